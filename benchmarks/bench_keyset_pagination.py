@@ -0,0 +1,66 @@
+"""
+Бенчмарк постраничного чтения пользователей: `OFFSET` против выборки по ключу (`DBHelperSQL.execute_page`).
+
+Для каждой глубины (номера первой строки страницы) замеряется время выборки одной страницы
+запроса `list_users_page` через `LIMIT ... OFFSET` и через курсор ключа последней строки
+предыдущей страницы. Время `OFFSET` растёт с глубиной, время выборки по ключу не зависит от неё.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_keyset_pagination --users 1000000 --depths 0 10000 100000 900000 --limit 50
+"""
+
+import argparse
+import os
+import tempfile
+
+from sqlalchemy import text
+
+from benchmarks.bench_login_index import measure
+from benchmarks.bench_result_shapes import build_helper
+from src.app.db.pagination import CursorCodec
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=1000000, help="Размер таблицы пользователей")
+    parser.add_argument(
+        "--depths", type=int, nargs="+", default=[0, 10000, 100000, 900000], help="Номера первых строк страниц"
+    )
+    parser.add_argument("--limit", type=int, default=50, help="Количество строк на странице")
+    parser.add_argument("--repeat", type=int, default=5, help="Количество повторов замера")
+    parser.add_argument("--number", type=int, default=20, help="Количество вызовов в одном замере")
+    args = parser.parse_args()
+
+    print(f"users={args.users} limit={args.limit} repeat={args.repeat} number={args.number}")
+    with tempfile.TemporaryDirectory() as directory:
+        helper = build_helper(os.path.join(directory, "bench.db"), args.users)
+        helper.cursor_codec = CursorCodec(secret_key="bench", max_limit=args.limit)
+        definition = helper.query_manager.get_definition("list_users_page")
+        offset_sql = text(
+            f"SELECT * FROM ({definition.sql}) AS offset_page ORDER BY login, id LIMIT :limit OFFSET :offset"
+        )
+
+        for depth in args.depths:
+            with helper.db_core.engine.connect() as connection:
+                row = connection.execute(offset_sql, {"limit": 1, "offset": depth - 1}).one() if depth else None
+            cursor = helper.cursor_codec.encode("list_users_page", [row.login, row.id]) if row else None
+
+            def offset_page() -> object:
+                with helper.db_core.engine.connect() as connection:
+                    return connection.execute(offset_sql, {"limit": args.limit, "offset": depth}).all()
+
+            offset_time = measure(offset_page, args.repeat, args.number)
+            keyset_time = measure(
+                lambda: helper.execute_page("list_users_page", after=cursor, limit=args.limit),
+                args.repeat,
+                args.number,
+            )
+            print(
+                f"depth={depth:<9} offset {offset_time * 1e3:9.3f} ms/page  "
+                f"keyset {keyset_time * 1e3:7.3f} ms/page  x{offset_time / keyset_time:.1f}"
+            )
+        helper.db_core.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Бенчмарк поиска пользователя по логину (`get_user_by_login`) без уникального индекса `ix_users_login` и с ним.
+
+Для каждого размера таблицы пользователей база создаётся заново, индекс удаляется, замеряется
+время запроса (последовательное сканирование), затем индекс строится и замер повторяется.
+Дополнительно выводится время построения индекса и план запроса.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_login_index --users 10000 100000 1000000 --repeat 5 --number 200
+"""
+
+import argparse
+import os
+import tempfile
+import timeit
+from typing import Callable
+
+from sqlalchemy import text
+
+from benchmarks.bench_result_shapes import build_helper
+from src.app.db.db_helper import DBHelperSQL
+
+
+def measure(case: Callable[[], object], repeat: int, number: int) -> float:
+    """
+    Замеряет лучшее среднее время одного вызова.
+
+    :param case: Замеряемый вызов.
+    :param repeat: Количество повторов замера.
+    :param number: Количество вызовов в одном замере.
+    :return: Время одного вызова (в секундах).
+    """
+    case()
+    return min(timeit.repeat(case, repeat=repeat, number=number)) / number
+
+
+def query_plan(helper: DBHelperSQL, login: str) -> str:
+    """
+    Возвращает план запроса `get_user_by_login` в SQLite.
+
+    :param helper: DBHelperSQL бенчмарка.
+    :param login: Искомый логин.
+    :return: Строки плана через `; `.
+    """
+    definition = helper.query_manager.get_definition("get_user_by_login")
+    with helper.db_core.engine.connect() as connection:
+        rows = connection.execute(definition.explain_statement("EXPLAIN QUERY PLAN "), {"login": login})
+        return "; ".join(str(row[-1]) for row in rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--users", type=int, nargs="+", default=[10000, 100000, 1000000], help="Размеры таблицы пользователей"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Количество повторов замера")
+    parser.add_argument("--number", type=int, default=200, help="Количество вызовов в одном замере")
+    args = parser.parse_args()
+
+    print(f"repeat={args.repeat} number={args.number}")
+    for users in args.users:
+        with tempfile.TemporaryDirectory() as directory:
+            helper = build_helper(os.path.join(directory, "bench.db"), users)
+            login = f"bench_user_{users // 2}"
+            case = lambda: helper.execute_one_or_none("get_user_by_login", {"login": login})  # noqa: E731
+
+            with helper.db_core.engine.begin() as connection:
+                connection.execute(text("DROP INDEX ix_users_login"))
+                connection.execute(text("ANALYZE"))
+            before = measure(case, args.repeat, args.number)
+            plan_before = query_plan(helper, login)
+
+            build_time = timeit.default_timer()
+            with helper.db_core.engine.begin() as connection:
+                connection.execute(text("CREATE UNIQUE INDEX ix_users_login ON users (login)"))
+                connection.execute(text("ANALYZE"))
+            build_time = timeit.default_timer() - build_time
+            after = measure(case, args.repeat, args.number)
+            plan_after = query_plan(helper, login)
+
+            print(
+                f"users={users:<9} without index {before * 1e6:11.1f} us/call  "
+                f"with index {after * 1e6:9.1f} us/call  x{before / after:.1f}  "
+                f"(index build {build_time:.2f} sec)"
+            )
+            print(f"    plan without index: {plan_before}")
+            print(f"    plan with index:    {plan_after}")
+            helper.db_core.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
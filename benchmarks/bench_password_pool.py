@@ -0,0 +1,120 @@
+"""
+Бенчмарк проверки паролей под нагрузкой: в потоке запроса против пула процессов (`PASSWORD_POOL_WORKERS`).
+
+Моделируется воркер gunicorn gthread: `--login-threads` потоков непрерывно проверяют пароль
+(`PasswordHasher.verify`), а `--route-threads` потоков обслуживают лёгкий маршрут (короткая работа
+на Python под GIL). Для каждого режима выводятся пропускная способность входа, количество входов,
+отклонённых при заполненной очереди пула (ответ 503), и задержки входа и лёгкого маршрута.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_password_pool --method scrypt:32768:8:1 --login-threads 16 --duration 10
+"""
+
+import argparse
+import json
+import threading
+import time
+from typing import Dict, List
+
+from src.app.core.password_hasher import (PasswordHasher,
+                                          PasswordHasherBusyError,
+                                          hash_password)
+
+# Данные "лёгкого маршрута": сериализация небольшого ответа в JSON
+ROUTE_PAYLOAD = {"items": [{"id": i, "login": f"user_{i}", "role_name": "user"} for i in range(200)]}
+
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    Возвращает перцентиль выборки.
+
+    :param values: Значения.
+    :param q: Перцентиль от 0 до 100.
+    :return: Значение перцентиля или 0 для пустой выборки.
+    """
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q / 100))]
+
+
+def run(hasher: PasswordHasher, password_hash: str, args: argparse.Namespace) -> Dict[str, object]:
+    """
+    Запускает потоки входа и лёгкого маршрута на `args.duration` секунд.
+
+    :param hasher: Сервис хеширования паролей.
+    :param password_hash: Проверяемый хеш.
+    :param args: Параметры бенчмарка.
+    :return: Задержки входа и маршрута (в секундах) и количество отклонённых входов.
+    """
+    stop = threading.Event()
+    logins: List[float] = []
+    routes: List[float] = []
+    rejected = [0]
+    lock = threading.Lock()
+
+    def login() -> None:
+        while not stop.is_set():
+            start_time = time.perf_counter()
+            try:
+                hasher.verify(password_hash, "password")
+            except PasswordHasherBusyError:
+                with lock:
+                    rejected[0] += 1
+                time.sleep(args.retry_delay)  # Клиент повторяет вход после ответа 503
+                continue
+            with lock:
+                logins.append(time.perf_counter() - start_time)
+
+    def route() -> None:
+        while not stop.is_set():
+            start_time = time.perf_counter()
+            json.dumps(ROUTE_PAYLOAD)
+            with lock:
+                routes.append(time.perf_counter() - start_time)
+            time.sleep(args.route_interval)
+
+    threads = [threading.Thread(target=login) for _ in range(args.login_threads)]
+    threads += [threading.Thread(target=route) for _ in range(args.route_threads)]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return {"logins": logins, "routes": routes, "rejected": rejected[0]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--method", default="scrypt:32768:8:1", help="Метод хеширования проверяемого пароля")
+    parser.add_argument("--login-threads", type=int, default=16, help="Количество потоков, выполняющих вход")
+    parser.add_argument("--route-threads", type=int, default=4, help="Количество потоков лёгкого маршрута")
+    parser.add_argument("--route-interval", type=float, default=0.005, help="Пауза между запросами маршрута (сек)")
+    parser.add_argument("--pool-workers", type=int, default=1, help="Количество процессов пула")
+    parser.add_argument("--queue-limit", type=int, default=8, help="Очередь пула")
+    parser.add_argument("--retry-delay", type=float, default=0.05, help="Пауза клиента после ответа 503 (сек)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Длительность каждого режима (сек)")
+    args = parser.parse_args()
+
+    password_hash = hash_password("password", args.method)
+    print(
+        f"method={args.method} login_threads={args.login_threads} route_threads={args.route_threads} "
+        f"pool_workers={args.pool_workers} queue_limit={args.queue_limit} duration={args.duration}"
+    )
+    for mode, pool_workers in (("inline", 0), ("pool", args.pool_workers)):
+        hasher = PasswordHasher(method=args.method, pool_workers=pool_workers, queue_limit=args.queue_limit)
+        hasher.verify(password_hash, "password")  # Запуск процессов пула не входит в замер
+        result = run(hasher, password_hash, args)
+        hasher.shutdown()
+        logins, routes = result["logins"], result["routes"]
+        print(
+            f"{mode:<7} login {len(logins) / args.duration:6.1f}/s "
+            f"p50 {percentile(logins, 50) * 1e3:7.1f} ms p99 {percentile(logins, 99) * 1e3:7.1f} ms "
+            f"rejected {result['rejected']:<6} "
+            f"route p50 {percentile(routes, 50) * 1e3:6.2f} ms p99 {percentile(routes, 99) * 1e3:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Бенчмарк форм результата DBHelperSQL на сценарии входа пользователя (`get_user_by_login`).
+
+Сравнивает прежний путь (`execute_query(...)[0]` со списком словарей) с получением одной
+строки (`execute_first`, `execute_one_or_none`) в формах `dict`, `tuple`, `record` и со `execute_scalar`.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_result_shapes --users 10000 --repeat 5 --number 2000
+"""
+
+import argparse
+import os
+import tempfile
+import timeit
+from typing import Callable, Dict
+
+from src.app.db.db_core import DatabaseCore
+from src.app.db.db_helper import DBHelperSQL
+from src.app.db.query_manager import QueryManager
+
+
+def build_helper(database_path: str, users: int) -> DBHelperSQL:
+    """
+    Создаёт DBHelperSQL на файловой SQLite с каталогом запросов и заполняет таблицу пользователей.
+
+    :param database_path: Путь к файлу базы данных.
+    :param users: Количество дополнительных пользователей.
+    :return: Настроенный DBHelperSQL.
+    """
+    app = type(
+        "BenchApp",
+        (object,),
+        {
+            "config": {
+                "SQLALCHEMY_DATABASE_URI": f"sqlite:///{database_path}",
+                "SQLALCHEMY_CONFIG_PATH_INIT": "./config/db_config/config.yaml",
+                "SQLALCHEMY_CONFIG_PATH_QUERIES": "./config/db_config/queries_base.yaml",
+                "SQLALCHEMY_CONFIG_PATH_QUERIES_DIALECTS": {"sqlite": "./config/db_config/queries_sqlite.yaml"},
+            }
+        },
+    )()
+    query_manager = QueryManager()
+    db_core = DatabaseCore(query_manager=query_manager)
+    db_core.init_app(app)
+    db_core.create_tables()
+    helper = DBHelperSQL(db_core=db_core, query_manager=query_manager)
+    helper.execute_many(
+        "create_user",
+        ({"login": f"bench_user_{i}", "password_hash": "hash", "role_id": 1} for i in range(users)),
+    )
+    return helper
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=10000, help="Количество пользователей в таблице")
+    parser.add_argument("--repeat", type=int, default=5, help="Количество повторов замера")
+    parser.add_argument("--number", type=int, default=2000, help="Количество вызовов в одном замере")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        helper = build_helper(os.path.join(directory, "bench.db"), args.users)
+        params = {"login": f"bench_user_{args.users // 2}"}
+
+        cases: Dict[str, Callable[[], object]] = {
+            "execute_query()[0] (dict)": lambda: helper.execute_query("get_user_by_login", params)[0],
+            "execute_first (dict)": lambda: helper.execute_first("get_user_by_login", params),
+            "execute_one_or_none (dict)": lambda: helper.execute_one_or_none("get_user_by_login", params),
+            "execute_one_or_none (tuple)": lambda: helper.execute_one_or_none(
+                "get_user_by_login", params, shape="tuple"
+            ),
+            "execute_one_or_none (record)": lambda: helper.execute_one_or_none(
+                "get_user_by_login", params, shape="record"
+            ),
+            "execute_scalar": lambda: helper.execute_scalar("get_user_by_login", params),
+        }
+
+        baseline = None
+        print(f"users={args.users} repeat={args.repeat} number={args.number}")
+        for name, case in cases.items():
+            case()
+            best = min(timeit.repeat(case, repeat=args.repeat, number=args.number)) / args.number
+            baseline = baseline or best
+            print(f"{name:<32} {best * 1e6:9.1f} us/call  x{baseline / best:.2f}")
+
+        helper.db_core.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Конфигурация Gunicorn для WebSslPanel.
+
+Приложение загружается в мастер-процессе до fork (`preload_app`), поэтому каждый воркер
+наследует его объекты. Хуки воркера:
+- post_fork: сбрасывает унаследованные пулы соединений БД и Redis и перезапускает фоновые потоки;
+- post_worker_init: до начала приёма запросов открывает соединения с БД и Redis
+  (`SQLALCHEMY_POOL_PREWARM`, `REDIS_POOL_PREWARM` в config/app_config.toml).
+
+Запуск:
+    gunicorn -c config/gunicorn.conf.py src.app.run:app
+"""
+
+import multiprocessing
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv("GUNICORN_THREADS", "1"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+# Предзагрузка несовместима с --reload: воркеры заново форкаются от уже загруженного кода
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() == "true"
+
+
+def post_fork(server, worker):
+    """
+    Сбрасывает ресурсы, унаследованные воркером от мастер-процесса.
+    """
+    if not server.cfg.preload_app:
+        return
+    from src.app.core.worker_lifecycle import after_fork
+
+    after_fork(worker.app.wsgi())
+
+
+def post_worker_init(worker):
+    """
+    Прогревает соединения воркера до начала приёма запросов.
+    """
+    from src.app.core.worker_lifecycle import prewarm
+
+    prewarm(worker.wsgi)
@@ -0,0 +1,35 @@
+"""App state
+
+Revision ID: 492e98246f87
+Revises: de19ef970e40
+Create Date: 2026-10-18 11:02:17.480193
+
+Таблица app_state для служебных значений приложения, в том числе отпечатка схемы
+и начальных данных, по которому запуск пропускает создание таблиц и инициализацию.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "492e98246f87"
+down_revision = "de19ef970e40"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "app_state",
+        sa.Column("key", sa.VARCHAR(length=100), nullable=False),
+        sa.Column("value", sa.String(length=500), nullable=False),
+        sa.Column("update_at", sa.TIMESTAMP(), nullable=False),
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_app_state_key", "app_state", ["key"], unique=True)
+
+
+def downgrade():
+    op.drop_index("ix_app_state_key", table_name="app_state")
+    op.drop_table("app_state")
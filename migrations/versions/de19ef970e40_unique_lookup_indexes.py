@@ -0,0 +1,79 @@
+"""Unique lookup indexes
+
+Revision ID: de19ef970e40
+Revises: e523a7601dba
+Create Date: 2026-10-18 10:12:41.215307
+
+Уникальные индексы по колонкам поиска: users.login, role.role_name, permission.name
+и паре (role_id, permission_id) в role_permission.
+
+В PostgreSQL индексы строятся через CREATE INDEX CONCURRENTLY вне транзакции миграции,
+без блокировки записи в таблицы. Перед построением проверяется отсутствие дубликатов.
+Дубликат, вставленный во время построения, всё равно прерывает его и оставляет невалидный
+индекс с тем же именем: при повторном запуске миграции такой индекс удаляется
+(DROP INDEX CONCURRENTLY) и строится заново, а не пропускается как существующий.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "de19ef970e40"
+down_revision = "e523a7601dba"
+branch_labels = None
+depends_on = None
+
+# Имя индекса, таблица и колонки
+INDEXES = (
+    ("ix_users_login", "users", ["login"]),
+    ("ix_role_role_name", "role", ["role_name"]),
+    ("ix_permission_name", "permission", ["name"]),
+    ("ix_role_permission_role_id_permission_id", "role_permission", ["role_id", "permission_id"]),
+)
+
+
+def _check_duplicates():
+    connection = op.get_bind()
+    for _, table, columns in INDEXES:
+        column_list = ", ".join(columns)
+        duplicates = connection.execute(
+            sa.text(f"SELECT {column_list} FROM {table} GROUP BY {column_list} HAVING COUNT(*) > 1 LIMIT 10")
+        ).all()
+        if duplicates:
+            raise RuntimeError(
+                f"Невозможно создать уникальный индекс по {table}({column_list}): найдены дубликаты {duplicates}"
+            )
+
+
+def _drop_invalid_index(name, table):
+    # Невалидный индекс остаётся после прерванного CREATE INDEX CONCURRENTLY и не обеспечивает уникальность
+    connection = op.get_bind()
+    statement = sa.text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)")
+    valid = connection.execute(statement, {"name": name}).scalar()
+    if valid is False:
+        op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+
+def upgrade():
+    _check_duplicates()
+    concurrently = op.get_bind().dialect.name == "postgresql"
+    if concurrently:
+        # CREATE INDEX CONCURRENTLY нельзя выполнять внутри транзакции
+        with op.get_context().autocommit_block():
+            for name, table, columns in INDEXES:
+                _drop_invalid_index(name, table)
+                op.create_index(name, table, columns, unique=True, postgresql_concurrently=True, if_not_exists=True)
+    else:
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=True, if_not_exists=True)
+
+
+def downgrade():
+    concurrently = op.get_bind().dialect.name == "postgresql"
+    if concurrently:
+        with op.get_context().autocommit_block():
+            for name, table, _ in reversed(INDEXES):
+                op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    else:
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True)
@@ -1,7 +1,9 @@
 import logging
+from typing import Sequence
 
-from werkzeug.security import check_password_hash
-
+from src.app.core.login_throttle import LoginThrottle, RateLimitExceededError
+from src.app.core.password_hasher import PasswordHasher
+from src.app.repository.interface.irole_repo import IRoleRepository
 from src.app.repository.interface.isession_repo import ISessionManager
 from src.app.repository.interface.iuser_repo import IUserRepository
 from src.app.schemas.main_controller_schemas import AuthUserSchemas
@@ -17,30 +19,64 @@ class MainController:
     Атрибуты:
         session_manger (ISessionManager): Объект для управления сессиями пользователей.
         user_repository (IUserRepository): Репозиторий для взаимодействия с базой данных пользователей.
+        password_hasher (PasswordHasher): Сервис проверки и пересчёта хешей паролей.
+        login_throttle (LoginThrottle): Ограничение частоты попыток входа по IP-адресу и логину.
+        role_repository (IRoleRepository): Репозиторий для проверки прав ролей.
     """
 
-    __slots__ = ("session_manger", "user_repository")
+    __slots__ = ("session_manger", "user_repository", "password_hasher", "login_throttle", "role_repository")
 
-    def __init__(self, user_repository: IUserRepository, session_manager: ISessionManager):
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        session_manager: ISessionManager,
+        password_hasher: PasswordHasher,
+        login_throttle: LoginThrottle,
+        role_repository: IRoleRepository,
+    ):
         """
         Инициализирует MainController с репозиторием пользователей и менеджером сессий.
 
         :param user_repository: Репозиторий для получения данных о пользователях.
         :param session_manager: Менеджер сессий для управления состоянием сессий.
+        :param password_hasher: Сервис проверки и пересчёта хешей паролей.
+        :param login_throttle: Ограничение частоты попыток входа.
+        :param role_repository: Репозиторий для проверки прав ролей.
         """
         self.session_manger = session_manager  # объект для управления сесиями (репозиторий)
         self.user_repository = user_repository  # объект для манипуляции с базой данных (репозиторий)
+        self.password_hasher = password_hasher  # сервис хеширования паролей
+        self.login_throttle = login_throttle  # ограничение частоты попыток входа
+        self.role_repository = role_repository  # проверка прав ролей (репозиторий)
 
     @validate_schemas(AuthUserSchemas)
     def auth_user(self, data: AuthUserSchemas) -> bool | None:
         """
         Выполняет аутентификацию пользователя, проверяя его данные и устанавливая соответствующие значения в сессии.
 
+        Попытка сначала списывается из корзин IP-адреса и логина: при превышении лимита
+        пользователь не ищется в БД и пароль не проверяется.
+        Если хеш пароля получен с устаревшими параметрами, после успешного входа он пересчитывается
+        текущим методом в фоновом потоке.
+
         :return: True, если аутентификация успешна, False, если данные неверны, None в случае ошибки.
+        :raises DatabaseUnavailableError: Если база данных недоступна и проверить данные невозможно.
+        :raises PasswordHasherBusyError: Если пул проверки паролей перегружен и проверка не выполнена.
+        :raises RateLimitExceededError: Если превышен лимит попыток входа с IP-адреса или для логина.
         """
         if not data:  # Проверяем преобразовались ли данные в схему
             return False
 
+        # Ограничиваем частоту попыток до обращения к БД и проверки пароля
+        try:
+            self.login_throttle.check(ip_addr=data.ip_addr, login=data.login)
+        except RateLimitExceededError as e:
+            logger.warning(
+                f"Попытка входа отклонена: login='{data.login}', ip='{data.ip_addr}' (превышен лимит: {e.scope})",
+                extra={"username": data.login, "role": "Unknown", "action": "login_throttled"},
+            )
+            raise
+
         # Получаем пользователя по его login
         user = self.user_repository.get_user_by_login(login=data.login)
 
@@ -55,7 +91,12 @@ class MainController:
             )
             return False  # Если пользователь не найден, возвращаем False
 
-        if check_password_hash(user.get("password_hash"), data.password):
+        password_hash = user.get("password_hash")
+        if self.password_hasher.verify(password_hash, data.password):
+            # Пересчитываем хеш с устаревшими параметрами, пока пароль известен
+            self.password_hasher.schedule_rehash(
+                data.login, data.password, password_hash, self.user_repository.update_password_hash
+            )
             # Если пароль совпадает, записываем данные в сессию
             self.session_manger.set(
                 key="user_id", value=str(user.get("user_id"))
@@ -126,3 +167,25 @@ class MainController:
             },
         )
         return False
+
+    def has_permissions(self, permissions: Sequence[str], require_all: bool = True) -> bool:
+        """
+        Проверяет права роли пользователя текущей сессии без обращения к БД.
+
+        :param permissions: Имена прав.
+        :param require_all: Требуются все права набора (True) или хотя бы одно (False).
+        :return: True, если роли пользователя выданы требуемые права.
+        """
+        role = self.session_manger.get("role_name")
+        if require_all:
+            allowed = self.role_repository.has_all(role, permissions)
+        else:
+            allowed = self.role_repository.has_any(role, permissions)
+        if not allowed:
+            user_id = self.session_manger.get("user_id")
+            logger.warning(
+                f"Доступ запрещён: user_id='{user_id}', role='{role}', "
+                f"права={list(permissions)} ({'все' if require_all else 'хотя бы одно'})",
+                extra={"username": user_id or "Unknown", "role": role or "Unknown", "action": "permission_denied"},
+            )
+        return allowed
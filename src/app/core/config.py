@@ -163,17 +163,78 @@ class FlaskConfig(BaseSettings):
     SESSION_USE_SIGNER: bool
     SESSION_CACHE_SIZE: int
     SESSION_POOL_TIMEOUT: int
+    REDIS_POOL_PREWARM: int
 
     # ====  Настройки базы данных SQLALCHEMY для Flask ====
     SQLALCHEMY_DATABASE_URI: Optional[str] = os.getenv("FLASK_SQLALCHEMY_DATABASE_URI", None)
+    SQLALCHEMY_ASYNC_DATABASE_URI: Optional[str] = os.getenv("FLASK_SQLALCHEMY_ASYNC_DATABASE_URI", None)
+    SQLALCHEMY_ASYNC_USE_NULL_POOL: bool
+    SQLALCHEMY_REPLICA_URIS: List[str] = [
+        uri.strip() for uri in os.getenv("FLASK_SQLALCHEMY_REPLICA_URIS", "").split(",") if uri.strip()
+    ]
+    SQLALCHEMY_REPLICA_MAX_LAG: float
+    SQLALCHEMY_REPLICA_HEALTH_INTERVAL: int
     SQLALCHEMY_TRACK_MODIFICATIONS: bool
     SQLALCHEMY_ECHO: bool
     SQLALCHEMY_RECORD_QUERIES: bool
     SQLALCHEMY_MAX_OVERFLOW: int
     SQLALCHEMY_POOL_SIZE: int
     SQLALCHEMY_POOL_RECYCLE: int
+    SQLALCHEMY_POOL_TIMEOUT: int
+    SQLALCHEMY_POOL_PRE_PING: bool
+    SQLALCHEMY_POOL_USE_LIFO: bool
+    SQLALCHEMY_POOL_METRICS_LOG_INTERVAL: int
+    SQLALCHEMY_POOL_PREWARM: int
+    SQLALCHEMY_EXECUTEMANY_PAGE_SIZE: int
+    SQLALCHEMY_SLOW_QUERY_THRESHOLD: float
+    SQLALCHEMY_SLOW_QUERY_EXPLAIN_INTERVAL: int
+    SQLALCHEMY_SLOW_QUERY_MAX_PLANS: int
     SQLALCHEMY_CONFIG_PATH_INIT: str
-    SQLALCHEMY_CONFIG_PATH_QUERIES_POSTGRESQL: str
+    SQLALCHEMY_CONFIG_PATH_QUERIES: str
+    SQLALCHEMY_CONFIG_PATH_QUERIES_DIALECTS: Dict[str, str] = {}
+    SQLALCHEMY_QUERY_CATALOG_RELOAD_INTERVAL: int
+    SQLALCHEMY_VALIDATE_QUERY_CATALOG: bool
+    SQLALCHEMY_BOOT_LOCK_TIMEOUT: int
+    SQLALCHEMY_CIRCUIT_FAILURE_THRESHOLD: int
+    SQLALCHEMY_CIRCUIT_RESET_TIMEOUT: int
+    SQLALCHEMY_RETRY_ATTEMPTS: int
+    SQLALCHEMY_RETRY_BASE_DELAY: float
+    SQLALCHEMY_PAGE_MAX_LIMIT: int
+
+    # ====  Настройки кэша результатов запросов ====
+    QUERY_CACHE_REDIS_URI: Optional[str] = os.getenv("FLASK_QUERY_CACHE_REDIS_URI", None)
+    QUERY_CACHE_MAX_ENTRIES: int
+    QUERY_CACHE_KEY_PREFIX: str
+
+    # ====  Настройки хеширования паролей ====
+    PASSWORD_HASH_METHOD: str
+    PASSWORD_REHASH_ON_LOGIN: bool
+    PASSWORD_POOL_WORKERS: int
+    PASSWORD_POOL_QUEUE_LIMIT: int
+    PASSWORD_POOL_TIMEOUT: float
+
+    # ====  Настройки ограничения попыток входа ====
+    LOGIN_RATE_LIMIT_REDIS_URI: Optional[str] = os.getenv(
+        "FLASK_LOGIN_RATE_LIMIT_REDIS_URI", os.getenv("FLASK_SESSION_REDIS_URI", None)
+    )
+    LOGIN_RATE_LIMIT_ENABLED: bool
+    LOGIN_RATE_LIMIT_IP_CAPACITY: int
+    LOGIN_RATE_LIMIT_IP_REFILL_PER_MINUTE: float
+    LOGIN_RATE_LIMIT_LOGIN_CAPACITY: int
+    LOGIN_RATE_LIMIT_LOGIN_REFILL_PER_MINUTE: float
+    LOGIN_RATE_LIMIT_KEY_PREFIX: str
+    LOGIN_RATE_LIMIT_REDIS_TIMEOUT: float
+    LOGIN_RATE_LIMIT_LOCAL_MAX_KEYS: int
+    PROXY_FIX_X_FOR: int
+
+    # ====  Настройки фильтра логинов ====
+    USER_LOGIN_FILTER_ENABLED: bool
+    USER_LOGIN_FILTER_ERROR_RATE: float
+    USER_LOGIN_FILTER_MIN_CAPACITY: int
+    USER_LOGIN_FILTER_MAX_AGE: int
+
+    # ====  Настройки авторизации ====
+    AUTHORIZATION_MAX_AGE: int
 
     # ====  Настройки SWAGGER OPEN API для Flask (Flask-Smorest) ====
     API_TITLE: str
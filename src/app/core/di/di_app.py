@@ -30,7 +30,7 @@ class AppContainer(containers.DynamicContainer):
     # Провайдер для инициализации контейнера RepositoryContainer (репозитории)
     repo = providers.Container(RepositoryContainer, db=db)
     # Провайдер для инициализации контейнера ControllerContainer (контроллеры)
-    controller = providers.Container(ControllerContainer, repo=repo)
+    controller = providers.Container(ControllerContainer, repo=repo, core=core)
     # Провайдер для инициализации контейнера ViewContainer (представления)
     view = providers.Container(ViewContainer, controller=controller)
 
@@ -20,10 +20,15 @@ class ControllerContainer(containers.DeclarativeContainer):
 
     # Контейнер зависимостей, используемых контроллерами (репозитории, менеджеры и другие компоненты)
     repo = providers.DependenciesContainer()
+    # Контейнер основных зависимостей (конфигурация, хеширование паролей, ограничение попыток входа)
+    core = providers.DependenciesContainer()
 
     # Основной контроллер приложения (MainController)
     main_controller: providers.Singleton[MainController] = providers.Singleton(
         MainController,
         user_repository=repo.user_repository,  # Репозиторий пользователей
         session_manager=repo.session_repository,  # Репозиторий для управления сессиями
+        password_hasher=core.password_hasher,  # Сервис проверки и пересчёта хешей паролей
+        login_throttle=core.login_throttle,  # Ограничение частоты попыток входа
+        role_repository=repo.role_repository,  # Репозиторий для проверки прав ролей
     )
@@ -4,6 +4,8 @@ from dependency_injector import containers, providers
 from pydantic_settings import BaseSettings
 
 from src.app.core.config import AppConfig
+from src.app.core.login_throttle import LoginThrottle
+from src.app.core.password_hasher import PasswordHasher
 
 
 class CoreContainer(containers.DeclarativeContainer):
@@ -17,6 +19,8 @@ class CoreContainer(containers.DeclarativeContainer):
         config: Провайдер для конфигурации приложения.
         logging_config: Провайдер для настройки конфигурации логгера.
         settings_flask: Провайдер для настройки Flask-приложения.
+        password_hasher: Провайдер сервиса хеширования паролей (настраивается в PasswordHasher.init_app).
+        login_throttle: Провайдер ограничения попыток входа (настраивается в LoginThrottle.init_app).
     """
 
     # Определяем провайдер для получения конфигурации
@@ -30,3 +34,9 @@ class CoreContainer(containers.DeclarativeContainer):
 
     # Определяем настройки для flask-приложения
     settings_flask: providers.Singleton[BaseSettings] = providers.Singleton(lambda: CoreContainer.config().flask_config)
+
+    # Сервис хеширования и проверки паролей
+    password_hasher: providers.Singleton[PasswordHasher] = providers.Singleton(PasswordHasher)
+
+    # Ограничение частоты попыток входа по IP-адресу и логину
+    login_throttle: providers.Singleton[LoginThrottle] = providers.Singleton(LoginThrottle)
@@ -1,8 +1,17 @@
 from dependency_injector import containers, providers
 
+from src.app.db.async_db_core import AsyncDatabaseCore
+from src.app.db.async_db_helper import AsyncDBHelperSQL
+from src.app.db.boot_lock import BootLock
+from src.app.db.catalog_validator import CatalogValidator
 from src.app.db.db_core import DatabaseCore
 from src.app.db.db_helper import DBHelperSQL
+from src.app.db.login_filter import LoginFilter
+from src.app.db.pagination import CursorCodec
+from src.app.db.query_cache import QueryCache
 from src.app.db.query_manager import QueryManager
+from src.app.db.role_permissions import RolePermissionIndex
+from src.app.db.slow_query_log import SlowQueryLog
 
 
 class DbContainer(containers.DeclarativeContainer):
@@ -17,21 +26,75 @@ class DbContainer(containers.DeclarativeContainer):
     Основные атрибуты:
     - db_core: Singleton-провайдер для DatabaseCore. Основной компонент для работы с БД.
     - query_manager: Singleton-провайдер для QueryManager. Используется для управления SQL-запросами.
+    - query_cache: Singleton-провайдер для QueryCache. Кэш результатов запросов (L1 в памяти и Redis L2).
+    - boot_lock: Singleton-провайдер для BootLock. Выбор процесса, выполняющего задачи запуска с БД.
+    - catalog_validator: Singleton-провайдер для CatalogValidator. Проверка и прогрев каталога запросов при запуске.
+    - slow_query_log: Singleton-провайдер для SlowQueryLog. Захват планов выполнения медленных запросов.
+    - cursor_codec: Singleton-провайдер для CursorCodec. Подпись курсоров постраничного чтения.
     - db_helper: Singleton-провайдер для DBHelperSQL. Вспомогательный класс для выполнения операций с БД.
+    - login_filter: Singleton-провайдер для LoginFilter. Фильтр Блума существующих логинов.
+    - role_permissions: Singleton-провайдер для RolePermissionIndex. Права ролей в памяти процесса.
+    - async_db_core: Singleton-провайдер для AsyncDatabaseCore. Асинхронный движок для async-представлений.
+    - async_db_helper: Singleton-провайдер для AsyncDBHelperSQL. Асинхронный аналог DBHelperSQL.
     """
 
     core = providers.DependenciesContainer()
 
+    # Singleton-провайдер для QueryManager (каталог загружается под диалект движка в DatabaseCore.init_app)
+    query_manager: providers.Singleton[QueryManager] = providers.Singleton(QueryManager)
+
+    # Singleton-провайдер для QueryCache (настраивается в QueryCache.init_app)
+    query_cache: providers.Singleton[QueryCache] = providers.Singleton(QueryCache)
+
     # Singleton-провайдер для DatabaseCore
-    db_core: providers.Singleton[DatabaseCore] = providers.Singleton(DatabaseCore)
+    db_core: providers.Singleton[DatabaseCore] = providers.Singleton(
+        DatabaseCore, query_manager=query_manager, query_cache=query_cache
+    )
+
+    # Singleton-провайдер для BootLock (настраивается в BootLock.init_app)
+    boot_lock: providers.Singleton[BootLock] = providers.Singleton(BootLock, db_core=db_core)
 
-    # Singleton-провайдер для QueryManager
-    query_manager: providers.Singleton[QueryManager] = providers.Singleton(
-        QueryManager.from_yaml,
-        file_path_query_yaml="./config/db_config/queries_postgres.yaml",  # тут нужно подправить хардкод
+    # Singleton-провайдер для CatalogValidator (проверка выполняется в CatalogValidator.init_app)
+    catalog_validator: providers.Singleton[CatalogValidator] = providers.Singleton(
+        CatalogValidator, db_core=db_core, query_manager=query_manager
     )
 
+    # Singleton-провайдер для SlowQueryLog (настраивается в SlowQueryLog.init_app)
+    slow_query_log: providers.Singleton[SlowQueryLog] = providers.Singleton(
+        SlowQueryLog, db_core=db_core, query_manager=query_manager
+    )
+
+    # Singleton-провайдер для CursorCodec (ключ подписи задаётся в CursorCodec.init_app)
+    cursor_codec: providers.Singleton[CursorCodec] = providers.Singleton(CursorCodec)
+
     # Singleton-провайдер для DBHelperSQL
     db_helper: providers.Singleton[DBHelperSQL] = providers.Singleton(
-        DBHelperSQL, db_core=db_core, query_manager=query_manager
+        DBHelperSQL,
+        db_core=db_core,
+        query_manager=query_manager,
+        query_cache=query_cache,
+        slow_query_log=slow_query_log,
+        cursor_codec=cursor_codec,
+    )
+
+    # Singleton-провайдер для LoginFilter (фильтр строится в LoginFilter.init_app)
+    login_filter: providers.Singleton[LoginFilter] = providers.Singleton(
+        LoginFilter, db_helper=db_helper, query_cache=query_cache
+    )
+
+    # Singleton-провайдер для RolePermissionIndex (права загружаются в RolePermissionIndex.init_app)
+    role_permissions: providers.Singleton[RolePermissionIndex] = providers.Singleton(
+        RolePermissionIndex, db_helper=db_helper, query_cache=query_cache
+    )
+
+    # Singleton-провайдер для AsyncDatabaseCore (каталог запросов общий с синхронным ядром через db_helper)
+    async_db_core: providers.Singleton[AsyncDatabaseCore] = providers.Singleton(AsyncDatabaseCore)
+
+    # Singleton-провайдер для AsyncDBHelperSQL
+    async_db_helper: providers.Singleton[AsyncDBHelperSQL] = providers.Singleton(
+        AsyncDBHelperSQL,
+        db_core=async_db_core,
+        query_manager=query_manager,
+        query_cache=query_cache,
+        slow_query_log=slow_query_log,
     )
@@ -1,8 +1,10 @@
 from dependency_injector import containers, providers
 
+from src.app.repository.interface.irole_repo import IRoleRepository
 from src.app.repository.interface.isession_repo import ISessionManager
 # Импорт интерфейсов для репозиториев
 from src.app.repository.interface.iuser_repo import IUserRepository
+from src.app.repository.repo_role import RoleRepository
 from src.app.repository.repo_session import RepositoryFlaskSessionManager
 # Импорт реализаций репозиториев
 from src.app.repository.repo_user import UserRepository
@@ -21,6 +23,7 @@ class RepositoryContainer(containers.DeclarativeContainer):
     - db: Зависимость от контейнера базы данных (DbContainer).
     - session_repository: Singleton-провайдер для репозитория сессий. Реализация `ISessionManager`.
     - user_repository: Singleton-провайдер для репозитория пользователей. Реализация `IUserRepository`.
+    - role_repository: Singleton-провайдер для репозитория ролей. Реализация `IRoleRepository`.
     """
 
     # Зависим от контенера базы данных
@@ -30,4 +33,11 @@ class RepositoryContainer(containers.DeclarativeContainer):
     session_repository: providers.Singleton[ISessionManager] = providers.Singleton(RepositoryFlaskSessionManager)
 
     # Репозиторий для работы с пользователями, предоставляющий реализацию IUserRepository
-    user_repository: providers.Singleton[IUserRepository] = providers.Singleton(UserRepository, db_helper=db.db_helper)
+    user_repository: providers.Singleton[IUserRepository] = providers.Singleton(
+        UserRepository, db_helper=db.db_helper, login_filter=db.login_filter
+    )
+
+    # Репозиторий для проверки прав ролей, предоставляющий реализацию IRoleRepository
+    role_repository: providers.Singleton[IRoleRepository] = providers.Singleton(
+        RoleRepository, role_permissions=db.role_permissions
+    )
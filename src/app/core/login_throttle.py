@@ -0,0 +1,320 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from flask import Flask
+from redis import Redis, RedisError
+
+logger = logging.getLogger("app_logger")
+
+# Атомарное списание токена из нескольких корзин за одно обращение к Redis.
+# KEYS — ключи корзин, ARGV — пары (ёмкость, пополнение в токенах за секунду) для каждой корзины.
+# Корзина хранится хешем {tokens, ts}; время берётся с сервера Redis, поэтому не зависит от часов воркеров
+# (запись после TIME в скрипте требует Redis 5+).
+# Токен списывается только если он есть во всех корзинах. Возвращает {разрешено, индекс корзины
+# отказа (с 1) или 0, через сколько миллисекунд появится токен}.
+TOKEN_BUCKET_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local tokens = {}
+local denied, wait = 0, 0
+for i, key in ipairs(KEYS) do
+    local capacity, rate = tonumber(ARGV[i * 2 - 1]), tonumber(ARGV[i * 2])
+    local bucket = redis.call('HMGET', key, 'tokens', 'ts')
+    local available = tonumber(bucket[1]) or capacity
+    local ts = tonumber(bucket[2]) or now
+    available = math.min(capacity, available + math.max(0, now - ts) * rate)
+    tokens[i] = available
+    if available < 1 and (1 - available) / rate > wait then
+        denied, wait = i, (1 - available) / rate
+    end
+end
+for i, key in ipairs(KEYS) do
+    local capacity, rate = tonumber(ARGV[i * 2 - 1]), tonumber(ARGV[i * 2])
+    local available = tokens[i]
+    if denied == 0 then
+        available = available - 1
+    end
+    redis.call('HSET', key, 'tokens', tostring(available), 'ts', tostring(now))
+    redis.call('PEXPIRE', key, math.ceil((capacity - available) / rate * 1000) + 1000)
+end
+return {denied == 0 and 1 or 0, denied, math.ceil(wait * 1000)}
+"""
+
+
+class RateLimitExceededError(RuntimeError):
+    """
+    Превышен лимит попыток входа с IP-адреса или для логина.
+    """
+
+    def __init__(self, message: str, scope: str, retry_after: float) -> None:
+        """
+        Инициализация RateLimitExceededError.
+
+        :param message: Описание ошибки.
+        :param scope: Исчерпанная корзина: `ip` или `login`.
+        :param retry_after: Через сколько секунд появится следующая попытка.
+        """
+        super().__init__(message)
+        self.scope = scope
+        self.retry_after = retry_after
+
+
+class TokenBucketPolicy:
+    """
+    Параметры корзины токенов: не более `capacity` попыток подряд, далее `refill_per_minute` попыток в минуту.
+    """
+
+    __slots__ = ("capacity", "rate")
+
+    def __init__(self, capacity: int, refill_per_minute: float) -> None:
+        """
+        Инициализация TokenBucketPolicy.
+
+        :param capacity: Ёмкость корзины (количество попыток подряд).
+        :param refill_per_minute: Пополнение корзины (попыток в минуту).
+        :raises ValueError: Если ёмкость меньше 1 или пополнение не положительное.
+        """
+        if capacity < 1 or refill_per_minute <= 0:
+            raise ValueError(
+                f"Некорректные параметры корзины токенов: capacity={capacity}, refill_per_minute={refill_per_minute}."
+            )
+        self.capacity = capacity
+        self.rate = refill_per_minute / 60  # Токенов в секунду
+
+    def __repr__(self) -> str:
+        return f"TokenBucketPolicy(capacity={self.capacity}, refill_per_minute={self.rate * 60:g})"
+
+
+class LocalTokenBuckets:
+    """
+    Корзины токенов в памяти процесса с той же логикой, что и `TOKEN_BUCKET_SCRIPT`.
+
+    Используются, пока Redis недоступен. Лимит действует в каждом процессе отдельно,
+    поэтому общий лимит пода в этом режиме в число воркеров раз выше. Количество корзин
+    ограничено: при переполнении вытесняются давно не использованные.
+    """
+
+    __slots__ = ("max_keys", "_buckets", "_lock")
+
+    def __init__(self, max_keys: int = 10000) -> None:
+        """
+        Инициализация LocalTokenBuckets.
+
+        :param max_keys: Максимальное количество корзин в памяти.
+        """
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, buckets: Sequence[Tuple[str, TokenBucketPolicy]], now: float) -> Tuple[int, float]:
+        """
+        Списывает по токену из всех корзин, если токен есть в каждой.
+
+        :param buckets: Ключи корзин и их параметры.
+        :param now: Текущее время (в секундах, монотонное).
+        :return: Индекс корзины отказа (с 1) или 0, если попытка разрешена, и время до появления токена (сек).
+        """
+        with self._lock:
+            tokens: List[float] = []
+            denied, wait = 0, 0.0
+            for i, (key, policy) in enumerate(buckets, start=1):
+                available, ts = self._buckets.get(key, (policy.capacity, now))
+                available = min(policy.capacity, available + max(0.0, now - ts) * policy.rate)
+                tokens.append(available)
+                if available < 1 and (1 - available) / policy.rate > wait:
+                    denied, wait = i, (1 - available) / policy.rate
+            for (key, _), available in zip(buckets, tokens):
+                self._buckets[key] = (available - 1 if denied == 0 else available, now)
+                self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return denied, wait
+
+
+class LoginThrottle:
+    """
+    Ограничение частоты попыток входа по IP-адресу и по логину (token bucket).
+
+    Проверка выполняется до поиска пользователя и проверки пароля, поэтому перебор паролей
+    не создаёт нагрузку на БД и CPU. Обе корзины проверяются и списываются атомарно одним
+    Lua-скриптом (`EVALSHA`) за одно обращение к Redis, общим для всех воркеров и подов.
+
+    Клиент Redis работает с коротким таймаутом (`LOGIN_RATE_LIMIT_REDIS_TIMEOUT`): если Redis
+    недоступен или не ответил вовремя, решение принимают корзины в памяти процесса, а Redis
+    не опрашивается `REDIS_RETRY_INTERVAL` секунд, чтобы вход не ждал таймаут на каждом запросе.
+
+    Ведутся счётчики: разрешённые попытки, отказы по IP и по логину, решения корзин
+    в памяти процесса и ошибки Redis.
+    """
+
+    # Пауза перед повторным обращением к Redis после ошибки (в секундах)
+    REDIS_RETRY_INTERVAL = 5.0
+    # Корзины в порядке ключей скрипта
+    SCOPES = ("ip", "login")
+
+    __slots__ = (
+        "enabled",
+        "ip_policy",
+        "login_policy",
+        "key_prefix",
+        "redis",
+        "local",
+        "_script",
+        "_redis_retry_at",
+        "_stats",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        ip_policy: Optional[TokenBucketPolicy] = None,
+        login_policy: Optional[TokenBucketPolicy] = None,
+        redis: Optional[Redis] = None,
+        key_prefix: str = "login_limit:",
+        local_max_keys: int = 10000,
+        enabled: bool = True,
+    ) -> None:
+        """
+        Инициализация LoginThrottle.
+
+        :param ip_policy: Параметры корзины IP-адреса.
+        :param login_policy: Параметры корзины логина.
+        :param redis: Клиент Redis (без него используются корзины в памяти процесса).
+        :param key_prefix: Префикс ключей корзин в Redis.
+        :param local_max_keys: Максимальное количество корзин в памяти процесса.
+        :param enabled: Включено ли ограничение.
+        """
+        self.enabled = enabled
+        self.ip_policy = ip_policy or TokenBucketPolicy(capacity=20, refill_per_minute=10)
+        self.login_policy = login_policy or TokenBucketPolicy(capacity=5, refill_per_minute=1)
+        self.key_prefix = key_prefix
+        self.local = LocalTokenBuckets(local_max_keys)
+        self._redis_retry_at = 0.0
+        self._stats: Dict[str, int] = dict.fromkeys(
+            ("allowed", "rejected_ip", "rejected_login", "local_decisions", "redis_errors"), 0
+        )
+        self._lock = threading.Lock()
+        self.__set_redis(redis)
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Настраивает корзины и клиент Redis из конфигурации приложения.
+
+        :param app: Flask-приложение.
+        :raises ValueError: Если параметры корзин некорректны.
+        """
+        config = app.config
+        self.enabled = config.get("LOGIN_RATE_LIMIT_ENABLED", self.enabled)
+        self.ip_policy = TokenBucketPolicy(
+            config.get("LOGIN_RATE_LIMIT_IP_CAPACITY", self.ip_policy.capacity),
+            config.get("LOGIN_RATE_LIMIT_IP_REFILL_PER_MINUTE", self.ip_policy.rate * 60),
+        )
+        self.login_policy = TokenBucketPolicy(
+            config.get("LOGIN_RATE_LIMIT_LOGIN_CAPACITY", self.login_policy.capacity),
+            config.get("LOGIN_RATE_LIMIT_LOGIN_REFILL_PER_MINUTE", self.login_policy.rate * 60),
+        )
+        self.key_prefix = config.get("LOGIN_RATE_LIMIT_KEY_PREFIX", self.key_prefix)
+        self.local = LocalTokenBuckets(config.get("LOGIN_RATE_LIMIT_LOCAL_MAX_KEYS", self.local.max_keys))
+        redis_uri = config.get("LOGIN_RATE_LIMIT_REDIS_URI")
+        if redis_uri:
+            timeout = config.get("LOGIN_RATE_LIMIT_REDIS_TIMEOUT", 0.05)
+            self.__set_redis(Redis.from_url(redis_uri, socket_timeout=timeout, socket_connect_timeout=timeout))
+        storage = "Redis" if self.redis is not None else "память процесса"
+        logger.info(
+            f"Ограничение попыток входа: {'включено' if self.enabled else 'отключено'}, "
+            f"IP {self.ip_policy}, логин {self.login_policy}, хранилище — {storage}"
+        )
+
+    def check(self, ip_addr: str, login: str) -> None:
+        """
+        Списывает попытку входа из корзин IP-адреса и логина.
+
+        :param ip_addr: IP-адрес клиента.
+        :param login: Логин, под которым выполняется вход.
+        :raises RateLimitExceededError: Если корзина IP-адреса или логина пуста.
+        """
+        if not self.enabled:
+            return
+        buckets = (
+            (f"{self.key_prefix}ip:{ip_addr}", self.ip_policy),
+            (f"{self.key_prefix}login:{login}", self.login_policy),
+        )
+        denied, wait = self.__take_redis(buckets)
+        if denied is None:
+            denied, wait = self.local.take(buckets, time.monotonic())
+            self.__count("local_decisions")
+        if denied == 0:
+            self.__count("allowed")
+            return
+        scope = self.SCOPES[denied - 1]
+        self.__count(f"rejected_{scope}")
+        raise RateLimitExceededError(
+            f"Превышен лимит попыток входа ({scope}): ip='{ip_addr}', login='{login}'.",
+            scope=scope,
+            retry_after=wait,
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Возвращает счётчики попыток входа.
+
+        :return: Разрешённые попытки, отказы по IP и по логину, решения корзин в памяти и ошибки Redis.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def after_fork(self) -> None:
+        """
+        Сбрасывает унаследованный пул соединений Redis, корзины и блокировку в дочернем процессе после fork.
+        """
+        if self.redis is not None:
+            self.redis.connection_pool.reset()
+        self.local = LocalTokenBuckets(self.local.max_keys)
+        self._redis_retry_at = 0.0
+        self._lock = threading.Lock()
+
+    def __set_redis(self, redis: Optional[Redis]) -> None:
+        """
+        Задаёт клиент Redis и регистрирует скрипт корзин.
+
+        :param redis: Клиент Redis или None.
+        """
+        self.redis = redis
+        self._script = redis.register_script(TOKEN_BUCKET_SCRIPT) if redis is not None else None
+
+    def __take_redis(self, buckets: Sequence[Tuple[str, TokenBucketPolicy]]) -> Tuple[Optional[int], float]:
+        """
+        Списывает токены скриптом в Redis.
+
+        :param buckets: Ключи корзин и их параметры.
+        :return: Индекс корзины отказа или 0 и время до появления токена (сек);
+            None вместо индекса, если Redis не используется или не ответил.
+        """
+        if self._script is None or time.monotonic() < self._redis_retry_at:
+            return None, 0.0
+        args: List[float] = []
+        for _, policy in buckets:
+            args.extend((policy.capacity, policy.rate))
+        try:
+            _, denied, wait_ms = self._script(keys=[key for key, _ in buckets], args=args)
+        except RedisError as e:
+            self._redis_retry_at = time.monotonic() + self.REDIS_RETRY_INTERVAL
+            self.__count("redis_errors")
+            logger.warning(
+                f"Redis ограничения попыток входа недоступен, {self.REDIS_RETRY_INTERVAL:g} сек. "
+                f"используются корзины в памяти процесса: {e}"
+            )
+            return None, 0.0
+        return int(denied), int(wait_ms) / 1000
+
+    def __count(self, name: str) -> None:
+        """
+        Увеличивает счётчик.
+
+        :param name: Имя счётчика.
+        """
+        with self._lock:
+            self._stats[name] += 1
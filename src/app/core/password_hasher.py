@@ -0,0 +1,499 @@
+import logging
+import multiprocessing
+import statistics
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, Optional, Set, Tuple, TypeVar
+
+import click
+from flask import Flask, current_app
+from flask.cli import with_appcontext
+from werkzeug.security import (DEFAULT_PBKDF2_ITERATIONS, check_password_hash,
+                               generate_password_hash)
+
+try:
+    from argon2 import PasswordHasher as Argon2Hasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+except ImportError:  # argon2-cffi не установлен: доступны только scrypt и pbkdf2
+    Argon2Hasher = None
+
+logger = logging.getLogger("app_logger")
+
+T = TypeVar("T")
+
+# Алгоритмы хеширования, поддерживаемые сервисом
+ALGORITHMS = ("scrypt", "pbkdf2", "argon2")
+# Параметры werkzeug по умолчанию для scrypt (n, r, p)
+DEFAULT_SCRYPT_PARAMS = (2**15, 8, 1)
+# Параметры argon2id по умолчанию (time_cost, memory_cost в КиБ, parallelism)
+DEFAULT_ARGON2_PARAMS = (3, 65536, 4)
+# Через сколько секунд имеет смысл повторить вход, если пул проверки паролей перегружен
+BUSY_RETRY_AFTER = 1
+
+
+class PasswordHasherBusyError(RuntimeError):
+    """
+    Пул процессов проверки паролей перегружен или не ответил за отведённое время.
+
+    Запрос не выполнялся (или его результат не дождались), поэтому ответ неизвестен:
+    обработчик должен сразу вернуть 503 с заголовком `Retry-After`, а не ждать.
+    """
+
+    def __init__(self, message: str, retry_after: Optional[float] = BUSY_RETRY_AFTER) -> None:
+        """
+        Инициализация PasswordHasherBusyError.
+
+        :param message: Описание ошибки.
+        :param retry_after: Через сколько секунд имеет смысл повторить запрос.
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def normalize_method(method: str) -> str:
+    """
+    Приводит метод хеширования к полной записи с параметрами, как в сохраняемом хеше.
+
+    Методы записываются как в werkzeug: `scrypt:n:r:p`, `pbkdf2:hash_name:iterations`,
+    и `argon2:time_cost:memory_cost:parallelism` для argon2id.
+
+    :param method: Метод хеширования, возможно без параметров (например, `scrypt`).
+    :return: Метод с явными параметрами (например, `scrypt:32768:8:1`).
+    :raises ValueError: Если алгоритм не поддерживается или параметры некорректны.
+    """
+    algorithm, *args = method.split(":")
+    try:
+        if algorithm == "scrypt":
+            n, r, p = map(int, args) if args else DEFAULT_SCRYPT_PARAMS
+            return f"scrypt:{n}:{r}:{p}"
+        if algorithm == "pbkdf2":
+            hash_name = args[0] if args else "sha256"
+            iterations = int(args[1]) if len(args) > 1 else DEFAULT_PBKDF2_ITERATIONS
+            return f"pbkdf2:{hash_name}:{iterations}"
+        if algorithm == "argon2":
+            time_cost, memory_cost, parallelism = map(int, args) if args else DEFAULT_ARGON2_PARAMS
+            return f"argon2:{time_cost}:{memory_cost}:{parallelism}"
+    except ValueError:
+        raise ValueError(f"Некорректные параметры метода хеширования '{method}'.") from None
+    raise ValueError(f"Алгоритм хеширования '{algorithm}' не поддерживается, ожидается один из {ALGORITHMS}.")
+
+
+def hash_method(password_hash: str) -> Optional[str]:
+    """
+    Определяет метод и параметры, с которыми был получен сохранённый хеш.
+
+    :param password_hash: Сохранённый хеш пароля.
+    :return: Метод в полной записи или None, если формат хеша неизвестен.
+    """
+    if password_hash.startswith("$argon2id$"):
+        # $argon2id$v=19$m=65536,t=3,p=4$salt$hash
+        try:
+            params = dict(item.split("=", 1) for item in password_hash.split("$")[3].split(","))
+            return f"argon2:{int(params['t'])}:{int(params['m'])}:{int(params['p'])}"
+        except (IndexError, KeyError, ValueError):
+            return None
+    if password_hash.count("$") < 2:
+        return None
+    try:
+        return normalize_method(password_hash.split("$", 1)[0])
+    except ValueError:
+        return None
+
+
+def _argon2_hasher(method: str) -> Any:
+    """
+    Создаёт хешер argon2id с параметрами метода.
+
+    :param method: Метод в полной записи `argon2:time_cost:memory_cost:parallelism`.
+    :return: Экземпляр `argon2.PasswordHasher`.
+    :raises RuntimeError: Если пакет argon2-cffi не установлен.
+    """
+    if Argon2Hasher is None:
+        raise RuntimeError("Для хеширования argon2 требуется пакет argon2-cffi.")
+    time_cost, memory_cost, parallelism = map(int, method.split(":")[1:])
+    return Argon2Hasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+
+
+def hash_password(password: str, method: str) -> str:
+    """
+    Хеширует пароль заданным методом.
+
+    Функция уровня модуля, чтобы её можно было передавать в пул процессов.
+
+    :param password: Пароль в открытом виде.
+    :param method: Метод хеширования в полной записи.
+    :return: Хеш пароля для хранения в БД.
+    """
+    if method.startswith("argon2:"):
+        return _argon2_hasher(method).hash(password)
+    return generate_password_hash(password, method=method)
+
+
+def verify_password(password_hash: str, password: str) -> bool:
+    """
+    Проверяет пароль по сохранённому хешу любого поддерживаемого метода.
+
+    :param password_hash: Сохранённый хеш пароля.
+    :param password: Пароль в открытом виде.
+    :return: True, если пароль совпадает.
+    """
+    if password_hash.startswith("$argon2id$"):
+        if Argon2Hasher is None:
+            logger.error("Хеш пароля argon2 не может быть проверен: пакет argon2-cffi не установлен.")
+            return False
+        try:
+            return Argon2Hasher().verify(password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    return check_password_hash(password_hash, password)
+
+
+class PasswordHasher:
+    """
+    Сервис хеширования и проверки паролей с настраиваемыми параметрами.
+
+    Метод хеширования задаётся в конфигурации (`PASSWORD_HASH_METHOD`) и подбирается под целевую
+    задержку на текущем CPU командой `flask calibrate-password-hash`. Проверка принимает хеши любого
+    поддерживаемого метода, а хеши, полученные с устаревшими параметрами, после успешного входа
+    пересчитываются в фоновом потоке (`schedule_rehash`), поэтому смена параметров вступает
+    в силу постепенно, без сброса паролей.
+
+    Хеширование занимает CPU и удерживает GIL, поэтому при `pool_workers > 0` оно выполняется
+    в отдельных процессах: потоки воркера, обслуживающие другие маршруты, не ждут GIL.
+    Очередь пула ограничена (`pool_workers + queue_limit` задач): если она заполнена,
+    `verify` и `hash` сразу выбрасывают `PasswordHasherBusyError`, и перегружается только вход.
+    """
+
+    # Способ запуска процессов пула: воркер gunicorn многопоточный, а fork из многопоточного
+    # процесса небезопасен, поэтому процессы порождаются отдельным однопоточным сервером
+    POOL_START_METHOD = "forkserver"
+
+    __slots__ = (
+        "method",
+        "rehash_on_login",
+        "pool_workers",
+        "queue_limit",
+        "timeout",
+        "_executor",
+        "_pending",
+        "_lock",
+        "_pool",
+        "_slots",
+    )
+
+    def __init__(
+        self,
+        method: str = "scrypt",
+        rehash_on_login: bool = True,
+        pool_workers: int = 0,
+        queue_limit: int = 16,
+        timeout: float = 5.0,
+    ) -> None:
+        """
+        Инициализация PasswordHasher.
+
+        :param method: Метод хеширования новых паролей (например, `scrypt:32768:8:1`).
+        :param rehash_on_login: Пересчитывать хеши с устаревшими параметрами после успешного входа.
+        :param pool_workers: Количество процессов пула хеширования (0 — хешировать в вызывающем потоке).
+        :param queue_limit: Количество задач, ожидающих свободный процесс пула.
+        :param timeout: Максимальное время ожидания результата из пула (в секундах).
+        :raises ValueError: Если метод не поддерживается или параметры пула некорректны.
+        """
+        self.method = normalize_method(method)
+        self.rehash_on_login = rehash_on_login
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Set[str] = set()  # Логины, хеши которых пересчитываются
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.__configure_pool(pool_workers, queue_limit, timeout)
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Настраивает метод хеширования и пул процессов из конфигурации приложения и регистрирует команду калибровки.
+
+        Процессы пула создаются при первой проверке пароля, то есть уже в воркере после fork.
+
+        :param app: Flask-приложение.
+        :raises ValueError: Если метод из конфигурации не поддерживается или параметры пула некорректны.
+        :raises RuntimeError: Если выбран argon2, а пакет argon2-cffi не установлен.
+        """
+        self.method = normalize_method(app.config.get("PASSWORD_HASH_METHOD") or self.method)
+        self.rehash_on_login = app.config.get("PASSWORD_REHASH_ON_LOGIN", self.rehash_on_login)
+        if self.method.startswith("argon2:") and Argon2Hasher is None:
+            raise RuntimeError("PASSWORD_HASH_METHOD использует argon2, но пакет argon2-cffi не установлен.")
+        self.__configure_pool(
+            app.config.get("PASSWORD_POOL_WORKERS", self.pool_workers),
+            app.config.get("PASSWORD_POOL_QUEUE_LIMIT", self.queue_limit),
+            app.config.get("PASSWORD_POOL_TIMEOUT", self.timeout),
+        )
+        app.cli.add_command(calibrate_command)
+        logger.info(f"Метод хеширования паролей: {self.method}, процессов пула: {self.pool_workers}")
+
+    def hash(self, password: str) -> str:
+        """
+        Хеширует пароль текущим методом.
+
+        :param password: Пароль в открытом виде.
+        :return: Хеш пароля.
+        :raises PasswordHasherBusyError: Если пул перегружен или не ответил за `timeout`.
+        """
+        return self.__run(hash_password, password, self.method)
+
+    def verify(self, password_hash: str, password: str) -> bool:
+        """
+        Проверяет пароль по сохранённому хешу.
+
+        :param password_hash: Сохранённый хеш пароля.
+        :param password: Пароль в открытом виде.
+        :return: True, если пароль совпадает.
+        :raises PasswordHasherBusyError: Если пул перегружен или не ответил за `timeout`.
+        """
+        return self.__run(verify_password, password_hash, password)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """
+        Проверяет, получен ли хеш с параметрами, отличными от текущего метода.
+
+        :param password_hash: Сохранённый хеш пароля.
+        :return: True, если хеш следует пересчитать.
+        """
+        return hash_method(password_hash) != self.method
+
+    def schedule_rehash(
+        self, login: str, password: str, password_hash: str, store: Callable[[str, str, str], Any]
+    ) -> bool:
+        """
+        Ставит пересчёт хеша с устаревшими параметрами в фоновый поток.
+
+        Вызывается после успешной проверки пароля, пока пароль в открытом виде ещё известен.
+        Новый хеш сохраняется функцией `store(login, new_hash, old_hash)`, которая должна
+        заменять хеш, только если он не изменился с момента проверки.
+
+        :param login: Логин пользователя.
+        :param password: Проверенный пароль в открытом виде.
+        :param password_hash: Текущий сохранённый хеш.
+        :param store: Функция сохранения нового хеша.
+        :return: True, если пересчёт поставлен в очередь.
+        """
+        if not self.rehash_on_login or not self.needs_rehash(password_hash):
+            return False
+        with self._lock:
+            if login in self._pending:
+                return False
+            self._pending.add(login)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="password-rehash")
+            executor = self._executor
+        executor.submit(self.__rehash, login, password, password_hash, store)
+        return True
+
+    def __rehash(self, login: str, password: str, password_hash: str, store: Callable[[str, str, str], Any]) -> None:
+        """
+        Пересчитывает хеш пароля текущим методом и сохраняет его.
+
+        Если пул перегружен, пересчёт откладывается до следующего входа пользователя.
+
+        :param login: Логин пользователя.
+        :param password: Пароль в открытом виде.
+        :param password_hash: Прежний хеш.
+        :param store: Функция сохранения нового хеша.
+        """
+        try:
+            start_time = time.perf_counter()
+            new_hash = self.hash(password)
+            store(login, new_hash, password_hash)
+            logger.info(
+                f"Хеш пароля пользователя '{login}' пересчитан: {hash_method(password_hash)} -> {self.method} "
+                f"за {time.perf_counter() - start_time:.3f} сек."
+            )
+        except PasswordHasherBusyError as e:
+            logger.warning(f"Пересчёт хеша пароля пользователя '{login}' отложен: {e}")
+        except Exception as e:
+            logger.error(f"Не удалось пересчитать хеш пароля пользователя '{login}': {e}")
+        finally:
+            with self._lock:
+                self._pending.discard(login)
+
+    def __configure_pool(self, pool_workers: int, queue_limit: int, timeout: float) -> None:
+        """
+        Задаёт параметры пула процессов; действующий пул закрывается и создаётся заново при следующем вызове.
+
+        :param pool_workers: Количество процессов пула (0 — без пула).
+        :param queue_limit: Количество задач, ожидающих свободный процесс.
+        :param timeout: Максимальное время ожидания результата (в секундах).
+        :raises ValueError: Если параметры некорректны.
+        """
+        if pool_workers < 0 or queue_limit < 0 or timeout <= 0:
+            raise ValueError(
+                "Параметры пула хеширования паролей некорректны: "
+                f"pool_workers={pool_workers}, queue_limit={queue_limit}, timeout={timeout}."
+            )
+        self.pool_workers = pool_workers
+        self.queue_limit = queue_limit
+        self.timeout = timeout
+        # Каждая задача пула занимает слот от постановки в очередь до завершения в процессе
+        self._slots = threading.BoundedSemaphore(pool_workers + queue_limit)
+        self.__close_pool(wait=False)
+
+    def __run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Выполняет функцию хеширования в пуле процессов (или в текущем потоке, если пул отключён).
+
+        Слот очереди занимается без ожидания: при заполненной очереди задача отклоняется сразу.
+        Задача, результат которой не дождались, остаётся в пуле и занимает слот до завершения,
+        поэтому количество задач в пуле никогда не превышает `pool_workers + queue_limit`.
+
+        :param func: Функция уровня модуля (`hash_password` или `verify_password`).
+        :param args: Аргументы функции.
+        :return: Результат функции.
+        :raises PasswordHasherBusyError: Если очередь заполнена, результат не получен за `timeout`
+            или процесс пула аварийно завершился.
+        """
+        if self.pool_workers == 0:
+            return func(*args)
+        slots = self._slots
+        if not slots.acquire(blocking=False):
+            raise PasswordHasherBusyError(
+                f"Очередь пула хеширования паролей заполнена ({self.pool_workers + self.queue_limit} задач)."
+            )
+        try:
+            future: Future = self.__get_pool().submit(func, *args)
+        except BaseException:
+            slots.release()
+            raise
+        future.add_done_callback(lambda _: slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()  # Задача, ещё ожидающая процесс, удаляется из очереди
+            raise PasswordHasherBusyError(
+                f"Пул хеширования паролей не ответил за {self.timeout} сек.", retry_after=self.timeout
+            ) from None
+        except BrokenProcessPool as e:
+            logger.error(f"Процесс пула хеширования паролей аварийно завершился, пул будет создан заново: {e}")
+            self.__close_pool(wait=False)
+            raise PasswordHasherBusyError("Пул хеширования паролей перезапускается.") from e
+
+    def __get_pool(self) -> ProcessPoolExecutor:
+        """
+        Возвращает пул процессов, создавая его при первом вызове.
+
+        :return: Пул процессов хеширования.
+        """
+        with self._lock:
+            if self._pool is None:
+                context = multiprocessing.get_context(self.POOL_START_METHOD)
+                self._pool = ProcessPoolExecutor(max_workers=self.pool_workers, mp_context=context)
+            return self._pool
+
+    def __close_pool(self, wait: bool) -> None:
+        """
+        Закрывает пул процессов; следующий вызов создаст новый.
+
+        :param wait: Дождаться завершения задач пула.
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=not wait)
+
+    def after_fork(self) -> None:
+        """
+        Сбрасывает фоновый поток, пул процессов и блокировки в дочернем процессе после fork:
+        потоки и процессы пула родителя дочернему процессу не принадлежат.
+        """
+        self._executor = None
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._pool = None
+        self._slots = threading.BoundedSemaphore(self.pool_workers + self.queue_limit)
+
+    def shutdown(self) -> None:
+        """
+        Дожидается завершения поставленных пересчётов хешей и закрывает пул процессов.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self.__close_pool(wait=True)
+
+
+def measure_hash_time(method: str, samples: int = 3) -> float:
+    """
+    Замеряет медианное время хеширования пароля методом.
+
+    :param method: Метод хеширования в полной записи.
+    :param samples: Количество замеров.
+    :return: Время одного хеширования (в секундах).
+    """
+    timings = []
+    for _ in range(samples):
+        start_time = time.perf_counter()
+        hash_password("calibration-password", method)
+        timings.append(time.perf_counter() - start_time)
+    return statistics.median(timings)
+
+
+def calibrate(algorithm: str, target: float, samples: int = 3) -> Tuple[str, float]:
+    """
+    Подбирает параметры алгоритма, при которых хеширование занимает не больше целевого времени.
+
+    - scrypt: при r=8, p=1 удваивается n (стоимость по CPU и памяти, 128·n·r байт);
+    - pbkdf2 (sha256): число итераций масштабируется по замеру и округляется до тысяч;
+    - argon2id: при памяти 64 МиБ и parallelism=1 увеличивается time_cost.
+
+    Если даже минимальные параметры медленнее цели, возвращаются минимальные параметры.
+
+    :param algorithm: Алгоритм: `scrypt`, `pbkdf2` или `argon2`.
+    :param target: Целевое время хеширования одного пароля (в секундах).
+    :param samples: Количество замеров каждого варианта.
+    :return: Метод в полной записи и замеренное время хеширования с ним (в секундах).
+    :raises ValueError: Если алгоритм не поддерживается или целевое время не положительное.
+    """
+    if target <= 0:
+        raise ValueError("Целевое время хеширования должно быть положительным.")
+    if algorithm == "pbkdf2":
+        probe_iterations = 100_000
+        probe = measure_hash_time(f"pbkdf2:sha256:{probe_iterations}", samples)
+        iterations = max(1000, int(probe_iterations * target / probe) // 1000 * 1000)
+        method = f"pbkdf2:sha256:{iterations}"
+        return method, measure_hash_time(method, samples)
+
+    if algorithm == "scrypt":
+        candidates: List[str] = [f"scrypt:{2**log_n}:8:1" for log_n in range(10, 21)]
+    elif algorithm == "argon2":
+        candidates = [f"argon2:{time_cost}:65536:1" for time_cost in range(1, 21)]
+    else:
+        raise ValueError(f"Алгоритм хеширования '{algorithm}' не поддерживается, ожидается один из {ALGORITHMS}.")
+
+    chosen = candidates[0], measure_hash_time(candidates[0], samples)
+    for method in candidates[1:]:
+        elapsed = measure_hash_time(method, samples)
+        if elapsed > target:
+            break
+        chosen = method, elapsed
+    return chosen
+
+
+@click.command("calibrate-password-hash")
+@click.option("--algorithm", type=click.Choice(ALGORITHMS), default="scrypt", show_default=True)
+@click.option("--target-ms", type=float, default=250.0, show_default=True, help="Целевое время одной проверки пароля")
+@click.option("--samples", type=int, default=3, show_default=True, help="Количество замеров каждого варианта")
+@with_appcontext
+def calibrate_command(algorithm: str, target_ms: float, samples: int) -> None:
+    """
+    Подбирает параметры хеширования паролей под целевое время на текущем CPU.
+
+    Выводит строку PASSWORD_HASH_METHOD для app_config.toml и пропускную способность
+    проверки паролей на одно ядро.
+    """
+    current = current_app.extensions.get("password_hasher")
+    if current is not None:
+        click.echo(f"Текущий метод: {current.method}, {measure_hash_time(current.method, samples) * 1e3:.1f} мс")
+    method, elapsed = calibrate(algorithm, target_ms / 1e3, samples)
+    click.echo(f"Подобранный метод: {method}, {elapsed * 1e3:.1f} мс, ~{1 / elapsed:.1f} входов/сек на ядро")
+    click.echo(f'PASSWORD_HASH_METHOD = "{method}"')
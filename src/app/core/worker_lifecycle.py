@@ -0,0 +1,99 @@
+import logging
+from typing import Dict, List
+
+from flask import Flask
+from redis import Redis, RedisError
+
+logger = logging.getLogger("app_logger")
+
+
+def _redis_clients(app: Flask) -> List[Redis]:
+    """
+    Возвращает клиенты Redis приложения: хранилище сессий, L2 кэша запросов и корзины попыток входа.
+
+    :param app: Flask-приложение.
+    :return: Список клиентов Redis без повторов.
+    """
+    clients: List[Redis] = []
+    query_cache = app.extensions.get("query_cache")
+    login_throttle = app.extensions.get("login_throttle")
+    for client in (
+        app.config.get("SESSION_REDIS"),
+        getattr(query_cache, "redis", None),
+        getattr(login_throttle, "redis", None),
+    ):
+        if client is not None and all(client is not known for known in clients):
+            clients.append(client)
+    return clients
+
+
+def prewarm_redis(client: Redis, connections: int) -> int:
+    """
+    Заранее открывает соединения пула клиента Redis.
+
+    :param client: Клиент Redis.
+    :param connections: Количество соединений.
+    :return: Количество открытых соединений.
+    """
+    pool = client.connection_pool
+    held = []
+    try:
+        for _ in range(connections):
+            held.append(pool.get_connection("PING"))
+    except RedisError as e:
+        logger.warning(f"Прогрев пула соединений Redis прерван: {e}")
+    finally:
+        for connection in held:
+            pool.release(connection)
+    return len(held)
+
+
+def after_fork(app: Flask) -> None:
+    """
+    Подготавливает ресурсы приложения в воркере после fork из процесса с предзагруженным приложением.
+
+    Пулы соединений БД сбрасываются без закрытия соединений родителя, пулы Redis сбрасываются,
+    а фоновые потоки (подписка на инвалидацию кэша, отслеживание каталога запросов,
+    захват планов медленных запросов, пересчёт хешей паролей) и корзины попыток входа создаются заново.
+
+    :param app: Flask-приложение, загруженное до fork.
+    """
+    for name in (
+        "db_core",
+        "async_db_core",
+        "query_cache",
+        "slow_query_log",
+        "password_hasher",
+        "login_throttle",
+        "login_filter",
+        "role_permissions",
+    ):
+        component = app.extensions.get(name)
+        if component is not None:
+            component.after_fork()
+    session_redis = app.config.get("SESSION_REDIS")
+    if session_redis is not None:
+        session_redis.connection_pool.reset()
+    logger.info("Ресурсы приложения переинициализированы после fork")
+
+
+def prewarm(app: Flask) -> Dict[str, int]:
+    """
+    Заранее открывает соединения с БД и Redis до начала обработки запросов воркером.
+
+    Количество соединений задаётся `SQLALCHEMY_POOL_PREWARM` (на каждый движок) и `REDIS_POOL_PREWARM`
+    (на каждый клиент Redis); 0 отключает прогрев.
+
+    :param app: Flask-приложение.
+    :return: Количество открытых соединений: `database` и `redis`.
+    """
+    opened = {"database": 0, "redis": 0}
+    db_core = app.extensions.get("db_core")
+    db_connections = app.config.get("SQLALCHEMY_POOL_PREWARM") or 0
+    if db_core is not None and db_connections > 0:
+        opened["database"] = db_core.prewarm(db_connections)
+    redis_connections = app.config.get("REDIS_POOL_PREWARM") or 0
+    if redis_connections > 0:
+        opened["redis"] = sum(prewarm_redis(client, redis_connections) for client in _redis_clients(app))
+    logger.info(f"Соединения воркера прогреты: БД {opened['database']}, Redis {opened['redis']}")
+    return opened
@@ -0,0 +1,148 @@
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+from flask import Flask
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import (AsyncEngine, AsyncSession,
+                                    async_sessionmaker, create_async_engine)
+from sqlalchemy.pool import NullPool
+
+from src.app.utils.error_handlers import handle_error_for_database
+
+from .db_core import DatabaseCore
+from .pool_metrics import PoolMetrics
+
+logger = logging.getLogger("app_db_logger")
+
+
+class AsyncDatabaseCore:
+    """
+    Управление асинхронным движком SQLAlchemy и асинхронными сессиями.
+
+    Работает с той же базой данных, что и `DatabaseCore`, через асинхронный драйвер
+    (asyncpg для PostgreSQL, aiosqlite для SQLite). Таблицы и каталог запросов
+    создаются и загружаются синхронным `DatabaseCore`; асинхронное ядро только выполняет запросы.
+
+    Flask выполняет каждое `async def` представление в собственном цикле событий, а соединения
+    асинхронных драйверов привязаны к циклу, в котором созданы. Поэтому по умолчанию
+    (`SQLALCHEMY_ASYNC_USE_NULL_POOL`) соединения не переиспользуются между запросами;
+    пул имеет смысл включать только под ASGI-сервером с общим циклом событий.
+    """
+
+    __slots__ = ("engine", "Session", "pool_metrics")
+
+    # Асинхронные драйверы по имени бэкенда синхронного URI
+    ASYNC_DRIVERS = {
+        "postgresql": "asyncpg",
+        "sqlite": "aiosqlite",
+    }
+
+    def __init__(self, app: Optional[Flask] = None) -> None:
+        """
+        Инициализирует AsyncDatabaseCore.
+
+        :param app: Flask-приложение (если используется).
+        """
+        self.engine: Optional[AsyncEngine] = None
+        self.Session: Optional[async_sessionmaker[AsyncSession]] = None
+        self.pool_metrics = PoolMetrics()
+        if app is not None:
+            self.init_app(app)
+
+    @classmethod
+    def build_async_uri(cls, database_uri: str) -> URL:
+        """
+        Формирует URI асинхронного драйвера из URI синхронного подключения.
+
+        :param database_uri: URI подключения синхронного движка.
+        :return: URI с асинхронным драйвером.
+        :raises ValueError: Если для бэкенда нет поддерживаемого асинхронного драйвера.
+        """
+        url = make_url(database_uri)
+        driver = cls.ASYNC_DRIVERS.get(url.get_backend_name())
+        if driver is None:
+            raise ValueError(f"Асинхронный драйвер для '{url.get_backend_name()}' не поддерживается.")
+        return url.set(drivername=f"{url.get_backend_name()}+{driver}")
+
+    @asynccontextmanager
+    async def session_scope(self) -> AsyncIterator[AsyncSession]:
+        """
+        Асинхронный контекст транзакции базы данных.
+
+        :return: Асинхронная SQLAlchemy-сессия.
+        :raises RuntimeError: Если асинхронный движок не инициализирован.
+        """
+        if self.Session is None:
+            raise RuntimeError("Асинхронный движок базы данных не инициализирован.")
+        session = self.Session()
+        logger.debug("Создана новая асинхронная сессия базы данных")
+        try:
+            yield session
+            await session.commit()
+        except Exception as e:
+            logger.error(f"Ошибка асинхронной транзакции: {e}")
+            await session.rollback()
+            raise
+        finally:
+            logger.debug("Закрытие асинхронной сессии базы данных")
+            await session.close()
+
+    def __build_engine_options(self, url: URL, config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Формирует параметры асинхронного движка из конфигурации приложения.
+
+        :param url: URI асинхронного подключения.
+        :param config: Конфигурация Flask-приложения.
+        :return: Словарь именованных аргументов для `create_async_engine`.
+        """
+        mapping = dict(DatabaseCore.ENGINE_OPTIONS)
+        if config.get("SQLALCHEMY_ASYNC_USE_NULL_POOL", True):
+            return {"echo": config.get("SQLALCHEMY_ECHO", False), "poolclass": NullPool}
+        if url.get_backend_name() != "sqlite":
+            mapping.update(DatabaseCore.QUEUE_POOL_OPTIONS)
+        return {option: config[key] for key, option in mapping.items() if config.get(key) is not None}
+
+    @handle_error_for_database
+    def init_app(self, app: Flask) -> None:
+        """
+        Инициализация асинхронного движка с Flask приложением.
+
+        URI берётся из `SQLALCHEMY_ASYNC_DATABASE_URI`, а если он не задан — выводится из
+        `SQLALCHEMY_DATABASE_URI` заменой драйвера. Если асинхронный драйвер не установлен,
+        асинхронное ядро остаётся неинициализированным, а синхронная работа не затрагивается.
+
+        :param app: Flask-приложение.
+        """
+        database_uri = app.config.get("SQLALCHEMY_ASYNC_DATABASE_URI") or app.config.get("SQLALCHEMY_DATABASE_URI")
+        if not database_uri:
+            raise ValueError(
+                "Параметр конфигурации 'SQLALCHEMY_DATABASE_URI' не определён. Проверьте конфигурацию приложения."
+            )
+        url = self.build_async_uri(database_uri)
+        try:
+            self.engine = create_async_engine(url, **self.__build_engine_options(url, app.config))
+        except ImportError as e:
+            logger.warning(
+                f"Асинхронный драйвер '{url.get_driver_name()}' не установлен, async-запросы недоступны: {e}"
+            )
+            return
+        self.pool_metrics.attach(self.engine.sync_engine)
+        self.Session = async_sessionmaker(bind=self.engine, expire_on_commit=False)
+        logger.info(f"Асинхронный движок базы данных создан: {url.render_as_string(hide_password=True)}")
+
+    def after_fork(self) -> None:
+        """
+        Сбрасывает пул асинхронного движка, унаследованный дочерним процессом после fork.
+
+        Соединения родительского процесса не закрываются (`close=False`).
+        """
+        if self.engine is not None:
+            self.engine.sync_engine.dispose(close=False)
+
+    async def dispose(self) -> None:
+        """
+        Закрывает пул соединений асинхронного движка.
+        """
+        if self.engine is not None:
+            await self.engine.dispose()
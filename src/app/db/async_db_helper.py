@@ -0,0 +1,218 @@
+import asyncio
+import logging
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy.engine import Result
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.utils.error_handlers import handle_db_helper_errors
+from src.app.utils.profiler import profile_sql_execution
+
+from .async_db_core import AsyncDatabaseCore
+from .query_cache import QueryCache
+from .query_manager import QueryManager
+from .records import check_shape, row_converter
+from .slow_query_log import SlowQueryLog
+
+logger = logging.getLogger("app_db_logger")
+
+
+class AsyncDBHelperSQL:
+    """
+    Асинхронный вспомогательный класс для работы с базой данных.
+
+    Повторяет интерфейс `DBHelperSQL` для `async def` представлений и контроллеров: запросы
+    берутся из того же каталога `QueryManager`, ошибки и время выполнения обрабатываются
+    теми же декораторами, формы строк результата (`dict`, `tuple`, `record`) совпадают.
+
+    Основные методы:
+    - execute_query: Выполнение SELECT-запросов.
+    - execute_first / execute_one_or_none: Получение одной строки.
+    - execute_scalar: Получение первого столбца первой строки.
+    - execute_update: Выполнение INSERT, UPDATE или DELETE-запросов.
+    - execute_many: Пакетное выполнение одного запроса для множества наборов параметров.
+
+    Результаты запросов не читаются из `QueryCache` (его L2 работает через синхронный клиент Redis),
+    но запросы с секцией `invalidates` инвалидируют кэш так же, как в `DBHelperSQL`.
+    """
+
+    __slots__ = ("db_core", "query_manager", "query_cache", "slow_query_log")
+
+    def __init__(
+        self,
+        db_core: AsyncDatabaseCore,
+        query_manager: QueryManager,
+        query_cache: Optional[QueryCache] = None,
+        slow_query_log: Optional[SlowQueryLog] = None,
+    ) -> None:
+        """
+        Инициализация AsyncDBHelperSQL.
+
+        :param db_core: Экземпляр AsyncDatabaseCore для управления асинхронными сессиями.
+        :param query_manager: Экземпляр QueryManager, общий с синхронным DBHelperSQL.
+        :param query_cache: Кэш результатов запросов для инвалидации (опционально).
+        :param slow_query_log: Захват планов медленных запросов, общий с DBHelperSQL (опционально).
+        """
+        self.db_core = db_core
+        self.query_manager = query_manager
+        self.query_cache = query_cache
+        self.slow_query_log = slow_query_log
+
+    @profile_sql_execution
+    @handle_db_helper_errors
+    async def execute_query(
+        self,
+        query_name: str,
+        params: Optional[Dict[str, Any]] = None,
+        shape: str = "dict",
+    ) -> List[Any]:
+        """
+        Выполнить SELECT-запрос по имени.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Параметры для SQL-запроса (опционально).
+        :param shape: Форма строк результата: `dict`, `tuple` или `record`.
+        :return: Список строк результата.
+        """
+        check_shape(shape)
+        async with self.db_core.session_scope() as session:
+            result = await self.__execute(session, query_name, params)
+            convert = row_converter(self.query_manager, query_name, list(result.keys()), shape)
+            logger.debug(f"Запрос {query_name} успешно выполнено")
+            return [convert(row) for row in result]
+
+    @profile_sql_execution
+    @handle_db_helper_errors(default=None)
+    async def execute_first(
+        self,
+        query_name: str,
+        params: Optional[Dict[str, Any]] = None,
+        shape: str = "dict",
+    ) -> Optional[Any]:
+        """
+        Выполнить SELECT-запрос по имени и получить первую строку результата.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Параметры для SQL-запроса (опционально).
+        :param shape: Форма строки результата: `dict`, `tuple` или `record`.
+        :return: Первая строка результата или None, если результат пуст.
+        """
+        check_shape(shape)
+        async with self.db_core.session_scope() as session:
+            result = await self.__execute(session, query_name, params)
+            convert = row_converter(self.query_manager, query_name, list(result.keys()), shape)
+            row = result.first()
+            logger.debug(f"Запрос {query_name} успешно выполнено")
+            return convert(row) if row is not None else None
+
+    @profile_sql_execution
+    @handle_db_helper_errors(default=None)
+    async def execute_one_or_none(
+        self,
+        query_name: str,
+        params: Optional[Dict[str, Any]] = None,
+        shape: str = "dict",
+    ) -> Optional[Any]:
+        """
+        Выполнить SELECT-запрос по имени, ожидая не более одной строки результата.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Параметры для SQL-запроса (опционально).
+        :param shape: Форма строки результата: `dict`, `tuple` или `record`.
+        :return: Единственная строка результата или None.
+        """
+        check_shape(shape)
+        async with self.db_core.session_scope() as session:
+            result = await self.__execute(session, query_name, params)
+            convert = row_converter(self.query_manager, query_name, list(result.keys()), shape)
+            row = result.one_or_none()
+            logger.debug(f"Запрос {query_name} успешно выполнено")
+            return convert(row) if row is not None else None
+
+    @profile_sql_execution
+    @handle_db_helper_errors(default=None)
+    async def execute_scalar(self, query_name: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Выполнить SELECT-запрос по имени и получить значение первого столбца первой строки.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Параметры для SQL-запроса (опционально).
+        :return: Значение или None, если результат пуст.
+        """
+        async with self.db_core.session_scope() as session:
+            result = await self.__execute(session, query_name, params)
+            logger.debug(f"Запрос {query_name} успешно выполнено")
+            return result.scalar()
+
+    @profile_sql_execution
+    @handle_db_helper_errors
+    async def execute_update(self, query_name: str, params: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Выполнить INSERT, UPDATE или DELETE-запрос по имени.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Параметры для SQL-запроса (опционально).
+        """
+        async with self.db_core.session_scope() as session:
+            await self.__execute(session, query_name, params)
+        await self.__invalidate_cache(query_name)
+        logger.debug(f"Запрос {query_name} успешно выполнено")
+        return True
+
+    @profile_sql_execution
+    @handle_db_helper_errors
+    async def execute_many(
+        self,
+        query_name: str,
+        params: Iterable[Dict[str, Any]],
+        chunk_size: int = 1000,
+    ) -> List[int]:
+        """
+        Выполнить запрос по имени для множества наборов параметров в одной транзакции.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Итерируемый набор словарей параметров.
+        :param chunk_size: Количество наборов параметров в одной порции.
+        :return: Количество затронутых строк по каждой порции (-1, если драйвер его не сообщает).
+        """
+        if chunk_size < 1:
+            raise ValueError("Параметр chunk_size должен быть положительным.")
+        statement = self.query_manager.get_statement(query_name)
+        affected: List[int] = []
+        async with self.db_core.session_scope() as session:
+            iterator = iter(params)
+            while chunk := list(islice(iterator, chunk_size)):
+                result = await session.execute(statement, chunk)
+                self.query_manager.record_cache_result(query_name, result.context.cache_hit)
+                sane_rowcount = result.context.dialect.supports_sane_multi_rowcount or len(chunk) == 1
+                affected.append(result.rowcount if sane_rowcount else -1)
+        await self.__invalidate_cache(query_name)
+        logger.debug(f"Запрос {query_name} успешно выполнено пакетно: {len(affected)} порций")
+        return affected
+
+    async def __execute(self, session: AsyncSession, query_name: str, params: Optional[Dict[str, Any]]) -> Result[Any]:
+        """
+        Выполняет подготовленное выражение запроса в асинхронной сессии и учитывает обращение к кэшу компиляции.
+
+        :param session: Асинхронная SQLAlchemy-сессия.
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Параметры для SQL-запроса.
+        :return: Буферизованный результат выполнения запроса.
+        """
+        statement = self.query_manager.get_statement(query_name)
+        result = await session.execute(statement, params or {})
+        self.query_manager.record_cache_result(query_name, result.context.cache_hit)
+        return result
+
+    async def __invalidate_cache(self, query_name: str) -> None:
+        """
+        Инвалидирует теги кэша, объявленные в секции `invalidates` выполненного запроса.
+
+        Инвалидация выполняется в отдельном потоке, чтобы обращение к Redis не блокировало цикл событий.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        """
+        tags = self.query_manager.get_definition(query_name).invalidates
+        if self.query_cache is not None and tags:
+            await asyncio.to_thread(self.query_cache.invalidate, tags)
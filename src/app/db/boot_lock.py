@@ -0,0 +1,167 @@
+import fcntl
+import logging
+import os
+import time
+import zlib
+from typing import Callable, Optional
+
+from flask import Flask
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from .db_core import DatabaseCore
+
+logger = logging.getLogger("app_db_logger")
+
+# Освобождение захваченной блокировки
+Release = Callable[[], None]
+
+
+class BootLockTimeoutError(RuntimeError):
+    """
+    Задачи запуска не были выполнены другим процессом за отведённое время.
+    """
+
+
+class BootLock:
+    """
+    Выбор лидера для задач запуска, работающих с БД (создание таблиц и начальные данные).
+
+    Задачи выполняет ровно один процесс среди всех воркеров и подов, захвативший блокировку:
+    - PostgreSQL: сессионная advisory-блокировка (`pg_try_advisory_lock`) на выделенном соединении;
+    - SQLite (файловая БД): блокировка `fcntl.flock` файла `<путь к БД>.boot.lock`;
+    - SQLite in-memory и прочие диалекты: блокировка не нужна или недоступна, задачи выполняются сразу.
+
+    Остальные процессы не ждут на блокировке, а опрашивают флаг готовности — совпадение
+    отпечатка схемы в `app_state` (`DatabaseCore.is_schema_current`). Если лидер завершился,
+    не выполнив задачи, блокировка освобождается и её захватывает один из ожидающих.
+    """
+
+    __slots__ = ("db_core", "timeout", "poll_interval")
+
+    # Ключ advisory-блокировки PostgreSQL (общий для всех процессов приложения)
+    ADVISORY_LOCK_KEY = zlib.crc32(b"web_panel:boot")
+
+    def __init__(self, db_core: DatabaseCore, timeout: float = 120.0, poll_interval: float = 0.5) -> None:
+        """
+        Инициализация BootLock.
+
+        :param db_core: DatabaseCore с инициализированным движком основной БД.
+        :param timeout: Максимальное время ожидания готовности (в секундах).
+        :param poll_interval: Интервал опроса флага готовности и блокировки (в секундах).
+        """
+        self.db_core = db_core
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Настраивает время ожидания из конфигурации приложения.
+
+        :param app: Flask-приложение.
+        """
+        self.timeout = app.config.get("SQLALCHEMY_BOOT_LOCK_TIMEOUT", self.timeout)
+
+    def run(self, task: Callable[[], None]) -> bool:
+        """
+        Выполняет задачи запуска в процессе-лидере или дожидается их выполнения другим процессом.
+
+        :param task: Задачи запуска.
+        :return: True, если задачи выполнены текущим процессом.
+        :raises BootLockTimeoutError: Если готовность не достигнута за `timeout` секунд.
+        :raises RuntimeError: Если движок основной БД не инициализирован.
+        """
+        engine = self.db_core.engine
+        if engine is None:
+            raise RuntimeError("Движок основной БД не инициализирован, задачи запуска не могут быть выполнены")
+        start_time = time.monotonic()
+        deadline = start_time + self.timeout
+        while True:
+            if self.db_core.is_schema_current():
+                logger.info(f"База данных готова, ожидание {time.monotonic() - start_time:.3f} сек.")
+                return False
+            release = self.__acquire(engine)
+            if release is not None:
+                acquired_at = time.monotonic()
+                logger.info(f"Блокировка задач запуска захвачена, ожидание {acquired_at - start_time:.3f} сек.")
+                try:
+                    task()
+                finally:
+                    release()
+                    held = time.monotonic() - acquired_at
+                    logger.info(f"Блокировка задач запуска освобождена, удержание {held:.3f} сек.")
+                return True
+            if time.monotonic() >= deadline:
+                raise BootLockTimeoutError(
+                    f"База данных не подготовлена другим процессом за {self.timeout} сек. ожидания"
+                )
+            time.sleep(self.poll_interval)
+
+    def __acquire(self, engine: Engine) -> Optional[Release]:
+        """
+        Пытается захватить блокировку без ожидания.
+
+        :param engine: Движок основной БД.
+        :return: Функция освобождения блокировки или None, если блокировка занята.
+        """
+        if engine.dialect.name == "postgresql":
+            return self.__acquire_advisory(engine)
+        database = engine.url.database
+        if engine.dialect.name == "sqlite" and database and database != ":memory:":
+            return self.__acquire_file(f"{database}.boot.lock")
+        return lambda: None
+
+    def __acquire_advisory(self, engine: Engine) -> Optional[Release]:
+        """
+        Захватывает advisory-блокировку PostgreSQL на выделенном соединении.
+
+        Соединение удерживается до освобождения: сессионная блокировка принадлежит соединению
+        и снимается сервером, если процесс завершился, не освободив её.
+
+        :param engine: Движок основной БД PostgreSQL.
+        :return: Функция освобождения блокировки или None.
+        """
+        connection = engine.connect()
+        try:
+            acquired = connection.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": self.ADVISORY_LOCK_KEY}
+            ).scalar()
+            connection.commit()
+        except Exception:
+            connection.close()
+            raise
+        if not acquired:
+            connection.close()
+            return None
+
+        def release() -> None:
+            try:
+                connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self.ADVISORY_LOCK_KEY})
+                connection.commit()
+            finally:
+                connection.close()
+
+        return release
+
+    @staticmethod
+    def __acquire_file(lock_path: str) -> Optional[Release]:
+        """
+        Захватывает файловую блокировку рядом с файлом БД SQLite.
+
+        :param lock_path: Путь к файлу блокировки.
+        :return: Функция освобождения блокировки или None.
+        """
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return None
+
+        def release() -> None:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            finally:
+                os.close(fd)
+
+        return release
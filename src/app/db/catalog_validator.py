@@ -0,0 +1,171 @@
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from flask import Flask
+from sqlalchemy.engine import Connection
+
+from .db_core import DatabaseCore
+from .pagination import KeysetPolicy
+from .query_manager import QueryDefinition, QueryManager
+
+logger = logging.getLogger("app_db_logger")
+
+
+class CatalogValidationError(RuntimeError):
+    """
+    Каталог запросов не соответствует схеме подключённой базы данных.
+    """
+
+    def __init__(self, failures: Dict[str, str]) -> None:
+        """
+        Инициализация CatalogValidationError.
+
+        :param failures: Ошибки по именам запросов.
+        """
+        self.failures = failures
+        details = "; ".join(f"{name}: {error}" for name, error in sorted(failures.items()))
+        super().__init__(f"Каталог запросов не прошёл проверку ({len(failures)} ошибок): {details}")
+
+
+class CatalogValidator:
+    """
+    Проверка и прогрев каталога запросов на подключённой базе данных при запуске.
+
+    Для каждого запроса каталога:
+    - параметры SQL сверяются с секцией `binds` (если она объявлена, в ней должны быть все
+      параметры запроса) и ключами `cache.key_params`;
+    - запрос на чтение выполняется на основной БД подзапросом с `LIMIT 0` (`probe_statement`)
+      со значениями NULL всех параметров в откатываемой транзакции: база данных разбирает запрос,
+      но не читает строки, а колонки результата сверяются с секцией `columns`;
+    - для запроса с секцией `keyset` так же выполняются выражения первой и следующих страниц
+      с пустой страницей (`LIMIT 0`), что проверяет обёртку запроса, колонки ключа и прогревает
+      кэш компиляции SQLAlchemy для выражений, которые выполняет `DBHelperSQL`;
+    - запрос на запись не выполняется, а разбирается базой через `EXPLAIN`
+      (`EXPLAIN QUERY PLAN` в SQLite), что проверяет существование таблиц и колонок.
+
+    Ни один запрос не читает строки таблиц, поэтому время проверки не зависит от объёма данных.
+    """
+
+    __slots__ = ("db_core", "query_manager", "ready", "report")
+
+    # Префикс EXPLAIN для проверки запросов на запись по имени диалекта
+    EXPLAIN_PREFIXES = {"sqlite": "EXPLAIN QUERY PLAN "}
+    DEFAULT_EXPLAIN_PREFIX = "EXPLAIN "
+
+    def __init__(self, db_core: DatabaseCore, query_manager: QueryManager) -> None:
+        """
+        Инициализация CatalogValidator.
+
+        :param db_core: DatabaseCore с инициализированным движком основной БД.
+        :param query_manager: Загруженный каталог SQL-запросов.
+        """
+        self.db_core = db_core
+        self.query_manager = query_manager
+        self.ready = False  # Каталог проверен и процесс готов обслуживать запросы
+        self.report: Dict[str, Any] = {}
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Проверяет каталог при запуске приложения, если это включено в конфигурации.
+
+        :param app: Flask-приложение.
+        :raises CatalogValidationError: Если хотя бы один запрос не прошёл проверку.
+        """
+        if app.config.get("SQLALCHEMY_VALIDATE_QUERY_CATALOG", True):
+            self.validate()
+        else:
+            self.ready = True
+
+    def validate(self) -> Dict[str, Any]:
+        """
+        Проверяет и прогревает все запросы каталога.
+
+        :return: Отчёт: количество проверенных запросов, ошибки, время проверки и версия каталога.
+        :raises CatalogValidationError: Если хотя бы один запрос не прошёл проверку.
+        :raises RuntimeError: Если движок основной БД не инициализирован.
+        """
+        engine = self.db_core.engine
+        if engine is None:
+            raise RuntimeError("Движок основной БД не инициализирован, каталог запросов не может быть проверен")
+        self.ready = False
+        start_time = time.monotonic()
+        definitions = self.query_manager.definitions
+        failures: Dict[str, str] = {}
+        with engine.connect() as connection:
+            for name, definition in definitions.items():
+                error = self.__check(connection, definition)
+                if error is not None:
+                    failures[name] = error
+                    logger.error(f"Запрос '{name}' не прошёл проверку каталога: {error}")
+
+        self.report = {
+            "checked": len(definitions),
+            "failures": failures,
+            "elapsed": time.monotonic() - start_time,
+            "catalog_version": self.query_manager.catalog_version,
+        }
+        if failures:
+            raise CatalogValidationError(failures)
+        self.ready = True
+        logger.info(
+            f"Каталог запросов {self.report['catalog_version']} проверен: "
+            f"{len(definitions)} запросов за {self.report['elapsed']:.3f} сек."
+        )
+        return self.report
+
+    def __check(self, connection: Connection, definition: QueryDefinition) -> Optional[str]:
+        """
+        Проверяет один запрос каталога.
+
+        :param connection: Соединение с основной БД.
+        :param definition: Описание запроса.
+        :return: Описание ошибки или None, если запрос корректен.
+        """
+        statement = definition.statement
+        bind_names = list(statement.compile(dialect=connection.dialect).params)
+        error = self.__check_binds(definition, bind_names)
+        if error is not None:
+            return error
+
+        params = dict.fromkeys(bind_names)
+        transaction = connection.begin()
+        try:
+            if definition.mode != "read":
+                prefix = self.EXPLAIN_PREFIXES.get(connection.dialect.name, self.DEFAULT_EXPLAIN_PREFIX)
+                connection.execute(definition.explain_statement(prefix), params).close()
+                return None
+            result = connection.execute(definition.probe_statement(), params)
+            keys = list(result.keys())
+            result.close()
+            for page_statement in definition.page_statements or ():
+                page_params = dict.fromkeys(page_statement.compile(dialect=connection.dialect).params)
+                page_params[KeysetPolicy.LIMIT_PARAM] = 0
+                connection.execute(page_statement, page_params).close()
+        except Exception as e:
+            return f"{type(e).__name__}: {e}"
+        finally:
+            transaction.rollback()
+
+        if definition.columns and keys != list(definition.columns):
+            return f"колонки результата {keys} не совпадают с объявленными {list(definition.columns)}"
+        return None
+
+    @staticmethod
+    def __check_binds(definition: QueryDefinition, bind_names: List[str]) -> Optional[str]:
+        """
+        Сверяет параметры SQL с секциями `binds` и `cache.key_params`.
+
+        :param definition: Описание запроса.
+        :param bind_names: Имена параметров SQL-запроса.
+        :return: Описание ошибки или None.
+        """
+        if definition.binds:
+            undeclared = sorted(set(bind_names) - set(definition.binds))
+            if undeclared:
+                return f"параметры {undeclared} не объявлены в секции binds"
+        if definition.cache is not None and definition.cache.key_params:
+            unknown = sorted(set(definition.cache.key_params) - set(bind_names))
+            if unknown:
+                return f"ключи кэша {unknown} не являются параметрами запроса"
+        return None
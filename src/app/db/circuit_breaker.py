@@ -0,0 +1,270 @@
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Optional, TypeVar
+
+from sqlalchemy.exc import DBAPIError, OperationalError
+
+logger = logging.getLogger("app_db_logger")
+
+T = TypeVar("T")
+
+# SQLSTATE PostgreSQL недоступности сервера: ошибки соединения (класс 08), остановка сервера,
+# превышение числа соединений
+UNAVAILABLE_SQLSTATES = ("08", "57P01", "57P02", "57P03", "53300")
+# SQLSTATE PostgreSQL, после которых транзакцию можно безопасно повторить: конфликт сериализации, взаимоблокировка
+RETRYABLE_SQLSTATES = ("40001", "40P01")
+
+
+class DatabaseUnavailableError(RuntimeError):
+    """
+    База данных недоступна: соединение не устанавливается или автомат защиты разомкнут.
+
+    В отличие от пустого результата ("не найдено"), означает, что ответ на запрос неизвестен.
+    """
+
+    def __init__(self, message: str, retry_after: Optional[float] = None) -> None:
+        """
+        Инициализация DatabaseUnavailableError.
+
+        :param message: Описание ошибки.
+        :param retry_after: Через сколько секунд имеет смысл повторить запрос (если известно).
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _sqlstate(error: BaseException) -> Optional[str]:
+    """
+    Возвращает SQLSTATE исходной ошибки драйвера (psycopg2 — `pgcode`, psycopg/asyncpg — `sqlstate`).
+
+    :param error: Исключение SQLAlchemy.
+    :return: Код SQLSTATE или None.
+    """
+    orig = getattr(error, "orig", None)
+    return getattr(orig, "pgcode", None) or getattr(orig, "sqlstate", None)
+
+
+def _is_sqlite_error(error: DBAPIError) -> bool:
+    """
+    Проверяет, что исходная ошибка получена от драйвера sqlite3.
+
+    :param error: Исключение SQLAlchemy.
+    :return: True для ошибок SQLite.
+    """
+    return type(error.orig).__module__.startswith("sqlite3")
+
+
+def is_unavailable_error(error: BaseException) -> bool:
+    """
+    Проверяет, что ошибка означает недоступность сервера БД, а не ошибку самого запроса.
+
+    В SQLite `OperationalError` означает ошибку запроса (например, отсутствие таблицы),
+    поэтому недоступностью считается только разрыв соединения.
+
+    :param error: Перехваченное исключение.
+    :return: True, если сервер БД недоступен.
+    """
+    if isinstance(error, DatabaseUnavailableError):
+        return True
+    if not isinstance(error, DBAPIError) or error.orig is None:
+        return False
+    if error.connection_invalidated:
+        return True
+    sqlstate = _sqlstate(error)
+    if sqlstate:
+        return sqlstate.startswith(UNAVAILABLE_SQLSTATES)
+    # Без SQLSTATE OperationalError драйвера сервера означает ошибку установки соединения
+    return isinstance(error, OperationalError) and not _is_sqlite_error(error)
+
+
+def is_retryable_error(error: BaseException, idempotent: bool = True) -> bool:
+    """
+    Проверяет, что запрос после ошибки можно выполнить повторно в новой транзакции.
+
+    Конфликт сериализации, взаимоблокировка и блокировка файла SQLite гарантируют откат
+    транзакции, поэтому повторяются для любых запросов. Недоступность сервера повторяется
+    только для идемпотентных запросов (чтения): при разрыве соединения во время фиксации
+    неизвестно, была ли запись применена.
+
+    :param error: Перехваченное исключение.
+    :param idempotent: Запрос можно безопасно выполнить повторно.
+    :return: True, если запрос можно повторить.
+    """
+    if isinstance(error, DatabaseUnavailableError) or not isinstance(error, DBAPIError) or error.orig is None:
+        return False
+    if _sqlstate(error) in RETRYABLE_SQLSTATES:
+        return True
+    if isinstance(error, OperationalError) and _is_sqlite_error(error) and "locked" in str(error.orig):
+        return True
+    return idempotent and is_unavailable_error(error)
+
+
+class CircuitBreaker:
+    """
+    Автомат защиты (circuit breaker) движка БД с состояниями:
+    - `closed`: запросы выполняются, подряд идущие ошибки недоступности считаются;
+    - `open`: после `failure_threshold` ошибок подряд запросы сразу завершаются
+      `DatabaseUnavailableError`, не дожидаясь таймаута соединения;
+    - `half_open`: через `reset_timeout` секунд пропускается один пробный запрос; успех замыкает
+      автомат, ошибка снова размыкает его.
+
+    Также выполняет повтор запросов после временных ошибок (`call`) с экспоненциальной
+    задержкой и полным случайным разбросом (full jitter), чтобы воркеры не повторяли запросы
+    одновременно.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    # Максимальная задержка между повторами (в секундах)
+    MAX_RETRY_DELAY = 1.0
+
+    __slots__ = (
+        "name",
+        "failure_threshold",
+        "reset_timeout",
+        "retry_attempts",
+        "retry_base_delay",
+        "state",
+        "failures",
+        "_opened_at",
+        "_probe_started",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        name: str = "primary",
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        retry_attempts: int = 2,
+        retry_base_delay: float = 0.05,
+    ) -> None:
+        """
+        Инициализация CircuitBreaker.
+
+        :param name: Имя движка для логов.
+        :param failure_threshold: Количество ошибок недоступности подряд, после которого автомат размыкается.
+        :param reset_timeout: Время (в секундах) до пробного запроса после размыкания.
+        :param retry_attempts: Количество повторов запроса после временной ошибки.
+        :param retry_base_delay: Базовая задержка перед повтором (в секундах), удваивается с каждой попыткой.
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.retry_attempts = retry_attempts
+        self.retry_base_delay = retry_base_delay
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probe_started: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """
+        Разрешает обращение к БД или сразу отклоняет его, если автомат разомкнут.
+
+        :raises DatabaseUnavailableError: Если автомат разомкнут или пробный запрос уже выполняется.
+        """
+        if self.state == self.CLOSED:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if self.state == self.OPEN:
+                remaining = self._opened_at + self.reset_timeout - now
+                if remaining > 0:
+                    raise DatabaseUnavailableError(f"База данных '{self.name}' недоступна", retry_after=remaining)
+                self.state = self.HALF_OPEN
+                logger.info(f"Автомат защиты БД '{self.name}': пробный запрос")
+            elif self.state == self.HALF_OPEN:
+                if self._probe_started is not None and now - self._probe_started < self.reset_timeout:
+                    raise DatabaseUnavailableError(
+                        f"База данных '{self.name}' недоступна, выполняется пробный запрос",
+                        retry_after=self.reset_timeout,
+                    )
+            else:
+                return
+            self._probe_started = now
+
+    def record_success(self) -> None:
+        """
+        Учитывает успешное обращение к БД: сбрасывает счётчик ошибок и замыкает автомат.
+        """
+        if self.state == self.CLOSED and self.failures == 0:
+            return
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info(f"Автомат защиты БД '{self.name}' замкнут: соединение восстановлено")
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probe_started = None
+
+    def record_error(self, error: BaseException) -> None:
+        """
+        Учитывает ошибку обращения к БД.
+
+        Ошибка недоступности увеличивает счётчик ошибок и может разомкнуть автомат. Остальные
+        ошибки (целостности, синтаксиса) означают, что сервер ответил, и учитываются как успех.
+
+        :param error: Перехваченное исключение.
+        """
+        if isinstance(error, DatabaseUnavailableError):
+            return
+        if not is_unavailable_error(error):
+            self.record_success()
+            return
+        with self._lock:
+            self.failures += 1
+            self._probe_started = None
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.error(
+                        f"Автомат защиты БД '{self.name}' разомкнут после {self.failures} ошибок подряд "
+                        f"на {self.reset_timeout} сек.: {error}"
+                    )
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def after_fork(self) -> None:
+        """
+        Восстанавливает блокировку в дочернем процессе после fork: блокировка родителя
+        могла быть захвачена другим его потоком в момент fork.
+        """
+        self._lock = threading.Lock()
+
+    def call(self, func: Callable[..., T], *args: Any, idempotent: bool = True, **kwargs: Any) -> T:
+        """
+        Выполняет функцию, повторяя её после временных ошибок БД.
+
+        Функция должна открывать собственную транзакцию: повтор внутри уже начатой
+        транзакции невозможен.
+
+        :param func: Функция, выполняющая запрос.
+        :param idempotent: Запрос можно повторить после разрыва соединения (чтение).
+        :return: Результат функции.
+        """
+        attempt = 0
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if attempt >= self.retry_attempts or not is_retryable_error(e, idempotent):
+                    raise
+                delay = self.backoff(attempt)
+                attempt += 1
+                logger.warning(
+                    f"Повтор запроса к БД '{self.name}' ({attempt}/{self.retry_attempts}) через {delay:.3f} сек.: {e}"
+                )
+                time.sleep(delay)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Вычисляет задержку перед повтором: случайное значение от 0 до экспоненциальной границы.
+
+        :param attempt: Номер попытки, начиная с 0.
+        :return: Задержка (в секундах).
+        """
+        return random.uniform(0, min(self.MAX_RETRY_DELAY, self.retry_base_delay * 2**attempt))  # nosec B311
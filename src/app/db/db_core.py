@@ -1,17 +1,35 @@
+import hashlib
 import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
-from typing import Any, Dict, List, Optional, Type
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, cast
 
 import yaml
-from flask import Flask
-from sqlalchemy import MetaData, create_engine
+from flask import Flask, g, has_request_context
+from sqlalchemy import Insert, MetaData, create_engine, insert, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import Session, sessionmaker
-from werkzeug.security import generate_password_hash
+from sqlalchemy.schema import CreateIndex, CreateTable
 
+from src.app.core.password_hasher import (PasswordHasher, hash_password,
+                                          normalize_method)
 from src.app.utils.error_handlers import handle_error_for_database
 
-from .models import (AbstractModel, PermissionModel, RoleModel,
+from .circuit_breaker import CircuitBreaker
+from .models import (AbstractModel, AppStateModel, PermissionModel, RoleModel,
                      RolePermissionModel, UserModel)
+from .pool_metrics import PoolMetrics
+from .query_cache import QueryCache
+from .query_manager import QueryManager
+from .replica_router import ReplicaRouter
 
 logger = logging.getLogger("app_db_logger")
 
@@ -24,15 +42,28 @@ class DatabaseInitializer:
     - Права доступа (permissions)
     - Роли (roles) и их привязки к правам
     - Пользователей (users) и их привязки к ролям.
+
+    Каждая таблица заполняется пакетно: существующие записи загружаются одним запросом,
+    отсутствующие вставляются одним INSERT.
     """
 
-    def __init__(self, config_path: str) -> None:
+    # Количество создаваемых пользователей, начиная с которого пароли хешируются в пуле процессов
+    PARALLEL_HASH_THRESHOLD = 8
+    # Конструкторы INSERT с поддержкой ON CONFLICT DO NOTHING по имени диалекта
+    UPSERT_INSERTS: Dict[str, Callable[..., Insert]] = {
+        "postgresql": postgresql_insert,
+        "sqlite": sqlite_insert,
+    }
+
+    def __init__(self, config_path: str, hash_method: str = "scrypt") -> None:
         """
         Инициализация экземпляра DatabaseInitializer.
 
         :param config_path: Путь к YAML-файлу с начальными данными.
+        :param hash_method: Метод хеширования паролей создаваемых пользователей (см. `PASSWORD_HASH_METHOD`).
         """
         self.config_path: str = config_path
+        self.hash_method: str = normalize_method(hash_method)
 
     def initialize_db(self, session: Session) -> None:
         """
@@ -79,93 +110,144 @@ class DatabaseInitializer:
             logger.error(f"Ошибка чтения файла конфигурации {self.config_path}: {e}")
             raise
 
-    def __get_or_create(
-        self,
-        session: Session,
-        model: Type[AbstractModel],
-        filters: Dict[str, Any],
-        defaults: Dict[str, Any] = {},
-    ) -> AbstractModel:
+    def _hash_passwords(self, passwords: List[str]) -> List[str]:
+        """
+        Хеширует пароли создаваемых пользователей.
+
+        Хеширование намеренно медленное, поэтому начиная с `PARALLEL_HASH_THRESHOLD` паролей
+        оно распределяется по пулу процессов (по одному на ядро, если ядер больше одного).
+        К этому моменту в процессе уже работают фоновые потоки (отслеживание каталога запросов,
+        подписка кэша), поэтому процессы пула запускаются тем же способом, что и в `PasswordHasher`, без fork.
+
+        :param passwords: Пароли в открытом виде.
+        :return: Хеши паролей в том же порядке.
+        """
+        hash_func = partial(hash_password, method=self.hash_method)
+        workers = min(os.cpu_count() or 1, len(passwords))
+        if workers < 2 or len(passwords) < self.PARALLEL_HASH_THRESHOLD:
+            return [hash_func(password) for password in passwords]
+        chunk_size = max(1, len(passwords) // (workers * 4))
+        logger.info(f"Хеширование {len(passwords)} паролей в {workers} процессах")
+        context = multiprocessing.get_context(PasswordHasher.POOL_START_METHOD)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            return list(executor.map(hash_func, passwords, chunksize=chunk_size))
+
+    @classmethod
+    def __insert_missing(
+        cls, session: Session, model: Type[AbstractModel], rows: List[Dict[str, Any]], conflict_columns: List[str]
+    ) -> None:
+        """
+        Вставляет строки одним пакетным INSERT, пропуская конфликты по уникальному индексу.
+
+        В PostgreSQL и SQLite используется `INSERT ... ON CONFLICT DO NOTHING`, поэтому одновременная
+        инициализация в нескольких процессах не завершается ошибкой уникальности.
+
+        :param session: Сессия базы данных.
+        :param model: Модель базы данных.
+        :param rows: Значения вставляемых строк.
+        :param conflict_columns: Колонки уникального индекса.
         """
-        Получает существующую запись или создаёт новую.
+        if not rows:
+            return
+        dialect_insert = cls.UPSERT_INSERTS.get(session.get_bind().dialect.name)
+        if dialect_insert is not None:
+            statement = dialect_insert(model).on_conflict_do_nothing(index_elements=conflict_columns)
+        else:
+            statement = insert(model)
+        session.execute(statement, rows)
+        logger.info(f"Добавлено записей в {model.__name__}: {len(rows)}")
+
+    @staticmethod
+    def __load_ids(session: Session, key_column: Any, id_column: Any) -> Dict[Any, int]:
+        """
+        Загружает идентификаторы всех записей таблицы одним запросом.
 
         :param session: Сессия базы данных.
-        :param model: Модель базы данных, с которой выполняется работа.
-        :param filters: Условия поиска существующей записи.
-        :param defaults: Значения по умолчанию для создания новой записи.
-        :return: Экземпляр модели (существующий или новый).
-        """
-        instance = session.query(model).filter_by(**filters).first()
-        if instance is None:
-            instance = model(**{**filters, **defaults})
-            session.add(instance)
-            logger.info(f"Добавлена новая запись в {model.__name__}: {filters}")
-        return instance  # type: ignore
+        :param key_column: Колонка с уникальным именем записи.
+        :param id_column: Колонка идентификатора.
+        :return: Словарь имя -> идентификатор.
+        """
+        return dict(session.execute(select(key_column, id_column)).tuples().all())
 
     @handle_error_for_database
     def _add_default_permissions(self, session: Session, permissions: List[Dict[str, Any]]) -> None:
         """
-        Добавляет права доступа в базу данных.
+        Добавляет отсутствующие права доступа в базу данных.
 
         :param session: Сессия базы данных.
         :param permissions: Список прав доступа для добавления.
         """
         logger.info("Добавление прав доступа")
+        existing = set(session.execute(select(PermissionModel.name)).scalars())
+        missing: Dict[str, Dict[str, Any]] = {}
         for permission_data in permissions:
-            self.__get_or_create(
-                session,
-                PermissionModel,
-                {"name": permission_data["name"]},
-                {"description": permission_data.get("description", "")},
-            )
+            name = permission_data["name"]
+            if name not in existing and name not in missing:
+                missing[name] = {"name": name, "description": permission_data.get("description", "")}
+        self.__insert_missing(session, PermissionModel, list(missing.values()), ["name"])
 
     @handle_error_for_database
     def _add_default_roles(self, session: Session, roles: List[Dict[str, Any]]) -> None:
         """
-        Добавляет роли и их привязки к правам в базу данных.
+        Добавляет отсутствующие роли и их привязки к правам в базу данных.
 
         :param session: Сессия базы данных.
         :param roles: Список ролей для добавления.
         """
         logger.info("Добавление ролей")
+        role_ids = self.__load_ids(session, RoleModel.role_name, RoleModel.id)
+        missing: Dict[str, Dict[str, Any]] = {}
         for role_data in roles:
-            role = self.__get_or_create(
-                session,
-                RoleModel,
-                {"role_name": role_data["role_name"]},
-                {"description": role_data.get("description", "")},
-            )
+            role_name = role_data["role_name"]
+            if role_name not in role_ids and role_name not in missing:
+                missing[role_name] = {"role_name": role_name, "description": role_data.get("description", "")}
+        if missing:
+            self.__insert_missing(session, RoleModel, list(missing.values()), ["role_name"])
+            role_ids = self.__load_ids(session, RoleModel.role_name, RoleModel.id)
+
+        permission_ids = self.__load_ids(session, PermissionModel.name, PermissionModel.id)
+        existing_links = set(
+            session.execute(select(RolePermissionModel.role_id, RolePermissionModel.permission_id)).tuples()
+        )
+        links: Dict[Tuple[int, int], Dict[str, int]] = {}
+        for role_data in roles:
+            role_id = role_ids[role_data["role_name"]]
             for perm_name in role_data.get("permissions", []):
-                permission = session.query(PermissionModel).filter_by(name=perm_name).first()
-                if permission:
-                    self.__get_or_create(
-                        session,
-                        RolePermissionModel,
-                        {"role_id": role.id, "permission_id": permission.id},
-                    )
+                permission_id = permission_ids.get(perm_name)
+                if permission_id is None:
+                    logger.warning(f"Право '{perm_name}' для роли '{role_data['role_name']}' не найдено")
+                elif (role_id, permission_id) not in existing_links:
+                    links[(role_id, permission_id)] = {"role_id": role_id, "permission_id": permission_id}
+        self.__insert_missing(session, RolePermissionModel, list(links.values()), ["role_id", "permission_id"])
 
     @handle_error_for_database
     def _add_default_users(self, session: Session, users: List[Dict[str, Any]]) -> None:
         """
-        Добавляет пользователей и их привязки к ролям в базу данных.
+        Добавляет отсутствующих пользователей и их привязки к ролям в базу данных.
+
+        Пароли хешируются только для создаваемых пользователей.
 
         :param session: Сессия базы данных.
         :param users: Список пользователей для добавления.
+        :raises ValueError: Если роль пользователя не найдена.
         """
         logger.info("Добавление пользователей")
+        role_ids = self.__load_ids(session, RoleModel.role_name, RoleModel.id)
+        existing = set(session.execute(select(UserModel.login)).scalars())
+        missing: Dict[str, Dict[str, Any]] = {}
+        passwords: List[str] = []
         for user_data in users:
-            role = session.query(RoleModel).filter_by(role_name=user_data["role_name"]).first()
-            if not role:
+            role_id = role_ids.get(user_data["role_name"])
+            if role_id is None:
                 logger.error(f"Роль '{user_data['role_name']}' не найдена!")
                 raise ValueError(f"Роль '{user_data['role_name']}' для пользователя '{user_data['login']}' не найдена")
+            if user_data["login"] not in existing and user_data["login"] not in missing:
+                missing[user_data["login"]] = {"login": user_data["login"], "role_id": role_id}
+                passwords.append(user_data["password"])
 
-            hashed_password = generate_password_hash(user_data["password"])
-            self.__get_or_create(
-                session,
-                UserModel,
-                {"login": user_data["login"]},
-                {"password_hash": hashed_password, "role_id": role.id},
-            )
+        for row, password_hash in zip(missing.values(), self._hash_passwords(passwords)):
+            row["password_hash"] = password_hash
+        self.__insert_missing(session, UserModel, list(missing.values()), ["login"])
 
 
 class DatabaseCore:
@@ -173,17 +255,59 @@ class DatabaseCore:
     Основной класс для управления базой данных, включая создание, удаление таблиц и управление сессиями.
     """
 
-    __slots__ = ("engine", "Session", "instance_initializer")
-
-    def __init__(self, app: Optional[Flask] = None) -> None:
+    __slots__ = (
+        "engine",
+        "Session",
+        "instance_initializer",
+        "query_manager",
+        "query_cache",
+        "pool_metrics",
+        "replica_router",
+        "circuit_breaker",
+    )
+
+    # Атрибут flask.g: в текущем запросе была запись, чтения должны идти в основную БД
+    PRIMARY_STICKY_FLAG = "_db_primary_sticky"
+    # Ключ app_state с отпечатком схемы и начальных данных
+    SCHEMA_FINGERPRINT_KEY = "schema_fingerprint"
+    # Теги кэша запросов, инвалидируемые после заполнения начальными данными (пользователи, роли и права)
+    SEED_INVALIDATES = ("users", "user_logins", "roles")
+
+    # Параметры конфигурации, применимые к любому пулу соединений
+    ENGINE_OPTIONS = {
+        "SQLALCHEMY_ECHO": "echo",
+        "SQLALCHEMY_POOL_RECYCLE": "pool_recycle",
+        "SQLALCHEMY_POOL_PRE_PING": "pool_pre_ping",
+    }
+    # Параметры конфигурации, применимые только к QueuePool (не к SQLite in-memory)
+    QUEUE_POOL_OPTIONS = {
+        "SQLALCHEMY_POOL_SIZE": "pool_size",
+        "SQLALCHEMY_MAX_OVERFLOW": "max_overflow",
+        "SQLALCHEMY_POOL_TIMEOUT": "pool_timeout",
+        "SQLALCHEMY_POOL_USE_LIFO": "pool_use_lifo",
+    }
+
+    def __init__(
+        self,
+        app: Optional[Flask] = None,
+        query_manager: Optional[QueryManager] = None,
+        query_cache: Optional[QueryCache] = None,
+    ) -> None:
         """
         Инициализирует DatabaseCore.
 
         :param app: Flask-приложение (если используется).
+        :param query_manager: Каталог SQL-запросов, загружаемый под диалект движка при `init_app`.
+        :param query_cache: Кэш запросов, теги которого инвалидируются после заполнения начальными данными.
         """
         self.engine = None
         self.Session = None
         self.instance_initializer: Optional[DatabaseInitializer] = None
+        self.query_manager = query_manager
+        self.query_cache = query_cache
+        self.pool_metrics = PoolMetrics()
+        self.replica_router = ReplicaRouter()
+        self.circuit_breaker = CircuitBreaker()
         if app is not None:
             self.init_app(app)
 
@@ -198,22 +322,44 @@ class DatabaseCore:
 
     @contextmanager
     @handle_error_for_database
-    def session_scope(self) -> Session:
-        session = self.__get_session()
+    def session_scope(self, read_only: bool = False) -> Session:
+        """
+        Контекст транзакции базы данных.
+
+        Сессии только для чтения направляются на наименее загруженную здоровую реплику,
+        если реплики настроены и в текущем запросе ещё не было записи. Остальные сессии
+        работают с основной БД и после фиксации закрепляют чтения текущего запроса за ней.
+
+        Обращения к основной БД проходят через автомат защиты `circuit_breaker`: пока он
+        разомкнут, сессия не открывается.
+
+        :param read_only: Сессия выполняет только чтение и может быть направлена на реплику.
+        :return: SQLAlchemy-сессия.
+        :raises DatabaseUnavailableError: Если автомат защиты основной БД разомкнут.
+        """
+        session = self.__open_session(read_only)
+        primary = session.get_bind() is self.engine
         logger.debug("Создана новая сессия базы данных")
         try:
             yield session
             session.commit()
+            if not read_only and has_request_context():
+                setattr(g, self.PRIMARY_STICKY_FLAG, True)
         except Exception as e:
             logger.error(f"Ошибка транзакции: {e}")
+            if primary:
+                self.circuit_breaker.record_error(e)
             session.rollback()
             raise
+        else:
+            if primary:
+                self.circuit_breaker.record_success()
         finally:
             logger.debug("Закрытие сессии базы данных")
             session.close()
 
     @handle_error_for_database
-    def __init_database_initializer(self, config_path: str) -> None:
+    def __init_database_initializer(self, config_path: str, hash_method: str) -> None:
         """
         Инициализация компонента DatabaseInitializer.
 
@@ -222,22 +368,128 @@ class DatabaseCore:
         и наполнение начальными данными.
 
         :param config_path: Путь к YAML-файлу конфигурации базы данных.
+        :param hash_method: Метод хеширования паролей начальных пользователей.
         :raises Exception: Если возникла ошибка при инициализации.
         """
-        self.instance_initializer = DatabaseInitializer(config_path=config_path)
+        self.instance_initializer = DatabaseInitializer(config_path=config_path, hash_method=hash_method)
+
+    def __open_session(self, read_only: bool) -> Session:
+        """
+        Создаёт сессию на реплике или основной БД и сразу получает для неё соединение.
+
+        Если соединение с выбранной репликой получить не удалось, реплика исключается
+        из выбора, а сессия открывается на основной БД.
+
+        :param read_only: Сессия выполняет только чтение.
+        :return: SQLAlchemy-сессия с полученным соединением.
+        """
+        sticky = has_request_context() and g.get(self.PRIMARY_STICKY_FLAG, False)
+        replica = self.replica_router.choose() if read_only and not sticky else None
+        if replica is not None:
+            session = self.__get_session(bind=replica.engine)
+            try:
+                self.__acquire_connection(session, replica.metrics)
+                return session
+            except OperationalError as e:
+                session.close()
+                self.replica_router.mark_failed(replica, e)
+
+        self.circuit_breaker.before_call()
+        session = self.__get_session()
+        try:
+            self.__acquire_connection(session, self.pool_metrics)
+        except Exception as e:
+            session.close()
+            self.circuit_breaker.record_error(e)
+            raise
+        return session
+
+    @staticmethod
+    def __acquire_connection(session: Session, metrics: PoolMetrics) -> None:
+        """
+        Получает соединение из пула для сессии и учитывает время ожидания в метриках пула.
+
+        :param session: SQLAlchemy-сессия, для которой выдаётся соединение.
+        :param metrics: Метрики пула, из которого выдаётся соединение.
+        :raises sqlalchemy.exc.TimeoutError: Если истекло время ожидания соединения из пула.
+        """
+        started = time.perf_counter()
+        try:
+            session.connection()
+        except PoolTimeoutError:
+            metrics.observe_timeout()
+            raise
+        metrics.observe_wait(time.perf_counter() - started)
+
+    def __build_engine_options(self, database_uri: str, config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Формирует параметры движка и пула соединений из конфигурации приложения.
+
+        Параметры размера пула, переполнения, таймаута и LIFO передаются только для пулов
+        на основе QueuePool: SQLite in-memory использует SingletonThreadPool, который их не принимает.
+        Для psycopg2 включается пакетный режим executemany.
+
+        :param database_uri: URI подключения к базе данных.
+        :param config: Конфигурация Flask-приложения.
+        :return: Словарь именованных аргументов для `create_engine`.
+        """
+        url = make_url(database_uri)
+        in_memory = url.get_backend_name() == "sqlite" and (
+            url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+        )
+        mapping = dict(self.ENGINE_OPTIONS)
+        if not in_memory:
+            mapping.update(self.QUEUE_POOL_OPTIONS)
+        options = {option: config[key] for key, option in mapping.items() if config.get(key) is not None}
+        if url.get_driver_name() == "psycopg2":
+            # Пакетное выполнение executemany через psycopg2.extras.execute_batch/execute_values
+            options["executemany_mode"] = "values_plus_batch"
+            if config.get("SQLALCHEMY_EXECUTEMANY_PAGE_SIZE"):
+                options["executemany_batch_page_size"] = config["SQLALCHEMY_EXECUTEMANY_PAGE_SIZE"]
+                options["insertmanyvalues_page_size"] = config["SQLALCHEMY_EXECUTEMANY_PAGE_SIZE"]
+        return options
 
     @handle_error_for_database
-    def __init_engine(self, database_uri: str) -> None:
+    def __init_engine(self, database_uri: str, engine_options: Dict[str, Any]) -> None:
         """
         Инициализация движка базы данных.
 
         Этот метод создаёт объект движка SQLAlchemy, который управляет соединениями
-        с базой данных. Движок настраивается с указанным URI базы данных.
+        с базой данных. Движок настраивается с указанным URI базы данных и параметрами пула,
+        а к пулу подключается сбор метрик `PoolMetrics`.
 
         :param database_uri: URI подключения к базе данных (например, "sqlite+pysqlite:///:memory:").
+        :param engine_options: Параметры движка и пула соединений для `create_engine`.
         :raises Exception: Если возникла ошибка при создании движка.
         """
-        self.engine = create_engine(database_uri, echo=False)
+        engine_options.setdefault("echo", False)
+        self.engine = create_engine(database_uri, **engine_options)
+        self.pool_metrics.attach(self.engine)
+        logger.info(f"Движок базы данных создан с параметрами пула: {engine_options}")
+
+    @handle_error_for_database
+    def __init_replicas(self, replica_uris: List[str], config: Dict[str, Any]) -> None:
+        """
+        Инициализация движков реплик для чтения.
+
+        Каждая реплика получает собственный пул с теми же параметрами, что и основная БД,
+        и собственные метрики пула, по которым выбирается наименее загруженная реплика.
+
+        :param replica_uris: URI подключения к репликам.
+        :param config: Конфигурация Flask-приложения.
+        """
+        self.replica_router = ReplicaRouter(
+            max_lag=config.get("SQLALCHEMY_REPLICA_MAX_LAG") or 5.0,
+            health_interval=config.get("SQLALCHEMY_REPLICA_HEALTH_INTERVAL") or 10.0,
+        )
+        for uri in replica_uris:
+            options = self.__build_engine_options(uri, config)
+            options.setdefault("echo", False)
+            engine: Engine = create_engine(uri, **options)
+            metrics = PoolMetrics(log_interval=self.pool_metrics.log_interval)
+            metrics.attach(engine)
+            replica = self.replica_router.add_replica(engine, metrics)
+            logger.info(f"Подключена реплика для чтения: {replica.name}")
 
     @handle_error_for_database
     def __init_session(self) -> None:
@@ -251,6 +503,25 @@ class DatabaseCore:
         """
         self.Session = sessionmaker(bind=self.engine)
 
+    @handle_error_for_database
+    def __init_query_catalog(self, file_path_query_yaml: str, dialect_files: Dict[str, str]) -> None:
+        """
+        Загрузка каталога SQL-запросов под диалект созданного движка.
+
+        Каждый запрос каталога должен быть определён для активного диалекта, иначе
+        инициализация прерывается до начала обработки запросов.
+
+        :param file_path_query_yaml: Путь к общему YAML-файлу с SQL-запросами.
+        :param dialect_files: Пути к YAML-файлам переопределений по имени диалекта.
+        :raises ValueError: Если каталог неполон для активного диалекта.
+        """
+        if self.query_manager is not None and self.engine is not None:
+            self.query_manager.load_catalog(
+                file_path_query_yaml=file_path_query_yaml,
+                dialect_files=dialect_files,
+                dialect=self.engine.dialect.name,
+            )
+
     @handle_error_for_database
     def init_app(self, app: Flask) -> None:
         """
@@ -271,23 +542,165 @@ class DatabaseCore:
                 "Параметр конфигурации 'SQLALCHEMY_CONFIG_PATH_INIT' не определён. Проверьте конфигурацию приложения."
             )
 
-        self.__init_database_initializer(config_path)
-        self.__init_engine(database_uri)
+        self.__init_database_initializer(config_path, app.config.get("PASSWORD_HASH_METHOD") or "scrypt")
+        self.circuit_breaker = CircuitBreaker(
+            name=make_url(database_uri).render_as_string(hide_password=True),
+            failure_threshold=app.config.get("SQLALCHEMY_CIRCUIT_FAILURE_THRESHOLD", 5),
+            reset_timeout=app.config.get("SQLALCHEMY_CIRCUIT_RESET_TIMEOUT", 30),
+            retry_attempts=app.config.get("SQLALCHEMY_RETRY_ATTEMPTS", 2),
+            retry_base_delay=app.config.get("SQLALCHEMY_RETRY_BASE_DELAY", 0.05),
+        )
+        metrics_log_interval = app.config.get("SQLALCHEMY_POOL_METRICS_LOG_INTERVAL")
+        if metrics_log_interval is not None:
+            self.pool_metrics.log_interval = metrics_log_interval
+        self.__init_engine(database_uri, self.__build_engine_options(database_uri, app.config))
         self.__init_session()
+        self.__init_replicas(app.config.get("SQLALCHEMY_REPLICA_URIS") or [], app.config)
+
+        if self.query_manager is not None:
+            queries_path = app.config.get("SQLALCHEMY_CONFIG_PATH_QUERIES")
+            if not queries_path:
+                raise ValueError(
+                    "Параметр конфигурации 'SQLALCHEMY_CONFIG_PATH_QUERIES' не определён. "
+                    "Проверьте конфигурацию приложения."
+                )
+            self.__init_query_catalog(queries_path, app.config.get("SQLALCHEMY_CONFIG_PATH_QUERIES_DIALECTS") or {})
+            self.query_manager.start_watching(app.config.get("SQLALCHEMY_QUERY_CATALOG_RELOAD_INTERVAL") or 0)
 
     @handle_error_for_database
-    def create_tables(self) -> None:
+    def create_tables(self, force: bool = False) -> None:
         """
         Создает таблицы в базе данных и заполняет начальными данными.
+
+        Если отпечаток схемы и начальных данных, сохранённый в `app_state` при прошлом запуске,
+        совпадает с текущим, создание таблиц и инициализация пропускаются за один запрос.
+        Начальные данные вставляются в обход каталога запросов, поэтому после фиксации
+        инвалидируются теги `SEED_INVALIDATES`: фильтр логинов, права ролей и результаты запросов,
+        загруженные до заполнения в этом или другом процессе, перестают считаться актуальными.
+
+        :param force: Создать таблицы и выполнить инициализацию независимо от отпечатка.
         """
-        logger.info("Создание таблиц в базе данных")
         if self.engine:
+            fingerprint = self.schema_fingerprint()
+            if not force and self.__stored_fingerprint() == fingerprint:
+                logger.info(f"Схема и начальные данные не изменились ({fingerprint[:12]}), создание таблиц пропущено")
+                return
+            logger.info("Создание таблиц в базе данных")
             self.metadata.create_all(self.engine)
             with self.session_scope() as session:
                 if self.instance_initializer:
                     self.instance_initializer.initialize_db(session=session)
+                self.__store_fingerprint(session, fingerprint)
+            if self.query_cache is not None:
+                self.query_cache.invalidate(self.SEED_INVALIDATES)
             logger.info("Таблицы успешно созданы")
 
+    def is_schema_current(self) -> bool:
+        """
+        Проверяет одним запросом, что схема и начальные данные соответствуют текущему отпечатку.
+
+        :return: True, если создание таблиц и инициализация не требуются.
+        """
+        return self.engine is not None and self.__stored_fingerprint() == self.schema_fingerprint()
+
+    def schema_fingerprint(self) -> str:
+        """
+        Вычисляет отпечаток схемы (DDL таблиц и индексов для диалекта движка) и содержимого
+        YAML-файла начальных данных.
+
+        :return: SHA-256 в шестнадцатеричном виде.
+        :raises RuntimeError: Если движок основной БД не инициализирован.
+        """
+        digest = hashlib.sha256()
+        dialect = self.__primary_engine().dialect
+        for table in self.metadata.sorted_tables:
+            digest.update(str(CreateTable(table).compile(dialect=dialect)).encode())
+            for index in sorted(table.indexes, key=lambda index: index.name or ""):
+                digest.update(str(CreateIndex(index).compile(dialect=dialect)).encode())
+        if self.instance_initializer:
+            with open(self.instance_initializer.config_path, "rb") as file:
+                digest.update(file.read())
+        return digest.hexdigest()
+
+    def __stored_fingerprint(self) -> Optional[str]:
+        """
+        Читает отпечаток схемы, сохранённый при прошлой инициализации.
+
+        :return: Отпечаток или None, если он не сохранён или таблицы `app_state` ещё нет.
+        """
+        engine = self.__primary_engine()
+        statement = select(AppStateModel.value).where(AppStateModel.key == self.SCHEMA_FINGERPRINT_KEY)
+        try:
+            with engine.connect() as connection:
+                return cast(Optional[str], connection.execute(statement).scalar_one_or_none())
+        except SQLAlchemyError as e:
+            logger.debug(f"Отпечаток схемы не прочитан: {e}")
+            return None
+
+    def __store_fingerprint(self, session: Session, fingerprint: str) -> None:
+        """
+        Сохраняет отпечаток схемы в `app_state` в транзакции инициализации.
+
+        :param session: Сессия базы данных.
+        :param fingerprint: Отпечаток схемы и начальных данных.
+        """
+        state = session.execute(
+            select(AppStateModel).where(AppStateModel.key == self.SCHEMA_FINGERPRINT_KEY)
+        ).scalar_one_or_none()
+        if state is None:
+            session.execute(insert(AppStateModel).values(key=self.SCHEMA_FINGERPRINT_KEY, value=fingerprint))
+        else:
+            state.value = fingerprint
+
+    def after_fork(self) -> None:
+        """
+        Сбрасывает пулы соединений, унаследованные дочерним процессом после fork.
+
+        Соединения родительского процесса не закрываются (`close=False`), чтобы не разорвать
+        их у родителя: дочерний процесс просто забывает о них и открывает собственные.
+        Фоновое отслеживание каталога запросов перезапускается, так как потоки не переживают fork.
+        """
+        for engine in self.__engines():
+            engine.dispose(close=False)
+        self.circuit_breaker.after_fork()
+        if self.query_manager is not None:
+            self.query_manager.after_fork()
+        logger.debug("Пулы соединений, унаследованные после fork, сброшены")
+
+    def prewarm(self, connections: int) -> int:
+        """
+        Заранее открывает соединения пула основной БД и реплик.
+
+        Соединения открываются одновременно и сразу возвращаются в пул, поэтому первые
+        запросы не тратят время на установку соединения.
+
+        :param connections: Количество соединений на каждый движок.
+        :return: Количество открытых соединений.
+        """
+        opened = 0
+        for engine in self.__engines():
+            held = []
+            try:
+                for _ in range(connections):
+                    held.append(engine.connect())
+            except SQLAlchemyError as e:
+                logger.warning(f"Прогрев пула соединений прерван: {e}")
+            finally:
+                opened += len(held)
+                for connection in held:
+                    connection.close()
+        logger.info(f"Пул соединений прогрет: открыто {opened} соединений")
+        return opened
+
+    def __engines(self) -> List[Engine]:
+        """
+        Возвращает движки основной БД и реплик.
+
+        :return: Список инициализированных движков.
+        """
+        engines: List[Engine] = [self.engine] if self.engine is not None else []
+        return engines + [replica.engine for replica in self.replica_router.replicas]
+
     @handle_error_for_database
     def drop_tables(self) -> None:
         """
@@ -297,15 +710,27 @@ class DatabaseCore:
         if self.engine:
             self.metadata.drop_all(self.engine)
 
+    def __primary_engine(self) -> Engine:
+        """
+        Возвращает движок основной БД.
+
+        :return: Движок основной БД.
+        :raises RuntimeError: Если движок не инициализирован.
+        """
+        if self.engine is None:
+            raise RuntimeError("DatabaseCore is not initialized. Call 'init_app' first.")
+        return self.engine
+
     @handle_error_for_database
-    def __get_session(self) -> Session:
+    def __get_session(self, bind: Optional[Engine] = None) -> Session:
         """
         Получает сессию для работы с базой данных.
 
+        :param bind: Движок, к которому привязать сессию (по умолчанию основная БД).
         :return: SQLAlchemy-сессия.
         :raises RuntimeError: Если сессия не инициализирована.
         """
         if self.Session:
-            return self.Session()
+            return self.Session(bind=bind) if bind is not None else self.Session()
         logger.critical("Попытка работы с БД без инициализации!")
         raise RuntimeError("DatabaseCore is not initialized. Call 'init_app' first.")
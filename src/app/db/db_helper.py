@@ -1,17 +1,56 @@
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from itertools import islice
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Optional,
+                    cast)
 
-from sqlalchemy.sql import text
+from flask import g, has_app_context
+from sqlalchemy.engine import Result
+from sqlalchemy.exc import MultipleResultsFound
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Executable
 
 from src.app.utils.error_handlers import handle_db_helper_errors
 from src.app.utils.profiler import profile_sql_execution
 
 from .db_core import DatabaseCore
+from .pagination import CursorCodec, KeysetPolicy, Page
+from .query_cache import QueryCache
 from .query_manager import QueryManager
+from .records import check_shape, row_converter
+from .slow_query_log import SlowQueryLog
+from .unit_of_work import UnitOfWork
 
 logger = logging.getLogger("app_db_logger")
 
 
+def _retry_transient(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Декоратор методов `DBHelperSQL`: повторяет запрос после временной ошибки БД
+    через `CircuitBreaker.call` основной БД.
+
+    Запросы на запись повторяются только после ошибок, гарантирующих откат транзакции.
+    Внутри единицы работы запрос не повторяется: транзакция уже начата.
+
+    :param func: Метод, выполняющий запрос в собственной транзакции.
+    :return: Обернутый метод.
+    """
+
+    @wraps(func)
+    def wrapper(
+        self: "DBHelperSQL", query_name: str, params: Optional[Dict[str, Any]] = None, *args: Any, **kwargs: Any
+    ) -> Any:
+        if self.current_unit_of_work() is not None:
+            return func(self, query_name, params, *args, **kwargs)
+        idempotent = self.query_manager.is_read_query(query_name)
+        breaker = self.db_core.circuit_breaker
+        return breaker.call(func, self, query_name, params, *args, idempotent=idempotent, **kwargs)
+
+    return wrapper
+
+
 class DBHelperSQL:
     """
     Вспомогательный класс для работы с базой данных.
@@ -22,39 +61,280 @@ class DBHelperSQL:
 
     Основные методы:
     - execute_query: Выполнение SELECT-запросов.
+    - execute_query_iter: Потоковое выполнение SELECT-запросов с серверным курсором.
+    - execute_first / execute_one_or_none: Получение одной строки без построения списка.
+    - execute_scalar: Получение первого столбца первой строки.
     - execute_update: Выполнение INSERT, UPDATE или DELETE-запросов.
+    - execute_many: Пакетное выполнение одного запроса для множества наборов параметров.
+    - execute_page: Постраничное чтение по ключу с подписанным курсором следующей страницы.
+
+    Запросы выполняются через заранее подготовленные в `QueryManager` выражения SQLAlchemy,
+    а результат обращения к кэшу компиляции учитывается в счётчиках `QueryManager`.
+    Запросы, помеченные в каталоге как `mode: read`, могут выполняться на репликах.
+
+    Форма строк результата задаётся параметром `shape`: `dict` (словарь, по умолчанию),
+    `tuple` (кортеж значений) или `record` (экземпляр класса записи со `__slots__`,
+    сгенерированного для запроса по колонкам каталога).
+
+    Если передан `QueryCache`, результаты запросов с секцией `cache` в каталоге читаются
+    через него (кроме потокового `execute_query_iter`), а успешное выполнение запросов
+    с секцией `invalidates` инвалидирует соответствующие теги.
+
+    Если передан `SlowQueryLog`, для запросов медленнее его порога захватывается план выполнения.
+
+    Обращения к основной БД проходят через её автомат защиты (`DatabaseCore.circuit_breaker`):
+    при недоступной БД методы сразу завершаются `DatabaseUnavailableError`, а не возвращают
+    пустой результат. Чтения и запись (кроме потокового и пакетного выполнения) повторяются
+    после временных ошибок с экспоненциальной задержкой со случайным разбросом.
+
+    Запросы с секцией `keyset` в каталоге читаются постранично через `execute_page`: страница
+    выбирается условием по ключу последней строки предыдущей страницы, а не через `OFFSET`,
+    поэтому её стоимость не зависит от глубины. Курсоры подписываются `CursorCodec`.
+
+    Несколько запросов можно выполнить в одной транзакции через `transaction()`: пока единица
+    работы активна, все методы `execute_*` используют её сессию вместо открытия собственной.
     """
 
-    __slots__ = ("db_core", "query_manager")
+    __slots__ = ("db_core", "query_manager", "query_cache", "slow_query_log", "cursor_codec", "_local")
 
-    def __init__(self, db_core: DatabaseCore, query_manager: QueryManager):
+    # Атрибут flask.g: активная единица работы текущего контекста приложения
+    UNIT_OF_WORK_FLAG = "_db_unit_of_work"
+
+    def __init__(
+        self,
+        db_core: DatabaseCore,
+        query_manager: QueryManager,
+        query_cache: Optional[QueryCache] = None,
+        slow_query_log: Optional[SlowQueryLog] = None,
+        cursor_codec: Optional[CursorCodec] = None,
+    ):
         """
         Инициализация DBHelperSQL.
 
         :param db_core: Экземпляр DatabaseCore для управления сессиями базы данных.
         :param query_manager: Экземпляр QueryManager для управления SQL-запросами.
+        :param query_cache: Кэш результатов запросов (опционально).
+        :param slow_query_log: Захват планов медленных запросов для `profile_sql_execution` (опционально).
+        :param cursor_codec: Подпись курсоров страниц для `execute_page` (опционально).
         """
         self.db_core = db_core
         self.query_manager = query_manager
+        self.query_cache = query_cache
+        self.slow_query_log = slow_query_log
+        self.cursor_codec = cursor_codec
+        # Хранилище единицы работы вне контекста приложения Flask (CLI, фоновые задачи)
+        self._local = threading.local()
+
+    @contextmanager
+    def transaction(self, read_only: bool = False) -> Iterator[UnitOfWork]:
+        """
+        Единица работы: одна сессия и одна транзакция для нескольких именованных запросов.
+
+        Единица работы привязывается к контексту приложения Flask (вне его — к текущему потоку),
+        поэтому методы `execute_*`, вызванные внутри блока, в том числе из репозиториев, выполняются
+        в той же транзакции. Вложенный вызов `transaction()` возвращает уже активную единицу работы;
+        для частичного отката используйте `UnitOfWork.savepoint()`.
+
+        Транзакция фиксируется при выходе из блока и откатывается, если блок завершился исключением
+        или если внутри него была подавленная ошибка запроса вне точки сохранения. Кэш результатов
+        читается в обход и инвалидируется только после фиксации.
+
+        :param read_only: Транзакция выполняет только чтение и может быть направлена на реплику.
+        :return: Активная единица работы.
+        :raises RuntimeError: Если в транзакции только для чтения выполняется запрос на запись.
+        """
+        current = self.current_unit_of_work()
+        if current is not None:
+            if current.read_only and not read_only:
+                raise RuntimeError("Транзакция на запись не может быть вложена в транзакцию только для чтения.")
+            yield current
+            return
+
+        with self.db_core.session_scope(read_only=read_only) as session:
+            unit_of_work = UnitOfWork(self, session, read_only=read_only)
+            self.__bind(unit_of_work)
+            try:
+                yield unit_of_work
+                if unit_of_work.error is not None:
+                    raise unit_of_work.error
+            finally:
+                self.__bind(None)
+        if self.query_cache is not None and unit_of_work.pending_tags:
+            self.query_cache.invalidate(sorted(unit_of_work.pending_tags))
+
+    def current_unit_of_work(self) -> Optional[UnitOfWork]:
+        """
+        Возвращает активную единицу работы текущего контекста.
+
+        :return: Единица работы или None, если транзакция не открыта.
+        """
+        if has_app_context():
+            return cast(Optional[UnitOfWork], g.get(self.UNIT_OF_WORK_FLAG))
+        return getattr(self._local, "unit_of_work", None)
 
     @profile_sql_execution
     @handle_db_helper_errors
-    def execute_query(self, query_name: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    @_retry_transient
+    def execute_query(
+        self,
+        query_name: str,
+        params: Optional[Dict[str, Any]] = None,
+        shape: str = "dict",
+    ) -> List[Any]:
         """
         Выполнить SELECT-запрос по имени.
 
         :param query_name: Имя запроса, зарегистрированного в QueryManager.
         :param params: Параметры для SQL-запроса (опционально).
-        :return: Список строк результата в виде словарей.
+        :param shape: Форма строк результата: `dict`, `tuple` или `record`.
+        :return: Список строк результата.
         """
-        with self.db_core.session_scope() as session:
-            query = self.query_manager.get_query(query_name)
-            result = session.execute(text(query), params or {})
+        check_shape(shape)
+        cached = self.__cached_rows(query_name, params)
+        if cached is not None:
+            convert = self.__cached_row_converter(query_name, cached, shape)
+            return [convert(row) for row in cached]
+        read_only = self.query_manager.is_read_query(query_name)
+        with self.__session_scope(read_only=read_only) as session:
+            result = self.__execute(session, query_name, params)
+            convert = row_converter(self.query_manager, query_name, list(result.keys()), shape)
             logger.debug(f"Запрос {query_name} успешно выполнено")
-            return [row._asdict() for row in result]
+            return [convert(row) for row in result]
+
+    @profile_sql_execution
+    @handle_db_helper_errors(default=None)
+    @_retry_transient
+    def execute_first(
+        self,
+        query_name: str,
+        params: Optional[Dict[str, Any]] = None,
+        shape: str = "dict",
+    ) -> Optional[Any]:
+        """
+        Выполнить SELECT-запрос по имени и получить первую строку результата.
+
+        Остальные строки не забираются у драйвера: курсор закрывается после первой строки.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Параметры для SQL-запроса (опционально).
+        :param shape: Форма строки результата: `dict`, `tuple` или `record`.
+        :return: Первая строка результата или None, если результат пуст.
+        """
+        check_shape(shape)
+        cached = self.__cached_rows(query_name, params)
+        if cached is not None:
+            return self.__cached_row_converter(query_name, cached, shape)(cached[0]) if cached else None
+        read_only = self.query_manager.is_read_query(query_name)
+        with self.__session_scope(read_only=read_only) as session:
+            result = self.__execute(session, query_name, params)
+            convert = row_converter(self.query_manager, query_name, list(result.keys()), shape)
+            row = result.first()
+            logger.debug(f"Запрос {query_name} успешно выполнено")
+            return convert(row) if row is not None else None
+
+    @profile_sql_execution
+    @handle_db_helper_errors(default=None)
+    @_retry_transient
+    def execute_one_or_none(
+        self,
+        query_name: str,
+        params: Optional[Dict[str, Any]] = None,
+        shape: str = "dict",
+    ) -> Optional[Any]:
+        """
+        Выполнить SELECT-запрос по имени, ожидая не более одной строки результата.
+
+        Если запрос вернул больше одной строки, ошибка `MultipleResultsFound` логируется
+        и возвращается None.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Параметры для SQL-запроса (опционально).
+        :param shape: Форма строки результата: `dict`, `tuple` или `record`.
+        :return: Единственная строка результата или None.
+        """
+        check_shape(shape)
+        cached = self.__cached_rows(query_name, params)
+        if cached is not None:
+            if len(cached) > 1:
+                raise MultipleResultsFound(f"Запрос {query_name} вернул больше одной строки.")
+            return self.__cached_row_converter(query_name, cached, shape)(cached[0]) if cached else None
+        read_only = self.query_manager.is_read_query(query_name)
+        with self.__session_scope(read_only=read_only) as session:
+            result = self.__execute(session, query_name, params)
+            convert = row_converter(self.query_manager, query_name, list(result.keys()), shape)
+            row = result.one_or_none()
+            logger.debug(f"Запрос {query_name} успешно выполнено")
+            return convert(row) if row is not None else None
+
+    @profile_sql_execution
+    @handle_db_helper_errors(default=None)
+    @_retry_transient
+    def execute_scalar(self, query_name: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Выполнить SELECT-запрос по имени и получить значение первого столбца первой строки.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Параметры для SQL-запроса (опционально).
+        :return: Значение или None, если результат пуст.
+        """
+        cached = self.__cached_rows(query_name, params)
+        if cached is not None:
+            return next(iter(cached[0].values()), None) if cached else None
+        read_only = self.query_manager.is_read_query(query_name)
+        with self.__session_scope(read_only=read_only) as session:
+            result = self.__execute(session, query_name, params)
+            logger.debug(f"Запрос {query_name} успешно выполнено")
+            return result.scalar()
 
     @profile_sql_execution
     @handle_db_helper_errors
+    def execute_query_iter(
+        self,
+        query_name: str,
+        params: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+        shape: str = "dict",
+    ) -> Iterator[Any]:
+        """
+        Выполнить SELECT-запрос по имени и выдавать строки результата по мере чтения.
+
+        Запрос выполняется через серверный курсор (`stream_results`), строки забираются
+        у драйвера порциями по `batch_size` (`yield_per`). Сессия и соединение открываются
+        при первой итерации и возвращаются в пул по её окончании, в том числе при досрочном
+        закрытии генератора (например, при разрыве соединения с клиентом потокового ответа).
+
+        Генератор не обращается к контексту запроса Flask после открытия сессии, поэтому его
+        можно передавать в `Response` напрямую; чтобы чтение учитывало запись, сделанную ранее
+        в этом же запросе, оберните генератор в `flask.stream_with_context`.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Параметры для SQL-запроса (опционально).
+        :param batch_size: Количество строк, забираемых у драйвера за одно обращение.
+        :param shape: Форма строк результата: `dict`, `tuple` или `record`.
+        :return: Итератор строк результата.
+        """
+        if batch_size < 1:
+            raise ValueError("Параметр batch_size должен быть положительным.")
+        check_shape(shape)
+        read_only = self.query_manager.is_read_query(query_name)
+        with self.__session_scope(read_only=read_only) as session:
+            result = self.__execute(
+                session,
+                query_name,
+                params,
+                execution_options={"stream_results": True, "yield_per": batch_size},
+            )
+            convert = row_converter(self.query_manager, query_name, list(result.keys()), shape)
+            try:
+                for row in result:
+                    yield convert(row)
+            finally:
+                result.close()
+            logger.debug(f"Запрос {query_name} успешно выполнено потоково")
+
+    @profile_sql_execution
+    @handle_db_helper_errors
+    @_retry_transient
     def execute_update(self, query_name: str, params: Optional[Dict[str, Any]] = None) -> bool:
         """
         Выполнить INSERT, UPDATE или DELETE-запрос по имени.
@@ -62,8 +342,235 @@ class DBHelperSQL:
         :param query_name: Имя запроса, зарегистрированного в QueryManager.
         :param params: Параметры для SQL-запроса (опционально).
         """
-        with self.db_core.session_scope() as session:
-            query = self.query_manager.get_query(query_name)
-            session.execute(text(query), params or {})
-            logger.debug(f"Запрос {query_name} успешно выполнено")
-            return True
+        with self.__session_scope() as session:
+            self.__execute(session, query_name, params)
+        self.__invalidate_cache(query_name)
+        logger.debug(f"Запрос {query_name} успешно выполнено")
+        return True
+
+    @profile_sql_execution
+    @handle_db_helper_errors
+    def execute_many(
+        self,
+        query_name: str,
+        params: Iterable[Dict[str, Any]],
+        chunk_size: int = 1000,
+    ) -> List[int]:
+        """
+        Выполнить запрос по имени для множества наборов параметров в одной транзакции.
+
+        Параметры читаются из итератора порциями по `chunk_size` и передаются драйверу
+        одним вызовом `executemany` на порцию (для psycopg2 — через `execute_batch`,
+        см. `SQLALCHEMY_EXECUTEMANY_PAGE_SIZE`). Если выполнение любой порции завершилось
+        ошибкой, откатывается вся транзакция.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Итерируемый набор словарей параметров.
+        :param chunk_size: Количество наборов параметров в одной порции.
+        :return: Количество затронутых строк по каждой порции (-1, если драйвер его не сообщает).
+        """
+        if chunk_size < 1:
+            raise ValueError("Параметр chunk_size должен быть положительным.")
+        statement = self.query_manager.get_statement(query_name)
+        affected: List[int] = []
+        with self.__session_scope() as session:
+            iterator = iter(params)
+            while chunk := list(islice(iterator, chunk_size)):
+                result = session.execute(statement, chunk)
+                self.query_manager.record_cache_result(query_name, result.context.cache_hit)
+                sane_rowcount = result.context.dialect.supports_sane_multi_rowcount or len(chunk) == 1
+                affected.append(result.rowcount if sane_rowcount else -1)
+                logger.debug(f"Запрос {query_name}: порция {len(affected)} из {len(chunk)} строк выполнена")
+        self.__invalidate_cache(query_name)
+        logger.debug(f"Запрос {query_name} успешно выполнено пакетно: {len(affected)} порций")
+        return affected
+
+    def execute_page(
+        self,
+        query_name: str,
+        params: Optional[Dict[str, Any]] = None,
+        after: Optional[str] = None,
+        limit: int = 50,
+        shape: str = "dict",
+    ) -> Optional[Page]:
+        """
+        Выполнить SELECT-запрос с секцией `keyset` и получить одну страницу результата.
+
+        Запрос выбирает `limit + 1` строк после ключа из курсора по индексу колонок ключа;
+        лишняя строка означает, что следующая страница существует. Кэш результатов не используется.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Параметры для SQL-запроса (опционально).
+        :param after: Курсор `next_cursor` предыдущей страницы или None для первой страницы.
+        :param limit: Количество строк на странице.
+        :param shape: Форма строк результата: `dict`, `tuple` или `record`.
+        :return: Страница результата или None при ошибке запроса.
+        :raises ValueError: Если запрос не поддерживает постраничное чтение или размер страницы некорректен.
+        :raises InvalidCursorError: Если курсор некорректен или выдан для другого запроса.
+        :raises RuntimeError: Если `CursorCodec` не передан.
+        """
+        definition = self.query_manager.get_definition(query_name)
+        keyset, page_statements = definition.keyset, definition.page_statements
+        if keyset is None or page_statements is None:
+            raise ValueError(f"Запрос '{query_name}' не поддерживает постраничное чтение: нет секции keyset.")
+        cursor_codec = self.cursor_codec
+        if cursor_codec is None:
+            raise RuntimeError("Для постраничного чтения DBHelperSQL требуется CursorCodec.")
+        cursor_codec.check_limit(limit)
+        check_shape(shape)
+        after_values = cursor_codec.decode(query_name, after, len(keyset.columns)) if after else None
+        page_params = keyset.page_params(params, after_values, limit + 1)
+        statement = page_statements[after_values is not None]
+        return cast(
+            Optional[Page], self.__fetch_page(query_name, page_params, statement, keyset, cursor_codec, limit, shape)
+        )
+
+    @profile_sql_execution
+    @handle_db_helper_errors(default=None)
+    @_retry_transient
+    def __fetch_page(
+        self,
+        query_name: str,
+        params: Dict[str, Any],
+        statement: Executable,
+        keyset: KeysetPolicy,
+        cursor_codec: CursorCodec,
+        limit: int,
+        shape: str,
+    ) -> Page:
+        """
+        Выполняет выборку страницы и создаёт курсор следующей страницы.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Параметры запроса страницы.
+        :param statement: Выражение первой страницы или страницы после ключа.
+        :param keyset: Политика постраничного чтения запроса.
+        :param cursor_codec: Кодек курсоров страниц.
+        :param limit: Количество строк на странице.
+        :param shape: Форма строк результата.
+        :return: Страница результата.
+        """
+        with self.__session_scope(read_only=True) as session:
+            result = self.__execute(session, query_name, params, statement=statement)
+            convert = row_converter(self.query_manager, query_name, list(result.keys()), shape)
+            rows = result.all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]._mapping
+            next_cursor = cursor_codec.encode(query_name, [last[column] for column in keyset.columns])
+        logger.debug(f"Запрос {query_name}: страница из {len(rows)} строк выбрана")
+        return Page([convert(row) for row in rows], next_cursor)
+
+    def __bind(self, unit_of_work: Optional[UnitOfWork]) -> None:
+        """
+        Привязывает единицу работы к текущему контексту или снимает привязку.
+
+        :param unit_of_work: Единица работы или None.
+        """
+        if has_app_context():
+            setattr(g, self.UNIT_OF_WORK_FLAG, unit_of_work)
+        else:
+            self._local.unit_of_work = unit_of_work
+
+    @contextmanager
+    def __session_scope(self, read_only: bool = False) -> Iterator[Session]:
+        """
+        Сессия для выполнения запроса: сессия активной единицы работы или новая транзакция.
+
+        Ошибка запроса в единице работы запоминается в ней, чтобы транзакция не была
+        зафиксирована после ошибки, подавленной `handle_db_helper_errors`.
+
+        :param read_only: Запрос выполняет только чтение.
+        :return: SQLAlchemy-сессия.
+        """
+        unit_of_work = self.current_unit_of_work()
+        if unit_of_work is None:
+            with self.db_core.session_scope(read_only=read_only) as session:
+                yield session
+            return
+        try:
+            if unit_of_work.read_only and not read_only:
+                raise RuntimeError("Запрос на запись в транзакции только для чтения.")
+            yield unit_of_work.session
+        except Exception as e:
+            if unit_of_work.error is None:
+                unit_of_work.error = e
+            raise
+
+    def __execute(
+        self,
+        session: Any,
+        query_name: str,
+        params: Optional[Dict[str, Any]],
+        execution_options: Optional[Dict[str, Any]] = None,
+        statement: Optional[Executable] = None,
+    ) -> Result[Any]:
+        """
+        Выполняет подготовленное выражение запроса в сессии и учитывает обращение к кэшу компиляции.
+
+        :param session: SQLAlchemy-сессия.
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Параметры для SQL-запроса.
+        :param execution_options: Параметры выполнения SQLAlchemy (опционально).
+        :param statement: Выражение, выполняемое вместо основного выражения запроса (например, выборка страницы).
+        :return: Результат выполнения запроса.
+        """
+        if statement is None:
+            statement = self.query_manager.get_statement(query_name)
+        result = session.execute(statement, params or {}, execution_options=execution_options or {})
+        self.query_manager.record_cache_result(query_name, result.context.cache_hit)
+        return result
+
+    def __cached_rows(self, query_name: str, params: Optional[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Получает строки результата через кэш, если для запроса задана политика кэширования.
+
+        Внутри единицы работы кэш не используется: чтение должно видеть изменения своей транзакции.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Параметры для SQL-запроса.
+        :return: Строки результата в виде словарей или None, если запрос не кэшируется.
+        """
+        policy = self.query_manager.get_definition(query_name).cache
+        if self.query_cache is None or policy is None or self.current_unit_of_work() is not None:
+            return None
+
+        def load() -> List[Dict[str, Any]]:
+            with self.db_core.session_scope(read_only=True) as session:
+                return [row._asdict() for row in self.__execute(session, query_name, params)]
+
+        return self.query_cache.get_or_load(query_name, params, policy, load)
+
+    def __cached_row_converter(
+        self, query_name: str, rows: List[Dict[str, Any]], shape: str
+    ) -> Callable[[Dict[str, Any]], Any]:
+        """
+        Возвращает функцию преобразования строки из кэша (словаря) в заданную форму.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param rows: Строки результата из кэша.
+        :param shape: Форма строк результата: `dict`, `tuple` или `record`.
+        :return: Функция преобразования строки.
+        """
+        if shape == "tuple":
+            return lambda row: tuple(row.values())
+        if shape == "record" and rows:
+            record_class = self.query_manager.get_record_class(query_name, list(rows[0]))
+            return lambda row: record_class(*row.values())
+        return lambda row: row
+
+    def __invalidate_cache(self, query_name: str) -> None:
+        """
+        Инвалидирует теги кэша, объявленные в секции `invalidates` выполненного запроса.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        """
+        tags = self.query_manager.get_definition(query_name).invalidates
+        if self.query_cache is None or not tags:
+            return
+        unit_of_work = self.current_unit_of_work()
+        if unit_of_work is not None:
+            unit_of_work.pending_tags.update(tags)
+        else:
+            self.query_cache.invalidate(tags)
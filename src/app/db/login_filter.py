@@ -0,0 +1,312 @@
+import logging
+import struct
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from flask import Flask
+from redis import RedisError
+
+from src.app.db.circuit_breaker import DatabaseUnavailableError
+from src.app.db.db_helper import DBHelperSQL
+from src.app.db.query_cache import QueryCache
+from src.app.utils.bloom_filter import BloomFilter
+
+logger = logging.getLogger("app_db_logger")
+
+
+class LoginFilter:
+    """
+    Фильтр Блума существующих логинов для отказа во входе без обращения к БД.
+
+    Если логина точно нет в фильтре, `UserRepository.get_user_by_login` возвращает None, не выполняя
+    запрос: при переборе несуществующих логинов БД не нагружается. Фильтр не даёт ложноотрицательных
+    ответов, поэтому существующий пользователь всегда проходит к БД; несуществующий проходит
+    с вероятностью `USER_LOGIN_FILTER_ERROR_RATE`.
+
+    Фильтр строится потоковым чтением логинов (`list_user_logins`) при создании приложения
+    и сохраняется в Redis кэша запросов, откуда его загружают следующие процессы. Актуальность
+    определяется тегом кэша `user_logins`, который инвалидируют запросы, добавляющие пользователей:
+    - после инвалидации в этом или другом процессе (поколение тега в `QueryCache`) отрицательным
+      ответам фильтра не доверяют, пока он не перестроен в фоновом потоке;
+    - копия в Redis хранит версию тега, при которой построена, и не загружается после её изменения;
+    - фильтр старше `USER_LOGIN_FILTER_MAX_AGE` перестраивается, чтобы учесть пользователей,
+      добавленных в обход каталога запросов (и при работе без Redis — другими процессами);
+    - заполнение начальными данными при запуске (`DatabaseCore.create_tables`) инвалидирует тег,
+      поэтому фильтры и копии в Redis, построенные до него, не используются.
+
+    Пока фильтр не построен или устарел, все логины проходят к БД.
+    """
+
+    # Тег кэша запросов, инвалидируемый при добавлении пользователей
+    TAG = "user_logins"
+    # Заголовок копии фильтра в Redis: версия тега и время построения (Unix time)
+    HEADER = struct.Struct(">Qd")
+    # Пауза перед повторным построением после ошибки (в секундах)
+    RETRY_INTERVAL = 30.0
+
+    __slots__ = (
+        "db_helper",
+        "query_cache",
+        "enabled",
+        "error_rate",
+        "min_capacity",
+        "max_age",
+        "_state",
+        "_building",
+        "_retry_at",
+        "_stats",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        db_helper: DBHelperSQL,
+        query_cache: Optional[QueryCache] = None,
+        error_rate: float = 0.001,
+        min_capacity: int = 100000,
+        max_age: int = 300,
+        enabled: bool = True,
+    ) -> None:
+        """
+        Инициализация LoginFilter.
+
+        :param db_helper: DBHelperSQL для чтения логинов.
+        :param query_cache: Кэш запросов: поколения тега `user_logins` и Redis для копии фильтра.
+        :param error_rate: Вероятность ложного срабатывания фильтра.
+        :param min_capacity: Минимальная ёмкость фильтра (количество логинов).
+        :param max_age: Максимальный возраст фильтра (в секундах).
+        :param enabled: Включён ли фильтр.
+        """
+        self.db_helper = db_helper
+        self.query_cache = query_cache
+        self.enabled = enabled
+        self.error_rate = error_rate
+        self.min_capacity = min_capacity
+        self.max_age = max_age
+        # Фильтр, поколение тега, при котором он построен, и время построения (time.monotonic);
+        # заменяются одним присваиванием, чтобы проверка не увидела фильтр с чужим поколением
+        self._state: Optional[Tuple[BloomFilter, int, float]] = None
+        self._building = False
+        self._retry_at = 0.0
+        self._stats: Dict[str, int] = dict.fromkeys(("passed", "rejected", "unchecked", "builds", "loads"), 0)
+        self._lock = threading.Lock()
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Настраивает фильтр из конфигурации приложения и загружает его из Redis или строит по таблице пользователей.
+
+        Ошибка построения не останавливает запуск: до следующей попытки все логины проходят к БД.
+
+        :param app: Flask-приложение.
+        """
+        config = app.config
+        self.enabled = config.get("USER_LOGIN_FILTER_ENABLED", self.enabled)
+        self.error_rate = config.get("USER_LOGIN_FILTER_ERROR_RATE", self.error_rate)
+        self.min_capacity = config.get("USER_LOGIN_FILTER_MIN_CAPACITY", self.min_capacity)
+        self.max_age = config.get("USER_LOGIN_FILTER_MAX_AGE", self.max_age)
+        if self.enabled:
+            with app.app_context():
+                self.refresh()
+
+    def might_contain(self, login: str) -> bool:
+        """
+        Проверяет, может ли пользователь с логином существовать.
+
+        :param login: Логин.
+        :return: False, если пользователя с таким логином точно нет; True, если он может существовать
+            или фильтр не построен либо устарел.
+        """
+        if not self.enabled:
+            return True
+        bloom = self.__current()
+        if bloom is None:
+            self.__count("unchecked")
+            return True
+        if login in bloom:
+            self.__count("passed")
+            return True
+        self.__count("rejected")
+        return False
+
+    def refresh(self) -> bool:
+        """
+        Загружает актуальную копию фильтра из Redis или строит фильтр по таблице пользователей.
+
+        :return: True, если фильтр загружен или построен.
+        """
+        generation = self.__tag_generation()
+        version, bloom, age = self.__load_redis()
+        if bloom is not None:
+            self.__install(bloom, generation, age)
+            self.__count("loads")
+            logger.info(f"Фильтр логинов загружен из Redis: {bloom}")
+            return True
+        try:
+            start_time = time.perf_counter()
+            bloom = self.__build()
+        except (DatabaseUnavailableError, RuntimeError) as e:
+            self._retry_at = time.monotonic() + self.RETRY_INTERVAL
+            logger.error(f"Фильтр логинов не построен, логины проверяются в БД: {e}")
+            return False
+        self.__install(bloom, generation, 0.0)
+        self.__count("builds")
+        self.__save_redis(bloom, version)
+        logger.info(f"Фильтр логинов построен за {time.perf_counter() - start_time:.3f} сек.: {bloom}")
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Возвращает счётчики проверок фильтра.
+
+        :return: Пропущенные и отклонённые логины, проверки без фильтра, построения и загрузки из Redis.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def after_fork(self) -> None:
+        """
+        Сбрасывает блокировку и признак фонового построения в дочернем процессе после fork.
+
+        Фильтр, построенный до fork, остаётся в памяти воркера.
+        """
+        self._lock = threading.Lock()
+        self._building = False
+
+    def __current(self) -> Optional[BloomFilter]:
+        """
+        Возвращает фильтр, если его отрицательным ответам можно доверять, и запускает фоновое
+        перестроение устаревшего фильтра.
+
+        :return: Фильтр или None, если фильтр не построен, логины добавлялись после его построения
+            или истёк его максимальный возраст.
+        """
+        state = self._state
+        if state is None:
+            self.__refresh_in_background()
+            return None
+        bloom, generation, built_at = state
+        if generation != self.__tag_generation() or time.monotonic() - built_at > self.max_age:
+            # Пользователи могли быть добавлены в обход каталога запросов: пока фильтр перестраивается,
+            # логины проверяются в БД
+            self.__refresh_in_background()
+            return None
+        return bloom
+
+    def __refresh_in_background(self) -> None:
+        """
+        Запускает перестроение фильтра в фоновом потоке, если оно ещё не запущено.
+        """
+        with self._lock:
+            if self._building or time.monotonic() < self._retry_at:
+                return
+            self._building = True
+        threading.Thread(target=self.__refresh_task, name="login-filter-refresh", daemon=True).start()
+
+    def __refresh_task(self) -> None:
+        """
+        Перестраивает фильтр и снимает признак фонового построения.
+        """
+        try:
+            self.refresh()
+        except Exception as e:
+            self._retry_at = time.monotonic() + self.RETRY_INTERVAL
+            logger.error(f"Ошибка перестроения фильтра логинов: {e}", exc_info=True)
+        finally:
+            with self._lock:
+                self._building = False
+
+    def __build(self) -> BloomFilter:
+        """
+        Строит фильтр потоковым чтением логинов.
+
+        Ёмкость фильтра выбирается по количеству пользователей, прочитанному до сканирования.
+        Если чтение прервалось ошибкой, `execute_query_iter` выбрасывает `QueryStreamError`,
+        и неполный фильтр не используется.
+
+        :return: Фильтр всех логинов.
+        :raises RuntimeError: Если количество пользователей не получено или чтение логинов прервалось.
+        """
+        expected = self.db_helper.execute_scalar("count_users")
+        if expected is None:
+            raise RuntimeError("Не удалось получить количество пользователей.")
+        bloom = BloomFilter.for_capacity(max(self.min_capacity, expected), self.error_rate)
+        rows = self.db_helper.execute_query_iter("list_user_logins", batch_size=10000, shape="tuple")
+        bloom.update(row[0] for row in rows)
+        return bloom
+
+    def __install(self, bloom: BloomFilter, generation: int, age: float) -> None:
+        """
+        Делает фильтр текущим.
+
+        :param bloom: Фильтр.
+        :param generation: Поколение тега, прочитанное до построения фильтра.
+        :param age: Возраст фильтра (в секундах).
+        """
+        self._state = (bloom, generation, time.monotonic() - age)
+
+    def __tag_generation(self) -> int:
+        """
+        Возвращает поколение тега `user_logins` в текущем процессе.
+
+        :return: Поколение тега (0 без кэша запросов).
+        """
+        return self.query_cache.generation(self.TAG) if self.query_cache is not None else 0
+
+    def __redis_key(self) -> str:
+        """Ключ копии фильтра в Redis."""
+        return f"{self.query_cache.key_prefix}login_filter"  # type: ignore[union-attr]
+
+    def __load_redis(self) -> Tuple[Optional[int], Optional[BloomFilter], float]:
+        """
+        Читает копию фильтра и текущую версию тега одним обращением к Redis.
+
+        :return: Текущая версия тега (None без Redis), фильтр (None, если копии нет или она устарела)
+            и его возраст (в секундах).
+        """
+        redis = getattr(self.query_cache, "redis", None)
+        if redis is None:
+            return None, None, 0.0
+        try:
+            raw, raw_version = redis.mget([self.__redis_key(), self.query_cache.tag_key(self.TAG)])  # type: ignore
+        except RedisError as e:
+            logger.warning(f"Копия фильтра логинов в Redis недоступна: {e}")
+            return None, None, 0.0
+        version = int(raw_version or 0)
+        header_size = self.HEADER.size
+        if raw is None or len(raw) < header_size:
+            return version, None, 0.0
+        saved_version, built_at = self.HEADER.unpack_from(raw)
+        age = max(0.0, time.time() - built_at)
+        if saved_version != version or age > self.max_age:
+            return version, None, 0.0
+        try:
+            return version, BloomFilter.from_bytes(raw[header_size:]), age
+        except ValueError as e:
+            logger.warning(f"Копия фильтра логинов в Redis повреждена: {e}")
+            return version, None, 0.0
+
+    def __save_redis(self, bloom: BloomFilter, version: Optional[int]) -> None:
+        """
+        Сохраняет фильтр в Redis с версией тега, прочитанной до построения.
+
+        :param bloom: Фильтр.
+        :param version: Версия тега `user_logins` в Redis (None — Redis не используется).
+        """
+        redis = getattr(self.query_cache, "redis", None)
+        if redis is None or version is None:
+            return
+        try:
+            payload = self.HEADER.pack(version, time.time()) + bloom.to_bytes()
+            redis.set(self.__redis_key(), payload, ex=self.max_age)
+        except RedisError as e:
+            logger.warning(f"Не удалось сохранить фильтр логинов в Redis: {e}")
+
+    def __count(self, name: str) -> None:
+        """
+        Увеличивает счётчик.
+
+        :param name: Имя счётчика.
+        """
+        with self._lock:
+            self._stats[name] += 1
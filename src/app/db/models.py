@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 from typing import List
 
-from sqlalchemy import TIMESTAMP, VARCHAR, ForeignKey, String
+from sqlalchemy import TIMESTAMP, VARCHAR, ForeignKey, Index, String
 from sqlalchemy.orm import (Mapped, as_declarative, declared_attr,
                             mapped_column, relationship)
 
@@ -23,6 +23,7 @@ class UserModel(AbstractModel):
     """Модель пользователя, включает данные для авторизации и связку с сотрудником и ролью."""
 
     __tablename__ = "users"  # type: ignore
+    __table_args__ = (Index("ix_users_login", "login", unique=True),)
 
     login: Mapped[str] = mapped_column(VARCHAR(length=150), nullable=False)
     password_hash: Mapped[str] = mapped_column(String(length=200), nullable=False)
@@ -41,6 +42,7 @@ class RoleModel(AbstractModel):
     """Модель роли, используется для группировки прав доступа."""
 
     __tablename__ = "role"  # type: ignore
+    __table_args__ = (Index("ix_role_role_name", "role_name", unique=True),)
 
     role_name: Mapped[str] = mapped_column(VARCHAR(length=100), nullable=False)
     description: Mapped[str] = mapped_column(String(length=500), nullable=True)
@@ -73,6 +75,7 @@ class PermissionModel(AbstractModel):
     """Модель прав доступа, описывает, что разрешено."""
 
     __tablename__ = "permission"  # type: ignore
+    __table_args__ = (Index("ix_permission_name", "name", unique=True),)
 
     name: Mapped[str] = mapped_column(VARCHAR(length=200), nullable=False)
     description: Mapped[str] = mapped_column(String(length=500), nullable=True)
@@ -103,6 +106,7 @@ class RolePermissionModel(AbstractModel):
     """Промежуточная таблица для связи ролей и прав."""
 
     __tablename__ = "role_permission"  # type: ignore
+    __table_args__ = (Index("ix_role_permission_role_id_permission_id", "role_id", "permission_id", unique=True),)
 
     role_id: Mapped[int] = mapped_column(ForeignKey(column="role.id"), nullable=False)
     permission_id: Mapped[int] = mapped_column(ForeignKey(column="permission.id"), nullable=False)
@@ -113,3 +117,19 @@ class RolePermissionModel(AbstractModel):
     permission: Mapped["PermissionModel"] = relationship(
         "PermissionModel", back_populates="role_permissions", overlaps="roles"
     )
+
+
+class AppStateModel(AbstractModel):
+    """Служебные значения состояния приложения в базе данных (например, отпечаток схемы и начальных данных)."""
+
+    __tablename__ = "app_state"  # type: ignore
+    __table_args__ = (Index("ix_app_state_key", "key", unique=True),)
+
+    key: Mapped[str] = mapped_column(VARCHAR(length=100), nullable=False)
+    value: Mapped[str] = mapped_column(String(length=500), nullable=False)
+    # Время вычисляется при каждой записи, а не один раз при импорте модуля
+    update_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
@@ -0,0 +1,233 @@
+import logging
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
+
+from flask import Flask
+from itsdangerous import BadSignature, URLSafeSerializer
+
+logger = logging.getLogger("app_db_logger")
+
+# Допустимые имена колонок ключа страницы: подставляются в SQL без кавычек
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+class InvalidCursorError(ValueError):
+    """
+    Курсор страницы повреждён, подделан или выдан для другого запроса.
+    """
+
+
+class KeysetPolicy:
+    """
+    Политика постраничного чтения по ключу (keyset pagination) именованного запроса из YAML-каталога.
+
+    Страница выбирается условием "строго после ключа последней строки предыдущей страницы"
+    по колонкам сортировки и уникальной колонке `tie_breaker`, а не через `OFFSET`, поэтому
+    при индексе по этим колонкам стоимость страницы не зависит от её номера.
+
+    Пример записи в каталоге:
+        keyset:
+          columns: [login]
+          tie_breaker: id
+          order: asc
+    """
+
+    ORDERS = ("asc", "desc")
+
+    # Имена служебных параметров страницы в SQL
+    AFTER_PARAM = "keyset_after_{}"
+    LIMIT_PARAM = "keyset_limit"
+
+    __slots__ = ("columns", "order")
+
+    def __init__(self, columns: Sequence[str], tie_breaker: str, order: str = "asc") -> None:
+        """
+        Инициализация KeysetPolicy.
+
+        :param columns: Колонки сортировки результата запроса.
+        :param tie_breaker: Уникальная колонка результата, упорядочивающая строки с равными значениями сортировки.
+        :param order: Направление сортировки всех колонок: `asc` или `desc`.
+        :raises ValueError: Если имя колонки некорректно, колонка повторяется или направление не поддерживается.
+        """
+        if order not in self.ORDERS:
+            raise ValueError(f"Направление сортировки должно быть одним из {self.ORDERS}, получено '{order}'.")
+        keys = (*columns, tie_breaker)
+        invalid = [key for key in keys if not isinstance(key, str) or not _IDENTIFIER.match(key)]
+        if invalid:
+            raise ValueError(f"Некорректные имена колонок ключа страницы: {invalid}.")
+        if len(set(keys)) != len(keys):
+            raise ValueError(f"Колонки ключа страницы повторяются: {list(keys)}.")
+        self.columns: Tuple[str, ...] = keys
+        self.order = order
+
+    @classmethod
+    def from_yaml(cls, query_name: str, raw: Any) -> "KeysetPolicy":
+        """
+        Создаёт политику из секции `keyset` запроса.
+
+        :param query_name: Имя запроса (для сообщений об ошибках).
+        :param raw: Содержимое секции `keyset`.
+        :return: Политика постраничного чтения.
+        :raises ValueError: Если секция имеет некорректный формат.
+        """
+        if not isinstance(raw, dict) or not isinstance(raw.get("tie_breaker"), str):
+            raise ValueError(f"Секция keyset запроса '{query_name}' должна содержать колонку 'tie_breaker'.")
+        columns = raw.get("columns") or []
+        if not isinstance(columns, list):
+            raise ValueError(f"Колонки секции keyset запроса '{query_name}' должны быть списком.")
+        return cls(columns=columns, tie_breaker=raw["tie_breaker"], order=raw.get("order", "asc"))
+
+    def page_sql(self, sql: str, after: bool) -> str:
+        """
+        Оборачивает текст запроса в выборку страницы.
+
+        Запрос становится подзапросом, поэтому колонки ключа — это имена колонок его результата.
+        Условие после ключа записывается сравнением кортежей (`(a, b) > (:a, :b)`), которое
+        PostgreSQL и SQLite используют как условие поиска по индексу.
+
+        :param sql: Текст исходного запроса (без `ORDER BY` и `LIMIT`).
+        :param after: Выборка страницы после ключа (иначе — первой страницы).
+        :return: Текст запроса страницы.
+        """
+        columns = ", ".join(self.columns)
+        page_sql = f"SELECT * FROM ({sql.strip().rstrip(';')}) AS keyset_page"
+        if after:
+            operator = ">" if self.order == "asc" else "<"
+            params = ", ".join(f":{self.AFTER_PARAM.format(i)}" for i in range(len(self.columns)))
+            page_sql += f" WHERE ({columns}) {operator} ({params})"
+        direction = self.order.upper()
+        order_by = ", ".join(f"{column} {direction}" for column in self.columns)
+        return f"{page_sql} ORDER BY {order_by} LIMIT :{self.LIMIT_PARAM}"
+
+    def page_params(self, params: Optional[Dict[str, Any]], after: Optional[List[Any]], limit: int) -> Dict[str, Any]:
+        """
+        Добавляет к параметрам запроса параметры страницы.
+
+        :param params: Параметры исходного запроса.
+        :param after: Значения ключа последней строки предыдущей страницы или None для первой страницы.
+        :param limit: Количество строк, выбираемых запросом страницы.
+        :return: Параметры запроса страницы.
+        """
+        page_params = dict(params or {})
+        page_params[self.LIMIT_PARAM] = limit
+        for i, value in enumerate(after or ()):
+            page_params[self.AFTER_PARAM.format(i)] = value
+        return page_params
+
+
+class Page:
+    """
+    Страница результата запроса.
+
+    `next_cursor` передаётся в следующий вызов `DBHelperSQL.execute_page` как `after`;
+    None означает, что страница последняя.
+    """
+
+    __slots__ = ("items", "next_cursor")
+
+    def __init__(self, items: List[Any], next_cursor: Optional[str]) -> None:
+        """
+        Инициализация Page.
+
+        :param items: Строки страницы.
+        :param next_cursor: Курсор следующей страницы или None.
+        """
+        self.items = items
+        self.next_cursor = next_cursor
+
+    def __repr__(self) -> str:
+        return f"Page(items={len(self.items)}, next_cursor={self.next_cursor!r})"
+
+
+class CursorCodec:
+    """
+    Кодирование курсоров страниц.
+
+    Курсор — непрозрачная для клиента строка с именем запроса и значениями ключа последней
+    строки страницы, подписанная секретным ключом приложения (`itsdangerous`). Подпись не даёт
+    подставить в условие страницы произвольные значения, а имя запроса — использовать курсор
+    одного запроса для другого.
+    """
+
+    # Соль подписи, отделяющая курсоры от других значений, подписанных тем же ключом
+    SALT = "keyset-cursor"
+
+    __slots__ = ("_serializer", "max_limit")
+
+    def __init__(self, secret_key: Optional[str] = None, max_limit: int = 500) -> None:
+        """
+        Инициализация CursorCodec.
+
+        :param secret_key: Секретный ключ подписи (обычно задаётся в `init_app`).
+        :param max_limit: Максимальное количество строк на странице.
+        """
+        self._serializer = URLSafeSerializer(secret_key, salt=self.SALT) if secret_key else None
+        self.max_limit = max_limit
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Настраивает ключ подписи и размер страницы из конфигурации приложения.
+
+        :param app: Flask-приложение.
+        """
+        secret_key = app.config.get("SECRET_KEY")
+        if secret_key:
+            self._serializer = URLSafeSerializer(secret_key, salt=self.SALT)
+        else:
+            logger.warning("SECRET_KEY не задан: постраничное чтение по курсорам недоступно.")
+        self.max_limit = app.config.get("SQLALCHEMY_PAGE_MAX_LIMIT", self.max_limit)
+
+    def check_limit(self, limit: int) -> None:
+        """
+        Проверяет размер страницы.
+
+        :param limit: Количество строк на странице.
+        :raises ValueError: Если размер страницы не в диапазоне от 1 до `max_limit`.
+        """
+        if not 1 <= limit <= self.max_limit:
+            raise ValueError(f"Размер страницы должен быть от 1 до {self.max_limit}, получено {limit}.")
+
+    def encode(self, query_name: str, values: Sequence[Any]) -> str:
+        """
+        Создаёт курсор страницы.
+
+        :param query_name: Имя запроса.
+        :param values: Значения ключа последней строки страницы.
+        :return: Подписанный курсор.
+        """
+        return cast(str, self.__serializer().dumps([query_name, list(values)]))
+
+    def decode(self, query_name: str, cursor: str, size: int) -> List[Any]:
+        """
+        Проверяет подпись курсора и возвращает значения ключа.
+
+        :param query_name: Имя запроса, для которого передан курсор.
+        :param cursor: Курсор, полученный от клиента.
+        :param size: Количество колонок ключа страницы запроса.
+        :return: Значения ключа последней строки предыдущей страницы.
+        :raises InvalidCursorError: Если подпись неверна или курсор выдан для другого запроса.
+        """
+        try:
+            payload = self.__serializer().loads(cursor)
+        except BadSignature as e:
+            raise InvalidCursorError("Некорректный курсор страницы.") from e
+        if (
+            not isinstance(payload, list)
+            or len(payload) != 2
+            or payload[0] != query_name
+            or not isinstance(payload[1], list)
+            or len(payload[1]) != size
+        ):
+            raise InvalidCursorError(f"Курсор страницы выдан не для запроса '{query_name}'.")
+        return payload[1]
+
+    def __serializer(self) -> URLSafeSerializer:
+        """
+        Возвращает сериализатор с ключом подписи.
+
+        :return: Сериализатор `itsdangerous`.
+        :raises RuntimeError: Если ключ подписи не задан.
+        """
+        if self._serializer is None:
+            raise RuntimeError("Ключ подписи курсоров страниц не задан (SECRET_KEY).")
+        return self._serializer
@@ -0,0 +1,161 @@
+import logging
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Логгер для метрик пула соединений (пишется вместе с профилированием SQL)
+logger = logging.getLogger("app_db_profiler_logger")
+
+
+class PoolMetrics:
+    """
+    Сбор метрик пула соединений SQLAlchemy.
+
+    Подписывается на события пула (`connect`, `checkout`, `checkin`, `invalidate`) и ведёт
+    счётчики выданных соединений, событий переполнения (overflow) и гистограмму времени
+    ожидания соединения. Время ожидания передаётся из `DatabaseCore.session_scope` через
+    `observe_wait`, так как у пула нет события "перед выдачей соединения".
+
+    Метрики доступны программно через `snapshot()` и периодически пишутся в лог.
+    """
+
+    # Верхние границы корзин гистограммы ожидания соединения (в миллисекундах)
+    WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+    __slots__ = (
+        "engine",
+        "log_interval",
+        "checked_out",
+        "peak_checked_out",
+        "checkouts",
+        "connects",
+        "invalidations",
+        "overflow_events",
+        "timeouts",
+        "wait_buckets",
+        "wait_count",
+        "wait_total",
+        "_last_log",
+        "_lock",
+    )
+
+    def __init__(self, log_interval: float = 60.0) -> None:
+        """
+        Инициализация PoolMetrics.
+
+        :param log_interval: Минимальный интервал (в секундах) между записями метрик в лог; 0 — не писать.
+        """
+        self.engine: Optional[Engine] = None
+        self.log_interval = log_interval
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        self.checkouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.overflow_events = 0
+        self.timeouts = 0
+        self.wait_buckets = [0] * (len(self.WAIT_BUCKETS_MS) + 1)
+        self.wait_count = 0
+        self.wait_total = 0.0
+        self._last_log = time.monotonic()
+        self._lock = threading.Lock()
+
+    def attach(self, engine: Engine) -> None:
+        """
+        Подписывает сбор метрик на события пула указанного движка.
+
+        :param engine: Движок SQLAlchemy, пул которого нужно инструментировать.
+        """
+        self.engine = engine
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    def _on_connect(self, dbapi_connection: Any, connection_record: Any) -> None:
+        """Обработчик события `connect`: учитывает новое физическое соединение."""
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+        """Обработчик события `checkout`: учитывает выдачу соединения и переполнение пула."""
+        pool = self.engine.pool if self.engine is not None else None
+        size = pool.size() if pool is not None and hasattr(pool, "overflow") else None
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+            overflow = size is not None and self.checked_out > size
+            if overflow:
+                self.overflow_events += 1
+            checked_out = self.checked_out
+        if overflow:
+            logger.warning(f"Пул соединений переполнен: выдано {checked_out} соединений при размере пула {size}")
+
+    def _on_checkin(self, dbapi_connection: Any, connection_record: Any) -> None:
+        """Обработчик события `checkin`: учитывает возврат соединения и при необходимости пишет метрики в лог."""
+        with self._lock:
+            self.checked_out = max(self.checked_out - 1, 0)
+            due = self.log_interval > 0 and time.monotonic() - self._last_log >= self.log_interval
+            if due:
+                self._last_log = time.monotonic()
+        if due:
+            self.log_snapshot()
+
+    def _on_invalidate(self, dbapi_connection: Any, connection_record: Any, exception: Any) -> None:
+        """Обработчик события `invalidate`: учитывает инвалидацию соединения."""
+        with self._lock:
+            self.invalidations += 1
+
+    def observe_wait(self, seconds: float) -> None:
+        """
+        Учитывает время ожидания выдачи соединения из пула.
+
+        :param seconds: Время ожидания в секундах.
+        """
+        index = bisect_left(self.WAIT_BUCKETS_MS, seconds * 1000)
+        with self._lock:
+            self.wait_buckets[index] += 1
+            self.wait_count += 1
+            self.wait_total += seconds
+
+    def observe_timeout(self) -> None:
+        """
+        Учитывает превышение `pool_timeout` при ожидании соединения.
+        """
+        with self._lock:
+            self.timeouts += 1
+        logger.error("Истекло время ожидания соединения из пула")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Возвращает текущее состояние метрик пула.
+
+        :return: Словарь со счётчиками, состоянием пула и гистограммой ожидания.
+        """
+        pool = self.engine.pool if self.engine is not None else None
+        labels = [f"le_{bound}ms" for bound in self.WAIT_BUCKETS_MS] + ["le_inf"]
+        with self._lock:
+            return {
+                "pool_status": pool.status() if pool is not None else None,
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "checkouts": self.checkouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "overflow_events": self.overflow_events,
+                "timeouts": self.timeouts,
+                "wait_count": self.wait_count,
+                "wait_avg_ms": (self.wait_total / self.wait_count * 1000) if self.wait_count else 0.0,
+                "wait_histogram": dict(zip(labels, self.wait_buckets)),
+            }
+
+    def log_snapshot(self) -> None:
+        """
+        Пишет текущее состояние метрик пула в лог.
+        """
+        logger.info(f"Метрики пула соединений: {self.snapshot()}")
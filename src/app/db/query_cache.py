@@ -0,0 +1,388 @@
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import (Any, Callable, Dict, Iterable, List, Optional, Sequence,
+                    Tuple)
+
+from flask import Flask
+from redis import Redis, RedisError
+
+logger = logging.getLogger("app_db_logger")
+
+
+class CachePolicy:
+    """
+    Политика кэширования результата именованного запроса из YAML-каталога.
+
+    Пример записи в каталоге:
+        cache:
+          ttl: 300
+          key_params: [login]
+          tags: [users]
+          l2: false
+
+    Результаты с `l2: false` хранятся только в памяти процесса и не попадают в общий Redis:
+    так кэшируются строки с учётными данными (например, хешами паролей).
+    """
+
+    __slots__ = ("ttl", "key_params", "tags", "l2")
+
+    def __init__(self, ttl: int, key_params: Sequence[str] = (), tags: Sequence[str] = (), l2: bool = True) -> None:
+        """
+        Инициализация CachePolicy.
+
+        :param ttl: Время жизни записи кэша в секундах.
+        :param key_params: Параметры запроса, входящие в ключ кэша (по умолчанию — все параметры).
+        :param tags: Теги, по которым записи инвалидируются запросами на запись.
+        :param l2: Сохранять результат в L2 (Redis); False — только в L1 процесса.
+        :raises ValueError: Если время жизни не положительное.
+        """
+        if ttl <= 0:
+            raise ValueError("Время жизни записи кэша должно быть положительным.")
+        self.ttl = ttl
+        self.key_params = tuple(key_params)
+        self.tags = tuple(tags)
+        self.l2 = l2
+
+    @classmethod
+    def from_yaml(cls, query_name: str, raw: Any) -> "CachePolicy":
+        """
+        Создаёт политику из секции `cache` запроса.
+
+        :param query_name: Имя запроса (для сообщений об ошибках).
+        :param raw: Содержимое секции `cache`.
+        :return: Политика кэширования.
+        :raises ValueError: Если секция имеет некорректный формат.
+        """
+        if not isinstance(raw, dict) or not isinstance(raw.get("ttl"), int):
+            raise ValueError(f"Секция cache запроса '{query_name}' должна содержать целое значение 'ttl'.")
+        if not isinstance(raw.get("l2", True), bool):
+            raise ValueError(f"Значение 'l2' секции cache запроса '{query_name}' должно быть логическим.")
+        return cls(
+            ttl=raw["ttl"], key_params=raw.get("key_params") or (), tags=raw.get("tags") or (), l2=raw.get("l2", True)
+        )
+
+
+class _CacheEntry:
+    """Запись L1-кэша: строки результата, срок жизни, теги с их поколениями и размер в байтах."""
+
+    __slots__ = ("query_name", "rows", "expires_at", "generations", "size")
+
+    def __init__(
+        self, query_name: str, rows: List[Dict[str, Any]], expires_at: float, generations: Dict[str, int], size: int
+    ) -> None:
+        self.query_name = query_name
+        self.rows = rows
+        self.expires_at = expires_at
+        self.generations = generations
+        self.size = size
+
+
+class QueryCache:
+    """
+    Двухуровневый кэш результатов именованных запросов.
+
+    L1 — LRU-кэш в памяти процесса, L2 — необязательный общий Redis (кроме запросов с `l2: false`).
+    Записи хранятся в JSON, поэтому значения, не представимые в JSON (например, даты), возвращаются
+    строками на обоих уровнях.
+
+    Инвалидация выполняется по тегам:
+    - в L1 каждый тег имеет локальное поколение; запись, загруженная при старом поколении, отбрасывается;
+    - в Redis каждый тег имеет счётчик версии, а запись L2 хранит версии тегов, при которых она была
+      загружена, поэтому устаревшие записи не удаляются явно, а перестают совпадать и истекают по TTL;
+    - другие процессы узнают об инвалидации через Redis pub/sub и очищают свой L1.
+
+    Ведётся статистика по имени запроса: попадания в L1 и L2, промахи, доля попаданий,
+    количество записей и размер L1 в байтах.
+    """
+
+    __slots__ = (
+        "max_entries",
+        "redis",
+        "key_prefix",
+        "instance_id",
+        "_entries",
+        "_generations",
+        "_stats",
+        "_lock",
+        "_listener",
+    )
+
+    def __init__(
+        self, max_entries: int = 1024, redis: Optional[Redis] = None, key_prefix: str = "query_cache:"
+    ) -> None:
+        """
+        Инициализация QueryCache.
+
+        :param max_entries: Максимальное количество записей L1.
+        :param redis: Клиент Redis для L2 (опционально).
+        :param key_prefix: Префикс ключей и канала инвалидации в Redis.
+        """
+        self.max_entries = max_entries
+        self.redis = redis
+        self.key_prefix = key_prefix
+        self.instance_id = uuid.uuid4().hex
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+        self._listener: Optional[threading.Thread] = None
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Настраивает кэш из конфигурации Flask-приложения и запускает подписку на инвалидацию.
+
+        :param app: Flask-приложение.
+        """
+        config = app.config
+        self.max_entries = config.get("QUERY_CACHE_MAX_ENTRIES", self.max_entries)
+        self.key_prefix = config.get("QUERY_CACHE_KEY_PREFIX", self.key_prefix)
+        redis_uri = config.get("QUERY_CACHE_REDIS_URI")
+        if redis_uri:
+            self.redis = Redis.from_url(redis_uri)
+            self.start_listener()
+        l2 = "Redis" if self.redis else "отключён"
+        logger.info(f"Кэш запросов настроен: L1 до {self.max_entries} записей, L2 {l2}")
+
+    @property
+    def channel(self) -> str:
+        """Канал Redis pub/sub для сообщений об инвалидации."""
+        return f"{self.key_prefix}invalidate"
+
+    def build_key(self, query_name: str, params: Optional[Dict[str, Any]], policy: CachePolicy) -> str:
+        """
+        Формирует ключ кэша для запроса и его параметров.
+
+        :param query_name: Имя запроса.
+        :param params: Параметры запроса.
+        :param policy: Политика кэширования запроса.
+        :return: Ключ кэша.
+        """
+        params = params or {}
+        names = policy.key_params or tuple(sorted(params))
+        values = json.dumps([params.get(name) for name in names], default=str, separators=(",", ":"))
+        return f"{query_name}:{values}"
+
+    def get_or_load(
+        self,
+        query_name: str,
+        params: Optional[Dict[str, Any]],
+        policy: CachePolicy,
+        loader: Callable[[], List[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Возвращает строки результата из L1, L2 или загружает их и сохраняет в кэш.
+
+        :param query_name: Имя запроса.
+        :param params: Параметры запроса.
+        :param policy: Политика кэширования запроса.
+        :param loader: Функция выполнения запроса, возвращающая строки в виде словарей.
+        :return: Строки результата в виде новых словарей (изменение не затрагивает кэш).
+        """
+        key = self.build_key(query_name, params, policy)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > now and self.__is_current(entry.generations):
+                self._entries.move_to_end(key)
+                self.__count(query_name, "l1_hits")
+                return [dict(row) for row in entry.rows]
+            if entry is not None:
+                self.__evict(key)
+            generations = {tag: self._generations.get(tag, 0) for tag in policy.tags}
+
+        rows, versions = self.__l2_get(key, policy)
+        if rows is not None:
+            with self._lock:
+                self.__count(query_name, "l2_hits")
+        else:
+            with self._lock:
+                self.__count(query_name, "misses")
+            payload = json.dumps(loader(), default=str, separators=(",", ":"))
+            rows = json.loads(payload)
+            self.__l2_set(key, policy, payload, versions)
+
+        size = len(json.dumps(rows, separators=(",", ":")).encode())
+        with self._lock:
+            if self.__is_current(generations):
+                self.__store(key, _CacheEntry(query_name, rows, now + policy.ttl, generations, size))
+        return [dict(row) for row in rows]
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        """
+        Инвалидирует записи с указанными тегами в L1 текущего процесса, в L2 и в L1 других процессов.
+
+        :param tags: Теги инвалидации.
+        """
+        tags = tuple(tags)
+        if not tags:
+            return
+        self._invalidate_local(tags)
+        if self.redis is None:
+            return
+        try:
+            pipeline = self.redis.pipeline(transaction=False)
+            for tag in tags:
+                pipeline.incr(self.tag_key(tag))
+            pipeline.publish(self.channel, json.dumps({"origin": self.instance_id, "tags": list(tags)}))
+            pipeline.execute()
+        except RedisError as e:
+            logger.error(f"Не удалось инвалидировать теги {list(tags)} в Redis: {e}")
+
+    def _invalidate_local(self, tags: Iterable[str]) -> None:
+        """
+        Инвалидирует записи с указанными тегами в L1 текущего процесса.
+
+        :param tags: Теги инвалидации.
+        """
+        tags = set(tags)
+        with self._lock:
+            for tag in tags:
+                self._generations[tag] = self._generations.get(tag, 0) + 1
+            stale = [key for key, entry in self._entries.items() if tags.intersection(entry.generations)]
+            for key in stale:
+                self.__evict(key)
+        logger.debug(f"Инвалидированы теги кэша {sorted(tags)}: удалено {len(stale)} записей L1")
+
+    def start_listener(self) -> None:
+        """
+        Запускает фоновый поток подписки на сообщения об инвалидации из других процессов.
+        """
+        if self.redis is None or (self._listener is not None and self._listener.is_alive()):
+            return
+        self._listener = threading.Thread(target=self.__listen, name="query-cache-invalidation", daemon=True)
+        self._listener.start()
+
+    def generation(self, tag: str) -> int:
+        """
+        Возвращает поколение тега в текущем процессе: увеличивается при каждой инвалидации тега
+        в этом процессе и при получении сообщения об инвалидации из других процессов.
+
+        :param tag: Тег инвалидации.
+        :return: Поколение тега.
+        """
+        with self._lock:
+            return self._generations.get(tag, 0)
+
+    def after_fork(self) -> None:
+        """
+        Восстанавливает состояние кэша в дочернем процессе после fork.
+
+        Процесс получает собственный идентификатор (иначе сообщения об инвалидации от других
+        воркеров с унаследованным идентификатором игнорировались бы), блокировку и пул соединений
+        Redis, после чего заново запускается поток подписки на инвалидацию.
+        """
+        self.instance_id = uuid.uuid4().hex
+        self._lock = threading.Lock()
+        self._listener = None
+        if self.redis is not None:
+            self.redis.connection_pool.reset()
+            self.start_listener()
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Возвращает статистику кэша по именам запросов.
+
+        :return: Словарь имя запроса -> попадания L1/L2, промахи, доля попаданий, записи и размер L1.
+        """
+        with self._lock:
+            stats: Dict[str, Dict[str, float]] = {name: dict(counters) for name, counters in self._stats.items()}
+            for entry in self._entries.values():
+                counters = stats[entry.query_name]
+                counters["entries"] = counters.get("entries", 0) + 1
+                counters["size_bytes"] = counters.get("size_bytes", 0) + entry.size
+        for counters in stats.values():
+            counters.setdefault("entries", 0)
+            counters.setdefault("size_bytes", 0)
+            hits = counters.get("l1_hits", 0) + counters.get("l2_hits", 0)
+            total = hits + counters.get("misses", 0)
+            counters["hit_ratio"] = hits / total if total else 0.0
+        return stats
+
+    def clear(self) -> None:
+        """
+        Очищает L1 текущего процесса и статистику.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+
+    def __is_current(self, generations: Dict[str, int]) -> bool:
+        """Проверяет, что поколения тегов записи не изменились (вызывается под блокировкой)."""
+        return all(self._generations.get(tag, 0) == generation for tag, generation in generations.items())
+
+    def __count(self, query_name: str, counter: str) -> None:
+        """Увеличивает счётчик статистики запроса (вызывается под блокировкой)."""
+        counters = self._stats.setdefault(query_name, {"l1_hits": 0, "l2_hits": 0, "misses": 0})
+        counters[counter] += 1
+
+    def __store(self, key: str, entry: _CacheEntry) -> None:
+        """Сохраняет запись в L1 и вытесняет самые давние записи сверх лимита (вызывается под блокировкой)."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __evict(self, key: str) -> None:
+        """Удаляет запись из L1 (вызывается под блокировкой)."""
+        self._entries.pop(key, None)
+
+    def tag_key(self, tag: str) -> str:
+        """Ключ счётчика версии тега в Redis."""
+        return f"{self.key_prefix}tag:{tag}"
+
+    def __l2_get(self, key: str, policy: CachePolicy) -> Tuple[Optional[List[Dict[str, Any]]], Dict[str, int]]:
+        """
+        Читает запись L2 и текущие версии её тегов одним обращением к Redis.
+
+        :return: Строки результата (или None при промахе) и текущие версии тегов.
+        """
+        if self.redis is None or not policy.l2:
+            return None, {}
+        try:
+            raw, *raw_versions = self.redis.mget([self.key_prefix + key, *map(self.tag_key, policy.tags)])
+        except RedisError as e:
+            logger.error(f"Кэш L2 недоступен, запрос '{key}' выполняется без него: {e}")
+            return None, {}
+        versions = {tag: int(version or 0) for tag, version in zip(policy.tags, raw_versions)}
+        if raw is None:
+            return None, versions
+        cached = json.loads(raw)
+        if cached.get("versions") != versions:
+            return None, versions
+        return cached["rows"], versions
+
+    def __l2_set(self, key: str, policy: CachePolicy, payload: str, versions: Dict[str, int]) -> None:
+        """
+        Сохраняет строки результата в L2 вместе с версиями тегов, при которых они были загружены.
+        """
+        if self.redis is None or not policy.l2:
+            return
+        try:
+            value = f'{{"versions":{json.dumps(versions, separators=(",", ":"))},"rows":{payload}}}'
+            self.redis.set(self.key_prefix + key, value, ex=policy.ttl)
+        except RedisError as e:
+            logger.error(f"Не удалось сохранить запись '{key}' в кэш L2: {e}")
+
+    def __listen(self) -> None:
+        """
+        Цикл подписки на сообщения об инвалидации; при ошибке Redis переподключается с паузой.
+        """
+        while True:
+            try:
+                pubsub = self.redis.pubsub(ignore_subscribe_messages=True)  # type: ignore[union-attr]
+                pubsub.subscribe(self.channel)
+                for message in pubsub.listen():
+                    try:
+                        data = json.loads(message["data"])
+                    except (TypeError, ValueError) as e:
+                        logger.error(f"Некорректное сообщение инвалидации кэша: {e}")
+                        continue
+                    if data.get("origin") != self.instance_id:
+                        self._invalidate_local(data.get("tags", []))
+            except RedisError as e:
+                logger.error(f"Подписка на инвалидацию кэша прервана, повтор через 5 сек: {e}")
+                time.sleep(5)
@@ -1,85 +1,574 @@
+import hashlib
 import logging
-from typing import Dict
+import os
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
 
 import yaml
+from sqlalchemy import types as sqltypes
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS
+from sqlalchemy.sql import bindparam, text
+from sqlalchemy.sql.elements import TextClause
+from sqlalchemy.sql.selectable import TextualSelect
+
+from .pagination import KeysetPolicy
+from .query_cache import CachePolicy
+from .records import QueryRecord, build_record_class
 
 logger = logging.getLogger("app_db_logger")
 
 
+class QueryDefinition:
+    """
+    Описание зарегистрированного SQL-запроса.
+
+    Хранит исходный текст запроса и заранее подготовленный объект выражения SQLAlchemy
+    (`TextClause`/`TextualSelect`) с объявленными типами параметров и колонок результата.
+    Один и тот же объект выражения переиспользуется при каждом выполнении, поэтому
+    параметры не разбираются заново, а ключ кэша компиляции SQLAlchemy остаётся стабильным.
+    Для запросов с объявленными колонками сразу генерируется класс записи результата.
+    Для запросов с секцией `keyset` также подготавливаются выражения первой и следующих страниц.
+    """
+
+    # Допустимые режимы запроса: чтение может выполняться на реплике, запись — только на основной БД
+    MODES = ("read", "write")
+
+    # Типы значений колонок ключа страницы, представимые в JSON курсора
+    KEYSET_PYTHON_TYPES = (str, int, float, bool)
+
+    __slots__ = (
+        "name",
+        "category",
+        "sql",
+        "binds",
+        "columns",
+        "mode",
+        "statement",
+        "record_class",
+        "cache",
+        "invalidates",
+        "keyset",
+        "page_statements",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        category: str,
+        sql: str,
+        binds: Optional[Dict[str, Any]] = None,
+        columns: Optional[Dict[str, Any]] = None,
+        mode: str = "write",
+        cache: Optional[CachePolicy] = None,
+        invalidates: Sequence[str] = (),
+        keyset: Optional[KeysetPolicy] = None,
+    ) -> None:
+        """
+        Инициализация QueryDefinition.
+
+        :param name: Имя запроса.
+        :param category: Категория запроса в YAML-файле.
+        :param sql: Текст SQL-запроса.
+        :param binds: Объявленные типы параметров (имя параметра -> тип SQLAlchemy).
+        :param columns: Объявленные типы колонок результата (имя колонки -> тип SQLAlchemy).
+        :param mode: Режим запроса: `read` или `write` (по умолчанию `write`, выполняется на основной БД).
+        :param cache: Политика кэширования результата (только для запросов на чтение).
+        :param invalidates: Теги кэша, инвалидируемые выполнением запроса.
+        :param keyset: Политика постраничного чтения по ключу (только для запросов на чтение).
+        :raises ValueError: Если режим не поддерживается, кэширование или постраничное чтение задано
+            для запроса на запись либо колонки ключа страницы не объявлены в `columns`.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Режим запроса '{name}' должен быть одним из {self.MODES}, получено '{mode}'.")
+        if cache is not None and mode != "read":
+            raise ValueError(f"Кэширование результата допустимо только для запросов на чтение, запрос '{name}'.")
+        if keyset is not None:
+            self._check_keyset(name, mode, keyset, columns or {})
+        self.name = name
+        self.category = category
+        self.sql = sql
+        self.binds = binds or {}
+        self.columns = columns or {}
+        self.mode = mode
+        self.cache = cache
+        self.invalidates = tuple(invalidates)
+        self.keyset = keyset
+        self.statement = self._compile_statement()
+        self.page_statements: Optional[Tuple[TextualSelect, TextualSelect]] = (
+            (self._compile_page_statement(keyset, after=False), self._compile_page_statement(keyset, after=True))
+            if keyset
+            else None
+        )
+        self.record_class: Optional[Type[QueryRecord]] = (
+            build_record_class(name, list(self.columns)) if self.columns else None
+        )
+
+    def _compile_statement(self) -> TextClause | TextualSelect:
+        """
+        Создаёт объект выражения SQLAlchemy для запроса.
+
+        :return: `TextClause` с типизированными параметрами или `TextualSelect`, если объявлены колонки.
+        """
+        statement = text(self.sql)
+        if self.binds:
+            statement = statement.bindparams(*(bindparam(key, type_=type_) for key, type_ in self.binds.items()))
+        if self.columns:
+            return statement.columns(**self.columns)
+        return statement
+
+    @classmethod
+    def _check_keyset(cls, name: str, mode: str, keyset: KeysetPolicy, columns: Dict[str, Any]) -> None:
+        """
+        Проверяет, что постраничное чтение применимо к запросу.
+
+        :param name: Имя запроса.
+        :param mode: Режим запроса.
+        :param keyset: Политика постраничного чтения.
+        :param columns: Объявленные типы колонок результата.
+        :raises ValueError: Если запрос на запись или колонки ключа не объявлены либо не представимы в курсоре.
+        """
+        if mode != "read":
+            raise ValueError(f"Постраничное чтение допустимо только для запросов на чтение, запрос '{name}'.")
+        undeclared = [column for column in keyset.columns if column not in columns]
+        if undeclared:
+            raise ValueError(f"Колонки ключа страницы {undeclared} запроса '{name}' не объявлены в секции columns.")
+        for column in keyset.columns:
+            if columns[column].python_type not in cls.KEYSET_PYTHON_TYPES:
+                raise ValueError(
+                    f"Колонка ключа страницы '{column}' запроса '{name}' должна быть строкой или числом, "
+                    f"получен тип {type(columns[column]).__name__}."
+                )
+
+    def _compile_page_statement(self, keyset: KeysetPolicy, after: bool) -> TextualSelect:
+        """
+        Создаёт объект выражения SQLAlchemy для выборки страницы.
+
+        Параметры ключа получают типы колонок ключа, поэтому выражение, как и основное,
+        подготавливается один раз и имеет стабильный ключ кэша компиляции.
+
+        :param keyset: Политика постраничного чтения запроса.
+        :param after: Выборка страницы после ключа (иначе — первой страницы).
+        :return: `TextualSelect` с типизированными параметрами.
+        """
+        binds = dict(self.binds)
+        binds[KeysetPolicy.LIMIT_PARAM] = sqltypes.Integer()
+        if after:
+            for i, column in enumerate(keyset.columns):
+                binds[KeysetPolicy.AFTER_PARAM.format(i)] = self.columns[column]
+        statement = text(keyset.page_sql(self.sql, after))
+        statement = statement.bindparams(*(bindparam(key, type_=type_) for key, type_ in binds.items()))
+        return statement.columns(**self.columns)
+
+    def explain_statement(self, prefix: str) -> TextClause:
+        """
+        Создаёт выражение `EXPLAIN` для запроса с теми же типами параметров.
+
+        :param prefix: Префикс команды, например `EXPLAIN ` или `EXPLAIN QUERY PLAN `.
+        :return: `TextClause` с типизированными параметрами.
+        """
+        return self._bind_text(prefix + self.sql)
+
+    def probe_statement(self) -> TextClause:
+        """
+        Создаёт выражение, возвращающее колонки результата запроса без чтения строк.
+
+        Запрос становится подзапросом выборки с `LIMIT 0`: база данных разбирает его и сообщает
+        колонки результата, но не читает строки таблиц.
+
+        :return: `TextClause` с типизированными параметрами.
+        """
+        return self._bind_text(f"SELECT * FROM ({self.sql.strip().rstrip(';')}) AS catalog_probe LIMIT 0")
+
+    def _bind_text(self, sql: str) -> TextClause:
+        """
+        Создаёт текстовое выражение с объявленными типами параметров запроса.
+
+        :param sql: Текст SQL.
+        :return: `TextClause` с типизированными параметрами.
+        """
+        statement = text(sql)
+        if self.binds:
+            statement = statement.bindparams(*(bindparam(key, type_=type_) for key, type_ in self.binds.items()))
+        return statement
+
+
 class QueryManager:
     """
     Класс для управления SQL-запросами.
 
-    Позволяет загружать, регистрировать и получать SQL-запросы из YAML-файла.
+    Позволяет загружать, регистрировать и получать SQL-запросы из YAML-файлов.
     Подходит для работы с динамическими или статическими запросами, разделёнными на категории.
+
+    Каталог запросов состоит из общего файла и необязательных файлов переопределений
+    для конкретных диалектов СУБД (например, `postgresql` и `sqlite`). Для активного
+    диалекта запрос берётся из файла переопределений, а при его отсутствии — из общего файла.
+    Каждое имя, объявленное в любом из файлов, обязано разрешаться для активного диалекта,
+    иначе регистрация завершается ошибкой.
+
+    Запрос в YAML задаётся строкой либо словарём с ключами:
+    - sql: текст запроса;
+    - binds: типы параметров (например, `login: String`);
+    - columns: типы колонок результата;
+    - mode: `read` (может выполняться на реплике) или `write` (по умолчанию, только основная БД);
+    - cache / invalidates: политика кэширования результата и инвалидируемые теги кэша;
+    - keyset: колонки сортировки и `tie_breaker` для постраничного чтения (`DBHelperSQL.execute_page`).
+
+    При регистрации для каждого запроса один раз создаётся объект выражения SQLAlchemy,
+    который затем выполняется напрямую. Счётчики попаданий в кэш компиляции SQLAlchemy
+    ведутся по каждому запросу и доступны через `get_cache_stats`.
+
+    Каталог можно перезагружать без перезапуска процесса: `start_watching` запускает фоновый поток,
+    который отслеживает время изменения файлов каталога и при изменении заново читает и подготавливает
+    все запросы, после чего подменяет каталог целиком. Если новый каталог некорректен, продолжает
+    использоваться прежний. Номер версии (`version`, растёт с каждой загрузкой в процессе) и дайджест
+    содержимого файлов (`digest`, одинаковый у всех процессов с одним каталогом) доступны через `catalog_version`.
     """
 
-    def __init__(self, file_path_query_yaml: str) -> None:
+    # Заголовок ответа с версией каталога запросов (см. `catalog_version`)
+    VERSION_HEADER = "X-Query-Catalog-Version"
+
+    def __init__(
+        self,
+        file_path_query_yaml: Optional[str] = None,
+        dialect_files: Optional[Dict[str, str]] = None,
+        dialect: Optional[str] = None,
+    ) -> None:
         """
         Инициализация QueryManager.
 
-        :param file_path_query_yaml: Путь к YAML-файлу с SQL-запросами.
+        :param file_path_query_yaml: Путь к общему YAML-файлу с SQL-запросами.
+        :param dialect_files: Пути к YAML-файлам переопределений по имени диалекта.
+        :param dialect: Имя активного диалекта (например, `postgresql`).
         """
         self.file_path_query_yaml = file_path_query_yaml
+        self.dialect_files: Dict[str, str] = dict(dialect_files or {})
+        self.dialect = dialect
         self.queries: Dict[str, str] = {}  # Словарь зарегистрированных запросов
+        self.definitions: Dict[str, QueryDefinition] = {}  # Подготовленные выражения запросов
+        self._cache_stats: Dict[str, Dict[str, int]] = {}  # Счётчики кэша компиляции по запросам
+        self._cache_stats_lock = threading.Lock()
+        self.version = 0  # Номер загрузки каталога в текущем процессе
+        self.digest = ""  # SHA-256 содержимого файлов загруженного каталога
+        self._load_lock = threading.Lock()
+        self._file_mtimes: Dict[str, Optional[int]] = {}
+        self._watcher: Optional[threading.Thread] = None
+        self._watcher_stop = threading.Event()
+        self._watch_interval = 0.0
 
     @classmethod
-    def from_yaml(cls, file_path_query_yaml: str) -> "QueryManager":
+    def from_yaml(
+        cls,
+        file_path_query_yaml: str,
+        dialect_files: Optional[Dict[str, str]] = None,
+        dialect: Optional[str] = None,
+    ) -> "QueryManager":
         """
         Фабричный метод для создания и инициализации QueryManager.
 
-        :param file_path_query_yaml: Путь к YAML-файлу с SQL-запросами.
+        :param file_path_query_yaml: Путь к общему YAML-файлу с SQL-запросами.
+        :param dialect_files: Пути к YAML-файлам переопределений по имени диалекта.
+        :param dialect: Имя активного диалекта.
         :return: Инициализированный экземпляр QueryManager.
         """
-        instance = cls(file_path_query_yaml)
-        instance._register_queries()
+        instance = cls(file_path_query_yaml, dialect_files=dialect_files, dialect=dialect)
+        instance._register_queries(force=True)
         return instance
 
-    def _load_queries_from_yaml(self) -> Dict[str, Dict[str, str]]:
+    def load_catalog(
+        self,
+        file_path_query_yaml: str,
+        dialect_files: Optional[Dict[str, str]] = None,
+        dialect: Optional[str] = None,
+    ) -> None:
+        """
+        Загружает каталог запросов для указанного диалекта.
+
+        Используется `DatabaseCore.init_app`, когда диалект становится известен по созданному движку.
+
+        :param file_path_query_yaml: Путь к общему YAML-файлу с SQL-запросами.
+        :param dialect_files: Пути к YAML-файлам переопределений по имени диалекта.
+        :param dialect: Имя активного диалекта.
+        :raises ValueError: Если каталог некорректен или неполон для диалекта.
+        """
+        self.file_path_query_yaml = file_path_query_yaml
+        self.dialect_files = dict(dialect_files or {})
+        self.dialect = dialect
+        self._register_queries(force=True)
+        logger.info(f"Каталог запросов загружен для диалекта '{dialect}': {len(self.queries)} запросов.")
+
+    @property
+    def catalog_version(self) -> str:
+        """
+        Версия загруженного каталога: номер загрузки и первые 12 символов дайджеста файлов.
+
+        :return: Строка вида `<version>-<digest>`.
+        """
+        return f"{self.version}-{self.digest[:12]}"
+
+    def reload(self) -> bool:
+        """
+        Перечитывает файлы каталога и подменяет каталог, если их содержимое изменилось.
+
+        Новый каталог полностью читается и подготавливается до подмены; при ошибке
+        продолжает использоваться прежний каталог.
+
+        :return: True, если каталог подменён.
+        """
+        previous = self.catalog_version
+        try:
+            if not self._register_queries():
+                return False
+        except Exception as e:
+            logger.error(f"Каталог запросов не перезагружен, используется версия {previous}: {e}")
+            return False
+        logger.info(f"Каталог запросов перезагружен: версия {previous} -> {self.catalog_version}.")
+        return True
+
+    def start_watching(self, interval: float) -> None:
+        """
+        Запускает фоновый поток, перезагружающий каталог при изменении его файлов.
+
+        :param interval: Интервал проверки времени изменения файлов (в секундах).
+        """
+        if interval <= 0 or (self._watcher is not None and self._watcher.is_alive()):
+            return
+        self._watch_interval = interval
+        self._file_mtimes = self._read_file_mtimes()
+        self._watcher_stop.clear()
+        self._watcher = threading.Thread(
+            target=self.__watch, args=(interval,), name="query-catalog-watcher", daemon=True
+        )
+        self._watcher.start()
+        logger.info(f"Отслеживание изменений каталога запросов запущено (интервал {interval} сек).")
+
+    def stop_watching(self) -> None:
+        """
+        Останавливает фоновый поток отслеживания файлов каталога.
+        """
+        self._watcher_stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+
+    def after_fork(self) -> None:
+        """
+        Восстанавливает состояние в дочернем процессе после fork.
+
+        Блокировки создаются заново (их мог удерживать поток родителя в момент fork),
+        а фоновое отслеживание файлов перезапускается, если было включено.
+        """
+        self._load_lock = threading.Lock()
+        self._cache_stats_lock = threading.Lock()
+        self._watcher = None
+        self._watcher_stop = threading.Event()
+        if self._watch_interval > 0:
+            self.start_watching(self._watch_interval)
+
+    def _catalog_files(self) -> List[str]:
+        """
+        Возвращает пути ко всем файлам каталога: общему и переопределениям диалектов.
+
+        :return: Список путей.
+        """
+        files = [self.file_path_query_yaml] if self.file_path_query_yaml else []
+        return files + [self.dialect_files[dialect] for dialect in sorted(self.dialect_files)]
+
+    def _read_file_mtimes(self) -> Dict[str, Optional[int]]:
+        """
+        Считывает время изменения файлов каталога.
+
+        :return: Словарь "путь -> время изменения в наносекундах" (None, если файл недоступен).
+        """
+        mtimes: Dict[str, Optional[int]] = {}
+        for file_path in self._catalog_files():
+            try:
+                mtimes[file_path] = os.stat(file_path).st_mtime_ns
+            except OSError:
+                mtimes[file_path] = None
+        return mtimes
+
+    def _read_digest(self) -> str:
+        """
+        Вычисляет SHA-256 содержимого файлов каталога.
+
+        :return: Дайджест в шестнадцатеричном виде.
+        :raises FileNotFoundError: Если файл каталога не найден.
+        """
+        digest = hashlib.sha256()
+        for file_path in self._catalog_files():
+            with open(file_path, "rb") as file:
+                digest.update(file.read())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def __watch(self, interval: float) -> None:
+        """
+        Цикл фонового потока: перезагружает каталог при изменении времени изменения файлов.
+
+        :param interval: Интервал проверки (в секундах).
+        """
+        while not self._watcher_stop.wait(interval):
+            mtimes = self._read_file_mtimes()
+            if mtimes != self._file_mtimes:
+                self._file_mtimes = mtimes
+                self.reload()
+
+    def _load_queries_from_yaml(self, file_path: str) -> Dict[str, Dict[str, Any]]:
         """
         Загрузка запросов из YAML-файла.
 
+        :param file_path: Путь к YAML-файлу.
         :return: Словарь запросов, загруженных из файла.
         :raises FileNotFoundError: Если файл не найден.
         :raises ValueError: Если структура YAML некорректна.
         """
         try:
-            with open(self.file_path_query_yaml, "r", encoding="utf-8") as file:
+            with open(file_path, "r", encoding="utf-8") as file:
                 data = yaml.safe_load(file)
                 if not isinstance(data, dict):
-                    raise ValueError(f"Некорректный формат YAML в {self.file_path_query_yaml}: ожидается словарь.")
+                    raise ValueError(f"Некорректный формат YAML в {file_path}: ожидается словарь.")
                 return data
         except FileNotFoundError:
-            logger.error(f"Файл {self.file_path_query_yaml} не найден.")
+            logger.error(f"Файл {file_path} не найден.")
             raise
         except yaml.YAMLError as e:
-            logger.error(f"Ошибка чтения YAML из файла {self.file_path_query_yaml}: {e}")
+            logger.error(f"Ошибка чтения YAML из файла {file_path}: {e}")
             raise
 
-    def _register_queries(self) -> None:
+    @staticmethod
+    def _resolve_types(name: str, section: str, declared: Any) -> Dict[str, Any]:
         """
-        Регистрирует SQL-запросы из YAML-файла.
+        Преобразует объявленные в YAML имена типов в типы SQLAlchemy.
 
-        Загружает запросы из файла и добавляет их в локальный словарь `queries`.
+        :param name: Имя запроса (для сообщений об ошибках).
+        :param section: Имя секции (`binds` или `columns`).
+        :param declared: Словарь "имя -> название типа" из YAML.
+        :return: Словарь "имя -> экземпляр типа SQLAlchemy".
+        :raises ValueError: Если секция не словарь или тип неизвестен.
+        """
+        if declared is None:
+            return {}
+        if not isinstance(declared, dict):
+            raise ValueError(f"Секция '{section}' запроса '{name}' должна быть словарём.")
+        resolved = {}
+        for key, type_name in declared.items():
+            type_ = getattr(sqltypes, str(type_name), None)
+            if not (isinstance(type_, type) and issubclass(type_, sqltypes.TypeEngine)):
+                raise ValueError(f"Неизвестный тип '{type_name}' для '{key}' в секции '{section}' запроса '{name}'.")
+            resolved[key] = type_()
+        return resolved
+
+    def _build_definition(self, category: str, name: str, query: Any) -> QueryDefinition:
+        """
+        Создаёт описание запроса из записи YAML.
+
+        :param category: Категория запроса.
+        :param name: Имя запроса.
+        :param query: Строка SQL или словарь с ключами `sql`, `binds`, `columns`, `mode`, `cache`, `invalidates`,
+            `keyset`.
+        :return: Подготовленное описание запроса.
+        :raises ValueError: Если запись имеет некорректный формат.
+        """
+        if isinstance(query, str):
+            return QueryDefinition(name=name, category=category, sql=query)
+        if isinstance(query, dict) and isinstance(query.get("sql"), str):
+            return QueryDefinition(
+                name=name,
+                category=category,
+                sql=query["sql"],
+                binds=self._resolve_types(name, "binds", query.get("binds")),
+                columns=self._resolve_types(name, "columns", query.get("columns")),
+                mode=query.get("mode", "write"),
+                cache=CachePolicy.from_yaml(name, query["cache"]) if query.get("cache") is not None else None,
+                invalidates=query.get("invalidates") or (),
+                keyset=KeysetPolicy.from_yaml(name, query["keyset"]) if query.get("keyset") is not None else None,
+            )
+        raise ValueError(f"Запрос '{name}' в категории '{category}' должен быть строкой или словарём с ключом 'sql'.")
 
-        :raises ValueError: Если запрос с одинаковым именем уже существует.
+    def _read_definitions(self, file_path: str) -> Dict[str, QueryDefinition]:
+        """
+        Читает и подготавливает все запросы одного YAML-файла.
+
+        :param file_path: Путь к YAML-файлу.
+        :return: Словарь "имя -> описание запроса".
+        :raises ValueError: Если структура файла некорректна или имя запроса повторяется.
+        """
+        definitions: Dict[str, QueryDefinition] = {}
+        for category, query_dict in self._load_queries_from_yaml(file_path).items():
+            if not isinstance(query_dict, dict):
+                raise ValueError(f"Категория '{category}' должна содержать словарь запросов.")
+            for name, query in query_dict.items():
+                if name in definitions:
+                    raise ValueError(f"Запрос с именем '{name}' уже зарегистрирован.")
+                definitions[name] = self._build_definition(category, name, query)
+        return definitions
+
+    def _register_queries(self, force: bool = False) -> bool:
+        """
+        Регистрирует SQL-запросы из YAML-файлов каталога.
+
+        Загружает общий файл и файлы переопределений, выбирает для каждого имени запрос
+        активного диалекта, подготавливает объекты выражений SQLAlchemy и заменяет
+        локальные словари `queries` и `definitions`. Если дайджест файлов не изменился
+        и `force` не задан, каталог не перечитывается.
+
+        :param force: Загрузить каталог, даже если содержимое файлов не изменилось.
+        :return: True, если каталог загружен и подменён.
+        :raises ValueError: Если запрос повторяется в файле или не определён для активного диалекта.
         """
         try:
-            queries = self._load_queries_from_yaml()
-            for category, query_dict in queries.items():
-                if not isinstance(query_dict, dict):
-                    raise ValueError(f"Категория '{category}' должна содержать словарь запросов.")
-                for name, query in query_dict.items():
-                    if not isinstance(query, str):
-                        raise ValueError(f"Запрос '{name}' в категории '{category}' должен быть строкой.")
-                    if name in self.queries:
-                        raise ValueError(f"Запрос с именем '{name}' уже зарегистрирован.")
-                    self.queries[name] = query
-                    logger.debug(f"Запрос '{name}' успешно зарегистрирован.")
+            file_path_query_yaml = self.file_path_query_yaml
+            if not file_path_query_yaml:
+                raise ValueError("Не указан путь к YAML-файлу с SQL-запросами.")
+            with self._load_lock:
+                digest = self._read_digest()
+                if not force and digest == self.digest:
+                    return False
+                self.__swap(*self.__build_catalog(file_path_query_yaml), digest)
+                return True
         except Exception as e:
             logger.error(f"Ошибка при регистрации запросов: {e}")
             raise
 
+    def __build_catalog(self, file_path_query_yaml: str) -> Tuple[Dict[str, QueryDefinition], Dict[str, str]]:
+        """
+        Читает файлы каталога и подготавливает описания запросов активного диалекта.
+
+        :param file_path_query_yaml: Путь к общему YAML-файлу с SQL-запросами.
+        :return: Пара (описания запросов, тексты запросов).
+        :raises ValueError: Если запрос повторяется в файле или не определён для активного диалекта.
+        """
+        definitions = self._read_definitions(file_path_query_yaml)
+        declared_names = set(definitions)
+        for dialect, file_path in self.dialect_files.items():
+            overrides = self._read_definitions(file_path)
+            declared_names.update(overrides)
+            if dialect == self.dialect:
+                definitions.update(overrides)
+
+        missing = sorted(declared_names - set(definitions))
+        if missing:
+            raise ValueError(f"Запросы {missing} не определены для диалекта '{self.dialect}'.")
+        return definitions, {name: definition.sql for name, definition in definitions.items()}
+
+    def __swap(self, definitions: Dict[str, QueryDefinition], queries: Dict[str, str], digest: str) -> None:
+        """
+        Подменяет загруженный каталог подготовленным.
+
+        Словари заменяются целиком, поэтому выполняющиеся запросы дочитывают прежние описания,
+        а новые обращения получают новые.
+
+        :param definitions: Описания запросов.
+        :param queries: Тексты запросов.
+        :param digest: Дайджест файлов каталога.
+        """
+        self.definitions = definitions
+        self.queries = queries
+        self.digest = digest
+        self.version += 1
+        for name in definitions:
+            logger.debug(f"Запрос '{name}' успешно зарегистрирован.")
+
     def get_query(self, name: str) -> str:
         """
         Получить SQL-запрос по имени.
@@ -94,6 +583,68 @@ class QueryManager:
             raise ValueError(f"Запрос с именем '{name}' не найден.")
         return query
 
+    def get_statement(self, name: str) -> TextClause | TextualSelect:
+        """
+        Получить подготовленное выражение SQLAlchemy по имени запроса.
+
+        :param name: Имя зарегистрированного SQL-запроса.
+        :return: Объект выражения, готовый к выполнению через `Session.execute`.
+        :raises ValueError: Если запрос с указанным именем не найден.
+        """
+        definition = self.definitions.get(name)
+        if definition is None:
+            logger.error(f"Запрос с именем '{name}' не найден.")
+            raise ValueError(f"Запрос с именем '{name}' не найден.")
+        return definition.statement
+
+    def is_read_query(self, name: str) -> bool:
+        """
+        Проверяет, помечен ли запрос в каталоге как чтение.
+
+        :param name: Имя зарегистрированного SQL-запроса.
+        :return: True, если запрос может выполняться на реплике.
+        :raises ValueError: Если запрос с указанным именем не найден.
+        """
+        definition = self.definitions.get(name)
+        if definition is None:
+            logger.error(f"Запрос с именем '{name}' не найден.")
+            raise ValueError(f"Запрос с именем '{name}' не найден.")
+        return definition.mode == "read"
+
+    def get_definition(self, name: str) -> QueryDefinition:
+        """
+        Получить описание запроса по имени.
+
+        :param name: Имя зарегистрированного SQL-запроса.
+        :return: Описание запроса.
+        :raises ValueError: Если запрос с указанным именем не найден.
+        """
+        definition = self.definitions.get(name)
+        if definition is None:
+            logger.error(f"Запрос с именем '{name}' не найден.")
+            raise ValueError(f"Запрос с именем '{name}' не найден.")
+        return definition
+
+    def get_record_class(self, name: str, keys: Sequence[str]) -> Type[QueryRecord]:
+        """
+        Получить класс записи результата для запроса.
+
+        Для запросов с объявленными колонками используется класс, созданный при загрузке каталога.
+        Для остальных класс генерируется по колонкам первого результата и сохраняется в описании запроса.
+
+        :param name: Имя зарегистрированного SQL-запроса.
+        :param keys: Имена колонок результата.
+        :return: Класс записи со `__slots__`.
+        :raises ValueError: Если запрос не найден или колонки результата не совпадают с классом записи.
+        """
+        definition = self.get_definition(name)
+        record_class = definition.record_class
+        if record_class is None:
+            record_class = definition.record_class = build_record_class(name, keys)
+        elif record_class._fields != tuple(keys):
+            raise ValueError(f"Колонки результата {list(keys)} не совпадают с записью запроса '{name}'.")
+        return record_class
+
     def list_queries(self) -> Dict[str, str]:
         """
         Возвращает список всех зарегистрированных запросов.
@@ -102,3 +653,26 @@ class QueryManager:
         """
         logger.debug("Получение списка всех зарегистрированных запросов.")
         return self.queries
+
+    def record_cache_result(self, name: str, cache_hit: Any) -> None:
+        """
+        Учитывает результат обращения к кэшу компиляции SQLAlchemy для запроса.
+
+        :param name: Имя выполненного запроса.
+        :param cache_hit: Значение `ExecutionContext.cache_hit` выполненного выражения.
+        """
+        key = "hits" if cache_hit is CACHE_HIT else "misses" if cache_hit is CACHE_MISS else "uncached"
+        with self._cache_stats_lock:
+            stats = self._cache_stats.setdefault(name, {"hits": 0, "misses": 0, "uncached": 0})
+            stats[key] += 1
+        if key == "misses":
+            logger.debug(f"Запрос '{name}' скомпилирован заново (промах кэша компиляции).")
+
+    def get_cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Возвращает счётчики кэша компиляции по каждому запросу текущего процесса.
+
+        :return: Словарь "имя запроса -> {hits, misses, uncached}".
+        """
+        with self._cache_stats_lock:
+            return {name: dict(stats) for name, stats in self._cache_stats.items()}
@@ -0,0 +1,131 @@
+from typing import (TYPE_CHECKING, Any, Callable, Dict, Iterator, Sequence,
+                    Tuple, Type, cast)
+
+from sqlalchemy.engine import Row
+
+if TYPE_CHECKING:
+    from .query_manager import QueryManager
+
+# Допустимые формы строк результата
+SHAPES = ("dict", "tuple", "record")
+
+
+class QueryRecord:
+    """
+    Базовый класс записей результата именованных запросов.
+
+    Классы-наследники генерируются функцией `build_record_class` для каждого запроса каталога
+    и хранят значения колонок в `__slots__`, без словаря экземпляра. Для совместимости с кодом,
+    работающим со строками-словарями, поддерживаются обращение по ключу, `get` и `_asdict`.
+    """
+
+    __slots__ = ()
+
+    _fields: Tuple[str, ...] = ()
+
+    def __init__(self, *values: Any) -> None:
+        """
+        Инициализация записи значениями колонок в порядке `_fields`.
+
+        :param values: Значения колонок.
+        :raises TypeError: Если количество значений не совпадает с количеством колонок.
+        """
+        if len(values) != len(self._fields):
+            raise TypeError(f"{type(self).__name__} ожидает {len(self._fields)} значений, получено {len(values)}.")
+        for field, value in zip(self._fields, values):
+            setattr(self, field, value)
+
+    def __getitem__(self, key: str) -> Any:
+        """
+        Возвращает значение колонки по имени.
+
+        :param key: Имя колонки.
+        :return: Значение колонки.
+        :raises KeyError: Если колонки нет в записи.
+        """
+        if key not in self._fields:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Возвращает значение колонки по имени или значение по умолчанию.
+
+        :param key: Имя колонки.
+        :param default: Значение, возвращаемое при отсутствии колонки.
+        :return: Значение колонки или `default`.
+        """
+        return getattr(self, key) if key in self._fields else default
+
+    def __iter__(self) -> Iterator[Any]:
+        """Итерирует значения колонок в порядке `_fields`."""
+        return (getattr(self, field) for field in self._fields)
+
+    def __eq__(self, other: object) -> bool:
+        """Записи равны, если совпадают их классы и значения колонок."""
+        if type(other) is not type(self):
+            return NotImplemented
+        return tuple(self) == tuple(other)  # type: ignore[arg-type]
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Строковое представление записи с именами и значениями колонок."""
+        values = ", ".join(f"{field}={getattr(self, field)!r}" for field in self._fields)
+        return f"{type(self).__name__}({values})"
+
+    def _asdict(self) -> Dict[str, Any]:
+        """
+        Преобразует запись в словарь.
+
+        :return: Словарь имя колонки -> значение.
+        """
+        return {field: getattr(self, field) for field in self._fields}
+
+
+def build_record_class(query_name: str, fields: Sequence[str]) -> Type[QueryRecord]:
+    """
+    Генерирует класс записи со `__slots__` для результата именованного запроса.
+
+    :param query_name: Имя запроса каталога (используется в имени класса).
+    :param fields: Имена колонок результата в порядке их выборки.
+    :return: Класс-наследник `QueryRecord`.
+    :raises ValueError: Если имена колонок не являются корректными уникальными идентификаторами.
+    """
+    fields = tuple(fields)
+    invalid = [field for field in fields if not field.isidentifier() or field.startswith("_")]
+    if invalid or len(set(fields)) != len(fields):
+        raise ValueError(f"Колонки {list(fields)} запроса '{query_name}' нельзя использовать как поля записи.")
+    class_name = "".join(part.capitalize() for part in query_name.split("_")) + "Record"
+    return type(class_name, (QueryRecord,), {"__slots__": fields, "_fields": fields})
+
+
+def check_shape(shape: str) -> None:
+    """
+    Проверяет, что форма строк результата поддерживается.
+
+    :param shape: Форма строк результата.
+    :raises ValueError: Если форма не поддерживается.
+    """
+    if shape not in SHAPES:
+        raise ValueError(f"Форма результата должна быть одной из {SHAPES}, получено '{shape}'.")
+
+
+def row_converter(
+    query_manager: "QueryManager", query_name: str, keys: Sequence[str], shape: str
+) -> Callable[[Row[Any]], Any]:
+    """
+    Возвращает функцию преобразования строки результата SQLAlchemy в заданную форму.
+
+    :param query_manager: Каталог запросов, хранящий классы записей.
+    :param query_name: Имя запроса.
+    :param keys: Имена колонок результата.
+    :param shape: Форма строк результата: `dict`, `tuple` или `record`.
+    :return: Функция преобразования строки.
+    """
+    if shape == "tuple":
+        return tuple
+    if shape == "record":
+        record_class = query_manager.get_record_class(query_name, keys)
+        return lambda row: record_class(*row)
+    return cast(Callable[[Row[Any]], Any], Row._asdict)
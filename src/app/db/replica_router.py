@@ -0,0 +1,152 @@
+import logging
+import threading
+import time
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from .pool_metrics import PoolMetrics
+
+logger = logging.getLogger("app_db_logger")
+
+# Запросы оценки отставания реплики (в секундах) по имени диалекта
+REPLICA_LAG_QUERIES = {
+    "postgresql": text(
+        "SELECT CASE "
+        "WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+        "ELSE COALESCE(EXTRACT(EPOCH FROM (now() - pg_last_xact_replay_timestamp())), 0) END"
+    ),
+}
+
+
+class ReplicaState:
+    """
+    Состояние одной реплики: движок, метрики пула и результат последней проверки здоровья.
+    """
+
+    __slots__ = ("name", "engine", "metrics", "healthy", "lag")
+
+    def __init__(self, name: str, engine: Engine, metrics: PoolMetrics) -> None:
+        """
+        Инициализация ReplicaState.
+
+        :param name: Имя реплики для логов (URI без пароля).
+        :param engine: Движок SQLAlchemy реплики.
+        :param metrics: Метрики пула соединений реплики.
+        """
+        self.name = name
+        self.engine = engine
+        self.metrics = metrics
+        self.healthy = True
+        self.lag = 0.0
+
+
+class ReplicaRouter:
+    """
+    Маршрутизатор чтений по репликам базы данных.
+
+    Выбирает наименее загруженную (по числу выданных соединений пула) здоровую реплику.
+    Здоровье и отставание реплик проверяются не чаще одного раза в `health_interval` секунд
+    прямо на пути запроса; реплика, недоступная или отстающая больше `max_lag` секунд,
+    исключается из выбора до следующей успешной проверки.
+    """
+
+    __slots__ = ("replicas", "max_lag", "health_interval", "_last_check", "_check_lock")
+
+    def __init__(self, max_lag: float = 5.0, health_interval: float = 10.0) -> None:
+        """
+        Инициализация ReplicaRouter.
+
+        :param max_lag: Максимально допустимое отставание реплики в секундах.
+        :param health_interval: Интервал между проверками здоровья реплик в секундах.
+        """
+        self.replicas: List[ReplicaState] = []
+        self.max_lag = max_lag
+        self.health_interval = health_interval
+        self._last_check = 0.0
+        self._check_lock = threading.Lock()
+
+    def add_replica(self, engine: Engine, metrics: PoolMetrics) -> ReplicaState:
+        """
+        Регистрирует реплику.
+
+        :param engine: Движок SQLAlchemy реплики.
+        :param metrics: Метрики пула соединений реплики.
+        :return: Состояние зарегистрированной реплики.
+        """
+        replica = ReplicaState(engine.url.render_as_string(hide_password=True), engine, metrics)
+        self.replicas.append(replica)
+        return replica
+
+    def choose(self) -> Optional[ReplicaState]:
+        """
+        Выбирает реплику для чтения.
+
+        :return: Наименее загруженная здоровая реплика или None, если таких нет.
+        """
+        if not self.replicas:
+            return None
+        if time.monotonic() - self._last_check >= self.health_interval:
+            self.check_health()
+        candidates = [replica for replica in self.replicas if replica.healthy]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda replica: (replica.metrics.checked_out, replica.lag))
+
+    def check_health(self) -> None:
+        """
+        Проверяет доступность и отставание всех реплик.
+
+        Если проверку уже выполняет другой поток, метод сразу возвращает управление.
+        """
+        if not self._check_lock.acquire(blocking=False):
+            return
+        try:
+            for replica in self.replicas:
+                self._check_replica(replica)
+            self._last_check = time.monotonic()
+        finally:
+            self._check_lock.release()
+
+    def _check_replica(self, replica: ReplicaState) -> None:
+        """
+        Проверяет одну реплику и обновляет её состояние.
+
+        :param replica: Проверяемая реплика.
+        """
+        lag_query = REPLICA_LAG_QUERIES.get(replica.engine.dialect.name)
+        try:
+            with replica.engine.connect() as connection:
+                lag = float(connection.execute(lag_query).scalar() or 0) if lag_query is not None else 0.0
+        except Exception as e:
+            if replica.healthy:
+                logger.error(f"Реплика {replica.name} недоступна и исключена из чтения: {e}")
+            replica.healthy = False
+            return
+
+        replica.lag = lag
+        healthy = lag <= self.max_lag
+        if healthy != replica.healthy:
+            if healthy:
+                logger.info(f"Реплика {replica.name} снова используется для чтения (отставание {lag:.2f} сек)")
+            else:
+                logger.warning(f"Реплика {replica.name} исключена из чтения: отставание {lag:.2f} сек")
+        replica.healthy = healthy
+
+    def mark_failed(self, replica: ReplicaState, error: Exception) -> None:
+        """
+        Исключает реплику из выбора до следующей проверки здоровья.
+
+        :param replica: Реплика, на которой произошла ошибка соединения.
+        :param error: Возникшая ошибка.
+        """
+        logger.error(f"Ошибка соединения с репликой {replica.name}, чтение переключено на основную БД: {error}")
+        replica.healthy = False
+
+    def dispose(self) -> None:
+        """
+        Закрывает пулы соединений всех реплик.
+        """
+        for replica in self.replicas:
+            replica.engine.dispose()
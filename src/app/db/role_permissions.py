@@ -0,0 +1,252 @@
+import logging
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from flask import Flask
+
+from src.app.db.circuit_breaker import DatabaseUnavailableError
+from src.app.db.db_helper import DBHelperSQL
+from src.app.db.query_cache import QueryCache
+
+logger = logging.getLogger("app_db_logger")
+
+
+class PermissionSnapshot:
+    """
+    Права ролей в виде битовых масок: каждому праву соответствует бит, каждой роли — маска её прав.
+
+    Набор прав проверяется одной операцией над масками, а маски наборов, проверяемых в маршрутах,
+    вычисляются один раз и запоминаются. Снимок не изменяется после построения (кроме кэша масок),
+    поэтому потоки читают его без блокировок.
+    """
+
+    __slots__ = ("bits", "roles", "generation", "loaded_at", "_masks")
+
+    def __init__(self, bits: Dict[str, int], roles: Dict[str, int], generation: int, loaded_at: float) -> None:
+        """
+        Инициализация PermissionSnapshot.
+
+        :param bits: Бит каждого права.
+        :param roles: Маска прав каждой роли.
+        :param generation: Поколение тега `roles`, прочитанное до загрузки прав.
+        :param loaded_at: Время загрузки (time.monotonic).
+        """
+        self.bits = bits
+        self.roles = roles
+        self.generation = generation
+        self.loaded_at = loaded_at
+        # Маска набора прав и признак того, что все права набора известны
+        self._masks: Dict[Tuple[str, ...], Tuple[int, bool]] = {}
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[str, Optional[str]]], generation: int) -> "PermissionSnapshot":
+        """
+        Строит снимок по парам (право, роль).
+
+        :param rows: Пары права и роли, которой оно выдано (None — право не выдано ни одной роли).
+        :param generation: Поколение тега `roles`, прочитанное до загрузки прав.
+        :return: Снимок прав.
+        """
+        bits: Dict[str, int] = {}
+        roles: Dict[str, int] = {}
+        for permission_name, role_name in rows:
+            bit = bits.setdefault(permission_name, 1 << len(bits))
+            if role_name is not None:
+                roles[role_name] = roles.get(role_name, 0) | bit
+        return cls(bits, roles, generation, time.monotonic())
+
+    def mask(self, permissions: Tuple[str, ...]) -> Tuple[int, bool]:
+        """
+        Возвращает маску набора прав.
+
+        :param permissions: Имена прав.
+        :return: Маска известных прав набора и признак того, что известны все права набора.
+        """
+        cached = self._masks.get(permissions)
+        if cached is None:
+            mask = 0
+            for name in permissions:
+                mask |= self.bits.get(name, 0)
+            cached = self._masks[permissions] = (mask, all(name in self.bits for name in permissions))
+        return cached
+
+
+class RolePermissionIndex:
+    """
+    Права ролей в памяти процесса для проверки прав без обращения к БД.
+
+    Права всех ролей загружаются одним запросом (`list_role_permissions`) в `PermissionSnapshot`:
+    проверка набора прав роли — поиск маски роли в словаре и одна побитовая операция.
+    Запрос не помечен как чтение и выполняется на основной БД: реплика может отставать от версии тега.
+
+    Актуальность определяется тегом кэша запросов `roles`, который инвалидируют запросы,
+    изменяющие права ролей:
+    - после инвалидации в этом или другом процессе (поколение тега в `QueryCache`) права перезагружаются
+      при следующей проверке, до ответа на неё, поэтому отзыв права действует сразу;
+    - права старше `AUTHORIZATION_MAX_AGE` перезагружаются, чтобы учесть изменения в обход каталога запросов.
+
+    Если перезагрузка не удалась, проверки используют прежние права до следующей попытки.
+    Пока права не загружены ни разу, все проверки завершаются отказом.
+    """
+
+    # Тег кэша запросов, инвалидируемый при изменении прав ролей
+    TAG = "roles"
+    # Пауза перед повторной загрузкой после ошибки (в секундах)
+    RETRY_INTERVAL = 5.0
+
+    __slots__ = ("db_helper", "query_cache", "max_age", "_snapshot", "_retry_at", "_stats", "_lock", "_refresh_lock")
+
+    def __init__(self, db_helper: DBHelperSQL, query_cache: Optional[QueryCache] = None, max_age: int = 300) -> None:
+        """
+        Инициализация RolePermissionIndex.
+
+        :param db_helper: DBHelperSQL для чтения прав ролей.
+        :param query_cache: Кэш запросов: поколения тега `roles`.
+        :param max_age: Максимальный возраст загруженных прав (в секундах).
+        """
+        self.db_helper = db_helper
+        self.query_cache = query_cache
+        self.max_age = max_age
+        self._snapshot: Optional[PermissionSnapshot] = None
+        self._retry_at = 0.0
+        self._stats: Dict[str, int] = dict.fromkeys(("allowed", "denied", "loads", "errors"), 0)
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Настраивает индекс из конфигурации приложения и загружает права ролей.
+
+        Ошибка загрузки не останавливает запуск: права загружаются повторно при первой проверке.
+
+        :param app: Flask-приложение.
+        """
+        self.max_age = app.config.get("AUTHORIZATION_MAX_AGE", self.max_age)
+        with app.app_context():
+            self.refresh()
+
+    def has_all(self, role_name: Optional[str], permissions: Iterable[str]) -> bool:
+        """
+        Проверяет, выданы ли роли все права набора.
+
+        :param role_name: Имя роли.
+        :param permissions: Имена прав.
+        :return: True, если роли выданы все права; False, если хотя бы одно не выдано или права не загружены.
+        """
+        snapshot = self.__current()
+        if snapshot is None:
+            return self.__count(False)
+        mask, complete = snapshot.mask(tuple(permissions))
+        return self.__count(complete and snapshot.roles.get(role_name or "", 0) & mask == mask)
+
+    def has_any(self, role_name: Optional[str], permissions: Iterable[str]) -> bool:
+        """
+        Проверяет, выдано ли роли хотя бы одно право набора.
+
+        :param role_name: Имя роли.
+        :param permissions: Имена прав.
+        :return: True, если роли выдано хотя бы одно право; False, если ни одного или права не загружены.
+        """
+        snapshot = self.__current()
+        if snapshot is None:
+            return self.__count(False)
+        mask, _ = snapshot.mask(tuple(permissions))
+        return self.__count(snapshot.roles.get(role_name or "", 0) & mask != 0)
+
+    def refresh(self) -> bool:
+        """
+        Загружает права ролей из БД.
+
+        :return: True, если права загружены.
+        """
+        generation = self.__tag_generation()
+        try:
+            rows = self.db_helper.execute_query("list_role_permissions", shape="tuple")
+        except DatabaseUnavailableError as e:
+            logger.warning(f"Права ролей не загружены, БД недоступна: {e}")
+            rows = []
+        # Ошибка запроса подавляется в DBHelperSQL и возвращает пустой список, поэтому пустой результат
+        # считается ошибкой: иначе сбой запроса заменил бы права всех ролей пустыми
+        if not rows:
+            self._retry_at = time.monotonic() + self.RETRY_INTERVAL
+            self.__count_event("errors")
+            logger.error("Права ролей не загружены, до следующей попытки используются прежние права")
+            return False
+        snapshot = PermissionSnapshot.from_rows(rows, generation)
+        self._snapshot = snapshot
+        self._retry_at = 0.0
+        self.__count_event("loads")
+        logger.info(f"Права ролей загружены: ролей {len(snapshot.roles)}, прав {len(snapshot.bits)}")
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Возвращает счётчики проверок.
+
+        :return: Разрешённые и отклонённые проверки, загрузки прав и ошибки загрузки.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def after_fork(self) -> None:
+        """
+        Сбрасывает блокировки в дочернем процессе после fork.
+
+        Права, загруженные до fork, остаются в памяти воркера.
+        """
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def __current(self) -> Optional[PermissionSnapshot]:
+        """
+        Возвращает актуальные права ролей, перезагружая их после изменения тега `roles` или по возрасту.
+
+        Перезагрузку выполняет один поток; остальные потоки ждут её завершения и используют её результат.
+
+        :return: Права ролей или None, если они не загружены.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and not self.__stale(snapshot):
+            return snapshot
+        with self._refresh_lock:
+            snapshot = self._snapshot
+            if (snapshot is None or self.__stale(snapshot)) and time.monotonic() >= self._retry_at:
+                self.refresh()
+            return self._snapshot
+
+    def __stale(self, snapshot: PermissionSnapshot) -> bool:
+        """
+        Проверяет, устарели ли права.
+
+        :param snapshot: Права ролей.
+        :return: True, если тег `roles` изменился после загрузки или истёк максимальный возраст.
+        """
+        return snapshot.generation != self.__tag_generation() or time.monotonic() - snapshot.loaded_at > self.max_age
+
+    def __tag_generation(self) -> int:
+        """
+        Возвращает поколение тега `roles` в текущем процессе.
+
+        :return: Поколение тега (0 без кэша запросов).
+        """
+        return self.query_cache.generation(self.TAG) if self.query_cache is not None else 0
+
+    def __count(self, allowed: bool) -> bool:
+        """
+        Учитывает результат проверки.
+
+        :param allowed: Результат проверки.
+        :return: Результат проверки.
+        """
+        self.__count_event("allowed" if allowed else "denied")
+        return allowed
+
+    def __count_event(self, name: str) -> None:
+        """
+        Увеличивает счётчик.
+
+        :param name: Имя счётчика.
+        """
+        with self._lock:
+            self._stats[name] += 1
@@ -0,0 +1,250 @@
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from flask import Flask
+from sqlalchemy.sql.elements import TextClause
+
+from .db_core import DatabaseCore
+from .query_manager import QueryDefinition, QueryManager
+
+logger = logging.getLogger("app_db_profiler_logger")
+
+# Форма параметров запроса: пары (имя параметра, имя типа значения)
+ParamShape = Tuple[Tuple[str, str], ...]
+
+
+class SlowQueryPlan:
+    """
+    План выполнения медленного запроса, сохранённый в кольцевом буфере `SlowQueryLog`.
+    """
+
+    __slots__ = ("query_name", "param_shape", "elapsed", "plan", "captured_at")
+
+    def __init__(self, query_name: str, param_shape: ParamShape, elapsed: float, plan: str) -> None:
+        """
+        Инициализация SlowQueryPlan.
+
+        :param query_name: Имя запроса.
+        :param param_shape: Форма параметров запроса.
+        :param elapsed: Время выполнения запроса (в секундах).
+        :param plan: Текст плана выполнения.
+        """
+        self.query_name = query_name
+        self.param_shape = param_shape
+        self.elapsed = elapsed
+        self.plan = plan
+        self.captured_at = time.time()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Представление плана в виде словаря.
+
+        :return: Словарь с полями плана.
+        """
+        return {
+            "query_name": self.query_name,
+            "param_shape": dict(self.param_shape),
+            "elapsed": self.elapsed,
+            "plan": self.plan,
+            "captured_at": self.captured_at,
+        }
+
+
+class SlowQueryLog:
+    """
+    Захват планов выполнения медленных SQL-запросов.
+
+    Для запросов, выполнявшихся дольше `threshold`, в фоновом потоке выполняется `EXPLAIN`
+    того же запроса с теми же параметрами на основной БД:
+    - PostgreSQL: `EXPLAIN (ANALYZE, BUFFERS)` для запросов на чтение и `EXPLAIN` для запросов
+      на запись (ANALYZE выполнил бы запись повторно);
+    - SQLite: `EXPLAIN QUERY PLAN`;
+    - остальные диалекты: `EXPLAIN`.
+
+    План захватывается не чаще одного раза в `explain_interval` секунд для пары
+    (имя запроса, форма параметров), пишется в лог `app_db_profiler_logger` с полями
+    `query_name`, `param_shape`, `elapsed` и `query_plan` в `extra` и сохраняется
+    в кольцевом буфере последних `max_plans` планов.
+    """
+
+    __slots__ = (
+        "db_core",
+        "query_manager",
+        "threshold",
+        "explain_interval",
+        "_plans",
+        "_last_capture",
+        "_lock",
+        "_executor",
+    )
+
+    # Префиксы EXPLAIN по имени диалекта: (для чтения, для записи)
+    EXPLAIN_PREFIXES = {
+        "postgresql": ("EXPLAIN (ANALYZE, BUFFERS) ", "EXPLAIN "),
+        "sqlite": ("EXPLAIN QUERY PLAN ", "EXPLAIN QUERY PLAN "),
+    }
+    DEFAULT_EXPLAIN_PREFIXES = ("EXPLAIN ", "EXPLAIN ")
+
+    def __init__(
+        self,
+        db_core: Optional[DatabaseCore] = None,
+        query_manager: Optional[QueryManager] = None,
+        threshold: float = 1.0,
+        explain_interval: float = 300.0,
+        max_plans: int = 100,
+    ) -> None:
+        """
+        Инициализация SlowQueryLog.
+
+        :param db_core: DatabaseCore, на основной БД которого выполняется EXPLAIN.
+        :param query_manager: Каталог SQL-запросов.
+        :param threshold: Порог времени выполнения запроса (в секундах), после которого он считается медленным.
+        :param explain_interval: Минимальный интервал между захватами плана одного запроса (в секундах).
+        :param max_plans: Размер кольцевого буфера планов.
+        """
+        self.db_core = db_core
+        self.query_manager = query_manager
+        self.threshold = threshold
+        self.explain_interval = explain_interval
+        self._plans: Deque[SlowQueryPlan] = deque(maxlen=max_plans)
+        self._last_capture: Dict[Tuple[str, ParamShape], float] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Настраивает захват планов из конфигурации приложения.
+
+        :param app: Flask-приложение.
+        """
+        config = app.config
+        self.threshold = config.get("SQLALCHEMY_SLOW_QUERY_THRESHOLD", self.threshold)
+        self.explain_interval = config.get("SQLALCHEMY_SLOW_QUERY_EXPLAIN_INTERVAL", self.explain_interval)
+        max_plans = config.get("SQLALCHEMY_SLOW_QUERY_MAX_PLANS", self._plans.maxlen)
+        with self._lock:
+            self._plans = deque(self._plans, maxlen=max_plans)
+
+    @staticmethod
+    def param_shape(params: Optional[Dict[str, Any]]) -> ParamShape:
+        """
+        Вычисляет форму параметров запроса: имена параметров и типы их значений.
+
+        :param params: Параметры SQL-запроса.
+        :return: Отсортированные пары (имя параметра, имя типа значения).
+        """
+        return tuple(sorted((key, type(value).__name__) for key, value in (params or {}).items()))
+
+    def capture(
+        self, query_name: str, params: Optional[Dict[str, Any]], elapsed: float
+    ) -> "Optional[Future[Optional[SlowQueryPlan]]]":
+        """
+        Запускает захват плана медленного запроса, если он не ограничен по частоте.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Параметры SQL-запроса.
+        :param elapsed: Время выполнения запроса (в секундах).
+        :return: Future захвата плана или None, если захват не запускался.
+        """
+        if self.db_core is None or self.query_manager is None or elapsed < self.threshold:
+            return None
+        shape = self.param_shape(params)
+        now = time.monotonic()
+        with self._lock:
+            last = self._last_capture.get((query_name, shape))
+            if last is not None and now - last < self.explain_interval:
+                return None
+            self._last_capture[(query_name, shape)] = now
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain")
+            executor = self._executor
+        return executor.submit(self.__capture, query_name, dict(params or {}), shape, elapsed)
+
+    def explain(self, query_name: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Выполняет EXPLAIN запроса на основной БД и возвращает план в виде текста.
+
+        Транзакция EXPLAIN всегда откатывается.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Параметры SQL-запроса.
+        :return: Текст плана выполнения.
+        :raises RuntimeError: Если подключение к БД или каталог запросов не инициализированы.
+        """
+        engine = self.db_core.engine if self.db_core is not None else None
+        if engine is None or self.query_manager is None:
+            raise RuntimeError("SlowQueryLog не инициализирован: нет подключения к БД или каталога запросов")
+        definition = self.query_manager.get_definition(query_name)
+        with engine.connect() as connection:
+            try:
+                rows = connection.execute(self.__explain_statement(definition, engine.dialect.name), params or {})
+                if engine.dialect.name == "sqlite":
+                    return "\n".join(str(row[-1]) for row in rows)
+                return "\n".join(str(row[0]) if len(row) == 1 else " | ".join(map(str, row)) for row in rows)
+            finally:
+                connection.rollback()
+
+    def get_plans(self) -> List[Dict[str, Any]]:
+        """
+        Возвращает сохранённые планы медленных запросов, начиная с самого старого.
+
+        :return: Список планов в виде словарей.
+        """
+        with self._lock:
+            return [plan.as_dict() for plan in self._plans]
+
+    def after_fork(self) -> None:
+        """
+        Восстанавливает состояние в дочернем процессе после fork: поток захвата планов
+        родителя в дочернем процессе не существует и будет создан заново при первом захвате.
+        """
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def shutdown(self) -> None:
+        """
+        Останавливает фоновый поток захвата планов, дожидаясь текущих задач.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __explain_statement(self, definition: QueryDefinition, dialect_name: str) -> TextClause:
+        """
+        Формирует выражение EXPLAIN для запроса с теми же типами параметров, что и в каталоге.
+
+        :param definition: Описание запроса из QueryManager.
+        :param dialect_name: Имя диалекта движка.
+        :return: Выражение EXPLAIN.
+        """
+        read_prefix, write_prefix = self.EXPLAIN_PREFIXES.get(dialect_name, self.DEFAULT_EXPLAIN_PREFIXES)
+        return definition.explain_statement(read_prefix if definition.mode == "read" else write_prefix)
+
+    def __capture(
+        self, query_name: str, params: Dict[str, Any], shape: ParamShape, elapsed: float
+    ) -> Optional[SlowQueryPlan]:
+        """
+        Захватывает план запроса, сохраняет его в буфере и пишет в лог.
+
+        :param query_name: Имя запроса.
+        :param params: Параметры SQL-запроса.
+        :param shape: Форма параметров запроса.
+        :param elapsed: Время выполнения запроса (в секундах).
+        :return: Сохранённый план или None, если EXPLAIN завершился ошибкой.
+        """
+        try:
+            plan = SlowQueryPlan(query_name, shape, elapsed, self.explain(query_name, params))
+        except Exception as e:
+            logger.warning(f"Не удалось получить план медленного запроса `{query_name}`: {e}")
+            return None
+        with self._lock:
+            self._plans.append(plan)
+        logger.warning(
+            f"SQL Query `{query_name}` plan captured after {elapsed:.4f} sec:\n{plan.plan}",
+            extra={"query_name": query_name, "param_shape": dict(shape), "elapsed": elapsed, "query_plan": plan.plan},
+        )
+        return plan
@@ -0,0 +1,155 @@
+import logging
+from contextlib import contextmanager
+from typing import (TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator,
+                    List, Optional, Set, cast)
+
+from sqlalchemy.orm import Session
+
+if TYPE_CHECKING:
+    from .db_helper import DBHelperSQL
+
+logger = logging.getLogger("app_db_logger")
+
+
+class UnitOfWork:
+    """
+    Единица работы: несколько именованных запросов в одной сессии и транзакции.
+
+    Создаётся методом `DBHelperSQL.transaction()` и привязывается к контексту приложения Flask
+    (вне его — к текущему потоку), поэтому методы `DBHelperSQL.execute_*`, вызванные
+    репозиториями внутри блока `with`, выполняются в той же транзакции.
+
+    В отличие от `DBHelperSQL.execute_*`, методы единицы работы не подавляют ошибки: ошибка
+    запроса пробрасывается и откатывает транзакцию. Ошибка, подавленная в `DBHelperSQL.execute_*`
+    внутри единицы работы, также откатывает транзакцию при выходе из блока, если она
+    не локализована точкой сохранения (`savepoint`).
+
+    Основные методы:
+    - query / first / one_or_none / scalar: Выполнение SELECT-запросов.
+    - update: Выполнение INSERT, UPDATE или DELETE-запроса.
+    - many: Пакетное выполнение одного запроса для множества наборов параметров.
+    - savepoint: Точка сохранения для частичного отката.
+    """
+
+    __slots__ = ("helper", "session", "read_only", "error", "pending_tags")
+
+    def __init__(self, helper: "DBHelperSQL", session: Session, read_only: bool = False) -> None:
+        """
+        Инициализация UnitOfWork.
+
+        :param helper: DBHelperSQL, выполняющий запросы.
+        :param session: SQLAlchemy-сессия транзакции.
+        :param read_only: Транзакция выполняет только чтение.
+        """
+        self.helper = helper
+        self.session = session
+        self.read_only = read_only
+        # Первая ошибка запроса, не локализованная точкой сохранения
+        self.error: Optional[BaseException] = None
+        # Теги кэша, инвалидируемые после фиксации транзакции
+        self.pending_tags: Set[str] = set()
+
+    def query(self, query_name: str, params: Optional[Dict[str, Any]] = None, shape: str = "dict") -> List[Any]:
+        """
+        Выполнить SELECT-запрос по имени.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Параметры для SQL-запроса (опционально).
+        :param shape: Форма строк результата: `dict`, `tuple` или `record`.
+        :return: Список строк результата.
+        """
+        return cast(List[Any], self.__run(self.helper.execute_query, query_name, params, shape=shape))
+
+    def first(self, query_name: str, params: Optional[Dict[str, Any]] = None, shape: str = "dict") -> Optional[Any]:
+        """
+        Выполнить SELECT-запрос по имени и получить первую строку результата.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Параметры для SQL-запроса (опционально).
+        :param shape: Форма строки результата: `dict`, `tuple` или `record`.
+        :return: Первая строка результата или None, если результат пуст.
+        """
+        return self.__run(self.helper.execute_first, query_name, params, shape=shape)
+
+    def one_or_none(
+        self, query_name: str, params: Optional[Dict[str, Any]] = None, shape: str = "dict"
+    ) -> Optional[Any]:
+        """
+        Выполнить SELECT-запрос по имени, ожидая не более одной строки результата.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Параметры для SQL-запроса (опционально).
+        :param shape: Форма строки результата: `dict`, `tuple` или `record`.
+        :return: Единственная строка результата или None.
+        :raises MultipleResultsFound: Если запрос вернул больше одной строки.
+        """
+        return self.__run(self.helper.execute_one_or_none, query_name, params, shape=shape)
+
+    def scalar(self, query_name: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Выполнить SELECT-запрос по имени и получить значение первого столбца первой строки.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Параметры для SQL-запроса (опционально).
+        :return: Значение или None, если результат пуст.
+        """
+        return self.__run(self.helper.execute_scalar, query_name, params)
+
+    def update(self, query_name: str, params: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Выполнить INSERT, UPDATE или DELETE-запрос по имени.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Параметры для SQL-запроса (опционально).
+        :return: True, если запрос выполнен.
+        """
+        return cast(bool, self.__run(self.helper.execute_update, query_name, params))
+
+    def many(self, query_name: str, params: Iterable[Dict[str, Any]], chunk_size: int = 1000) -> List[int]:
+        """
+        Выполнить запрос по имени для множества наборов параметров.
+
+        :param query_name: Имя запроса, зарегистрированного в QueryManager.
+        :param params: Итерируемый набор словарей параметров.
+        :param chunk_size: Количество наборов параметров в одной порции.
+        :return: Количество затронутых строк по каждой порции (-1, если драйвер его не сообщает).
+        """
+        return cast(List[int], self.__run(self.helper.execute_many, query_name, params, chunk_size=chunk_size))
+
+    @contextmanager
+    def savepoint(self) -> Iterator[None]:
+        """
+        Точка сохранения (`SAVEPOINT`) внутри транзакции единицы работы.
+
+        Если в блоке возникла ошибка запроса (проброшенная или подавленная в `DBHelperSQL.execute_*`),
+        изменения блока откатываются до точки сохранения, а остальная транзакция продолжается.
+        Проброшенное исключение выбрасывается дальше.
+        """
+        nested = self.session.begin_nested()
+        error_before = self.error
+        try:
+            yield
+        except Exception:
+            nested.rollback()
+            self.error = error_before
+            logger.debug("Откат до точки сохранения после ошибки")
+            raise
+        if self.error is not error_before:
+            nested.rollback()
+            logger.debug(f"Откат до точки сохранения после ошибки запроса: {self.error}")
+            self.error = error_before
+        else:
+            nested.commit()
+
+    def __run(self, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Выполняет метод DBHelperSQL и пробрасывает ошибку, которую он залогировал и подавил.
+
+        :param method: Метод `DBHelperSQL.execute_*`.
+        :return: Результат метода.
+        """
+        error_before = self.error
+        result = method(*args, **kwargs)
+        if self.error is not error_before:
+            raise self.error
+        return result
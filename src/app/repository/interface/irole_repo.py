@@ -0,0 +1,33 @@
+from typing import Iterable, Optional, Protocol
+
+
+class IRoleRepository(Protocol):
+    """
+    Интерфейс для репозитория ролей.
+
+    Этот интерфейс определяет методы для проверки прав, выданных ролям.
+
+    Методы:
+    - has_all(role_name: str, permissions: Iterable[str]) -> bool: Проверяет, выданы ли роли все права набора.
+    - has_any(role_name: str, permissions: Iterable[str]) -> bool: Проверяет, выдано ли роли хотя бы одно право.
+    """
+
+    def has_all(self, role_name: Optional[str], permissions: Iterable[str]) -> bool:
+        """
+        Проверяет, выданы ли роли все права набора.
+
+        :param role_name: Имя роли.
+        :param permissions: Имена прав.
+        :return: True, если роли выданы все права.
+        """
+        pass
+
+    def has_any(self, role_name: Optional[str], permissions: Iterable[str]) -> bool:
+        """
+        Проверяет, выдано ли роли хотя бы одно право набора.
+
+        :param role_name: Имя роли.
+        :param permissions: Имена прав.
+        :return: True, если роли выдано хотя бы одно право.
+        """
+        pass
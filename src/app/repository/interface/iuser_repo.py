@@ -10,6 +10,8 @@ class IUserRepository(Protocol):
 
     Методы:
     - get_user_by_login(login: str) -> Dict[str, str]: Метод для получения данных пользователя по его логину.
+    - update_password_hash(login: str, password_hash: str, old_password_hash: str) -> bool: Метод для замены
+      хеша пароля пользователя.
     """
 
     def get_user_by_login(self, login: str) -> Optional[Dict[str, str]]:
@@ -20,3 +22,14 @@ class IUserRepository(Protocol):
         :return: Словарь, содержащий данные пользователя, такие как имя, роль и другие атрибуты.
         """
         pass
+
+    def update_password_hash(self, login: str, password_hash: str, old_password_hash: str) -> bool:
+        """
+        Заменяет хеш пароля пользователя, если он не изменился с момента чтения.
+
+        :param login: Логин пользователя.
+        :param password_hash: Новый хеш пароля.
+        :param old_password_hash: Хеш пароля, прочитанный до пересчёта.
+        :return: True, если запрос выполнен.
+        """
+        pass
@@ -0,0 +1,40 @@
+from typing import Iterable, Optional
+
+from src.app.db.role_permissions import RolePermissionIndex
+from src.app.repository.interface.irole_repo import IRoleRepository
+
+
+class RoleRepository(IRoleRepository):
+    """
+    Реализация интерфейса IRoleRepository: права ролей проверяются по индексу в памяти без обращения к БД.
+
+    :param role_permissions: Индекс прав ролей.
+    """
+
+    def __init__(self, role_permissions: RolePermissionIndex) -> None:
+        """
+        Инициализирует репозиторий ролей.
+
+        :param role_permissions: Индекс прав ролей, загруженный из БД.
+        """
+        self.role_permissions = role_permissions
+
+    def has_all(self, role_name: Optional[str], permissions: Iterable[str]) -> bool:
+        """
+        Проверяет, выданы ли роли все права набора.
+
+        :param role_name: Имя роли.
+        :param permissions: Имена прав.
+        :return: True, если роли выданы все права; False, если хотя бы одно не выдано или права не загружены.
+        """
+        return self.role_permissions.has_all(role_name, permissions)
+
+    def has_any(self, role_name: Optional[str], permissions: Iterable[str]) -> bool:
+        """
+        Проверяет, выдано ли роли хотя бы одно право набора.
+
+        :param role_name: Имя роли.
+        :param permissions: Имена прав.
+        :return: True, если роли выдано хотя бы одно право; False, если ни одного или права не загружены.
+        """
+        return self.role_permissions.has_any(role_name, permissions)
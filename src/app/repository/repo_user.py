@@ -1,6 +1,7 @@
-from typing import Dict, Optional
+from typing import Dict, Optional, cast
 
 from src.app.db.db_helper import DBHelperSQL
+from src.app.db.login_filter import LoginFilter
 from src.app.repository.interface.iuser_repo import IUserRepository
 
 
@@ -9,15 +10,18 @@ class UserRepository(IUserRepository):
     Реализация интерфейса IUserRepository для взаимодействия с таблицей пользователей.
 
     :param db_helper: Экземпляр DBHelperSQL для выполнения SQL-запросов.
+    :param login_filter: Фильтр существующих логинов (опционально).
     """
 
-    def __init__(self, db_helper: DBHelperSQL) -> None:
+    def __init__(self, db_helper: DBHelperSQL, login_filter: Optional[LoginFilter] = None) -> None:
         """
         Инициализирует репозиторий пользователей.
 
         :param db_helper: DBHelperSQL для взаимодействия с базой данных.
+        :param login_filter: Фильтр существующих логинов: несуществующие логины не ищутся в БД.
         """
         self.db_helper = db_helper
+        self.login_filter = login_filter
 
     def get_user_by_login(self, login: str) -> Optional[Dict[str, str]]:
         """
@@ -26,9 +30,31 @@ class UserRepository(IUserRepository):
         :param login: Логин пользователя.
         :return: Словарь с данными пользователя, включая логин, пароль и роль,
                  или None, если пользователь не найден.
+        :raises DatabaseUnavailableError: Если база данных недоступна.
         """
-        # Выполнение SQL-запроса с параметром login.
-        result = self.db_helper.execute_query(query_name="get_user_by_login", params={"login": login})
+        # Логина точно нет среди пользователей: запрос к БД не выполняется
+        if self.login_filter is not None and not self.login_filter.might_contain(login):
+            return None
+        # Выполнение SQL-запроса с параметром login: одна строка без построения списка.
+        return cast(
+            Optional[Dict[str, str]],
+            self.db_helper.execute_one_or_none(query_name="get_user_by_login", params={"login": login}),
+        )
+
+    def update_password_hash(self, login: str, password_hash: str, old_password_hash: str) -> bool:
+        """
+        Заменяет хеш пароля пользователя, если он не изменился с момента чтения.
 
-        # Возврат первой записи, если она найдена, иначе None.
-        return result[0] if result else None
+        :param login: Логин пользователя.
+        :param password_hash: Новый хеш пароля.
+        :param old_password_hash: Хеш пароля, прочитанный до пересчёта.
+        :return: True, если запрос выполнен, False в случае ошибки.
+        :raises DatabaseUnavailableError: Если база данных недоступна.
+        """
+        return cast(
+            bool,
+            self.db_helper.execute_update(
+                query_name="update_user_password_hash",
+                params={"login": login, "password_hash": password_hash, "old_password_hash": old_password_hash},
+            ),
+        )
@@ -2,13 +2,25 @@ import logging
 from typing import Any, Dict
 
 from dependency_injector.wiring import Provide
-from flask import Flask
+from flask import Flask, Response
 from flask_session import Session  # type: ignore
 from flask_smorest import Api, Blueprint  # type: ignore
+from werkzeug.middleware.proxy_fix import ProxyFix
 
 from src.app.core.context_processors import utility_routes
 from src.app.core.di.di_app import AppContainer
+from src.app.core.login_throttle import LoginThrottle
+from src.app.core.password_hasher import PasswordHasher
+from src.app.db.async_db_core import AsyncDatabaseCore
+from src.app.db.boot_lock import BootLock
+from src.app.db.catalog_validator import CatalogValidator
 from src.app.db.db_core import DatabaseCore
+from src.app.db.login_filter import LoginFilter
+from src.app.db.pagination import CursorCodec
+from src.app.db.query_cache import QueryCache
+from src.app.db.query_manager import QueryManager
+from src.app.db.role_permissions import RolePermissionIndex
+from src.app.db.slow_query_log import SlowQueryLog
 from src.app.utils.logger_decorators import log_routes
 
 logger = logging.getLogger("app_logger")
@@ -24,6 +36,16 @@ def create_app(
     flask_config: Dict[str, Any] = Provide[AppContainer.core.settings_flask].provider(),
     blp: Blueprint = Provide[AppContainer.view.v1_bp].provider(),
     db_core: DatabaseCore = Provide[AppContainer.db.db_core].provider(),
+    query_cache: QueryCache = Provide[AppContainer.db.query_cache].provider(),
+    async_db_core: AsyncDatabaseCore = Provide[AppContainer.db.async_db_core].provider(),
+    slow_query_log: SlowQueryLog = Provide[AppContainer.db.slow_query_log].provider(),
+    catalog_validator: CatalogValidator = Provide[AppContainer.db.catalog_validator].provider(),
+    boot_lock: BootLock = Provide[AppContainer.db.boot_lock].provider(),
+    cursor_codec: CursorCodec = Provide[AppContainer.db.cursor_codec].provider(),
+    login_filter: LoginFilter = Provide[AppContainer.db.login_filter].provider(),
+    role_permissions: RolePermissionIndex = Provide[AppContainer.db.role_permissions].provider(),
+    password_hasher: PasswordHasher = Provide[AppContainer.core.password_hasher].provider(),
+    login_throttle: LoginThrottle = Provide[AppContainer.core.login_throttle].provider(),
 ) -> Flask:
     """
     Создает и настраивает экземпляр Flask приложения.
@@ -36,6 +58,39 @@ def create_app(
     blp : Blueprint
         Blueprint для регистрации маршрутов приложения.
 
+    db_core : DatabaseCore
+        Ядро работы с базой данных.
+
+    query_cache : QueryCache
+        Кэш результатов запросов.
+
+    async_db_core : AsyncDatabaseCore
+        Асинхронное ядро базы данных для async-представлений.
+
+    slow_query_log : SlowQueryLog
+        Захват планов выполнения медленных запросов.
+
+    catalog_validator : CatalogValidator
+        Проверка и прогрев каталога запросов на подключённой базе данных.
+
+    boot_lock : BootLock
+        Выбор процесса, создающего таблицы и начальные данные, среди воркеров и подов.
+
+    cursor_codec : CursorCodec
+        Подпись курсоров постраничного чтения.
+
+    login_filter : LoginFilter
+        Фильтр Блума существующих логинов.
+
+    role_permissions : RolePermissionIndex
+        Права ролей в памяти процесса.
+
+    password_hasher : PasswordHasher
+        Сервис хеширования паролей и команда его калибровки.
+
+    login_throttle : LoginThrottle
+        Ограничение частоты попыток входа по IP-адресу и логину.
+
     Возвращает:
     ----------
     Flask:
@@ -50,14 +105,64 @@ def create_app(
     logger.info("=== Инициализация приложения ===")
     app.config.from_mapping(flask_config)
 
+    # IP-адрес клиента (`request.remote_addr`) из X-Forwarded-For, дописанного доверенными обратными прокси
+    proxy_fix_x_for = app.config.get("PROXY_FIX_X_FOR", 0)
+    if proxy_fix_x_for:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=proxy_fix_x_for)
+
+    # Инициализация сервиса хеширования паролей
+    password_hasher.init_app(app=app)
+    app.extensions["password_hasher"] = password_hasher
+
+    # Ограничение попыток входа до поиска пользователя и проверки пароля
+    login_throttle.init_app(app=app)
+    app.extensions["login_throttle"] = login_throttle
+
     # Инициализация DatabaseCore
     logger.info("=== Инициализация базы данных ===")
     db_core.init_app(app=app)
     app.extensions["db_core"] = db_core
 
-    # Создание таблиц при первом запуске
+    @app.after_request
+    def add_query_catalog_version(response: Response) -> Response:
+        # Версия каталога запросов позволяет убедиться, что все воркеры используют один каталог
+        query_manager = db_core.query_manager
+        if query_manager is not None:
+            response.headers[QueryManager.VERSION_HEADER] = query_manager.catalog_version
+        return response
+
+    async_db_core.init_app(app=app)
+    app.extensions["async_db_core"] = async_db_core
+    slow_query_log.init_app(app=app)
+    app.extensions["slow_query_log"] = slow_query_log
+
+    # Инициализация кэша результатов запросов
+    logger.info("=== Инициализация кэша запросов ===")
+    query_cache.init_app(app=app)
+    app.extensions["query_cache"] = query_cache
+
+    # Ключ подписи курсоров постраничного чтения
+    cursor_codec.init_app(app=app)
+
+    # Создание таблиц при первом запуске: выполняет один процесс, остальные ждут готовности
+    boot_lock.init_app(app=app)
     with app.app_context():
-        db_core.create_tables()
+        boot_lock.run(db_core.create_tables)
+
+    # Проверка каталога запросов на схеме БД: при ошибке процесс не запускается
+    logger.info("=== Проверка каталога запросов ===")
+    catalog_validator.init_app(app=app)
+    app.extensions["catalog_validator"] = catalog_validator
+
+    # Фильтр существующих логинов: загружается из Redis или строится по таблице пользователей
+    logger.info("=== Инициализация фильтра логинов ===")
+    login_filter.init_app(app=app)
+    app.extensions["login_filter"] = login_filter
+
+    # Права ролей: загружаются в память процесса для проверки прав в маршрутах без обращения к БД
+    logger.info("=== Инициализация прав ролей ===")
+    role_permissions.init_app(app=app)
+    app.extensions["role_permissions"] = role_permissions
 
     # Инициализация сессий
     logger.info("=== Инициализация сессий ===")
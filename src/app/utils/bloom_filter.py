@@ -0,0 +1,138 @@
+import hashlib
+import math
+import struct
+from typing import Iterable, Optional, Tuple
+
+
+class BloomFilter:
+    """
+    Фильтр Блума над строками: вероятностное множество без ложноотрицательных ответов.
+
+    `item in bloom` возвращает False, только если строка точно не добавлялась; True означает
+    "возможно добавлялась" с вероятностью ложного срабатывания, заданной при создании.
+    Позиции битов вычисляются двойным хешированием по BLAKE2b, поэтому не зависят от процесса
+    (в отличие от `hash()`), и фильтр можно сохранить (`to_bytes`) и загрузить в другом процессе.
+    """
+
+    # Заголовок сериализованного фильтра: размер в битах и количество хеш-функций
+    HEADER = struct.Struct(">QI")
+
+    __slots__ = ("size", "hashes", "bits", "count")
+
+    def __init__(self, size: int, hashes: int, bits: Optional[bytearray] = None) -> None:
+        """
+        Инициализация BloomFilter.
+
+        :param size: Размер фильтра в битах.
+        :param hashes: Количество хеш-функций (битов на строку).
+        :param bits: Готовый массив битов (при загрузке сохранённого фильтра).
+        :raises ValueError: Если параметры некорректны или длина массива не соответствует размеру.
+        """
+        if size < 1 or hashes < 1:
+            raise ValueError(f"Некорректные параметры фильтра Блума: size={size}, hashes={hashes}.")
+        if bits is not None and len(bits) != (size + 7) // 8:
+            raise ValueError(f"Длина массива битов {len(bits)} не соответствует размеру фильтра {size}.")
+        self.size = size
+        self.hashes = hashes
+        self.bits = bits if bits is not None else bytearray((size + 7) // 8)
+        self.count = 0  # Количество добавленных строк (не сохраняется в to_bytes)
+
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float) -> "BloomFilter":
+        """
+        Создаёт фильтр оптимального размера для ожидаемого количества строк.
+
+        :param capacity: Ожидаемое количество строк.
+        :param error_rate: Допустимая вероятность ложного срабатывания (0 < error_rate < 1).
+        :return: Пустой фильтр.
+        :raises ValueError: Если параметры некорректны.
+        """
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError(f"Некорректные параметры фильтра Блума: capacity={capacity}, error_rate={error_rate}.")
+        size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        hashes = max(1, round(size / capacity * math.log(2)))
+        return cls(size, hashes)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        """
+        Загружает фильтр, сохранённый `to_bytes`.
+
+        :param data: Сериализованный фильтр.
+        :return: Фильтр.
+        :raises ValueError: Если данные повреждены.
+        """
+        header_size = cls.HEADER.size
+        if len(data) < header_size:
+            raise ValueError("Сериализованный фильтр Блума короче заголовка.")
+        size, hashes = cls.HEADER.unpack_from(data)
+        return cls(size, hashes, bytearray(data[header_size:]))
+
+    def to_bytes(self) -> bytes:
+        """
+        Сериализует фильтр.
+
+        :return: Заголовок и массив битов.
+        """
+        return self.HEADER.pack(self.size, self.hashes) + bytes(self.bits)
+
+    def add(self, item: str) -> None:
+        """
+        Добавляет строку в фильтр.
+
+        :param item: Строка.
+        """
+        self.update((item,))
+
+    def update(self, items: Iterable[str]) -> None:
+        """
+        Добавляет строки в фильтр.
+
+        Вычисление позиций встроено в цикл: при построении фильтра по всей таблице
+        вызов метода на каждую строку заметно дороже самого хеширования.
+
+        :param items: Строки.
+        """
+        bits, size, hashes = self.bits, self.size, self.hashes
+        added = 0
+        for item in items:
+            position, step = self.__seeds(item)
+            for _ in range(hashes):
+                bits[position >> 3] |= 1 << (position & 7)
+                position += step
+                if position >= size:
+                    position -= size
+            added += 1
+        self.count += added
+
+    def __contains__(self, item: str) -> bool:
+        """
+        Проверяет, могла ли строка быть добавлена в фильтр.
+
+        :param item: Строка.
+        :return: False, если строка точно не добавлялась.
+        """
+        bits, size = self.bits, self.size
+        position, step = self.__seeds(item)
+        for _ in range(self.hashes):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+            position += step
+            if position >= size:
+                position -= size
+        return True
+
+    def __seeds(self, item: str) -> Tuple[int, int]:
+        """
+        Вычисляет первую позицию и шаг позиций битов строки: i-я позиция равна `h1 + i * h2 (mod size)`.
+
+        :param item: Строка.
+        :return: Первая позиция и шаг (по модулю размера фильтра).
+        """
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return h1 % self.size, h2 % self.size
+
+    def __repr__(self) -> str:
+        return f"BloomFilter(size={self.size}, hashes={self.hashes}, count={self.count})"
@@ -1,13 +1,26 @@
+import inspect
 import logging
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterator, Optional
 
 from sqlalchemy.exc import (DataError, IntegrityError, OperationalError,
                             ProgrammingError, SQLAlchemyError)
 
+from src.app.db.circuit_breaker import (DatabaseUnavailableError,
+                                        is_unavailable_error)
+
 # Инициализация логера для базы данных
 logger = logging.getLogger("app_db_logger")
 
+# Признак того, что значение при ошибке для handle_db_helper_errors не задано явно
+_NO_DEFAULT = object()
+
+
+class QueryStreamError(RuntimeError):
+    """
+    Потоковое чтение (`execute_query_iter`) прервано ошибкой: выданные строки неполны.
+    """
+
 
 def handle_error_for_database(func: Callable[..., Any]) -> Callable[..., Any]:
     """
@@ -35,7 +48,63 @@ def handle_error_for_database(func: Callable[..., Any]) -> Callable[..., Any]:
     return wrapper
 
 
-def handle_db_helper_errors(func: Callable[..., Any]) -> Callable[..., Any]:
+def _log_db_helper_error(error: Exception, query_name: str, params: Optional[dict]) -> None:
+    """
+    Логирует ошибку выполнения SQL-запроса в `DBHelperSQL` с уровнем, зависящим от типа ошибки.
+
+    :param error: Перехваченное исключение.
+    :param query_name: Имя выполняемого запроса.
+    :param params: Параметры запроса.
+    """
+    if isinstance(error, OperationalError):
+        logger.critical(
+            f"Ошибка подключения к БД при выполнении '{query_name}', params: {params}",
+            exc_info=True,
+        )
+    elif isinstance(error, IntegrityError):
+        logger.warning(
+            f"Ошибка целостности данных в '{query_name}', params: {params}",
+            exc_info=True,
+        )
+    elif isinstance(error, ProgrammingError):
+        logger.error(
+            f"Ошибка SQL-синтаксиса в '{query_name}', params: {params}",
+            exc_info=True,
+        )
+    elif isinstance(error, DataError):
+        logger.warning(f"Ошибка типа данных в '{query_name}', params: {params}", exc_info=True)
+    elif isinstance(error, SQLAlchemyError):
+        logger.error(
+            f"Общая ошибка SQLAlchemy в '{query_name}', params: {params}",
+            exc_info=True,
+        )
+    else:
+        logger.error(
+            f"Непредвиденная ошибка в '{query_name}', params: {params}: {error}",
+            exc_info=True,
+        )
+
+
+def _raise_if_unavailable(error: Exception, query_name: str) -> None:
+    """
+    Пробрасывает ошибку недоступности БД как `DatabaseUnavailableError` вместо подавления.
+
+    Ошибка логируется одной строкой без трассировки: при недоступной БД она повторяется
+    в каждом запросе.
+
+    :param error: Перехваченное исключение.
+    :param query_name: Имя выполняемого запроса.
+    :raises DatabaseUnavailableError: Если ошибка означает недоступность БД.
+    """
+    if isinstance(error, DatabaseUnavailableError):
+        logger.warning(f"Запрос '{query_name}' не выполнен: {error}")
+        raise error
+    if is_unavailable_error(error):
+        logger.error(f"База данных недоступна при выполнении '{query_name}': {error}")
+        raise DatabaseUnavailableError(f"База данных недоступна: {getattr(error, 'orig', error)}") from error
+
+
+def handle_db_helper_errors(func: Optional[Callable[..., Any]] = None, *, default: Any = _NO_DEFAULT) -> Any:
     """
     Декоратор для обработки ошибок в `DBHelperSQL`.
 
@@ -43,11 +112,61 @@ def handle_db_helper_errors(func: Callable[..., Any]) -> Callable[..., Any]:
     в `DBHelperSQL`. Он логирует ошибки и добавляет контекст запроса и параметры.
 
     Если ошибка происходит в методе обновления (`execute_update`), он возвращает `False`,
-    в противном случае — пустой список `[]`.
+    в противном случае — пустой список `[]`. Недоступность БД (нет соединения, разомкнут
+    автомат защиты) не подавляется, а пробрасывается как `DatabaseUnavailableError`, чтобы
+    вызывающий код отличал её от пустого результата ("не найдено"). Значение при ошибке можно задать явно:
+    `@handle_db_helper_errors(default=None)` (для методов, возвращающих одну строку или скаляр).
+    Для методов-генераторов (`execute_query_iter`) ошибка, возникшая во время итерации,
+    логируется и пробрасывается как `QueryStreamError`: значения по умолчанию у потока нет,
+    а молча завершённая итерация выглядела бы как полный результат. Корутины (`AsyncDBHelperSQL`) обрабатываются так же,
+    как обычные методы.
 
     :param func: Функция, выполняющая SQL-запрос.
+    :param default: Значение, возвращаемое при ошибке (по умолчанию определяется по имени метода).
     :return: Обернутая функция с обработкой ошибок.
     """
+    if func is None:
+        return lambda decorated: handle_db_helper_errors(decorated, default=default)
+
+    if inspect.isgeneratorfunction(func):
+
+        @wraps(func)
+        def generator_wrapper(
+            self: Any,
+            query_name: str,
+            params: Optional[dict] = None,
+            *args: Any,
+            **kwargs: Any,
+        ) -> Iterator[Any]:
+            try:
+                yield from func(self, query_name, params, *args, **kwargs)
+            except Exception as e:
+                _raise_if_unavailable(e, query_name)
+                _log_db_helper_error(e, query_name, params)
+                raise QueryStreamError(f"Потоковое чтение '{query_name}' прервано: {e}") from e
+
+        return generator_wrapper
+
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(
+            self: Any,
+            query_name: str,
+            params: Optional[dict] = None,
+            *args: Any,
+            **kwargs: Any,
+        ) -> Any:
+            try:
+                return await func(self, query_name, params, *args, **kwargs)
+            except Exception as e:
+                _raise_if_unavailable(e, query_name)
+                _log_db_helper_error(e, query_name, params)
+                if default is not _NO_DEFAULT:
+                    return default
+                return False if "update" in func.__name__ else []
+
+        return async_wrapper
 
     @wraps(func)
     def wrapper(
@@ -59,44 +178,11 @@ def handle_db_helper_errors(func: Callable[..., Any]) -> Callable[..., Any]:
     ) -> Any:
         try:
             return func(self, query_name, params, *args, **kwargs)
-
-        except OperationalError:
-            logger.critical(
-                f"Ошибка подключения к БД при выполнении '{query_name}', params: {params}",
-                exc_info=True,
-            )
-            return False if "update" in func.__name__ else []
-
-        except IntegrityError:
-            logger.warning(
-                f"Ошибка целостности данных в '{query_name}', params: {params}",
-                exc_info=True,
-            )
-            return False if "update" in func.__name__ else []
-
-        except ProgrammingError:
-            logger.error(
-                f"Ошибка SQL-синтаксиса в '{query_name}', params: {params}",
-                exc_info=True,
-            )
-            return False if "update" in func.__name__ else []
-
-        except DataError:
-            logger.warning(f"Ошибка типа данных в '{query_name}', params: {params}", exc_info=True)
-            return False if "update" in func.__name__ else []
-
-        except SQLAlchemyError:
-            logger.error(
-                f"Общая ошибка SQLAlchemy в '{query_name}', params: {params}",
-                exc_info=True,
-            )
-            return False if "update" in func.__name__ else []
-
         except Exception as e:
-            logger.error(
-                f"Непредвиденная ошибка в '{query_name}', params: {params}: {e}",
-                exc_info=True,
-            )
+            _raise_if_unavailable(e, query_name)
+            _log_db_helper_error(e, query_name, params)
+            if default is not _NO_DEFAULT:
+                return default
             return False if "update" in func.__name__ else []
 
     return wrapper
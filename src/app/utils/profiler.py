@@ -1,11 +1,46 @@
+import inspect
 import logging
 import time
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 
 # Логгер для профилирования SQL-запросов
 logger = logging.getLogger("app_db_profiler_logger")
 
+# Порог времени выполнения (в секундах) для уровня WARNING, если у объекта нет `slow_query_log`
+SLOW_QUERY_THRESHOLD = 1.0
+
+
+def _slow_query_threshold(helper: Any) -> float:
+    """
+    Возвращает порог медленного запроса из `slow_query_log` объекта или значение по умолчанию.
+
+    :param helper: Объект, метод которого профилируется (DBHelperSQL, AsyncDBHelperSQL).
+    :return: Порог времени выполнения (в секундах).
+    """
+    slow_query_log = getattr(helper, "slow_query_log", None)
+    return slow_query_log.threshold if slow_query_log is not None else SLOW_QUERY_THRESHOLD
+
+
+def _capture_slow_query(helper: Any, query_name: str, args: tuple, kwargs: dict, execution_time: float) -> None:
+    """
+    Передаёт медленный запрос в `slow_query_log` объекта для захвата плана выполнения.
+
+    Захват выполняется только для запросов с одним набором параметров (словарь или None).
+
+    :param helper: Объект, метод которого профилируется.
+    :param query_name: Имя запроса.
+    :param args: Позиционные аргументы метода после имени запроса.
+    :param kwargs: Именованные аргументы метода.
+    :param execution_time: Время выполнения запроса (в секундах).
+    """
+    slow_query_log = getattr(helper, "slow_query_log", None)
+    if slow_query_log is None or execution_time < slow_query_log.threshold:
+        return
+    params = kwargs.get("params", args[0] if args else None)
+    if params is None or isinstance(params, dict):
+        slow_query_log.capture(query_name, params, execution_time)
+
 
 def profile_sql_execution(func: Callable[..., Any]) -> Callable[..., Any]:
     """
@@ -13,11 +48,54 @@ def profile_sql_execution(func: Callable[..., Any]) -> Callable[..., Any]:
 
     Логирует время выполнения функции, переданной в качестве аргумента,
     что позволяет отслеживать производительность запросов к базе данных.
+    Для функций-генераторов время измеряется от начала до окончания итерации
+    (в том числе досрочного) и в лог дополнительно пишется число выданных строк.
+    Для корутин (`async def`) время измеряется до завершения ожидания результата.
+
+    Если у объекта есть `slow_query_log` (`SlowQueryLog`), порог уровня WARNING берётся из него,
+    а для медленных запросов запускается захват плана выполнения. Потоковые запросы
+    не захватываются: их время включает обработку строк вызывающим кодом.
 
     :param func: Функция, выполняющая SQL-запрос.
     :return: Обернутая функция, измеряющая и логирующая время выполнения.
     """
 
+    if inspect.isgeneratorfunction(func):
+
+        @wraps(func)
+        def generator_wrapper(self, query_name: str, *args: Any, **kwargs: Any) -> Iterator[Any]:
+            start_time = time.time()
+            rows = 0
+            try:
+                for row in func(self, query_name, *args, **kwargs):
+                    rows += 1
+                    yield row
+            finally:
+                execution_time = time.time() - start_time
+                log_level = logging.WARNING if execution_time > _slow_query_threshold(self) else logging.INFO
+                logger.log(
+                    log_level,
+                    f"SQL Query `{query_name}` streamed {rows} rows in {execution_time:.4f} sec",
+                )
+
+        return generator_wrapper
+
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(self, query_name: str, *args: Any, **kwargs: Any) -> Any:
+            start_time = time.time()
+            result = await func(self, query_name, *args, **kwargs)
+            execution_time = time.time() - start_time
+
+            log_level = logging.WARNING if execution_time > _slow_query_threshold(self) else logging.INFO
+
+            logger.log(log_level, f"SQL Query `{query_name}` executed in {execution_time:.4f} sec")
+            _capture_slow_query(self, query_name, args, kwargs, execution_time)
+            return result
+
+        return async_wrapper
+
     @wraps(func)
     def wrapper(self, query_name: str, *args: Any, **kwargs: Any) -> Any:
         start_time = time.time()
@@ -25,9 +103,10 @@ def profile_sql_execution(func: Callable[..., Any]) -> Callable[..., Any]:
         execution_time = time.time() - start_time
 
         # Определяем уровень логирования
-        log_level = logging.WARNING if execution_time > 1.0 else logging.INFO
+        log_level = logging.WARNING if execution_time > _slow_query_threshold(self) else logging.INFO
 
         logger.log(log_level, f"SQL Query `{query_name}` executed in {execution_time:.4f} sec")
+        _capture_slow_query(self, query_name, args, kwargs, execution_time)
         return result
 
     return wrapper
@@ -1,12 +1,20 @@
 import logging
+import math
 from functools import wraps
 from typing import Any, Callable
 
 from flask import render_template
 from werkzeug.exceptions import Forbidden, InternalServerError, Unauthorized
 
+from src.app.core.login_throttle import RateLimitExceededError
+from src.app.core.password_hasher import PasswordHasherBusyError
+from src.app.db.circuit_breaker import DatabaseUnavailableError
+
 logger = logging.getLogger("app_logger")
 
+# Значение заголовка Retry-After (в секундах), если время восстановления БД неизвестно
+DEFAULT_RETRY_AFTER = 30
+
 
 def handle_error_for_html_views(
     error_template: str = "error.html",
@@ -16,6 +24,11 @@ def handle_error_for_html_views(
 
     - **Forbidden (403)** → Рендерит `error_template`
     - **InternalServerError (500)** → Рендерит `error_template`
+    - **DatabaseUnavailableError (503)** → Рендерит `error_template` с заголовком `Retry-After`
+    - **PasswordHasherBusyError (503)** → Пул проверки паролей перегружен: рендерит `error_template`
+      с заголовком `Retry-After`, не дожидаясь освобождения пула
+    - **RateLimitExceededError (429)** → Превышен лимит попыток входа: рендерит `error_template`
+      с заголовком `Retry-After` до появления следующей попытки
     - **Unauthorized (401)** → Если передана форма, добавляет ошибку в `form.password.errors`
     - **Другие ошибки** → Логируются и рендерится `error_template`
 
@@ -53,6 +66,28 @@ def handle_error_for_html_views(
                     ),
                     403,
                 )
+            except RateLimitExceededError as e:
+                return (
+                    render_template(
+                        error_template,
+                        error="Too Many Requests 429",
+                        message=str("Too many login attempts, try again later"),
+                    ),
+                    429,
+                    {"Retry-After": str(max(1, math.ceil(e.retry_after)))},
+                )
+            except (DatabaseUnavailableError, PasswordHasherBusyError) as e:
+                logger.warning(f"Ошибка 503 в {func.__name__}: {e}")
+                retry_after = max(1, math.ceil(e.retry_after or DEFAULT_RETRY_AFTER))
+                return (
+                    render_template(
+                        error_template,
+                        error="Service Unavailable 503",
+                        message=str("Come back later"),
+                    ),
+                    503,
+                    {"Retry-After": str(retry_after)},
+                )
             except InternalServerError as e:
                 logger.error(
                     f"Ошибка 500 в {func.__name__}: {e}. Args: {args}, Kwargs: {kwargs}",
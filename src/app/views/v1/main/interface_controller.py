@@ -1,4 +1,4 @@
-from typing import Dict, Protocol
+from typing import Dict, Protocol, Sequence
 
 
 class IMainController(Protocol):
@@ -14,6 +14,8 @@ class IMainController(Protocol):
     Выполняет аутентификацию пользователя по логину и паролю.
     - check_activity_session(ip_addr: str) -> bool:
     Проверяет активность сессии по IP-адресу.
+    - has_permissions(permissions: Sequence[str], require_all: bool) -> bool:
+    Проверяет права роли пользователя текущей сессии.
     """
 
     def auth_user(self, data: Dict[str, str]) -> bool | None:
@@ -32,3 +34,13 @@ class IMainController(Protocol):
         :return: True, если сессия активна, False в противном случае.
         """
         pass
+
+    def has_permissions(self, permissions: Sequence[str], require_all: bool = True) -> bool:
+        """
+        Проверяет права роли пользователя текущей сессии.
+
+        :param permissions: Имена прав.
+        :param require_all: Требуются все права набора (True) или хотя бы одно (False).
+        :return: True, если роли пользователя выданы требуемые права.
+        """
+        pass
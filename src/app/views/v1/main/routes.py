@@ -7,7 +7,7 @@ from .forms import LoginForm
 from .handler_error import handle_error_for_html_views
 from .interface_controller import IMainController
 from .schemas import LoginSchema
-from .utils import inject_form
+from .utils import inject_form, require_permission
 
 
 class MainBlueprint(Blueprint):
@@ -57,16 +57,19 @@ class MainBlueprint(Blueprint):
 
         :return: Страница входа или редирект на страницу "about".
         """
-        ip_address = request.headers.get("X-Forwarded-For", request.remote_addr)
+        ip_address = str(request.remote_addr)
         if self.controller.check_activity_session(ip_addr=ip_address):
             return redirect(url_for(self.redirect_url))
         return redirect(url_for("v1.main.login_get"))  # Тип возвращаемого значения: str | flask.wrappers.Response
 
     @handle_error_for_html_views()
+    @require_permission("read")
     def about(self) -> str | Response:
         """
         Обрабатывает запрос на страницу "О приложении".
 
+        Доступна пользователям с правом `read`; без активной сессии выполняется перенаправление на страницу входа.
+
         :return: Страница "about".
         """
         return render_template("about.html")
@@ -87,7 +90,7 @@ class MainBlueprint(Blueprint):
         """
         Обрабатывает POST-запрос на страницу входа.
         """
-        ip_address = str(request.headers.get("X-Forwarded-For", request.remote_addr))
+        ip_address = str(request.remote_addr)
 
         if self.controller.check_activity_session(ip_addr=ip_address):
             return redirect(url_for(self.redirect_url))
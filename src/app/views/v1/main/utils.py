@@ -1,7 +1,9 @@
 from functools import wraps
 from typing import Any, Callable, Type
 
+from flask import redirect, request, url_for
 from flask_wtf import FlaskForm  # type: ignore
+from werkzeug.exceptions import Forbidden
 
 
 def inject_form(
@@ -26,3 +28,37 @@ def inject_form(
         return wrapper
 
     return decorator
+
+
+def require_permission(
+    *permissions: str, require_all: bool = True
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Декоратор для проверки прав роли пользователя перед выполнением представления `MainBlueprint`.
+
+    Права проверяются через `self.controller.has_permissions` по правам ролей в памяти, без обращения к БД.
+    Без активной сессии выполняется перенаправление на страницу входа; если права не выданы,
+    выбрасывается `Forbidden` (обрабатывается `handle_error_for_html_views`, поэтому декоратор
+    размещается под ним).
+
+    :param permissions: Имена требуемых прав.
+    :param require_all: Требуются все права (True) или хотя бы одно (False).
+    :return: Декорированная функция.
+    :raises ValueError: Если не указано ни одного права.
+    """
+    if not permissions:
+        raise ValueError("Не указано ни одного права для проверки.")
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            ip_address = str(request.remote_addr)
+            if not self.controller.check_activity_session(ip_addr=ip_address):
+                return redirect(url_for("v1.main.login_get"))
+            if not self.controller.has_permissions(permissions, require_all=require_all):
+                raise Forbidden(f"Недостаточно прав для {func.__name__}: {', '.join(permissions)}.")
+            return func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
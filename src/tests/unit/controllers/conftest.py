@@ -4,6 +4,9 @@ from unittest.mock import Mock
 from pytest import fixture
 
 from src.app.controllers.main_controller import MainController
+from src.app.core.login_throttle import LoginThrottle
+from src.app.core.password_hasher import PasswordHasher
+from src.app.repository.interface.irole_repo import IRoleRepository
 from src.app.repository.interface.isession_repo import ISessionManager
 from src.app.repository.interface.iuser_repo import IUserRepository
 
@@ -22,6 +25,36 @@ def mock_session_manager() -> ISessionManager:
 
 
 @fixture
-def main_controller(mock_user_repository: IUserRepository, mock_session_manager: ISessionManager) -> MainController:
+def mock_password_hasher() -> PasswordHasher:
+    """Создает мок для PasswordHasher."""
+    return cast(PasswordHasher, Mock(spec=PasswordHasher))
+
+
+@fixture
+def mock_login_throttle() -> LoginThrottle:
+    """Создает мок для LoginThrottle."""
+    return cast(LoginThrottle, Mock(spec=LoginThrottle))
+
+
+@fixture
+def mock_role_repository() -> IRoleRepository:
+    """Создает мок для IRoleRepository."""
+    return cast(IRoleRepository, Mock(spec=IRoleRepository))
+
+
+@fixture
+def main_controller(
+    mock_user_repository: IUserRepository,
+    mock_session_manager: ISessionManager,
+    mock_password_hasher: PasswordHasher,
+    mock_login_throttle: LoginThrottle,
+    mock_role_repository: IRoleRepository,
+) -> MainController:
     """Создает экземпляр MainController с моками."""
-    return MainController(user_repository=mock_user_repository, session_manager=mock_session_manager)
+    return MainController(
+        user_repository=mock_user_repository,
+        session_manager=mock_session_manager,
+        password_hasher=mock_password_hasher,
+        login_throttle=mock_login_throttle,
+        role_repository=mock_role_repository,
+    )
@@ -1,8 +1,10 @@
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import allure
+import pytest
 
 from src.app.controllers.main_controller import MainController
+from src.app.core.login_throttle import RateLimitExceededError
 
 
 @allure.parent_suite("Unit Tests")
@@ -11,13 +13,12 @@ from src.app.controllers.main_controller import MainController
 class TestMainController:
     @allure.title("Тест успешной аутентификации")
     @allure.description("Проверяет, что пользователь с правильными данными может успешно войти")
-    @patch("src.app.controllers.main_controller.check_password_hash")
     def test_auth_user_success(
         self,
-        mock_check_password_hash,
         main_controller: MainController,
         mock_user_repository: Mock,
         mock_session_manager: Mock,
+        mock_password_hasher: Mock,
     ) -> None:
         """
         Тест успешной аутентификации пользователя.
@@ -30,9 +31,9 @@ class TestMainController:
                 "role_name": "admin",
             }
 
-        # Настраиваем мок для check_password_hash
-        with allure.step("Настройка mock для check_password_hash"):
-            mock_check_password_hash.return_value = True
+        # Настраиваем мок для проверки пароля
+        with allure.step("Настройка mock для PasswordHasher.verify"):
+            mock_password_hasher.verify.return_value = True
 
         data = {
             "login": "test_user",
@@ -54,9 +55,12 @@ class TestMainController:
             mock_session_manager.set.assert_any_call(key="role_name", value="admin")
             mock_session_manager.set.assert_any_call(key="ip_addr", value="127.0.0.1")
 
-        # Проверяем вызов check_password_hash
-        with allure.step("Проверка вызова check_password_hash"):
-            mock_check_password_hash.assert_called_once_with("hashed_password", "correct_password")
+        # Проверяем проверку пароля и пересчёт хеша
+        with allure.step("Проверка вызовов PasswordHasher"):
+            mock_password_hasher.verify.assert_called_once_with("hashed_password", "correct_password")
+            mock_password_hasher.schedule_rehash.assert_called_once_with(
+                "test_user", "correct_password", "hashed_password", mock_user_repository.update_password_hash
+            )
 
     @allure.title("Тест неуспешной аутентификации")
     @allure.description("Проверяет, что пользователь с неправильными данными не может войти")
@@ -84,3 +88,51 @@ class TestMainController:
 
         with allure.step("Проверка, что сессия не была установлена"):
             mock_session_manager.set.assert_not_called()
+
+    @allure.title("Тест неверного пароля без пересчёта хеша")
+    @allure.description("Проверяет, что при неверном пароле сессия не создаётся и хеш не пересчитывается")
+    def test_auth_user_wrong_password(
+        self,
+        main_controller: MainController,
+        mock_user_repository: Mock,
+        mock_session_manager: Mock,
+        mock_password_hasher: Mock,
+    ) -> None:
+        """Тест аутентификации с неверным паролем."""
+        with allure.step("Настройка моков: пользователь найден, пароль не совпадает"):
+            mock_user_repository.get_user_by_login.return_value = {"password_hash": "hashed_password"}
+            mock_password_hasher.verify.return_value = False
+
+        data = {"login": "test_user", "password": "wrong_password", "ip_addr": "127.0.0.1"}
+
+        with allure.step("Вызов метода auth_user"):
+            result = main_controller.auth_user(data)
+
+        with allure.step("Проверка результата"):
+            assert result is False
+            mock_session_manager.set.assert_not_called()
+            mock_password_hasher.schedule_rehash.assert_not_called()
+
+    @allure.title("Тест отказа при превышении лимита попыток входа")
+    @allure.description("Проверяет, что при превышении лимита пользователь не ищется в БД и пароль не проверяется")
+    def test_auth_user_throttled(
+        self,
+        main_controller: MainController,
+        mock_user_repository: Mock,
+        mock_password_hasher: Mock,
+        mock_login_throttle: Mock,
+    ) -> None:
+        """Тест аутентификации при исчерпанной корзине логина."""
+        with allure.step("Настройка mock_login_throttle: корзина логина пуста"):
+            mock_login_throttle.check.side_effect = RateLimitExceededError("limit", scope="login", retry_after=30)
+
+        data = {"login": "test_user", "password": "password", "ip_addr": "127.0.0.1"}
+
+        with allure.step("Вызов метода auth_user"):
+            with pytest.raises(RateLimitExceededError):
+                main_controller.auth_user(data)
+
+        with allure.step("Проверка, что БД и проверка пароля не использовались"):
+            mock_login_throttle.check.assert_called_once_with(ip_addr="127.0.0.1", login="test_user")
+            mock_user_repository.get_user_by_login.assert_not_called()
+            mock_password_hasher.verify.assert_not_called()
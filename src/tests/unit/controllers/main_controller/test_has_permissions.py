@@ -0,0 +1,48 @@
+from unittest.mock import Mock
+
+import allure
+
+from src.app.controllers.main_controller import MainController
+
+
+@allure.parent_suite("Unit Tests")
+@allure.suite("Тестирование MainController")
+@allure.sub_suite("Проверка прав")
+class TestMainControllerPermissions:
+
+    @allure.title("Тест проверки всех прав набора")
+    @allure.description("Проверяет, что права проверяются для роли из сессии через has_all")
+    def test_has_permissions_all(
+        self,
+        main_controller: MainController,
+        mock_session_manager: Mock,
+        mock_role_repository: Mock,
+    ) -> None:
+        mock_session_manager.get.side_effect = {"user_id": "1", "role_name": "Root"}.get
+        mock_role_repository.has_all.return_value = True
+
+        with allure.step("Вызываем метод has_permissions"):
+            result = main_controller.has_permissions(("read", "delete"))
+
+        with allure.step("Проверка результата и вызова репозитория"):
+            assert result is True
+            mock_role_repository.has_all.assert_called_once_with("Root", ("read", "delete"))
+            mock_role_repository.has_any.assert_not_called()
+
+    @allure.title("Тест отказа при отсутствии хотя бы одного права")
+    @allure.description("Проверяет, что при require_all=False используется has_any, а отказ возвращает False")
+    def test_has_permissions_any_denied(
+        self,
+        main_controller: MainController,
+        mock_session_manager: Mock,
+        mock_role_repository: Mock,
+    ) -> None:
+        mock_session_manager.get.side_effect = {"user_id": "2", "role_name": "Admin"}.get
+        mock_role_repository.has_any.return_value = False
+
+        with allure.step("Вызываем метод has_permissions"):
+            result = main_controller.has_permissions(("delete",), require_all=False)
+
+        with allure.step("Проверка результата и вызова репозитория"):
+            assert result is False
+            mock_role_repository.has_any.assert_called_once_with("Admin", ("delete",))
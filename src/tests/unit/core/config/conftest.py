@@ -64,6 +64,7 @@ def mock_toml_config():
             "SESSION_USE_SIGNER": True,
             "SESSION_CACHE_SIZE": 100,
             "SESSION_POOL_TIMEOUT": 30,
+            "REDIS_POOL_PREWARM": 2,
             "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
             "SQLALCHEMY_TRACK_MODIFICATIONS": False,
             "SQLALCHEMY_ECHO": False,
@@ -71,8 +72,53 @@ def mock_toml_config():
             "SQLALCHEMY_MAX_OVERFLOW": 10,
             "SQLALCHEMY_POOL_SIZE": 5,
             "SQLALCHEMY_POOL_RECYCLE": 3600,
+            "SQLALCHEMY_POOL_TIMEOUT": 30,
+            "SQLALCHEMY_POOL_PRE_PING": True,
+            "SQLALCHEMY_POOL_USE_LIFO": True,
+            "SQLALCHEMY_POOL_METRICS_LOG_INTERVAL": 60,
+            "SQLALCHEMY_POOL_PREWARM": 5,
+            "SQLALCHEMY_EXECUTEMANY_PAGE_SIZE": 1000,
+            "SQLALCHEMY_SLOW_QUERY_THRESHOLD": 1.0,
+            "SQLALCHEMY_SLOW_QUERY_EXPLAIN_INTERVAL": 300,
+            "SQLALCHEMY_SLOW_QUERY_MAX_PLANS": 100,
+            "SQLALCHEMY_ASYNC_USE_NULL_POOL": True,
+            "SQLALCHEMY_REPLICA_MAX_LAG": 5.0,
+            "SQLALCHEMY_REPLICA_HEALTH_INTERVAL": 10,
             "SQLALCHEMY_CONFIG_PATH_INIT": "./config/db_config/config.yaml",
-            "SQLALCHEMY_CONFIG_PATH_QUERIES_POSTGRESQL": "./config/db_config/queries_postgres.yaml",
+            "SQLALCHEMY_CONFIG_PATH_QUERIES": "./config/db_config/queries_base.yaml",
+            "SQLALCHEMY_CONFIG_PATH_QUERIES_DIALECTS": {
+                "postgresql": "./config/db_config/queries_postgres.yaml",
+                "sqlite": "./config/db_config/queries_sqlite.yaml",
+            },
+            "SQLALCHEMY_QUERY_CATALOG_RELOAD_INTERVAL": 5,
+            "SQLALCHEMY_VALIDATE_QUERY_CATALOG": True,
+            "SQLALCHEMY_BOOT_LOCK_TIMEOUT": 120,
+            "SQLALCHEMY_CIRCUIT_FAILURE_THRESHOLD": 5,
+            "SQLALCHEMY_CIRCUIT_RESET_TIMEOUT": 30,
+            "SQLALCHEMY_RETRY_ATTEMPTS": 2,
+            "SQLALCHEMY_RETRY_BASE_DELAY": 0.05,
+            "SQLALCHEMY_PAGE_MAX_LIMIT": 500,
+            "QUERY_CACHE_MAX_ENTRIES": 1024,
+            "QUERY_CACHE_KEY_PREFIX": "web_panel_query_cache:",
+            "PASSWORD_HASH_METHOD": "scrypt:32768:8:1",
+            "PASSWORD_REHASH_ON_LOGIN": True,
+            "PASSWORD_POOL_WORKERS": 1,
+            "PASSWORD_POOL_QUEUE_LIMIT": 8,
+            "PASSWORD_POOL_TIMEOUT": 5.0,
+            "LOGIN_RATE_LIMIT_ENABLED": True,
+            "LOGIN_RATE_LIMIT_IP_CAPACITY": 20,
+            "LOGIN_RATE_LIMIT_IP_REFILL_PER_MINUTE": 10.0,
+            "LOGIN_RATE_LIMIT_LOGIN_CAPACITY": 5,
+            "LOGIN_RATE_LIMIT_LOGIN_REFILL_PER_MINUTE": 1.0,
+            "LOGIN_RATE_LIMIT_KEY_PREFIX": "web_panel_login_limit:",
+            "LOGIN_RATE_LIMIT_REDIS_TIMEOUT": 0.05,
+            "LOGIN_RATE_LIMIT_LOCAL_MAX_KEYS": 10000,
+            "PROXY_FIX_X_FOR": 1,
+            "USER_LOGIN_FILTER_ENABLED": True,
+            "USER_LOGIN_FILTER_ERROR_RATE": 0.001,
+            "USER_LOGIN_FILTER_MIN_CAPACITY": 100000,
+            "USER_LOGIN_FILTER_MAX_AGE": 300,
+            "AUTHORIZATION_MAX_AGE": 300,
             "API_TITLE": "WebSslPanel API Documentation",
             "API_VERSION": "0.0.1",
             "OPENAPI_VERSION": "3.0.3",
@@ -0,0 +1,31 @@
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+
+from src.app.db.db_core import DatabaseCore
+from src.app.db.query_cache import QueryCache
+from src.app.db.slow_query_log import SlowQueryLog
+
+
+@pytest.fixture
+def worker_app(tmp_path):
+    """
+    Создает Flask-приложение с компонентами БД (файловая SQLite) и моками клиентов Redis,
+    как оно выглядит в мастер-процессе Gunicorn после предзагрузки.
+    """
+    app = Flask(__name__)
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'worker.db'}",
+        SQLALCHEMY_CONFIG_PATH_INIT="./config/db_config/config.yaml",
+        SQLALCHEMY_POOL_PREWARM=3,
+        REDIS_POOL_PREWARM=2,
+        SESSION_REDIS=MagicMock(name="session_redis"),
+    )
+    db_core = DatabaseCore()
+    db_core.init_app(app)
+    app.extensions["db_core"] = db_core
+    app.extensions["query_cache"] = QueryCache(redis=MagicMock(name="query_cache_redis"))
+    app.extensions["slow_query_log"] = SlowQueryLog(db_core=db_core)
+    yield app
+    db_core.engine.dispose()
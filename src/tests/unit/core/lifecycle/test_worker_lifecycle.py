@@ -0,0 +1,68 @@
+import runpy
+from unittest.mock import MagicMock, patch
+
+import allure
+
+from src.app.core.worker_lifecycle import after_fork, prewarm
+from src.app.db.query_cache import QueryCache
+
+
+@allure.parent_suite("Unit Tests")
+@allure.suite("Тестирование жизненного цикла воркера")
+class TestWorkerLifecycle:
+
+    @allure.sub_suite("После fork")
+    @allure.title("Тест сброса унаследованных пулов и состояния после fork")
+    def test_after_fork_resets_inherited_resources(self, worker_app):
+        db_core = worker_app.extensions["db_core"]
+        query_cache = worker_app.extensions["query_cache"]
+        pool_before, instance_before = db_core.engine.pool, query_cache.instance_id
+
+        with allure.step("Выполняем хук после fork"):
+            with patch.object(QueryCache, "start_listener") as start_listener:
+                after_fork(worker_app)
+
+        with allure.step("Проверяем, что пул БД заменён, а пулы Redis сброшены"):
+            assert db_core.engine.pool is not pool_before, "Пул соединений БД должен быть пересоздан"
+            query_cache.redis.connection_pool.reset.assert_called_once()
+            worker_app.config["SESSION_REDIS"].connection_pool.reset.assert_called_once()
+
+        with allure.step("Проверяем, что кэш получил новый идентификатор и перезапустил подписку"):
+            assert query_cache.instance_id != instance_before, "Воркер должен получить свой идентификатор кэша"
+            start_listener.assert_called_once()
+
+    @allure.sub_suite("Прогрев")
+    @allure.title("Тест прогрева соединений БД и Redis")
+    def test_prewarm_opens_connections(self, worker_app):
+        db_core = worker_app.extensions["db_core"]
+
+        with allure.step("Прогреваем соединения воркера"):
+            opened = prewarm(worker_app)
+
+        with allure.step("Проверяем количество открытых соединений"):
+            assert opened == {"database": 3, "redis": 4}, f"Неожиданный результат прогрева: {opened}"
+            assert db_core.pool_metrics.connects == 3 and db_core.engine.pool.checkedin() == 3
+
+        with allure.step("Проверяем, что соединения Redis возвращены в пул"):
+            pool = worker_app.config["SESSION_REDIS"].connection_pool
+            assert pool.get_connection.call_count == 2 and pool.release.call_count == 2
+
+    @allure.sub_suite("Конфигурация Gunicorn")
+    @allure.title("Тест хуков конфигурации Gunicorn")
+    def test_gunicorn_hooks(self, worker_app):
+        config = runpy.run_path("config/gunicorn.conf.py")
+        worker = MagicMock(wsgi=worker_app)
+        worker.app.wsgi.return_value = worker_app
+
+        with allure.step("Вызываем хуки с предзагрузкой и без неё"):
+            with patch("src.app.core.worker_lifecycle.after_fork") as mock_after_fork, patch(
+                "src.app.core.worker_lifecycle.prewarm"
+            ) as mock_prewarm:
+                config["post_fork"](MagicMock(cfg=MagicMock(preload_app=False)), worker)
+                config["post_fork"](MagicMock(cfg=MagicMock(preload_app=True)), worker)
+                config["post_worker_init"](worker)
+
+        with allure.step("Проверяем, что сброс выполнен только при предзагрузке, а прогрев — всегда"):
+            mock_after_fork.assert_called_once_with(worker_app)
+            mock_prewarm.assert_called_once_with(worker_app)
+            assert config["preload_app"] is True
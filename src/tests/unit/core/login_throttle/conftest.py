@@ -0,0 +1,40 @@
+from unittest.mock import Mock
+
+import pytest
+from redis import Redis
+
+from src.app.core.login_throttle import LoginThrottle, TokenBucketPolicy
+
+
+@pytest.fixture
+def login_throttle():
+    """
+    Создает LoginThrottle без Redis: 3 попытки подряд с IP-адреса и 2 для логина, пополнение — токен в секунду.
+    """
+    return LoginThrottle(
+        ip_policy=TokenBucketPolicy(capacity=3, refill_per_minute=60),
+        login_policy=TokenBucketPolicy(capacity=2, refill_per_minute=60),
+    )
+
+
+@pytest.fixture
+def bucket_script():
+    """
+    Мок Lua-скрипта корзин, зарегистрированного в Redis.
+    """
+    return Mock()
+
+
+@pytest.fixture
+def redis_login_throttle(bucket_script):
+    """
+    Создает LoginThrottle с моком клиента Redis, возвращающим мок скрипта корзин.
+    """
+    redis = Mock(spec=Redis)
+    redis.register_script.return_value = bucket_script
+    return LoginThrottle(
+        ip_policy=TokenBucketPolicy(capacity=3, refill_per_minute=60),
+        login_policy=TokenBucketPolicy(capacity=2, refill_per_minute=60),
+        redis=redis,
+        key_prefix="test:",
+    )
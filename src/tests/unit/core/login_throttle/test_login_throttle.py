@@ -0,0 +1,109 @@
+from unittest.mock import patch
+
+import allure
+import pytest
+from flask import Flask
+from redis import RedisError
+
+from src.app.core.login_throttle import (TOKEN_BUCKET_SCRIPT, LoginThrottle,
+                                         RateLimitExceededError,
+                                         TokenBucketPolicy)
+
+
+@allure.parent_suite("Unit Tests")
+@allure.suite("Тестирование LoginThrottle")
+class TestLoginThrottle:
+
+    @allure.sub_suite("Корзины в памяти процесса")
+    @allure.title("Тест исчерпания и пополнения корзин логина и IP-адреса")
+    def test_local_buckets(self, login_throttle):
+        with patch("src.app.core.login_throttle.time.monotonic", return_value=100.0) as monotonic:
+            with allure.step("Корзина логина исчерпывается раньше корзины IP-адреса"):
+                login_throttle.check("10.0.0.1", "root")
+                login_throttle.check("10.0.0.1", "root")
+                with pytest.raises(RateLimitExceededError) as error:
+                    login_throttle.check("10.0.0.1", "root")
+                assert error.value.scope == "login"
+                assert error.value.retry_after == pytest.approx(1.0)
+
+            with allure.step("Отказ не списывает токен: другой логин с того же IP-адреса проходит"):
+                login_throttle.check("10.0.0.1", "admin")
+                with pytest.raises(RateLimitExceededError) as error:
+                    login_throttle.check("10.0.0.1", "guest")
+                assert error.value.scope == "ip"
+                login_throttle.check("10.0.0.2", "guest")
+
+            with allure.step("Через секунду в корзинах появляется по токену"):
+                monotonic.return_value = 101.0
+                login_throttle.check("10.0.0.1", "root")
+
+        assert login_throttle.stats() == {
+            "allowed": 5,
+            "rejected_ip": 1,
+            "rejected_login": 1,
+            "local_decisions": 7,
+            "redis_errors": 0,
+        }
+
+    @allure.sub_suite("Redis")
+    @allure.title("Тест списания обеих корзин одним вызовом скрипта")
+    def test_redis_script(self, redis_login_throttle, bucket_script):
+        redis_login_throttle.redis.register_script.assert_called_once_with(TOKEN_BUCKET_SCRIPT)
+
+        with allure.step("Разрешённая попытка"):
+            bucket_script.return_value = [1, 0, 0]
+            redis_login_throttle.check("10.0.0.1", "root")
+            bucket_script.assert_called_once_with(keys=["test:ip:10.0.0.1", "test:login:root"], args=[3, 1.0, 2, 1.0])
+
+        with allure.step("Отказ по корзине логина с временем до следующей попытки"):
+            bucket_script.return_value = [0, 2, 1500]
+            with pytest.raises(RateLimitExceededError) as error:
+                redis_login_throttle.check("10.0.0.1", "root")
+            assert (error.value.scope, error.value.retry_after) == ("login", 1.5)
+
+        assert redis_login_throttle.stats()["local_decisions"] == 0
+
+    @allure.sub_suite("Redis")
+    @allure.title("Тест перехода на корзины в памяти процесса при ошибке Redis")
+    def test_redis_fallback(self, redis_login_throttle, bucket_script):
+        bucket_script.side_effect = RedisError("Timeout reading from socket")
+
+        with allure.step("Ошибка Redis: решение принимают корзины в памяти процесса"):
+            redis_login_throttle.check("10.0.0.1", "root")
+            redis_login_throttle.check("10.0.0.1", "root")
+            with pytest.raises(RateLimitExceededError):
+                redis_login_throttle.check("10.0.0.1", "root")
+
+        with allure.step("Redis не опрашивается до истечения паузы после ошибки"):
+            assert bucket_script.call_count == 1
+            stats = redis_login_throttle.stats()
+            assert (stats["redis_errors"], stats["local_decisions"]) == (1, 3)
+
+        with allure.step("После паузы Redis снова используется"):
+            bucket_script.side_effect, bucket_script.return_value = None, [1, 0, 0]
+            redis_login_throttle._redis_retry_at = 0.0
+            redis_login_throttle.check("10.0.0.1", "root")
+            assert bucket_script.call_count == 2
+
+    @allure.sub_suite("Настройка")
+    @allure.title("Тест настройки корзин из конфигурации и отключения ограничения")
+    def test_init_app(self):
+        app = Flask(__name__)
+        app.config.update(
+            LOGIN_RATE_LIMIT_ENABLED=False,
+            LOGIN_RATE_LIMIT_IP_CAPACITY=50,
+            LOGIN_RATE_LIMIT_IP_REFILL_PER_MINUTE=30.0,
+            LOGIN_RATE_LIMIT_LOGIN_CAPACITY=1,
+            LOGIN_RATE_LIMIT_LOGIN_REFILL_PER_MINUTE=0.5,
+        )
+        throttle = LoginThrottle()
+        throttle.init_app(app)
+
+        assert (throttle.ip_policy.capacity, throttle.ip_policy.rate) == (50, 0.5)
+        assert throttle.redis is None
+        for _ in range(3):
+            throttle.check("10.0.0.1", "root")
+        assert throttle.stats()["allowed"] == 0
+
+        with pytest.raises(ValueError):
+            TokenBucketPolicy(capacity=0, refill_per_minute=1)
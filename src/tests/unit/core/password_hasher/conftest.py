@@ -0,0 +1,36 @@
+import pytest
+from werkzeug.security import generate_password_hash
+
+from src.app.core.password_hasher import PasswordHasher
+
+# Дешёвые параметры, чтобы тесты не тратили время на хеширование
+CURRENT_METHOD = "pbkdf2:sha256:1000"
+OUTDATED_METHOD = "scrypt:1024:8:1"
+
+
+@pytest.fixture
+def password_hasher():
+    """
+    Создает PasswordHasher с дешёвым методом хеширования и дожидается фоновых пересчётов после теста.
+    """
+    hasher = PasswordHasher(method=CURRENT_METHOD)
+    yield hasher
+    hasher.shutdown()
+
+
+@pytest.fixture
+def outdated_hash():
+    """
+    Хеш пароля `secret`, полученный с параметрами, отличными от текущего метода.
+    """
+    return generate_password_hash("secret", method=OUTDATED_METHOD)
+
+
+@pytest.fixture
+def pooled_password_hasher():
+    """
+    Создает PasswordHasher с пулом из одного процесса без очереди и закрывает пул после теста.
+    """
+    hasher = PasswordHasher(method=CURRENT_METHOD, pool_workers=1, queue_limit=0, timeout=30)
+    yield hasher
+    hasher.shutdown()
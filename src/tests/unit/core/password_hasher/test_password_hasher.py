@@ -0,0 +1,137 @@
+from unittest.mock import Mock, patch
+
+import allure
+import pytest
+from flask import Flask
+from werkzeug.security import generate_password_hash
+
+from src.app.core.password_hasher import (PasswordHasher,
+                                          PasswordHasherBusyError, calibrate,
+                                          hash_method, normalize_method)
+
+
+@allure.parent_suite("Unit Tests")
+@allure.suite("Тестирование PasswordHasher")
+class TestPasswordHasher:
+
+    @allure.sub_suite("Методы хеширования")
+    @allure.title("Тест полной записи метода и определения метода по хешу")
+    def test_methods(self, password_hasher):
+        with allure.step("Методы без параметров дополняются параметрами werkzeug по умолчанию"):
+            assert normalize_method("scrypt") == "scrypt:32768:8:1"
+            assert normalize_method("pbkdf2") == "pbkdf2:sha256:1000000"
+            assert normalize_method("argon2") == "argon2:3:65536:4"
+            with pytest.raises(ValueError):
+                normalize_method("md5")
+            with pytest.raises(ValueError):
+                normalize_method("scrypt:fast")
+
+        with allure.step("Метод определяется по сохранённому хешу"):
+            assert hash_method(password_hasher.hash("secret")) == "pbkdf2:sha256:1000"
+            assert hash_method("$argon2id$v=19$m=65536,t=3,p=4$c2FsdA$aGFzaA") == "argon2:3:65536:4"
+            assert hash_method("plain") is None
+
+    @allure.sub_suite("Проверка пароля")
+    @allure.title("Тест проверки пароля и признака устаревших параметров")
+    def test_verify_and_needs_rehash(self, password_hasher, outdated_hash):
+        current_hash = password_hasher.hash("secret")
+
+        assert password_hasher.verify(current_hash, "secret")
+        assert not password_hasher.verify(current_hash, "wrong")
+        assert password_hasher.verify(outdated_hash, "secret")
+        assert not password_hasher.needs_rehash(current_hash)
+        assert password_hasher.needs_rehash(outdated_hash)
+
+    @allure.sub_suite("Пул процессов")
+    @allure.title("Тест проверки и хеширования пароля в пуле процессов")
+    def test_pool_verify_and_hash(self, pooled_password_hasher, outdated_hash):
+        assert pooled_password_hasher.verify(outdated_hash, "secret")
+        assert not pooled_password_hasher.verify(outdated_hash, "wrong")
+        assert pooled_password_hasher.verify(pooled_password_hasher.hash("secret"), "secret")
+
+    @allure.sub_suite("Пул процессов")
+    @allure.title("Тест отказа без ожидания при заполненной очереди пула и по таймауту")
+    def test_pool_sheds_load(self, pooled_password_hasher, outdated_hash):
+        with allure.step("Очередь заполнена: проверка отклоняется сразу, без запуска процесса"):
+            pooled_password_hasher._slots.acquire()
+            with pytest.raises(PasswordHasherBusyError) as error:
+                pooled_password_hasher.verify(outdated_hash, "secret")
+            assert error.value.retry_after == 1
+            assert pooled_password_hasher._pool is None
+
+        with allure.step("После освобождения слота проверка выполняется"):
+            pooled_password_hasher._slots.release()
+            assert pooled_password_hasher.verify(outdated_hash, "secret")
+
+        with allure.step("Результат не получен за timeout: слот занят, пока задача не завершится в пуле"):
+            pooled_password_hasher.timeout = 0.001
+            slow_hash = generate_password_hash("secret", method="scrypt:65536:8:1")
+            with pytest.raises(PasswordHasherBusyError):
+                pooled_password_hasher.verify(slow_hash, "secret")
+            with pytest.raises(PasswordHasherBusyError, match="заполнена"):
+                pooled_password_hasher.verify(outdated_hash, "secret")
+
+        with allure.step("Некорректные параметры пула"):
+            with pytest.raises(ValueError):
+                PasswordHasher(pool_workers=-1)
+            with pytest.raises(ValueError):
+                PasswordHasher(pool_workers=1, timeout=0)
+
+    @allure.sub_suite("Пересчёт хеша")
+    @allure.title("Тест фонового пересчёта хеша с устаревшими параметрами")
+    def test_schedule_rehash(self, password_hasher, outdated_hash):
+        store = Mock()
+
+        with allure.step("Хеш с текущими параметрами не пересчитывается"):
+            assert not password_hasher.schedule_rehash("root", "secret", password_hasher.hash("secret"), store)
+
+        with allure.step("Хеш с устаревшими параметрами пересчитывается в фоне"):
+            assert password_hasher.schedule_rehash("root", "secret", outdated_hash, store)
+            password_hasher.shutdown()
+
+        with allure.step("Новый хеш сохранён с прежним хешем для проверки"):
+            store.assert_called_once()
+            login, new_hash, old_hash = store.call_args.args
+            assert (login, old_hash) == ("root", outdated_hash)
+            assert password_hasher.verify(new_hash, "secret")
+            assert not password_hasher.needs_rehash(new_hash)
+
+        with allure.step("Пересчёт отключается конфигурацией"):
+            password_hasher.rehash_on_login = False
+            assert not password_hasher.schedule_rehash("root", "secret", outdated_hash, store)
+
+    @allure.sub_suite("Калибровка")
+    @allure.title("Тест подбора параметров под целевое время")
+    def test_calibrate(self):
+        with allure.step("scrypt: наибольшее n, при котором время не превышает цель"):
+            timing = lambda method, samples: int(method.split(":")[1]) / 2**14 * 0.1  # noqa: E731
+            with patch("src.app.core.password_hasher.measure_hash_time", side_effect=timing):
+                assert calibrate("scrypt", 0.25) == ("scrypt:32768:8:1", 0.2)
+
+        with allure.step("pbkdf2: число итераций масштабируется по замеру"):
+            timing = lambda method, samples: int(method.split(":")[2]) / 1e6  # noqa: E731
+            with patch("src.app.core.password_hasher.measure_hash_time", side_effect=timing):
+                assert calibrate("pbkdf2", 0.25) == ("pbkdf2:sha256:250000", 0.25)
+
+        with allure.step("Неизвестный алгоритм"):
+            with pytest.raises(ValueError):
+                calibrate("md5", 0.25)
+
+    @allure.sub_suite("Калибровка")
+    @allure.title("Тест команды flask calibrate-password-hash")
+    def test_calibrate_command(self):
+        app = Flask(__name__)
+        app.config.update(
+            PASSWORD_HASH_METHOD="pbkdf2:sha256:1000", PASSWORD_REHASH_ON_LOGIN=False, PASSWORD_POOL_WORKERS=2
+        )
+        hasher = PasswordHasher()
+        hasher.init_app(app)
+        app.extensions["password_hasher"] = hasher
+        assert hasher.method == "pbkdf2:sha256:1000" and hasher.rehash_on_login is False
+        assert (hasher.pool_workers, hasher.queue_limit) == (2, 16)
+
+        with patch("src.app.core.password_hasher.calibrate", return_value=("scrypt:16384:8:1", 0.05)):
+            result = app.test_cli_runner().invoke(args=["calibrate-password-hash", "--target-ms", "60"])
+
+        assert result.exit_code == 0, result.output
+        assert 'PASSWORD_HASH_METHOD = "scrypt:16384:8:1"' in result.output
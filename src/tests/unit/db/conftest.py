@@ -5,6 +5,8 @@ import yaml
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+from src.app.db.async_db_core import AsyncDatabaseCore
+from src.app.db.async_db_helper import AsyncDBHelperSQL
 from src.app.db.db_core import DatabaseCore, DatabaseInitializer
 from src.app.db.db_helper import DBHelperSQL
 from src.app.db.models import AbstractModel
@@ -66,6 +68,11 @@ def mock_app(mock_config_file):
             "config": {
                 "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
                 "SQLALCHEMY_CONFIG_PATH_INIT": str(mock_config_file),
+                "SQLALCHEMY_CONFIG_PATH_QUERIES": "./config/db_config/queries_base.yaml",
+                "SQLALCHEMY_CONFIG_PATH_QUERIES_DIALECTS": {
+                    "postgresql": "./config/db_config/queries_postgres.yaml",
+                    "sqlite": "./config/db_config/queries_sqlite.yaml",
+                },
             }
         },
     )()
@@ -157,24 +164,39 @@ def db_core(mock_app):
 def db_helper_with_real_queries(mock_app):
     """
     Создает экземпляр DBHelperSQL с реальными SQL-запросами и настроенным DatabaseCore.
+    Каталог запросов загружается в DatabaseCore.init_app под диалект движка (sqlite).
     """
-    # Инициализация DatabaseCore
-    db_core = DatabaseCore()
+    # Инициализация DatabaseCore вместе с каталогом реальных запросов
+    query_manager = QueryManager()
+    db_core = DatabaseCore(query_manager=query_manager)
     db_core.init_app(mock_app)
     db_core.create_tables()
 
     # Инициализация данных через DatabaseInitializer
     DatabaseInitializer(config_path=mock_app.config["SQLALCHEMY_CONFIG_PATH_INIT"])
 
-    # Инициализация QueryManager с реальными запросами
-    query_manager = QueryManager.from_yaml(
-        file_path_query_yaml="./config/db_config/queries_sqlite.yaml"
-    )  # для тестов файл
-
     # Возвращаем DBHelperSQL
     return DBHelperSQL(db_core=db_core, query_manager=query_manager)
 
 
+@pytest.fixture
+def async_db_helper(mock_app, tmp_path):
+    """
+    Создает экземпляр AsyncDBHelperSQL (aiosqlite) над файловой SQLite-базой.
+    Таблицы, начальные данные и каталог запросов создаются синхронным DatabaseCore.
+    """
+    mock_app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'async.db'}"
+    query_manager = QueryManager()
+    db_core = DatabaseCore(query_manager=query_manager)
+    db_core.init_app(mock_app)
+    db_core.create_tables()
+
+    async_db_core = AsyncDatabaseCore()
+    async_db_core.init_app(mock_app)
+    yield AsyncDBHelperSQL(db_core=async_db_core, query_manager=query_manager)
+    db_core.engine.dispose()
+
+
 @pytest.fixture
 def query_manager(temp_query_file):
     """
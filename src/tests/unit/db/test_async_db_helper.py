@@ -0,0 +1,76 @@
+import asyncio
+
+import allure
+
+from src.app.db.async_db_core import AsyncDatabaseCore
+
+
+@allure.parent_suite("Database Tests")
+@allure.suite("Тестирование AsyncDBHelperSQL")
+class TestAsyncDBHelperSQL:
+
+    @allure.sub_suite("Чтение")
+    @allure.title("Тест асинхронного чтения из общего каталога запросов")
+    def test_async_reads(self, async_db_helper):
+        async def run():
+            user = await async_db_helper.execute_one_or_none("get_user_by_login", {"login": "root"}, shape="record")
+            roles = await async_db_helper.execute_query("get_all_roles_and_permissions")
+            login = await async_db_helper.execute_scalar("get_user_by_login", {"login": "admin"})
+            return user, roles, login
+
+        with allure.step("Выполняем запросы асинхронно"):
+            user, roles, login = asyncio.run(run())
+
+        with allure.step("Проверяем результаты"):
+            assert user.login == "root" and user.role_name == "Root"
+            assert {role["role_name"] for role in roles} == {"Root", "Admin"}
+            assert login == "admin"
+
+    @allure.sub_suite("Чтение")
+    @allure.title("Тест конкурентных запросов в одном цикле событий")
+    def test_concurrent_logins(self, async_db_helper):
+        async def run():
+            logins = ["root", "admin"] * 5
+            return await asyncio.gather(
+                *(async_db_helper.execute_one_or_none("get_user_by_login", {"login": login}) for login in logins)
+            )
+
+        with allure.step("Выполняем 10 запросов конкурентно"):
+            users = asyncio.run(run())
+
+        with allure.step("Проверяем, что все запросы вернули пользователей"):
+            assert [user["login"] for user in users] == ["root", "admin"] * 5
+
+    @allure.sub_suite("Запись")
+    @allure.title("Тест асинхронной записи и обработки ошибок")
+    def test_async_writes_and_errors(self, async_db_helper):
+        async def run():
+            created = await async_db_helper.execute_many(
+                "create_user", [{"login": f"async_{i}", "password_hash": "hash", "role_id": 1} for i in range(3)]
+            )
+            invalid = await async_db_helper.execute_update(
+                "create_user", {"login": None, "password_hash": "hash", "role_id": 1}
+            )
+            missing = await async_db_helper.execute_first("unknown_query")
+            user = await async_db_helper.execute_first("get_user_by_login", {"login": "async_2"})
+            return created, invalid, missing, user
+
+        with allure.step("Выполняем пакетную вставку, некорректную запись и неизвестный запрос"):
+            created, invalid, missing, user = asyncio.run(run())
+
+        with allure.step("Проверяем результаты и значения при ошибках"):
+            assert created == [3]
+            assert invalid is False, "При ошибке записи должен возвращаться False"
+            assert missing is None, "При ошибке чтения одной строки должен возвращаться None"
+            assert user["login"] == "async_2"
+
+    @allure.sub_suite("Настройка")
+    @allure.title("Тест вывода URI асинхронного драйвера")
+    def test_build_async_uri(self):
+        with allure.step("Преобразуем URI синхронных драйверов"):
+            pg = AsyncDatabaseCore.build_async_uri("postgresql+psycopg2://user:pass@db:5432/panel")
+            sqlite = AsyncDatabaseCore.build_async_uri("sqlite:///local.db")
+
+        with allure.step("Проверяем драйверы"):
+            assert pg.drivername == "postgresql+asyncpg" and pg.host == "db"
+            assert sqlite.drivername == "sqlite+aiosqlite"
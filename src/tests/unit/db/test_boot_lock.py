@@ -0,0 +1,83 @@
+import fcntl
+import os
+import threading
+from unittest.mock import Mock
+
+import allure
+import pytest
+
+from src.app.db.boot_lock import BootLock, BootLockTimeoutError
+from src.app.db.db_core import DatabaseCore
+
+
+@pytest.fixture
+def file_db_core(mock_app, tmp_path):
+    """
+    Создает DatabaseCore над файловой SQLite-базой без созданных таблиц.
+    """
+    mock_app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'boot.db'}"
+    db_core = DatabaseCore()
+    db_core.init_app(mock_app)
+    yield db_core
+    db_core.engine.dispose()
+
+
+@pytest.fixture
+def held_file_lock(tmp_path):
+    """
+    Удерживает файловую блокировку задач запуска, как если бы её захватил другой процесс.
+    """
+    fd = os.open(str(tmp_path / "boot.db.boot.lock"), os.O_RDWR | os.O_CREAT)
+    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    yield fd
+    os.close(fd)
+
+
+@allure.parent_suite("Database Tests")
+@allure.suite("Тестирование BootLock")
+@allure.sub_suite("Выбор процесса для задач запуска")
+class TestBootLock:
+    @allure.title("Лидер выполняет задачи запуска и освобождает блокировку")
+    def test_leader_runs_task(self, file_db_core, tmp_path):
+        boot_lock = BootLock(file_db_core, timeout=1.0, poll_interval=0.05)
+
+        with allure.step("Выполняем задачи запуска"):
+            assert boot_lock.run(file_db_core.create_tables) is True
+            assert file_db_core.is_schema_current()
+
+        with allure.step("Проверяем, что блокировка освобождена"):
+            fd = os.open(str(tmp_path / "boot.db.boot.lock"), os.O_RDWR)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            finally:
+                os.close(fd)
+
+        with allure.step("Повторный запуск только проверяет флаг готовности"):
+            task = Mock()
+            assert boot_lock.run(task) is False
+            task.assert_not_called()
+
+    @allure.title("Ожидающий процесс дожидается готовности, не выполняя задачи")
+    def test_follower_waits_for_readiness(self, file_db_core, held_file_lock):
+        boot_lock = BootLock(file_db_core, timeout=5.0, poll_interval=0.05)
+        task = Mock()
+        leader = threading.Timer(0.2, file_db_core.create_tables)
+
+        with allure.step("Другой процесс удерживает блокировку и создаёт таблицы"):
+            leader.start()
+            try:
+                assert boot_lock.run(task) is False
+            finally:
+                leader.join()
+
+        with allure.step("Задачи запуска не выполнялись текущим процессом"):
+            task.assert_not_called()
+
+    @allure.title("Ожидание готовности ограничено по времени")
+    def test_follower_timeout(self, file_db_core, held_file_lock):
+        boot_lock = BootLock(file_db_core, timeout=0.2, poll_interval=0.05)
+        task = Mock()
+
+        with pytest.raises(BootLockTimeoutError):
+            boot_lock.run(task)
+        task.assert_not_called()
@@ -0,0 +1,89 @@
+import allure
+import pytest
+from sqlalchemy import event
+
+from src.app.db.catalog_validator import (CatalogValidationError,
+                                          CatalogValidator)
+from src.app.db.query_manager import QueryManager
+
+
+@allure.parent_suite("Database Tests")
+@allure.suite("Тестирование CatalogValidator")
+class TestCatalogValidator:
+
+    @allure.sub_suite("Проверка каталога")
+    @allure.title("Тест проверки реального каталога на схеме SQLite")
+    def test_real_catalog_is_valid(self, db_helper_with_real_queries):
+        validator = CatalogValidator(db_helper_with_real_queries.db_core, db_helper_with_real_queries.query_manager)
+
+        with allure.step("Проверяем все запросы каталога"):
+            report = validator.validate()
+
+        with allure.step("Проверяем отчёт и готовность"):
+            assert validator.ready, "После успешной проверки процесс должен быть готов"
+            assert report["failures"] == {} and report["checked"] == len(validator.query_manager.definitions)
+
+    @allure.sub_suite("Проверка каталога")
+    @allure.title("Тест проверки запросов на чтение без чтения строк")
+    def test_reads_are_probed_without_rows(self, db_helper_with_real_queries):
+        db_core = db_helper_with_real_queries.db_core
+        validator = CatalogValidator(db_core, db_helper_with_real_queries.query_manager)
+        executed = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            executed.append(statement)
+
+        with allure.step("Проверяем каталог, записывая выполненные выражения"):
+            event.listen(db_core.engine, "before_cursor_execute", record)
+            try:
+                validator.validate()
+            finally:
+                event.remove(db_core.engine, "before_cursor_execute", record)
+
+        with allure.step("Проверяем, что запросы на чтение выполнены с LIMIT 0, а запросы на запись — через EXPLAIN"):
+            probes = [statement for statement in executed if not statement.startswith("EXPLAIN")]
+            assert probes, "Запросы на чтение должны проверяться на БД"
+            assert all(statement.rstrip().endswith(("LIMIT 0", "LIMIT ?")) for statement in probes), probes
+
+    @allure.sub_suite("Проверка каталога")
+    @allure.title("Тест обнаружения ошибок каталога")
+    def test_broken_catalog_refuses_readiness(self, db_core, temp_yaml_file):
+        queries = {
+            "user_queries": {
+                "valid_read": {"mode": "read", "sql": "SELECT login FROM users WHERE id = :id"},
+                "missing_column": {"mode": "read", "sql": "SELECT logn FROM users"},
+                "columns_mismatch": {
+                    "mode": "read",
+                    "sql": "SELECT login, id FROM users",
+                    "columns": {"id": "Integer", "login": "String"},
+                },
+                "undeclared_bind": {
+                    "mode": "read",
+                    "sql": "SELECT login FROM users WHERE id = :id AND login = :login",
+                    "binds": {"id": "Integer"},
+                },
+                "cache_key_typo": {
+                    "mode": "read",
+                    "sql": "SELECT login FROM users WHERE login = :login",
+                    "cache": {"ttl": 60, "key_params": ["logn"]},
+                },
+                "valid_write": "UPDATE users SET login = :login WHERE id = :id",
+                "missing_table": "UPDATE userz SET login = :login WHERE id = :id",
+            }
+        }
+        query_manager = QueryManager.from_yaml(temp_yaml_file(queries))
+        validator = CatalogValidator(db_core, query_manager)
+
+        with allure.step("Проверяем каталог с ошибками"):
+            with pytest.raises(CatalogValidationError) as error:
+                validator.validate()
+
+        with allure.step("Проверяем, что найдены все ошибки, а готовность не выставлена"):
+            assert set(error.value.failures) == {
+                "missing_column",
+                "columns_mismatch",
+                "undeclared_bind",
+                "cache_key_typo",
+                "missing_table",
+            }
+            assert not validator.ready, "При ошибках каталога процесс не должен быть готов"
@@ -0,0 +1,129 @@
+import sqlite3
+from unittest.mock import Mock, patch
+
+import allure
+import pytest
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from src.app.db.circuit_breaker import (CircuitBreaker,
+                                        DatabaseUnavailableError,
+                                        is_retryable_error,
+                                        is_unavailable_error)
+from src.app.db.db_core import DatabaseCore
+from src.app.utils.error_handlers import handle_db_helper_errors
+
+
+class DriverError(Exception):
+    """
+    Ошибка драйвера БД с SQLSTATE, как у psycopg2.
+    """
+
+    def __init__(self, message: str, pgcode: str = None) -> None:
+        super().__init__(message)
+        self.pgcode = pgcode
+
+
+def connection_refused():
+    return OperationalError("connect", None, DriverError("connection refused"))
+
+
+def serialization_failure():
+    return OperationalError("update", None, DriverError("could not serialize access", pgcode="40001"))
+
+
+@allure.parent_suite("Database Tests")
+@allure.suite("Тестирование CircuitBreaker")
+class TestCircuitBreaker:
+    @allure.sub_suite("Классификация ошибок")
+    @allure.title("Недоступность сервера отличается от ошибки запроса")
+    def test_error_classification(self):
+        assert is_unavailable_error(connection_refused())
+        assert not is_unavailable_error(serialization_failure())
+        assert not is_unavailable_error(OperationalError("select", None, sqlite3.OperationalError("no such table")))
+        assert not is_unavailable_error(IntegrityError("insert", None, DriverError("duplicate", pgcode="23505")))
+
+        assert is_retryable_error(serialization_failure(), idempotent=False)
+        assert is_retryable_error(connection_refused(), idempotent=True)
+        assert not is_retryable_error(connection_refused(), idempotent=False)
+        assert is_retryable_error(OperationalError("insert", None, sqlite3.OperationalError("database is locked")))
+
+    @allure.sub_suite("Состояния автомата")
+    @allure.title("Автомат размыкается, отклоняет запросы и замыкается после пробного запроса")
+    def test_open_half_open_close(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+
+        with allure.step("Ошибки недоступности подряд размыкают автомат"):
+            breaker.record_error(connection_refused())
+            assert breaker.state == CircuitBreaker.CLOSED
+            breaker.record_error(connection_refused())
+            assert breaker.state == CircuitBreaker.OPEN
+
+        with allure.step("Разомкнутый автомат сразу отклоняет запросы"):
+            with pytest.raises(DatabaseUnavailableError) as error:
+                breaker.before_call()
+            assert 0 < error.value.retry_after <= 10
+
+        with allure.step("После reset_timeout пропускается один пробный запрос"):
+            with patch("src.app.db.circuit_breaker.time.monotonic", return_value=breaker._opened_at + 11):
+                breaker.before_call()
+                assert breaker.state == CircuitBreaker.HALF_OPEN
+                with pytest.raises(DatabaseUnavailableError):
+                    breaker.before_call()
+
+        with allure.step("Ошибка пробного запроса снова размыкает автомат"):
+            breaker.record_error(connection_refused())
+            assert breaker.state == CircuitBreaker.OPEN
+
+        with allure.step("Успешный пробный запрос замыкает автомат"):
+            with patch("src.app.db.circuit_breaker.time.monotonic", return_value=breaker._opened_at + 11):
+                breaker.before_call()
+            breaker.record_error(IntegrityError("insert", None, DriverError("duplicate", pgcode="23505")))
+            assert breaker.state == CircuitBreaker.CLOSED
+            assert breaker.failures == 0
+
+    @allure.sub_suite("Повтор запросов")
+    @allure.title("Временные ошибки повторяются, остальные пробрасываются сразу")
+    def test_call_retries_transient_errors(self):
+        breaker = CircuitBreaker(retry_attempts=2, retry_base_delay=0.001)
+
+        with allure.step("Конфликт сериализации повторяется и для записи"):
+            func = Mock(side_effect=[serialization_failure(), serialization_failure(), "ok"])
+            assert breaker.call(func, "arg", idempotent=False) == "ok"
+            assert func.call_count == 3
+
+        with allure.step("Количество повторов ограничено"):
+            func = Mock(side_effect=serialization_failure())
+            with pytest.raises(OperationalError):
+                breaker.call(func)
+            assert func.call_count == 3
+
+        with allure.step("Разрыв соединения не повторяется для записи"):
+            func = Mock(side_effect=connection_refused())
+            with pytest.raises(OperationalError):
+                breaker.call(func, idempotent=False)
+            assert func.call_count == 1
+
+    @allure.sub_suite("Интеграция")
+    @allure.title("DatabaseCore не открывает сессию основной БД при разомкнутом автомате")
+    def test_session_scope_fails_fast(self, mock_app):
+        db_core = DatabaseCore()
+        db_core.init_app(mock_app)
+        db_core.circuit_breaker.state = CircuitBreaker.OPEN
+        db_core.circuit_breaker._opened_at = float("inf")
+
+        with patch.object(DatabaseCore, "_DatabaseCore__get_session") as get_session:
+            with pytest.raises(DatabaseUnavailableError):
+                with db_core.session_scope():
+                    pass
+        get_session.assert_not_called()
+
+    @allure.sub_suite("Интеграция")
+    @allure.title("Недоступность БД не подменяется пустым результатом")
+    def test_db_helper_errors_raise_unavailable(self):
+        class Dummy:
+            @handle_db_helper_errors(default=None)
+            def execute_one_or_none(self, query_name, params=None):
+                raise connection_refused()
+
+        with pytest.raises(DatabaseUnavailableError):
+            Dummy().execute_one_or_none("get_user_by_login", {"login": "root"})
@@ -1,7 +1,14 @@
+from datetime import datetime, timezone
+from unittest.mock import patch
+
 import allure
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.exc import IntegrityError
 
-from src.app.db.db_core import DatabaseCore
-from src.app.db.models import PermissionModel, RoleModel, UserModel
+from src.app.db.db_core import DatabaseCore, DatabaseInitializer
+from src.app.db.models import (AppStateModel, PermissionModel, RoleModel,
+                               RolePermissionModel, UserModel)
 
 
 @allure.parent_suite("Database Tests")
@@ -70,3 +77,61 @@ class TestDatabaseCore:
 
                     assert root_user.role.role_name == "Root", "У пользователя root неверная роль"
                     assert admin_user.role.role_name == "Admin", "У пользователя admin неверная роль"
+
+    @allure.title("Тест уникальных индексов колонок поиска")
+    @allure.description("Проверка, что таблицы создаются с уникальными индексами и дубликаты отклоняются")
+    @pytest.mark.parametrize(
+        "table, columns, duplicate",
+        [
+            ("users", ["login"], UserModel(login="root", password_hash="hash", role_id=1)),
+            ("role", ["role_name"], RoleModel(role_name="Root")),
+            ("permission", ["name"], PermissionModel(name="read")),
+            ("role_permission", ["role_id", "permission_id"], RolePermissionModel(role_id=1, permission_id=1)),
+        ],
+    )
+    def test_unique_lookup_indexes(self, mock_app, table, columns, duplicate):
+        with allure.step("Инициализируем DatabaseCore и создаем таблицы"):
+            db_core = DatabaseCore()
+            db_core.init_app(mock_app)
+            db_core.create_tables()
+
+        with allure.step("Проверяем наличие уникального индекса"):
+            indexes = inspect(db_core.engine).get_indexes(table)
+            assert any(index["unique"] and index["column_names"] == columns for index in indexes)
+
+        with allure.step("Проверяем, что дубликат отклоняется"):
+            with pytest.raises(IntegrityError):
+                with db_core.session_scope() as session:
+                    session.add(duplicate)
+
+    @allure.title("Тест пропуска создания таблиц по отпечатку схемы")
+    @allure.description("Проверка, что повторный запуск без изменений не выполняет create_all и инициализацию")
+    def test_create_tables_skipped_when_fingerprint_matches(self, mock_app, mock_config_file):
+        with allure.step("Инициализируем DatabaseCore и создаем таблицы"):
+            started_at = datetime.now(timezone.utc).replace(tzinfo=None)
+            db_core = DatabaseCore()
+            db_core.init_app(mock_app)
+            db_core.create_tables()
+
+        with allure.step("Проверяем сохранённый отпечаток и время его записи"):
+            with db_core.session_scope() as session:
+                state = session.query(AppStateModel).filter_by(key=DatabaseCore.SCHEMA_FINGERPRINT_KEY).one()
+                assert state.value == db_core.schema_fingerprint()
+                assert state.update_at.replace(tzinfo=None) >= started_at, "Время записи — время импорта модели"
+
+        with allure.step("Повторный запуск без изменений пропускает инициализацию"):
+            with patch.object(DatabaseInitializer, "initialize_db") as mock_initialize:
+                db_core.create_tables()
+            mock_initialize.assert_not_called()
+
+        with allure.step("Принудительный запуск выполняет инициализацию"):
+            with patch.object(DatabaseInitializer, "initialize_db") as mock_initialize:
+                db_core.create_tables(force=True)
+            mock_initialize.assert_called_once()
+
+        with allure.step("Изменение начальных данных запускает инициализацию"):
+            with open(mock_config_file, "a") as file:
+                file.write("\n# changed\n")
+            with patch.object(DatabaseInitializer, "initialize_db") as mock_initialize:
+                db_core.create_tables()
+            mock_initialize.assert_called_once()
@@ -1,6 +1,13 @@
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
 import allure
+from werkzeug.security import check_password_hash
 
-from src.app.db.models import PermissionModel, RoleModel, UserModel
+from src.app.core.password_hasher import PasswordHasher
+from src.app.db.db_core import DatabaseInitializer
+from src.app.db.models import (PermissionModel, RoleModel, RolePermissionModel,
+                               UserModel)
 
 
 @allure.parent_suite("Database Tests")
@@ -86,3 +93,43 @@ class TestDatabaseInitializer:
             assert (
                 admin_user.role.role_name == "Admin"
             ), f"У пользователя admin неверная роль: {admin_user.role.role_name}."
+
+    @allure.title("Тест повторной инициализации без повторного хеширования")
+    @allure.description("Проверка, что повторная инициализация не создаёт дубликатов и не хеширует пароли заново.")
+    def test_reinitialize_skips_existing(self, initializer_with_config, test_session):
+        with allure.step("Первичная инициализация базы данных"):
+            initializer_with_config.initialize_db(test_session)
+
+        with allure.step("Повторная инициализация базы данных"):
+            with patch("src.app.db.db_core.hash_password") as mock_hash:
+                initializer_with_config.initialize_db(test_session)
+
+        with allure.step("Проверка отсутствия хеширования и дубликатов"):
+            mock_hash.assert_not_called()
+            assert test_session.query(PermissionModel).count() == 4
+            assert test_session.query(RoleModel).count() == 2
+            assert test_session.query(RolePermissionModel).count() == 6
+            assert test_session.query(UserModel).count() == 2
+
+    @allure.title("Тест пакетного создания пользователей с хешированием в пуле процессов")
+    @allure.description("Проверка, что новые пользователи создаются с корректными хешами паролей.")
+    def test_bulk_users_parallel_hashing(self, initializer_with_config, test_session):
+        users = [{"login": f"user_{i}", "password": f"secret_{i}", "role_name": "Admin"} for i in range(3)]
+
+        with allure.step("Инициализация базы данных с хешированием в пуле процессов"):
+            initializer_with_config.initialize_db(test_session)
+            with (
+                patch.object(DatabaseInitializer, "PARALLEL_HASH_THRESHOLD", 2),
+                patch("os.cpu_count", return_value=2),
+                patch("src.app.db.db_core.ProcessPoolExecutor", wraps=ProcessPoolExecutor) as pool,
+            ):
+                initializer_with_config._add_default_users(test_session, users)
+
+        with allure.step("Проверка, что процессы пула запускаются без fork"):
+            assert pool.call_args.kwargs["mp_context"].get_start_method() == PasswordHasher.POOL_START_METHOD
+
+        with allure.step("Проверка созданных пользователей"):
+            for user_data in users:
+                user = test_session.query(UserModel).filter_by(login=user_data["login"]).one()
+                assert user.role.role_name == "Admin"
+                assert check_password_hash(user.password_hash, user_data["password"])
@@ -1,4 +1,11 @@
 import allure
+import pytest
+from flask import Flask, g
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+
+from src.app.db.db_helper import DBHelperSQL
+from src.app.utils.error_handlers import QueryStreamError
 
 
 @allure.parent_suite("Database Tests")
@@ -23,3 +30,253 @@ class TestDBHelperSQLSelectQueries:
             admin_user = next((user for user in result if user["login"] == "admin"), None)
             assert admin_user is not None, "Пользователь admin не найден"
             assert admin_user["login"] == "admin", "Логин второго пользователя должен быть 'admin'"
+
+    @allure.title("Тест учёта попаданий в кэш компиляции SQLAlchemy")
+    def test_execute_query_records_compiled_cache_stats(self, db_helper):
+        with allure.step("Выполняем один и тот же запрос дважды"):
+            db_helper.execute_query("get_all_users")
+            db_helper.execute_query("get_all_users")
+
+        with allure.step("Проверяем счётчики кэша компиляции"):
+            stats = db_helper.query_manager.get_cache_stats()["get_all_users"]
+            assert stats["hits"] + stats["misses"] == 2, f"Ожидалось 2 выполнения, получено: {stats}"
+            assert stats["hits"] >= 1, "Повторное выполнение должно попадать в кэш компиляции"
+
+
+@allure.parent_suite("Database Tests")
+@allure.suite("Тестирование DBHelperSQL")
+@allure.sub_suite("Тестирование пакетного выполнения запросов")
+class TestDBHelperSQLExecuteMany:
+
+    @allure.title("Тест пакетной вставки пользователей порциями")
+    def test_execute_many_inserts_in_chunks(self, db_helper_with_real_queries):
+        users = ({"login": f"user_{i}", "password_hash": "hash", "role_id": 1} for i in range(5))
+
+        with allure.step("Выполняем пакетную вставку генератора параметров порциями по 2"):
+            affected = db_helper_with_real_queries.execute_many("create_user", users, chunk_size=2)
+
+        with allure.step("Проверяем количество строк по порциям"):
+            assert affected == [2, 2, 1], f"Ожидалось [2, 2, 1], получено: {affected}"
+
+        with allure.step("Проверяем, что пользователи вставлены"):
+            user = db_helper_with_real_queries.execute_query("get_user_by_login", {"login": "user_4"})
+            assert user and user[0]["login"] == "user_4", "Пользователь user_4 не найден"
+
+    @allure.title("Тест отката всех порций при ошибке в одной из них")
+    def test_execute_many_rolls_back_on_error(self, db_helper_with_real_queries):
+        users = [
+            {"login": "batch_ok", "password_hash": "hash", "role_id": 1},
+            {"login": None, "password_hash": "hash", "role_id": 1},
+        ]
+
+        with allure.step("Выполняем пакетную вставку с некорректной второй порцией"):
+            affected = db_helper_with_real_queries.execute_many("create_user", users, chunk_size=1)
+
+        with allure.step("Проверяем, что ошибка обработана и транзакция откатена"):
+            assert affected == [], "При ошибке должен возвращаться пустой список"
+            user = db_helper_with_real_queries.execute_query("get_user_by_login", {"login": "batch_ok"})
+            assert user == [], "Первая порция должна быть откатена вместе с транзакцией"
+
+    @allure.title("Тест пакетного обновления через executemany")
+    def test_execute_many_update(self, db_helper):
+        with allure.step("Обновляем логины двух пользователей одной порцией"):
+            affected = db_helper.execute_many(
+                "update_user_login", [{"id": 1, "login": "root_new"}, {"id": 2, "login": "admin_new"}]
+            )
+
+        with allure.step("Проверяем результат обновления"):
+            assert affected == [2], f"Ожидалось [2], получено: {affected}"
+            logins = {user["login"] for user in db_helper.execute_query("get_all_users")}
+            assert logins == {"root_new", "admin_new"}, f"Неожиданные логины: {logins}"
+
+
+@allure.parent_suite("Database Tests")
+@allure.suite("Тестирование DBHelperSQL")
+@allure.sub_suite("Тестирование потокового чтения")
+class TestDBHelperSQLExecuteQueryIter:
+
+    @allure.title("Тест потокового чтения всех строк результата")
+    def test_execute_query_iter_yields_all_rows(self, db_helper):
+        with allure.step("Читаем пользователей генератором порциями по 1 строке"):
+            rows = db_helper.execute_query_iter("get_all_users", batch_size=1)
+            logins = sorted(row["login"] for row in rows)
+
+        with allure.step("Проверяем результат"):
+            assert logins == ["admin", "root"], f"Неожиданные логины: {logins}"
+
+    @allure.title("Тест удержания соединения только на время итерации")
+    def test_execute_query_iter_holds_connection_during_iteration(self, db_helper):
+        metrics = db_helper.db_core.pool_metrics
+
+        with allure.step("Создаём генератор без итерации"):
+            rows = db_helper.execute_query_iter("get_all_users")
+            assert metrics.checked_out == 0, "Соединение не должно выдаваться до начала итерации"
+
+        with allure.step("Читаем первую строку"):
+            next(rows)
+            assert metrics.checked_out == 1, "Во время итерации соединение должно быть выдано"
+
+        with allure.step("Досрочно закрываем генератор"):
+            rows.close()
+            assert metrics.checked_out == 0, "После закрытия генератора соединение должно вернуться в пул"
+
+    @allure.title("Тест обработки ошибки при потоковом чтении")
+    def test_execute_query_iter_unknown_query(self, db_helper):
+        with allure.step("Проверяем, что ошибка чтения несуществующего запроса не выглядит пустым результатом"):
+            with pytest.raises(QueryStreamError):
+                list(db_helper.execute_query_iter("unknown_query"))
+
+
+@allure.parent_suite("Database Tests")
+@allure.suite("Тестирование DBHelperSQL")
+@allure.sub_suite("Тестирование форм результата")
+class TestDBHelperSQLResultShapes:
+
+    @allure.title("Тест получения строк в виде кортежей и записей")
+    def test_execute_query_tuple_and_record_shapes(self, db_helper):
+        with allure.step("Получаем пользователей в виде кортежей"):
+            rows = db_helper.execute_query("get_user_by_id", {"id": 1}, shape="tuple")
+            assert type(rows[0]) is tuple, "Строка должна быть обычным кортежем"
+
+        with allure.step("Получаем пользователей в виде записей со __slots__"):
+            records = db_helper.execute_query("get_user_by_id", {"id": 1}, shape="record")
+            record = records[0]
+            assert record.login == "root" and record["login"] == "root", "Неверный логин в записи"
+            assert not hasattr(record, "__dict__"), "Запись не должна иметь словаря экземпляра"
+            assert record._asdict()["login"] == "root", "Запись должна преобразовываться в словарь"
+
+        with allure.step("Проверяем, что класс записи генерируется один раз на запрос"):
+            again = db_helper.execute_query("get_user_by_id", {"id": 2}, shape="record")
+            assert type(again[0]) is type(record), "Класс записи должен переиспользоваться"
+
+    @allure.title("Тест получения одной строки и скаляра")
+    def test_single_row_and_scalar(self, db_helper):
+        with allure.step("Получаем первую строку"):
+            assert db_helper.execute_first("get_user_by_id", {"id": 2})["login"] == "admin"
+
+        with allure.step("Получаем единственную строку и отсутствие строки"):
+            assert "root" in db_helper.execute_one_or_none("get_user_by_id", {"id": 1}, shape="tuple")
+            assert db_helper.execute_one_or_none("get_user_by_id", {"id": 100}) is None
+
+        with allure.step("Получаем скаляр"):
+            first_column = db_helper.execute_first("get_user_by_id", {"id": 1}, shape="tuple")[0]
+            assert db_helper.execute_scalar("get_user_by_id", {"id": 1}) == first_column
+
+    @allure.title("Тест one_or_none при нескольких строках результата")
+    def test_one_or_none_multiple_rows(self, db_helper):
+        with allure.step("Выполняем запрос, возвращающий несколько строк"):
+            result = db_helper.execute_one_or_none("get_all_users")
+
+        with allure.step("Проверяем, что ошибка обработана и возвращён None"):
+            assert result is None, "При нескольких строках должен возвращаться None"
+
+    @allure.title("Тест записей для запросов с объявленными колонками")
+    def test_record_for_declared_columns(self, db_helper_with_real_queries):
+        with allure.step("Получаем пользователя в виде записи"):
+            user = db_helper_with_real_queries.execute_one_or_none(
+                "get_user_by_login", {"login": "root"}, shape="record"
+            )
+
+        with allure.step("Проверяем поля записи из каталога"):
+            assert type(user).__name__ == "GetUserByLoginRecord", f"Неожиданный класс записи: {type(user)}"
+            assert type(user)._fields == ("login", "password_hash", "role_name")
+            assert user.get("role_name") == "Root" and user.get("user_id") is None
+
+    @allure.title("Тест неизвестной формы результата")
+    def test_unknown_shape(self, db_helper):
+        with allure.step("Запрашиваем неподдерживаемую форму результата"):
+            assert db_helper.execute_query("get_all_users", shape="frozenset") == []
+            assert db_helper.execute_first("get_all_users", shape="frozenset") is None
+
+
+@allure.parent_suite("Database Tests")
+@allure.suite("Тестирование DBHelperSQL")
+@allure.sub_suite("Тестирование единицы работы")
+class TestDBHelperSQLUnitOfWork:
+
+    @allure.title("Тест выполнения нескольких запросов в одной транзакции")
+    def test_transaction_uses_single_transaction(self, db_helper):
+        begins = []
+
+        def on_begin(connection):
+            begins.append(connection)
+
+        event.listen(db_helper.db_core.engine, "begin", on_begin)
+
+        with allure.step("Выполняем чтение и запись через единицу работы и методы execute_*"):
+            with db_helper.transaction() as uow:
+                uow.update("update_user_login", {"id": 1, "login": "root_new"})
+                user = db_helper.execute_first("get_user_by_id", {"id": 1})
+                users = uow.query("get_all_users")
+
+        with allure.step("Проверяем, что запросы выполнены в одной транзакции и видят её изменения"):
+            event.remove(db_helper.db_core.engine, "begin", on_begin)
+            assert len(begins) == 1, f"Ожидалась одна транзакция, получено: {len(begins)}"
+            assert user["login"] == "root_new" and len(users) == 2
+            assert db_helper.current_unit_of_work() is None, "Единица работы должна быть отвязана"
+
+    @allure.title("Тест отката транзакции при исключении")
+    def test_transaction_rolls_back_on_exception(self, db_helper):
+        with allure.step("Выбрасываем исключение после запроса на запись"):
+            with pytest.raises(RuntimeError):
+                with db_helper.transaction() as uow:
+                    uow.update("update_user_login", {"id": 1, "login": "root_new"})
+                    raise RuntimeError("boom")
+
+        with allure.step("Проверяем, что изменения откатены"):
+            assert db_helper.execute_scalar("get_user_by_id", {"id": 1}) == "root"
+
+    @allure.title("Тест частичного отката до точки сохранения")
+    def test_savepoint_partial_failure(self, db_helper_with_real_queries):
+        helper = db_helper_with_real_queries
+
+        with allure.step("Выполняем запись, ошибку внутри точки сохранения и ещё одну запись"):
+            with helper.transaction() as uow:
+                uow.update("create_user", {"login": "first", "password_hash": "hash", "role_id": 1})
+                with pytest.raises(IntegrityError):
+                    with uow.savepoint():
+                        uow.update("create_user", {"login": "failed", "password_hash": "hash", "role_id": 1})
+                        uow.update("create_user", {"login": None, "password_hash": "hash", "role_id": 1})
+                with uow.savepoint():
+                    created = helper.execute_update("create_user", {"login": None, "password_hash": "h", "role_id": 1})
+                    assert created is False, "Подавленная ошибка должна вернуть False"
+                uow.update("create_user", {"login": "second", "password_hash": "hash", "role_id": 1})
+
+        with allure.step("Проверяем, что откатены только изменения точек сохранения"):
+            for login, expected in (("first", 1), ("failed", 0), ("second", 1)):
+                rows = helper.execute_query("get_user_by_login", {"login": login})
+                assert len(rows) == expected, f"Неожиданное количество пользователей {login}: {rows}"
+
+    @allure.title("Тест отката транзакции после подавленной ошибки запроса")
+    def test_suppressed_error_rolls_back(self, db_helper_with_real_queries):
+        helper = db_helper_with_real_queries
+
+        with allure.step("Выполняем запись и ошибочный запрос через execute_update вне точки сохранения"):
+            with pytest.raises(IntegrityError):
+                with helper.transaction():
+                    helper.execute_update("create_user", {"login": "kept", "password_hash": "hash", "role_id": 1})
+                    helper.execute_update("create_user", {"login": None, "password_hash": "hash", "role_id": 1})
+
+        with allure.step("Проверяем, что вся транзакция откатена"):
+            assert helper.execute_query("get_user_by_login", {"login": "kept"}) == []
+
+    @allure.title("Тест привязки единицы работы к контексту запроса Flask")
+    def test_transaction_bound_to_request_context(self, db_helper):
+        app = Flask(__name__)
+
+        with allure.step("Открываем вложенные транзакции внутри контекста запроса"):
+            with app.test_request_context():
+                with db_helper.transaction() as outer:
+                    with db_helper.transaction() as inner:
+                        assert inner is outer, "Вложенная транзакция должна использовать активную единицу работы"
+                    assert g.get(DBHelperSQL.UNIT_OF_WORK_FLAG) is outer
+                assert g.get(DBHelperSQL.UNIT_OF_WORK_FLAG) is None
+
+        with allure.step("Проверяем, что запись в транзакции только для чтения запрещена"):
+            with pytest.raises(RuntimeError):
+                with db_helper.transaction(read_only=True):
+                    assert db_helper.execute_update("update_user_login", {"id": 1, "login": "x"}) is False
+            with db_helper.transaction(read_only=True):
+                with pytest.raises(RuntimeError):
+                    with db_helper.transaction():
+                        pass
@@ -0,0 +1,171 @@
+from unittest.mock import Mock
+
+import allure
+import pytest
+
+from src.app.db.db_core import DatabaseCore
+from src.app.db.db_helper import DBHelperSQL
+from src.app.db.login_filter import LoginFilter
+from src.app.db.query_cache import QueryCache
+from src.app.db.query_manager import QueryManager
+from src.app.utils.error_handlers import QueryStreamError
+
+
+@pytest.fixture
+def cached_db_helper(db_helper_with_real_queries):
+    """
+    Создает DBHelperSQL с реальными запросами и кэшем результатов без Redis.
+    """
+    return DBHelperSQL(
+        db_core=db_helper_with_real_queries.db_core,
+        query_manager=db_helper_with_real_queries.query_manager,
+        query_cache=QueryCache(max_entries=16),
+    )
+
+
+@pytest.fixture
+def login_filter(cached_db_helper, monkeypatch):
+    """
+    Создает LoginFilter над тестовой БД; фоновое перестроение заменено моком, чтобы тесты
+    перестраивали фильтр явным вызовом `refresh`.
+    """
+    monkeypatch.setattr(LoginFilter, "_LoginFilter__refresh_in_background", Mock())
+    return LoginFilter(cached_db_helper, cached_db_helper.query_cache, min_capacity=1000)
+
+
+@allure.parent_suite("Database Tests")
+@allure.suite("Тестирование LoginFilter")
+class TestLoginFilter:
+
+    @allure.sub_suite("Проверка логинов")
+    @allure.title("Тест отказа для неизвестного логина после построения фильтра")
+    def test_build_and_check(self, login_filter):
+        with allure.step("Проверяем, что до построения фильтра все логины проходят к БД"):
+            assert login_filter.might_contain("ghost") is True
+            assert login_filter.stats()["unchecked"] == 1
+
+        with allure.step("Строим фильтр по таблице пользователей"):
+            assert login_filter.refresh() is True
+
+        with allure.step("Проверяем существующие и неизвестный логины"):
+            assert login_filter.might_contain("root") is True
+            assert login_filter.might_contain("admin") is True
+            assert login_filter.might_contain("ghost") is False
+            stats = login_filter.stats()
+            assert (stats["passed"], stats["rejected"], stats["builds"]) == (2, 1, 1), f"Статистика: {stats}"
+
+    @allure.sub_suite("Актуальность")
+    @allure.title("Тест недоверия фильтру после добавления пользователя")
+    def test_invalidated_by_create_user(self, login_filter, cached_db_helper):
+        login_filter.refresh()
+
+        with allure.step("Добавляем пользователя запросом, инвалидирующим тег user_logins"):
+            cached_db_helper.execute_update("create_user", {"login": "new_user", "password_hash": "hash", "role_id": 1})
+
+        with allure.step("Проверяем, что до перестроения новый логин проходит к БД"):
+            assert login_filter.might_contain("new_user") is True
+            assert login_filter.stats()["unchecked"] == 1
+
+        with allure.step("Перестраиваем фильтр и проверяем, что он учитывает нового пользователя"):
+            assert login_filter.refresh() is True
+            assert login_filter.might_contain("new_user") is True
+            assert login_filter.might_contain("ghost") is False
+
+    @allure.sub_suite("Актуальность")
+    @allure.title("Тест работы без фильтра при ошибке чтения пользователей")
+    def test_build_failed(self, monkeypatch):
+        monkeypatch.setattr(LoginFilter, "_LoginFilter__refresh_in_background", Mock())
+        db_helper = Mock(spec=DBHelperSQL)
+        login_filter = LoginFilter(db_helper, min_capacity=1000)
+
+        def interrupted_stream(*args, **kwargs):
+            yield ("root",)
+            raise QueryStreamError("Потоковое чтение 'list_user_logins' прервано")
+
+        with allure.step("Имитируем чтение, прерванное ошибкой после части логинов"):
+            db_helper.execute_scalar.return_value = 2
+            db_helper.execute_query_iter.side_effect = interrupted_stream
+            assert login_filter.refresh() is False
+
+        with allure.step("Проверяем, что без фильтра все логины проходят к БД"):
+            assert login_filter.might_contain("ghost") is True
+            assert login_filter.stats()["unchecked"] == 1
+
+        with allure.step("Имитируем ошибку запроса количества пользователей"):
+            db_helper.execute_scalar.return_value = None
+            assert login_filter.refresh() is False
+            db_helper.execute_scalar.assert_called_with("count_users")
+
+    @allure.sub_suite("Актуальность")
+    @allure.title("Тест недоверия фильтру старше максимального возраста")
+    def test_expired_filter_not_trusted(self, cached_db_helper, monkeypatch):
+        monkeypatch.setattr(LoginFilter, "_LoginFilter__refresh_in_background", Mock())
+        login_filter = LoginFilter(cached_db_helper, cached_db_helper.query_cache, min_capacity=1000, max_age=-1)
+        assert login_filter.refresh() is True
+
+        with allure.step("Проверяем, что до перестроения истёкшего фильтра неизвестный логин проходит к БД"):
+            assert login_filter.might_contain("ghost") is True
+            assert login_filter.stats()["unchecked"] == 1
+
+    @allure.sub_suite("Актуальность")
+    @allure.title("Тест недоверия фильтру и копии в Redis после заполнения начальными данными")
+    def test_seeding_invalidates_filter(self, mock_app, monkeypatch):
+        monkeypatch.setattr(LoginFilter, "_LoginFilter__refresh_in_background", Mock())
+        redis = Mock()
+        query_cache = QueryCache(redis=redis, key_prefix="test:")
+        query_manager = QueryManager()
+        db_core = DatabaseCore(query_manager=query_manager, query_cache=query_cache)
+        db_core.init_app(mock_app)
+        db_core.metadata.create_all(db_core.engine)
+        db_helper = DBHelperSQL(db_core=db_core, query_manager=query_manager)
+
+        with allure.step("Строим фильтр до заполнения начальными данными и сохраняем копию в Redis"):
+            redis.mget.return_value = [None, b"0"]
+            login_filter = LoginFilter(db_helper, query_cache, min_capacity=1000)
+            assert login_filter.refresh() is True
+            assert login_filter.might_contain("root") is False
+            payload = redis.set.call_args.args[1]
+
+        with allure.step("Заполняем БД начальными данными"):
+            db_core.create_tables()
+            redis.pipeline.return_value.incr.assert_any_call("test:tag:user_logins")
+
+        with allure.step("Проверяем, что фильтр, построенный до заполнения, не отклоняет новый логин"):
+            assert login_filter.might_contain("root") is True
+
+        with allure.step("Проверяем, что копия в Redis со старой версией тега не загружается"):
+            redis.mget.return_value = [payload, b"1"]
+            started = LoginFilter(db_helper, query_cache, min_capacity=1000)
+            assert started.refresh() is True
+            assert started.stats()["loads"] == 0 and started.stats()["builds"] == 1
+            assert started.might_contain("root") is True and started.might_contain("ghost") is False
+
+    @allure.sub_suite("Redis")
+    @allure.title("Тест сохранения фильтра в Redis и загрузки с проверкой версии тега")
+    def test_redis_copy(self, cached_db_helper, monkeypatch):
+        monkeypatch.setattr(LoginFilter, "_LoginFilter__refresh_in_background", Mock())
+        redis = Mock()
+        query_cache = QueryCache(redis=redis, key_prefix="test:")
+
+        with allure.step("Строим фильтр при отсутствии копии и сохраняем его с версией тега"):
+            redis.mget.return_value = [None, b"3"]
+            assert LoginFilter(cached_db_helper, query_cache, min_capacity=1000).refresh() is True
+            assert redis.mget.call_args.args == (["test:login_filter", "test:tag:user_logins"],)
+            key, payload = redis.set.call_args.args
+            assert key == "test:login_filter" and redis.set.call_args.kwargs == {"ex": 300}
+
+        with allure.step("Загружаем копию с той же версией тега без обращения к БД"):
+            db_helper = Mock(spec=DBHelperSQL)
+            redis.mget.return_value = [payload, b"3"]
+            loaded = LoginFilter(db_helper, query_cache, min_capacity=1000)
+            assert loaded.refresh() is True
+            assert loaded.might_contain("root") is True and loaded.might_contain("ghost") is False
+            assert loaded.stats()["loads"] == 1
+            db_helper.execute_scalar.assert_not_called()
+
+        with allure.step("Проверяем, что копия с устаревшей версией тега не загружается"):
+            redis.mget.return_value = [payload, b"4"]
+            rebuilt = LoginFilter(cached_db_helper, query_cache, min_capacity=1000)
+            assert rebuilt.refresh() is True
+            assert rebuilt.stats()["builds"] == 1
+            assert redis.set.call_args.args[1][:8] == (4).to_bytes(8, "big"), "Копия сохраняется с новой версией"
@@ -0,0 +1,106 @@
+import allure
+import pytest
+from sqlalchemy import String, text
+
+from src.app.db.pagination import CursorCodec, InvalidCursorError, KeysetPolicy
+from src.app.db.query_manager import QueryDefinition
+
+
+@pytest.fixture
+def paged_db_helper(db_helper_with_real_queries):
+    """
+    DBHelperSQL с реальным каталогом, подписью курсоров и 25 дополнительными пользователями.
+    """
+    db_helper_with_real_queries.cursor_codec = CursorCodec(secret_key="test-secret", max_limit=100)
+    users = ({"login": f"user_{i:02d}", "password_hash": "hash", "role_id": 1} for i in range(25))
+    db_helper_with_real_queries.execute_many("create_user", users)
+    return db_helper_with_real_queries
+
+
+@allure.parent_suite("Database Tests")
+@allure.suite("Тестирование постраничного чтения")
+class TestKeysetPagination:
+    @allure.sub_suite("DBHelperSQL.execute_page")
+    @allure.title("Страницы по курсору покрывают весь результат без повторов и пропусков")
+    def test_walk_all_pages(self, paged_db_helper):
+        expected = sorted(row["login"] for row in paged_db_helper.execute_query("list_users_page"))
+        logins, pages, cursor = [], 0, None
+
+        with allure.step("Проходим все страницы по 4 строки"):
+            while True:
+                page = paged_db_helper.execute_page("list_users_page", after=cursor, limit=4)
+                assert len(page.items) <= 4
+                logins.extend(row["login"] for row in page.items)
+                pages += 1
+                cursor = page.next_cursor
+                if cursor is None:
+                    break
+
+        with allure.step("Проверяем порядок и количество страниц"):
+            assert logins == expected
+            assert pages == -(-len(expected) // 4)
+
+    @allure.sub_suite("DBHelperSQL.execute_page")
+    @allure.title("Страница после курсора выбирается по индексу, а не сканированием")
+    def test_page_uses_index(self, paged_db_helper):
+        definition = paged_db_helper.query_manager.get_definition("list_users_page")
+        page_sql = definition.keyset.page_sql(definition.sql, after=True)
+        params = definition.keyset.page_params(None, ["user_10", 1000], 5)
+
+        with paged_db_helper.db_core.engine.connect() as connection:
+            rows = connection.execute(text(f"EXPLAIN QUERY PLAN {page_sql}"), params)
+            plan = "; ".join(str(row[-1]) for row in rows)
+
+        assert "ix_users_login" in plan
+        assert "TEMP B-TREE" not in plan
+
+    @allure.sub_suite("DBHelperSQL.execute_page")
+    @allure.title("Подделанный, чужой курсор и некорректный размер страницы отклоняются")
+    def test_invalid_requests(self, paged_db_helper):
+        cursor = paged_db_helper.execute_page("list_users_page", limit=2).next_cursor
+        roles_cursor = paged_db_helper.execute_page("list_roles_page", limit=1).next_cursor
+
+        with allure.step("Подделанный курсор"):
+            with pytest.raises(InvalidCursorError):
+                paged_db_helper.execute_page("list_users_page", after=cursor[:-2] + "xx", limit=2)
+
+        with allure.step("Курсор другого запроса"):
+            with pytest.raises(InvalidCursorError):
+                paged_db_helper.execute_page("list_users_page", after=roles_cursor, limit=2)
+
+        with allure.step("Размер страницы вне допустимого диапазона"):
+            with pytest.raises(ValueError):
+                paged_db_helper.execute_page("list_users_page", limit=0)
+            with pytest.raises(ValueError):
+                paged_db_helper.execute_page("list_users_page", limit=101)
+
+        with allure.step("Запрос без секции keyset"):
+            with pytest.raises(ValueError):
+                paged_db_helper.execute_page("get_user_by_login", {"login": "root"})
+
+    @allure.sub_suite("Каталог запросов")
+    @allure.title("Секция keyset проверяется при загрузке каталога")
+    def test_keyset_definition_validation(self):
+        keyset = KeysetPolicy.from_yaml("q", {"columns": ["login"], "tie_breaker": "id", "order": "desc"})
+        columns = {"id": String(), "login": String()}
+
+        with allure.step("Обратный порядок сортировки"):
+            definition = QueryDefinition(
+                "q", "c", "SELECT id, login FROM users", columns=columns, mode="read", keyset=keyset
+            )
+            assert "(login, id) < (:keyset_after_0, :keyset_after_1)" in str(definition.page_statements[True])
+            assert "ORDER BY login DESC, id DESC" in str(definition.page_statements[False])
+
+        with allure.step("Постраничное чтение запроса на запись"):
+            with pytest.raises(ValueError):
+                QueryDefinition("q", "c", "SELECT id, login FROM users", columns=columns, keyset=keyset)
+
+        with allure.step("Колонка ключа не объявлена в columns"):
+            with pytest.raises(ValueError):
+                QueryDefinition(
+                    "q", "c", "SELECT login FROM users", columns={"login": String()}, mode="read", keyset=keyset
+                )
+
+        with allure.step("Некорректное имя колонки"):
+            with pytest.raises(ValueError):
+                KeysetPolicy.from_yaml("q", {"columns": ["login; DROP TABLE users"], "tie_breaker": "id"})
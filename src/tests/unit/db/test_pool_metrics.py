@@ -0,0 +1,70 @@
+import allure
+
+from src.app.db.db_core import DatabaseCore
+
+
+@allure.parent_suite("Database Tests")
+@allure.suite("Тестирование пула соединений DatabaseCore")
+class TestPoolConfigurationAndMetrics:
+
+    @allure.sub_suite("Настройки пула")
+    @allure.title("Тест применения настроек пула из конфигурации")
+    def test_pool_settings_applied(self, mock_app, tmp_path):
+        with allure.step("Инициализируем DatabaseCore с файловой SQLite и настройками пула"):
+            mock_app.config.update(
+                {
+                    "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'pool.db'}",
+                    "SQLALCHEMY_POOL_SIZE": 3,
+                    "SQLALCHEMY_MAX_OVERFLOW": 2,
+                    "SQLALCHEMY_POOL_TIMEOUT": 7,
+                    "SQLALCHEMY_POOL_RECYCLE": 120,
+                    "SQLALCHEMY_POOL_PRE_PING": True,
+                    "SQLALCHEMY_POOL_USE_LIFO": True,
+                }
+            )
+            db_core = DatabaseCore()
+            db_core.init_app(mock_app)
+
+        with allure.step("Проверяем параметры созданного пула"):
+            pool = db_core.engine.pool
+            assert pool.size() == 3
+            assert pool._max_overflow == 2
+            assert pool._timeout == 7
+            assert pool._recycle == 120
+            assert pool._pre_ping is True
+
+    @allure.sub_suite("Настройки пула")
+    @allure.title("Тест игнорирования настроек QueuePool для SQLite in-memory")
+    def test_queue_pool_settings_skipped_for_memory_sqlite(self, mock_app):
+        mock_app.config.update({"SQLALCHEMY_POOL_SIZE": 3, "SQLALCHEMY_MAX_OVERFLOW": 2})
+        db_core = DatabaseCore()
+        db_core.init_app(mock_app)
+        assert db_core.engine is not None, "Движок должен создаваться без ошибок для SQLite in-memory"
+
+    @allure.sub_suite("Метрики пула")
+    @allure.title("Тест сбора метрик выдачи и ожидания соединений")
+    def test_pool_metrics_collected(self, mock_app, tmp_path):
+        with allure.step("Инициализируем DatabaseCore с пулом размером 1 и переполнением 1"):
+            mock_app.config.update(
+                {
+                    "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'metrics.db'}",
+                    "SQLALCHEMY_POOL_SIZE": 1,
+                    "SQLALCHEMY_MAX_OVERFLOW": 1,
+                }
+            )
+            db_core = DatabaseCore()
+            db_core.init_app(mock_app)
+
+        with allure.step("Открываем две сессии одновременно"):
+            with db_core.session_scope():
+                with db_core.session_scope():
+                    snapshot = db_core.pool_metrics.snapshot()
+                    assert snapshot["checked_out"] == 2
+
+        with allure.step("Проверяем счётчики и гистограмму ожидания"):
+            snapshot = db_core.pool_metrics.snapshot()
+            assert snapshot["checked_out"] == 0
+            assert snapshot["peak_checked_out"] == 2
+            assert snapshot["overflow_events"] == 1
+            assert snapshot["wait_count"] == 2
+            assert sum(snapshot["wait_histogram"].values()) == 2
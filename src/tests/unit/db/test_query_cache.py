@@ -0,0 +1,205 @@
+import json
+from unittest.mock import Mock
+
+import allure
+import pytest
+from redis import RedisError
+
+from src.app.db.db_helper import DBHelperSQL
+from src.app.db.query_cache import CachePolicy, QueryCache
+
+
+@pytest.fixture
+def cached_db_helper(db_helper_with_real_queries):
+    """
+    Создает DBHelperSQL с реальными запросами и кэшем результатов без Redis.
+    """
+    return DBHelperSQL(
+        db_core=db_helper_with_real_queries.db_core,
+        query_manager=db_helper_with_real_queries.query_manager,
+        query_cache=QueryCache(max_entries=16),
+    )
+
+
+@allure.parent_suite("Database Tests")
+@allure.suite("Тестирование QueryCache")
+class TestQueryCache:
+
+    @allure.sub_suite("L1-кэш")
+    @allure.title("Тест попаданий, вытеснения LRU и метрик")
+    def test_lru_eviction_and_stats(self):
+        cache = QueryCache(max_entries=2)
+        policy = CachePolicy(ttl=60, key_params=["id"])
+        loader = Mock(side_effect=lambda: [{"id": 1}])
+
+        with allure.step("Загружаем три разных ключа и повторно читаем первый"):
+            for key in (1, 2, 3, 1):
+                cache.get_or_load("get_item", {"id": key}, policy, loader)
+
+        with allure.step("Проверяем, что первый ключ был вытеснен и загружен повторно"):
+            assert loader.call_count == 4, f"Ожидалось 4 загрузки, получено: {loader.call_count}"
+            stats = cache.get_stats()["get_item"]
+            assert stats["misses"] == 4 and stats["entries"] == 2, f"Неожиданная статистика: {stats}"
+            assert stats["size_bytes"] > 0, "Размер записей L1 должен учитываться"
+
+        with allure.step("Проверяем попадание и долю попаданий"):
+            cache.get_or_load("get_item", {"id": 1}, policy, loader)
+            stats = cache.get_stats()["get_item"]
+            assert stats["l1_hits"] == 1 and stats["hit_ratio"] == pytest.approx(0.2)
+
+    @allure.sub_suite("L1-кэш")
+    @allure.title("Тест истечения времени жизни записи")
+    def test_ttl_expiry(self, monkeypatch):
+        cache = QueryCache()
+        policy = CachePolicy(ttl=10)
+        loader = Mock(return_value=[{"value": 1}])
+        clock = iter([0.0, 5.0, 20.0])
+        monkeypatch.setattr("src.app.db.query_cache.time.monotonic", lambda: next(clock))
+
+        with allure.step("Читаем запись до и после истечения TTL"):
+            for _ in range(3):
+                cache.get_or_load("get_value", None, policy, loader)
+
+        with allure.step("Проверяем, что после истечения TTL запись загружена заново"):
+            assert loader.call_count == 2, f"Ожидалось 2 загрузки, получено: {loader.call_count}"
+
+    @allure.sub_suite("Инвалидация")
+    @allure.title("Тест инвалидации по тегам и защиты от гонки с загрузкой")
+    def test_invalidation_by_tags(self):
+        cache = QueryCache()
+        policy = CachePolicy(ttl=60, tags=["users"])
+
+        with allure.step("Загружаем запись и инвалидируем её тег"):
+            cache.get_or_load("get_users", None, policy, lambda: [{"login": "root"}])
+            cache.invalidate(["users"])
+            assert cache.get_stats()["get_users"]["entries"] == 0, "Запись с тегом должна быть удалена"
+
+        with allure.step("Инвалидируем тег во время загрузки"):
+
+            def load_with_concurrent_write():
+                cache.invalidate(["users"])
+                return [{"login": "stale"}]
+
+            cache.get_or_load("get_users", None, policy, load_with_concurrent_write)
+
+        with allure.step("Проверяем, что устаревший результат не сохранён в кэш"):
+            entries = cache.get_stats()["get_users"]["entries"]
+            assert entries == 0, "Результат устаревшей загрузки не должен кэшироваться"
+
+    @allure.sub_suite("L2-кэш")
+    @allure.title("Тест попадания в L2 и проверки версий тегов")
+    def test_l2_hit_and_version_mismatch(self):
+        redis = Mock()
+        cache = QueryCache(redis=redis)
+        policy = CachePolicy(ttl=60, tags=["roles"])
+        cached = json.dumps({"versions": {"roles": 3}, "rows": [{"role_name": "Root"}]})
+        loader = Mock(return_value=[{"role_name": "Admin"}])
+
+        with allure.step("Читаем запись, версия тега которой совпадает"):
+            redis.mget.return_value = [cached, b"3"]
+            assert cache.get_or_load("get_roles", None, policy, loader) == [{"role_name": "Root"}]
+            loader.assert_not_called()
+
+        with allure.step("Читаем запись после изменения версии тега"):
+            cache.clear()
+            redis.mget.return_value = [cached, b"4"]
+            assert cache.get_or_load("get_roles", None, policy, loader) == [{"role_name": "Admin"}]
+
+        with allure.step("Проверяем, что новая запись сохранена в L2 с текущими версиями тегов"):
+            key, value = redis.set.call_args.args
+            assert json.loads(value) == {"versions": {"roles": 4}, "rows": [{"role_name": "Admin"}]}
+            assert redis.set.call_args.kwargs == {"ex": 60}
+
+    @allure.sub_suite("L2-кэш")
+    @allure.title("Тест кэширования только в L1 при l2: false")
+    def test_l1_only_policy(self):
+        redis = Mock()
+        cache = QueryCache(redis=redis)
+        policy = CachePolicy(ttl=60, key_params=["login"], tags=["users"], l2=False)
+        loader = Mock(return_value=[{"login": "root", "password_hash": "secret"}])
+
+        with allure.step("Дважды читаем запись с учётными данными"):
+            cache.get_or_load("get_user_by_login", {"login": "root"}, policy, loader)
+            rows = cache.get_or_load("get_user_by_login", {"login": "root"}, policy, loader)
+
+        with allure.step("Проверяем, что запись взята из L1, а Redis не получал ни запросов, ни данных"):
+            assert rows == [{"login": "root", "password_hash": "secret"}]
+            loader.assert_called_once()
+            assert cache.get_stats()["get_user_by_login"]["l1_hits"] == 1
+            redis.mget.assert_not_called()
+            redis.set.assert_not_called()
+
+    @allure.sub_suite("L2-кэш")
+    @allure.title("Тест работы без L2 при недоступности Redis")
+    def test_redis_unavailable(self):
+        redis = Mock()
+        redis.mget.side_effect = RedisError("connection refused")
+        redis.set.side_effect = RedisError("connection refused")
+        cache = QueryCache(redis=redis)
+
+        with allure.step("Читаем запись при недоступном Redis"):
+            rows = cache.get_or_load("get_value", None, CachePolicy(ttl=60), lambda: [{"value": 1}])
+
+        with allure.step("Проверяем, что результат загружен и сохранён в L1"):
+            assert rows == [{"value": 1}]
+            assert cache.get_stats()["get_value"]["entries"] == 1
+
+
+@allure.parent_suite("Database Tests")
+@allure.suite("Тестирование DBHelperSQL")
+@allure.sub_suite("Тестирование кэша результатов")
+class TestDBHelperSQLQueryCache:
+
+    @allure.title("Тест чтения из кэша и инвалидации запросом на запись")
+    def test_cached_read_and_invalidation(self, cached_db_helper):
+        with allure.step("Дважды читаем пользователя, результат второго чтения берётся из кэша"):
+            first = cached_db_helper.execute_one_or_none("get_user_by_login", {"login": "root"})
+            second = cached_db_helper.execute_one_or_none("get_user_by_login", {"login": "root"}, shape="record")
+            assert first["login"] == second.login == "root"
+            stats = cached_db_helper.query_cache.get_stats()["get_user_by_login"]
+            assert stats["misses"] == 1 and stats["l1_hits"] == 1, f"Неожиданная статистика: {stats}"
+
+        with allure.step("Выполняем запрос на запись с тегом users"):
+            cached_db_helper.execute_update("create_user", {"login": "new_user", "password_hash": "hash", "role_id": 1})
+
+        with allure.step("Проверяем, что записи с тегом users инвалидированы"):
+            assert cached_db_helper.query_cache.get_stats()["get_user_by_login"]["entries"] == 0
+            assert cached_db_helper.execute_scalar("get_user_by_login", {"login": "new_user"}) == "new_user"
+
+    @allure.title("Тест разбора секции cache в каталоге")
+    def test_catalog_cache_policy(self, cached_db_helper):
+        with allure.step("Проверяем политику кэширования и теги инвалидации из YAML"):
+            definition = cached_db_helper.query_manager.get_definition("get_user_by_login")
+            assert definition.cache.ttl == 60 and definition.cache.key_params == ("login",)
+            assert definition.cache.l2 is False, "Строки с хешем пароля не должны попадать в Redis"
+            assert cached_db_helper.query_manager.get_definition("create_user").invalidates == ("users", "user_logins")
+
+    @allure.title("Тест того, что строки пользователя с хешем пароля не попадают в Redis")
+    def test_user_row_not_cached_in_l2(self, db_helper_with_real_queries):
+        redis = Mock()
+        db_helper = DBHelperSQL(
+            db_core=db_helper_with_real_queries.db_core,
+            query_manager=db_helper_with_real_queries.query_manager,
+            query_cache=QueryCache(max_entries=16, redis=redis),
+        )
+
+        with allure.step("Читаем пользователя через кэш с L2"):
+            user = db_helper.execute_one_or_none("get_user_by_login", {"login": "root"})
+            assert user["password_hash"], "Запрос должен вернуть хеш пароля"
+
+        with allure.step("Проверяем, что клиент Redis не получил строку пользователя"):
+            redis.mget.assert_not_called()
+            redis.set.assert_not_called()
+
+    @allure.title("Тест инвалидации кэша после фиксации единицы работы")
+    def test_invalidation_deferred_until_commit(self, cached_db_helper):
+        cached_db_helper.execute_one_or_none("get_user_by_login", {"login": "root"})
+
+        with allure.step("Выполняем запись с тегом users внутри единицы работы"):
+            with cached_db_helper.transaction() as uow:
+                uow.update("create_user", {"login": "uow_user", "password_hash": "hash", "role_id": 1})
+                assert uow.scalar("get_user_by_login", {"login": "uow_user"}) == "uow_user"
+                assert cached_db_helper.query_cache.get_stats()["get_user_by_login"]["entries"] == 1
+
+        with allure.step("Проверяем, что записи инвалидированы после фиксации"):
+            assert cached_db_helper.query_cache.get_stats()["get_user_by_login"]["entries"] == 0
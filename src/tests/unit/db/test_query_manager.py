@@ -1,4 +1,6 @@
+import os
 import tempfile
+import time
 
 import allure
 import pytest
@@ -53,3 +55,120 @@ class TestQueryManager:
         with allure.step("Проверяем, что инициализация с пустым файлом вызывает ошибку"):
             with pytest.raises(ValueError, match="Некорректный формат YAML"):
                 QueryManager.from_yaml(file_path_query_yaml=temp_file.name)
+
+    @allure.sub_suite("Подготовленные выражения QueryManager")
+    @allure.title("Тест подготовки выражения с объявленными типами параметров и колонок")
+    def test_statement_with_declared_types(self, temp_yaml_file):
+        with allure.step("Создаем QueryManager с запросом в словарной форме"):
+            file_path = temp_yaml_file(
+                {
+                    "user_queries": {
+                        "get_user_by_login": {
+                            "sql": "SELECT login FROM users WHERE login = :login",
+                            "binds": {"login": "String"},
+                            "columns": {"login": "String"},
+                        }
+                    }
+                }
+            )
+            query_manager = QueryManager.from_yaml(file_path_query_yaml=file_path)
+
+        with allure.step("Проверяем, что выражение подготовлено один раз и содержит типы"):
+            statement = query_manager.get_statement("get_user_by_login")
+            assert statement is query_manager.get_statement("get_user_by_login"), "Выражение должно переиспользоваться"
+            assert [column.name for column in statement.selected_columns] == ["login"]
+            assert query_manager.get_query("get_user_by_login") == "SELECT login FROM users WHERE login = :login"
+
+    @allure.sub_suite("Обработка ошибок QueryManager")
+    @allure.title("Тест обработки неизвестного типа параметра")
+    def test_statement_with_unknown_type(self, temp_yaml_file):
+        file_path = temp_yaml_file(
+            {"user_queries": {"get_user": {"sql": "SELECT 1 WHERE :id = 1", "binds": {"id": "NotAType"}}}}
+        )
+        with allure.step("Проверяем, что неизвестный тип вызывает ошибку"):
+            with pytest.raises(ValueError, match="Неизвестный тип 'NotAType'"):
+                QueryManager.from_yaml(file_path_query_yaml=file_path)
+
+    @allure.sub_suite("Каталог запросов по диалектам")
+    @allure.title("Тест выбора запроса активного диалекта")
+    def test_dialect_override_resolution(self, temp_yaml_file):
+        with allure.step("Создаем общий файл и переопределения для двух диалектов"):
+            base = temp_yaml_file({"user_queries": {"get_user": "SELECT 1", "list_roles": "SELECT 'base'"}})
+            postgres = temp_yaml_file({"role_queries": {"list_roles": "SELECT ARRAY_AGG(name) FROM permission"}})
+            sqlite = temp_yaml_file({"role_queries": {"list_roles": "SELECT GROUP_CONCAT(name, ', ') FROM permission"}})
+            dialect_files = {"postgresql": postgres, "sqlite": sqlite}
+
+        with allure.step("Проверяем, что для каждого диалекта выбирается свой запрос"):
+            pg_manager = QueryManager.from_yaml(base, dialect_files=dialect_files, dialect="postgresql")
+            sqlite_manager = QueryManager.from_yaml(base, dialect_files=dialect_files, dialect="sqlite")
+            assert "ARRAY_AGG" in pg_manager.get_query("list_roles")
+            assert "GROUP_CONCAT" in sqlite_manager.get_query("list_roles")
+            assert pg_manager.get_query("get_user") == sqlite_manager.get_query("get_user") == "SELECT 1"
+
+    @allure.sub_suite("Каталог запросов по диалектам")
+    @allure.title("Тест ошибки при отсутствии запроса для активного диалекта")
+    def test_dialect_missing_query_fails_fast(self, temp_yaml_file):
+        base = temp_yaml_file({"user_queries": {"get_user": "SELECT 1"}})
+        postgres = temp_yaml_file({"role_queries": {"list_roles": "SELECT ARRAY_AGG(name) FROM permission"}})
+
+        with allure.step("Проверяем, что неполный для sqlite каталог вызывает ошибку"):
+            with pytest.raises(ValueError, match=r"\['list_roles'\] не определены для диалекта 'sqlite'"):
+                QueryManager.from_yaml(base, dialect_files={"postgresql": postgres}, dialect="sqlite")
+
+    @allure.sub_suite("Каталог запросов по диалектам")
+    @allure.title("Тест полноты реального каталога для всех диалектов")
+    @pytest.mark.parametrize("dialect", ["postgresql", "sqlite"])
+    def test_real_catalog_complete_for_dialect(self, dialect):
+        query_manager = QueryManager.from_yaml(
+            "./config/db_config/queries_base.yaml",
+            dialect_files={
+                "postgresql": "./config/db_config/queries_postgres.yaml",
+                "sqlite": "./config/db_config/queries_sqlite.yaml",
+            },
+            dialect=dialect,
+        )
+        assert "get_user_by_login" in query_manager.queries
+        assert "get_all_roles_and_permissions" in query_manager.queries
+
+    @allure.sub_suite("Перезагрузка каталога запросов")
+    @allure.title("Тест перезагрузки каталога и сохранения прежнего при ошибке")
+    def test_reload_swaps_catalog_and_keeps_old_on_error(self, tmp_path):
+        catalog = tmp_path / "queries.yaml"
+        catalog.write_text("user_queries:\n  get_user: SELECT 1\n", encoding="utf-8")
+        query_manager = QueryManager.from_yaml(str(catalog))
+        first_version = query_manager.catalog_version
+
+        with allure.step("Проверяем, что без изменения файла каталог не подменяется"):
+            assert query_manager.reload() is False and query_manager.catalog_version == first_version
+
+        with allure.step("Изменяем запрос и перезагружаем каталог"):
+            catalog.write_text("user_queries:\n  get_user: SELECT 2\n", encoding="utf-8")
+            assert query_manager.reload() is True
+            assert query_manager.get_query("get_user") == "SELECT 2"
+            assert query_manager.version == 2 and query_manager.catalog_version != first_version
+
+        with allure.step("Записываем некорректный каталог и проверяем, что используется прежний"):
+            catalog.write_text("user_queries:\n  get_user: {binds: {id: Unknown}}\n", encoding="utf-8")
+            assert query_manager.reload() is False
+            assert query_manager.get_query("get_user") == "SELECT 2" and query_manager.version == 2
+
+    @allure.sub_suite("Перезагрузка каталога запросов")
+    @allure.title("Тест перезагрузки каталога фоновым потоком при изменении файла")
+    def test_watcher_reloads_changed_file(self, tmp_path):
+        catalog = tmp_path / "queries.yaml"
+        catalog.write_text("user_queries:\n  get_user: SELECT 1\n", encoding="utf-8")
+        query_manager = QueryManager.from_yaml(str(catalog))
+
+        with allure.step("Запускаем отслеживание и изменяем файл каталога"):
+            query_manager.start_watching(0.01)
+            try:
+                catalog.write_text("user_queries:\n  get_user: SELECT 3\n", encoding="utf-8")
+                os.utime(catalog, ns=(0, catalog.stat().st_mtime_ns + 1_000_000_000))
+                deadline = time.monotonic() + 5
+                while query_manager.version < 2 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+            finally:
+                query_manager.stop_watching()
+
+        with allure.step("Проверяем, что новый каталог загружен"):
+            assert query_manager.get_query("get_user") == "SELECT 3", "Каталог должен быть перезагружен"
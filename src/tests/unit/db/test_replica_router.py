@@ -0,0 +1,99 @@
+import sqlite3
+
+import allure
+import pytest
+from flask import Flask
+from sqlalchemy import create_engine
+
+from src.app.db.db_core import DatabaseCore
+from src.app.db.db_helper import DBHelperSQL
+from src.app.db.query_manager import QueryManager
+
+
+@pytest.fixture
+def replica_files(tmp_path):
+    """
+    Создает основную БД и две реплики в виде SQLite-файлов с разной меткой в таблице marker.
+    """
+    paths = {}
+    for name in ("primary", "replica1", "replica2"):
+        path = tmp_path / f"{name}.db"
+        with sqlite3.connect(path) as connection:
+            connection.execute("CREATE TABLE marker (name TEXT)")
+            connection.execute("INSERT INTO marker (name) VALUES (?)", (name,))
+        paths[name] = path
+    return paths
+
+
+@pytest.fixture
+def replica_helper(mock_app, replica_files, temp_yaml_file):
+    """
+    Создает DBHelperSQL поверх основной БД и двух реплик.
+    """
+    queries = temp_yaml_file(
+        {
+            "marker_queries": {
+                "whoami": {"sql": "SELECT name FROM marker", "mode": "read"},
+                "touch": "UPDATE marker SET name = name",
+            }
+        }
+    )
+    mock_app.config.update(
+        {
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{replica_files['primary']}",
+            "SQLALCHEMY_REPLICA_URIS": [
+                f"sqlite:///{replica_files['replica1']}",
+                f"sqlite:///{replica_files['replica2']}",
+            ],
+        }
+    )
+    db_core = DatabaseCore()
+    db_core.init_app(mock_app)
+    return DBHelperSQL(db_core=db_core, query_manager=QueryManager.from_yaml(queries))
+
+
+@allure.parent_suite("Database Tests")
+@allure.suite("Тестирование маршрутизации чтений по репликам")
+class TestReplicaRouting:
+
+    @allure.title("Тест выполнения чтения на реплике")
+    def test_read_query_routed_to_replica(self, replica_helper):
+        result = replica_helper.execute_query("whoami")
+        assert result[0]["name"] in {"replica1", "replica2"}, f"Чтение должно идти на реплику, получено: {result}"
+
+    @allure.title("Тест выбора наименее загруженной реплики")
+    def test_least_loaded_replica_selected(self, replica_helper):
+        with allure.step("Удерживаем соединение с одной из реплик"):
+            with replica_helper.db_core.session_scope(read_only=True) as session:
+                busy = session.execute(replica_helper.query_manager.get_statement("whoami")).scalar()
+
+                with allure.step("Проверяем, что следующее чтение идет на другую реплику"):
+                    result = replica_helper.execute_query("whoami")
+                    assert result[0]["name"] in {"replica1", "replica2"} - {busy}
+
+    @allure.title("Тест закрепления чтений за основной БД после записи в запросе")
+    def test_read_after_write_sticks_to_primary(self, replica_helper):
+        with Flask(__name__).test_request_context():
+            with allure.step("До записи чтение идет на реплику"):
+                assert replica_helper.execute_query("whoami")[0]["name"] != "primary"
+
+            with allure.step("После записи чтение идет на основную БД"):
+                assert replica_helper.execute_update("touch") is True
+                assert replica_helper.execute_query("whoami")[0]["name"] == "primary"
+
+        with Flask(__name__).test_request_context():
+            with allure.step("В новом запросе чтение снова идет на реплику"):
+                assert replica_helper.execute_query("whoami")[0]["name"] != "primary"
+
+    @allure.title("Тест исключения недоступной реплики")
+    def test_unhealthy_replica_skipped(self, replica_helper, tmp_path):
+        router = replica_helper.db_core.replica_router
+
+        with allure.step("Заменяем вторую реплику движком на несуществующий файл и проверяем здоровье"):
+            router.replicas[1].engine = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+            router.check_health()
+            assert router.replicas[1].healthy is False
+
+        with allure.step("Проверяем, что чтения идут только на доступную реплику"):
+            for _ in range(3):
+                assert replica_helper.execute_query("whoami")[0]["name"] == "replica1"
@@ -0,0 +1,104 @@
+from unittest.mock import Mock
+
+import allure
+import pytest
+
+from src.app.db.db_helper import DBHelperSQL
+from src.app.db.query_cache import QueryCache
+from src.app.db.role_permissions import PermissionSnapshot, RolePermissionIndex
+
+
+@pytest.fixture
+def cached_db_helper(db_helper_with_real_queries):
+    """
+    Создает DBHelperSQL с реальными запросами и кэшем результатов без Redis.
+    """
+    return DBHelperSQL(
+        db_core=db_helper_with_real_queries.db_core,
+        query_manager=db_helper_with_real_queries.query_manager,
+        query_cache=QueryCache(max_entries=16),
+    )
+
+
+@pytest.fixture
+def role_permissions(cached_db_helper):
+    """
+    Создает RolePermissionIndex над тестовой БД с ролями Root (read, write, delete) и Admin (read, write, update).
+    """
+    return RolePermissionIndex(cached_db_helper, cached_db_helper.query_cache)
+
+
+@allure.parent_suite("Database Tests")
+@allure.suite("Тестирование RolePermissionIndex")
+class TestRolePermissionIndex:
+
+    @allure.sub_suite("Проверка прав")
+    @allure.title("Тест проверки наборов прав ролей")
+    def test_has_all_and_has_any(self, role_permissions):
+        with allure.step("Проверяем наборы прав, выданных и не выданных ролям"):
+            assert role_permissions.has_all("Root", ["read", "delete"]) is True
+            assert role_permissions.has_all("Admin", ["read", "delete"]) is False
+            assert role_permissions.has_any("Admin", ["delete", "update"]) is True
+            assert role_permissions.has_any("Root", ["update"]) is False
+
+        with allure.step("Проверяем неизвестные роли и права"):
+            assert role_permissions.has_all(None, ["read"]) is False
+            assert role_permissions.has_all("Guest", ["read"]) is False
+            assert role_permissions.has_all("Root", ["read", "audit"]) is False
+            assert role_permissions.has_any("Root", ["read", "audit"]) is True
+
+        with allure.step("Проверяем, что права загружены один раз"):
+            stats = role_permissions.stats()
+            assert (stats["allowed"], stats["denied"], stats["loads"]) == (3, 5, 1), f"Статистика: {stats}"
+
+    @allure.sub_suite("Актуальность")
+    @allure.title("Тест перезагрузки прав после изменения тега roles")
+    def test_reload_on_grant(self, role_permissions, cached_db_helper):
+        assert role_permissions.has_all("Admin", ["delete"]) is False
+
+        with allure.step("Выдаём роли Admin право delete запросом, инвалидирующим тег roles"):
+            cached_db_helper.execute_update("grant_role_permission", {"role_id": 2, "permission_id": 3})
+
+        with allure.step("Проверяем, что новое право учитывается при следующей проверке"):
+            assert role_permissions.has_all("Admin", ["delete"]) is True
+            assert role_permissions.stats()["loads"] == 2
+
+    @allure.sub_suite("Актуальность")
+    @allure.title("Тест отказа до загрузки прав и сохранения прежних прав при ошибке перезагрузки")
+    def test_load_failed(self):
+        db_helper = Mock(spec=DBHelperSQL)
+        query_cache = QueryCache()
+        role_permissions = RolePermissionIndex(db_helper, query_cache)
+
+        with allure.step("Проверяем, что без загруженных прав все проверки завершаются отказом"):
+            db_helper.execute_query.return_value = []
+            assert role_permissions.has_any("Root", ["read"]) is False
+            assert role_permissions.stats()["errors"] == 1
+
+        with allure.step("Загружаем права и имитируем ошибку перезагрузки после изменения тега"):
+            db_helper.execute_query.return_value = [("read", "Root"), ("delete", None)]
+            assert role_permissions.refresh() is True
+            db_helper.execute_query.return_value = []
+            query_cache.invalidate(["roles"])
+
+        with allure.step("Проверяем, что используются прежние права"):
+            assert role_permissions.has_all("Root", ["read"]) is True
+            assert role_permissions.has_any("Root", ["delete"]) is False
+            assert role_permissions.stats()["errors"] == 2
+
+
+@allure.parent_suite("Database Tests")
+@allure.suite("Тестирование PermissionSnapshot")
+class TestPermissionSnapshot:
+
+    @allure.title("Тест построения масок ролей и наборов прав")
+    def test_from_rows(self):
+        snapshot = PermissionSnapshot.from_rows([("read", "Root"), ("read", "Admin"), ("write", "Root")], 0)
+
+        with allure.step("Проверяем биты прав и маски ролей"):
+            assert snapshot.bits == {"read": 1, "write": 2}
+            assert snapshot.roles == {"Root": 3, "Admin": 1}
+
+        with allure.step("Проверяем маску набора с неизвестным правом"):
+            assert snapshot.mask(("write", "audit")) == (2, False)
+            assert snapshot.mask(("write", "audit")) is snapshot.mask(("write", "audit"))
@@ -0,0 +1,97 @@
+import logging
+
+import allure
+import pytest
+
+from src.app.db.db_core import DatabaseCore
+from src.app.db.db_helper import DBHelperSQL
+from src.app.db.query_manager import QueryManager
+from src.app.db.slow_query_log import SlowQueryLog
+
+
+@pytest.fixture
+def file_db_helper(mock_app, tmp_path):
+    """
+    Создает DBHelperSQL с реальными запросами над файловой SQLite-базой.
+    EXPLAIN выполняется в фоновом потоке, а база SQLite in-memory видна только своему потоку.
+    """
+    mock_app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'slow.db'}"
+    query_manager = QueryManager()
+    db_core = DatabaseCore(query_manager=query_manager)
+    db_core.init_app(mock_app)
+    db_core.create_tables()
+    yield DBHelperSQL(db_core=db_core, query_manager=query_manager)
+    db_core.engine.dispose()
+
+
+@pytest.fixture
+def slow_query_log(file_db_helper):
+    """
+    Создает SlowQueryLog с порогом 0.5 сек и буфером на два плана.
+    """
+    log = SlowQueryLog(
+        db_core=file_db_helper.db_core,
+        query_manager=file_db_helper.query_manager,
+        threshold=0.5,
+        max_plans=2,
+    )
+    yield log
+    log.shutdown()
+
+
+@allure.parent_suite("Database Tests")
+@allure.suite("Тестирование SlowQueryLog")
+class TestSlowQueryLog:
+
+    @allure.sub_suite("EXPLAIN")
+    @allure.title("Тест получения плана запроса SQLite")
+    def test_explain_sqlite(self, slow_query_log):
+        with allure.step("Выполняем EXPLAIN QUERY PLAN для запроса с параметрами"):
+            plan = slow_query_log.explain("get_user_by_login", {"login": "root"})
+
+        with allure.step("Проверяем, что план содержит шаги чтения таблиц"):
+            assert "SCAN" in plan or "SEARCH" in plan, f"Неожиданный план: {plan}"
+
+    @allure.sub_suite("Захват планов")
+    @allure.title("Тест захвата плана медленного запроса с записью в лог")
+    def test_capture_logs_plan(self, slow_query_log, caplog):
+        with allure.step("Захватываем план запроса, превысившего порог"):
+            with caplog.at_level(logging.WARNING, logger="app_db_profiler_logger"):
+                plan = slow_query_log.capture("get_user_by_login", {"login": "root"}, 0.7).result()
+
+        with allure.step("Проверяем план в буфере и в записи лога"):
+            assert plan is not None and slow_query_log.get_plans()[0]["param_shape"] == {"login": "str"}
+            record = next(record for record in caplog.records if hasattr(record, "query_plan"))
+            assert record.query_name == "get_user_by_login" and record.query_plan == plan.plan
+
+    @allure.sub_suite("Захват планов")
+    @allure.title("Тест ограничения частоты захвата и размера буфера")
+    def test_rate_limit_and_ring_buffer(self, slow_query_log):
+        with allure.step("Проверяем, что быстрый запрос не захватывается"):
+            assert slow_query_log.capture("get_user_by_login", {"login": "root"}, 0.1) is None
+
+        with allure.step("Повторно захватываем запрос с той же формой параметров"):
+            assert slow_query_log.capture("get_user_by_login", {"login": "root"}, 0.7).result() is not None
+            assert slow_query_log.capture("get_user_by_login", {"login": "admin"}, 0.7) is None
+
+        with allure.step("Захватываем запросы с другой формой параметров и другим именем"):
+            slow_query_log.capture("get_user_by_login", {"login": None}, 0.7).result()
+            slow_query_log.capture("get_all_roles_and_permissions", None, 0.7).result()
+
+        with allure.step("Проверяем, что в буфере остались только последние планы"):
+            plans = slow_query_log.get_plans()
+            assert [plan["query_name"] for plan in plans] == ["get_user_by_login", "get_all_roles_and_permissions"]
+            assert plans[0]["param_shape"] == {"login": "NoneType"}
+
+    @allure.sub_suite("Захват планов")
+    @allure.title("Тест захвата плана при медленном выполнении через DBHelperSQL")
+    def test_profiler_captures_slow_query(self, file_db_helper, slow_query_log):
+        file_db_helper.slow_query_log = slow_query_log
+        slow_query_log.threshold = 0.0
+
+        with allure.step("Выполняем запрос, считающийся медленным при нулевом пороге"):
+            file_db_helper.execute_first("get_user_by_login", {"login": "root"})
+            slow_query_log.shutdown()
+
+        with allure.step("Проверяем, что план запроса захвачен"):
+            assert [plan["query_name"] for plan in slow_query_log.get_plans()] == ["get_user_by_login"]
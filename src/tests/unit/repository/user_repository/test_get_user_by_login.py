@@ -1,5 +1,10 @@
+from unittest.mock import Mock
+
 import allure
 
+from src.app.db.login_filter import LoginFilter
+from src.app.repository.repo_user import UserRepository
+
 
 @allure.parent_suite("Unit Tests")
 @allure.suite("Тестирование UserRepository")
@@ -14,17 +19,17 @@ class TestUserRepository:
         Тест метода get_user_by_login, если пользователь найден.
         """
         # Настройка мока для DBHelperSQL
-        mock_result = [{"login": "root", "password_hash": "hashed_password", "role_name": "Root"}]
-        db_helper_mock.execute_query.return_value = mock_result
+        mock_result = {"login": "root", "password_hash": "hashed_password", "role_name": "Root"}
+        db_helper_mock.execute_one_or_none.return_value = mock_result
 
         with allure.step("Вызов метода get_user_by_login с существующим логином"):
             result = repo_user_repository.get_user_by_login(login="root")
 
         with allure.step("Проверяем возвращённые данные"):
-            assert result == mock_result[0], "Возвращаемые данные не совпадают с ожидаемыми"
+            assert result == mock_result, "Возвращаемые данные не совпадают с ожидаемыми"
 
-        with allure.step("Убедиться, что execute_query вызван с правильными аргументами"):
-            db_helper_mock.execute_query.assert_called_once_with(
+        with allure.step("Убедиться, что execute_one_or_none вызван с правильными аргументами"):
+            db_helper_mock.execute_one_or_none.assert_called_once_with(
                 query_name="get_user_by_login", params={"login": "root"}
             )
 
@@ -36,7 +41,7 @@ class TestUserRepository:
         Тест метода get_user_by_login, если пользователь не найден.
         """
         # Настройка мока для DBHelperSQL
-        db_helper_mock.execute_query.return_value = []
+        db_helper_mock.execute_one_or_none.return_value = None
 
         with allure.step("Вызов метода get_user_by_login с несуществующим логином"):
             result = repo_user_repository.get_user_by_login(login="non_existent_user")
@@ -44,7 +49,39 @@ class TestUserRepository:
         with allure.step("Проверяем, что результат равен None"):
             assert result is None, "Результат должен быть None, если пользователь не найден"
 
-        with allure.step("Убедиться, что execute_query вызван с правильными аргументами"):
-            db_helper_mock.execute_query.assert_called_once_with(
+        with allure.step("Убедиться, что execute_one_or_none вызван с правильными аргументами"):
+            db_helper_mock.execute_one_or_none.assert_called_once_with(
                 query_name="get_user_by_login", params={"login": "non_existent_user"}
             )
+
+    @allure.sub_suite("Метод get_user_by_login")
+    @allure.title("Тест отказа фильтра логинов без запроса к базе")
+    @allure.description("Проверяет, что логин, отклонённый фильтром логинов, не ищется в базе")
+    def test_get_user_by_login_rejected_by_filter(self, db_helper_mock):
+        login_filter = Mock(spec=LoginFilter)
+        login_filter.might_contain.return_value = False
+        repository = UserRepository(db_helper=db_helper_mock, login_filter=login_filter)
+
+        with allure.step("Вызов метода get_user_by_login с логином, которого нет в фильтре"):
+            result = repository.get_user_by_login(login="ghost")
+
+        with allure.step("Проверяем, что результат равен None и запрос к базе не выполнялся"):
+            assert result is None
+            login_filter.might_contain.assert_called_once_with("ghost")
+            db_helper_mock.execute_one_or_none.assert_not_called()
+
+    @allure.sub_suite("Метод update_password_hash")
+    @allure.title("Тест замены хеша пароля с проверкой прежнего хеша")
+    @allure.description("Проверяет, что метод выполняет запрос замены хеша с прежним хешем в условии")
+    def test_update_password_hash(self, repo_user_repository, db_helper_mock):
+        db_helper_mock.execute_update.return_value = True
+
+        with allure.step("Вызов метода update_password_hash"):
+            result = repo_user_repository.update_password_hash("root", "new_hash", "old_hash")
+
+        with allure.step("Проверяем результат и параметры запроса"):
+            assert result is True
+            db_helper_mock.execute_update.assert_called_once_with(
+                query_name="update_user_password_hash",
+                params={"login": "root", "password_hash": "new_hash", "old_password_hash": "old_hash"},
+            )
@@ -1,5 +1,5 @@
 import time
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 from flask import Flask
@@ -65,6 +65,25 @@ def query_with_args():
     return lambda query_name, query: query_func(mock_self, query_name, query)
 
 
+@pytest.fixture
+def query_with_slow_query_log():
+    """
+    Тестовая функция, объект которой имеет SlowQueryLog с порогом 0.2 сек.
+    Возвращает функцию запроса и мок SlowQueryLog.
+    """
+    mock_self = Mock()
+    mock_self.slow_query_log.threshold = 0.2
+
+    @profile_sql_execution
+    def query_func(self, query_name, params=None):
+        return params
+
+    def query(query_name, *args, **kwargs):
+        return query_func(mock_self, query_name, *args, **kwargs)
+
+    return query, mock_self.slow_query_log
+
+
 @pytest.fixture
 def query_with_kwargs():
     """
@@ -79,6 +98,20 @@ def query_with_kwargs():
     return lambda query_name, **kwargs: query_func(mock_self, query_name, **kwargs)
 
 
+@pytest.fixture
+def streamed_query():
+    """
+    Тестовая функция-генератор, эмулирующая потоковый SQL-запрос.
+    """
+    mock_self = object()
+
+    @profile_sql_execution
+    def query_func(self, query_name):
+        yield from (1, 2, 3)
+
+    return lambda query_name: query_func(mock_self, query_name)
+
+
 # ================== Для тестов test_logger_decorators ==================
 @pytest.fixture
 def sample_app() -> Flask:
@@ -302,3 +335,15 @@ def dummy_helper_generic_error_update():
             raise Exception("generic error")
 
     return Dummy()
+
+
+# Фикстура для ошибки во время потоковой итерации
+@pytest.fixture
+def dummy_helper_error_during_iteration():
+    class Dummy:
+        @handle_db_helper_errors
+        def execute_query_iter(self, query_name, params=None, *args, **kwargs):
+            yield {"id": 1}
+            raise OperationalError("op error", None, None)
+
+    return Dummy()
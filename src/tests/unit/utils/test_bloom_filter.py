@@ -0,0 +1,57 @@
+import allure
+import pytest
+
+from src.app.utils.bloom_filter import BloomFilter
+
+
+@allure.parent_suite("Unit Tests")
+@allure.suite("Тестирование BloomFilter")
+class TestBloomFilter:
+
+    @allure.sub_suite("Проверка строк")
+    @allure.title("Тест отсутствия ложноотрицательных ответов и доли ложных срабатываний")
+    def test_membership(self):
+        bloom = BloomFilter.for_capacity(1000, 0.01)
+        logins = [f"user_{i}" for i in range(1000)]
+
+        with allure.step("Добавляем логины по одному и пакетом"):
+            bloom.add(logins[0])
+            bloom.update(logins[1:])
+            assert bloom.count == 1000
+
+        with allure.step("Проверяем, что все добавленные логины найдены"):
+            assert all(login in bloom for login in logins), "Фильтр Блума не может давать ложноотрицательных ответов"
+
+        with allure.step("Проверяем долю ложных срабатываний на недобавленных логинах"):
+            false_positives = sum(f"other_{i}" in bloom for i in range(10000))
+            assert false_positives < 300, f"Слишком много ложных срабатываний: {false_positives} из 10000"
+
+    @allure.sub_suite("Сериализация")
+    @allure.title("Тест сохранения и загрузки фильтра")
+    def test_round_trip(self):
+        bloom = BloomFilter.for_capacity(100, 0.001)
+        bloom.update(["root", "admin"])
+
+        with allure.step("Загружаем сериализованный фильтр"):
+            loaded = BloomFilter.from_bytes(bloom.to_bytes())
+
+        with allure.step("Проверяем параметры и ответы загруженного фильтра"):
+            assert (loaded.size, loaded.hashes, loaded.bits) == (bloom.size, bloom.hashes, bloom.bits)
+            assert "root" in loaded and "admin" in loaded
+            assert "guest" not in loaded
+
+    @allure.sub_suite("Сериализация")
+    @allure.title("Тест ошибок некорректных параметров и повреждённых данных")
+    @pytest.mark.parametrize(
+        "factory",
+        [
+            lambda: BloomFilter(0, 1),
+            lambda: BloomFilter.for_capacity(0, 0.01),
+            lambda: BloomFilter.for_capacity(100, 1.0),
+            lambda: BloomFilter.from_bytes(b"\x00"),
+            lambda: BloomFilter.from_bytes(BloomFilter(64, 3).to_bytes()[:-1]),
+        ],
+    )
+    def test_invalid(self, factory):
+        with pytest.raises(ValueError):
+            factory()
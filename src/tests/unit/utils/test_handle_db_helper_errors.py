@@ -1,4 +1,8 @@
 import allure
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from src.app.utils.error_handlers import QueryStreamError
 
 
 @allure.parent_suite("Unit Tests")
@@ -180,3 +184,21 @@ class TestHandleDbHelperErrors:
             result = dummy_helper_generic_error_update.execute_update("generic_update", {"param": "value"})
         with allure.step("Проверить, что результат равен False"):
             assert result is False, f"Ожидалось False, получено: {result}"
+
+    @allure.sub_suite("Обработка ошибок в генераторах")
+    @allure.title("Ошибка во время итерации execute_query_iter пробрасывается как QueryStreamError")
+    @allure.description(
+        "Проверяет, что ошибка, возникшая в генераторе после выдачи строк, не завершает итерацию молча."
+    )
+    def test_error_during_iteration(self, dummy_helper_error_during_iteration):
+        """
+        Проверяет, что строки до ошибки выданы, а затем выбрасывается QueryStreamError.
+        """
+        rows = []
+        with allure.step("Выполнить потоковый запрос, падающий после первой строки"):
+            with pytest.raises(QueryStreamError) as exc_info:
+                for row in dummy_helper_error_during_iteration.execute_query_iter("stream_query"):
+                    rows.append(row)
+        with allure.step("Проверить выданные строки и причину ошибки"):
+            assert rows == [{"id": 1}], f"Ожидалась одна строка, получено: {rows}"
+            assert isinstance(exc_info.value.__cause__, OperationalError)
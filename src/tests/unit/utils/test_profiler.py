@@ -51,3 +51,35 @@ class TestSqlQueryLogging:
             mock_logger.log.assert_called_once_with(
                 logging.INFO, "SQL Query `query_with_args_name` executed in 0.3000 sec"
             )
+
+    @allure.title("Тест логирования потокового SQL-запроса")
+    @allure.description("Проверяет, что для генератора время измеряется до конца итерации и логируется число строк")
+    def test_streamed_query_logging(self, mock_logger, streamed_query):
+        with allure.step("Мокаем время выполнения итерации (0.2 сек)"):
+            with patch("time.time", side_effect=[0, 0.2]):
+                result = list(streamed_query("streamed_query_name"))
+
+        with allure.step("Проверяем, что генератор выдал все строки"):
+            assert result == [1, 2, 3]
+
+        with allure.step("Проверяем, что логгер вызван после окончания итерации"):
+            mock_logger.log.assert_called_once_with(
+                logging.INFO, "SQL Query `streamed_query_name` streamed 3 rows in 0.2000 sec"
+            )
+
+    @allure.title("Тест передачи медленного SQL-запроса в SlowQueryLog")
+    @allure.description("Проверяет, что порог берётся из slow_query_log, а медленный запрос передаётся на захват плана")
+    def test_slow_query_capture(self, mock_logger, query_with_slow_query_log):
+        query, slow_query_log = query_with_slow_query_log
+
+        with allure.step("Мокаем время выполнения запросов (0.1 и 0.3 сек) при пороге 0.2 сек"):
+            with patch("time.time", side_effect=[0, 0.1, 0, 0.3]):
+                query("fast_name", {"id": 1})
+                query("slow_name", params={"id": 2})
+
+        with allure.step("Проверяем уровень логирования по порогу slow_query_log"):
+            levels = [call.args[0] for call in mock_logger.log.call_args_list]
+            assert levels == [logging.INFO, logging.WARNING]
+
+        with allure.step("Проверяем, что на захват плана передан только медленный запрос"):
+            slow_query_log.capture.assert_called_once_with("slow_name", {"id": 2}, 0.3)